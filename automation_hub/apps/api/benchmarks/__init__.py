@@ -0,0 +1 @@
+# Benchmarks 모듈
@@ -0,0 +1,116 @@
+"""
+플랫폼별 채널 목록 조회 벤치마크
+
+GET /api/channels?platform_id= 경로의 DB 호출을 비교합니다.
+- before: 플랫폼 존재 확인 + 그룹 ID 조회 + in_(group_id) 채널 조회 (3회 왕복)
+- after:  groups!inner 임베디드 조인 1회 (채널이 없을 때만 플랫폼 확인)
+
+PostgREST 대역(postgrest_stub)에 수천 개 그룹의 합성 데이터셋을 올리고
+요청마다 왕복 지연(rtt)을 더해 측정합니다.
+
+실행 (apps/api 디렉토리에서):
+    python -m benchmarks.bench_channels_by_platform --groups 100,1000,3000 --channels 2 --rtt 0.02
+
+대역은 Supabase처럼 응답 행 수를 1000개로 제한하므로, 기존 방식은 채널이 1000개를 넘으면
+결과가 잘리고, 그룹 수가 많으면 in_() URL이 httpx 한도(64KB)를 넘어 요청 자체가 실패합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+# core.database import 시 클라이언트 생성을 위한 더미 값
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "benchmark-key")
+os.environ["DB_BACKEND"] = "supabase"
+# 캐시 영향 제외
+os.environ.setdefault("CACHE_TTL_SECONDS", "0")
+
+import core.database as database  # noqa: E402
+from benchmarks.postgrest_stub import PostgrestStub, StubSupabase, build_dataset  # noqa: E402
+
+
+async def list_channels_before(platform_id: str) -> list:
+    """기존 방식: 플랫폼 확인 → 그룹 ID 조회 → 채널 in_ 조회"""
+    backend = database.backend
+    await database.get_platform_by_id(platform_id)
+
+    groups_response = await backend._execute(
+        backend.client.table("groups").select("id").eq("platform_id", platform_id)
+    )
+    group_ids = [g["id"] for g in groups_response.data]
+    if not group_ids:
+        return []
+
+    response = await backend._execute(
+        backend.client.table("channels").select("*").in_("group_id", group_ids).order("created_at")
+    )
+    return response.data
+
+
+async def list_channels_after(platform_id: str) -> list:
+    """개선 방식: 임베디드 inner join 1회"""
+    channels = await database.get_channels_by_platform(platform_id)
+    if not channels:
+        await database.get_platform_by_id(platform_id)
+    return channels
+
+
+async def measure(stub: PostgrestStub, handler, platform_id: str, repeat: int) -> dict:
+    stub.reset_counters()
+    started = time.perf_counter()
+    try:
+        for _ in range(repeat):
+            channels = await handler(platform_id)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    elapsed = time.perf_counter() - started
+    return {
+        "latency_ms": elapsed / repeat * 1000,
+        "requests": stub.requests / repeat,
+        "max_url_length": stub.max_url_length,
+        "channels": len(channels),
+    }
+
+
+async def run_case(groups: int, channels: int, rtt: float, repeat: int):
+    dataset = build_dataset(platforms=2, groups_per_platform=groups, channels_per_group=channels)
+    stub = PostgrestStub(dataset, rtt=rtt)
+    database.backend.client = StubSupabase(stub)
+
+    platform_id = dataset["platforms"][0]["id"]
+    print(
+        f"\n플랫폼당 그룹 {groups}개 x 그룹당 채널 {channels}개, "
+        f"왕복 지연 {rtt * 1000:.0f}ms, 반복 {repeat}회"
+    )
+
+    for name, handler in [("before (3 queries)", list_channels_before), ("after (inner join)", list_channels_after)]:
+        result = await measure(stub, handler, platform_id, repeat)
+        if "error" in result:
+            print(f"{name:<20} 실패 - {result['error']}")
+            continue
+        print(
+            f"{name:<20} 평균 {result['latency_ms']:.1f}ms | "
+            f"요청 {result['requests']:.0f}회 | "
+            f"최대 URL {result['max_url_length']:,}자 | "
+            f"채널 {result['channels']}개 (기대 {groups * channels}개)"
+        )
+
+
+async def main(group_counts: list, channels: int, rtt: float, repeat: int):
+    for groups in group_counts:
+        await run_case(groups, channels, rtt, repeat)
+    await database.close_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="플랫폼별 채널 목록 조회 벤치마크")
+    parser.add_argument("--groups", default="100,1000,3000", help="플랫폼당 그룹 수 (쉼표로 여러 개)")
+    parser.add_argument("--channels", type=int, default=2, help="그룹당 채널 수")
+    parser.add_argument("--rtt", type=float, default=0.02, help="요청당 왕복 지연(초)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    group_counts = [int(g) for g in args.groups.split(",")]
+    asyncio.run(main(group_counts, args.channels, args.rtt, args.repeat))
@@ -0,0 +1,103 @@
+"""
+DB 호출 스레드 오프로드 벤치마크
+
+동기 supabase 클라이언트를 이벤트 루프에서 직접 호출할 때(before)와
+Supabase 백엔드의 _execute()로 스레드 풀에 넘길 때(after)의
+동시 요청 처리량과 이벤트 루프 지연을 비교합니다.
+
+실제 DB 대신 지정한 지연(latency)만큼 블로킹하는 가짜 쿼리를 사용합니다.
+
+실행 (apps/api 디렉토리에서):
+    python -m benchmarks.bench_db_offload --requests 50 --queries 3 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+# core.database import 시 클라이언트 생성을 위한 더미 값
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "benchmark-key")
+os.environ["DB_BACKEND"] = "supabase"
+
+from core.database import backend, close_database  # noqa: E402
+
+
+class BlockingQuery:
+    """execute() 호출 시 latency만큼 블로킹하는 가짜 쿼리"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def execute(self):
+        time.sleep(self.latency)
+        return {"data": []}
+
+
+async def handle_request_blocking(queries: int, latency: float):
+    """기존 방식: 이벤트 루프에서 직접 execute() 호출"""
+    for _ in range(queries):
+        BlockingQuery(latency).execute()
+
+
+async def handle_request_offloaded(queries: int, latency: float):
+    """개선 방식: _execute()로 스레드 풀에서 실행"""
+    for _ in range(queries):
+        await backend._execute(BlockingQuery(latency))
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """이벤트 루프 최대 지연 측정 (주기적 sleep이 얼마나 늦게 깨어나는지)"""
+    max_lag = 0.0
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, time.perf_counter() - expected)
+    return max_lag
+
+
+async def run_scenario(handler, requests: int, queries: int, latency: float) -> dict:
+    """동시 요청 시나리오 실행"""
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(handler(queries, latency) for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    max_lag = await lag_task
+
+    return {
+        "elapsed": elapsed,
+        "throughput": requests / elapsed,
+        "max_loop_lag": max_lag,
+    }
+
+
+async def main(requests: int, queries: int, latency: float):
+    print(f"동시 요청 {requests}개 x 요청당 쿼리 {queries}개, 쿼리 지연 {latency * 1000:.0f}ms")
+
+    for name, handler in [
+        ("before (blocking)", handle_request_blocking),
+        ("after (offloaded)", handle_request_offloaded),
+    ]:
+        result = await run_scenario(handler, requests, queries, latency)
+        print(
+            f"{name:<20} 소요 {result['elapsed']:.2f}s | "
+            f"처리량 {result['throughput']:.1f} req/s | "
+            f"최대 루프 지연 {result['max_loop_lag'] * 1000:.0f}ms"
+        )
+
+    await close_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DB 호출 스레드 오프로드 벤치마크")
+    parser.add_argument("--requests", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--queries", type=int, default=3, help="요청당 쿼리 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="쿼리당 지연(초)")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.queries, args.latency))
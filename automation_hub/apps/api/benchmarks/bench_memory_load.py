@@ -0,0 +1,120 @@
+"""
+메모리 백엔드 기반 API/실행기 부하 테스트
+
+외부 DB 없이 메모리 백엔드에 합성 데이터를 올리고, 호출당 인공 지연(latency)을 더해
+주요 조회 API와 실행기(execute_channel)를 동시에 호출했을 때의 처리량과 지연을 측정합니다.
+
+- API: httpx ASGITransport로 앱을 직접 호출 (네트워크/서버 프로세스 없음)
+- 실행기: 채널을 동시에 실행하고 쓰기 버퍼 flush까지 포함해 측정
+- DB 호출 수: 요청당 백엔드 호출 횟수 (N+1 쿼리 확인용)
+
+실행 (apps/api 디렉토리에서):
+    python -m benchmarks.bench_memory_load --groups 20 --channels 5 --latency 0.02 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ["DB_BACKEND"] = "memory"
+# 캐시 영향 제외
+os.environ.setdefault("CACHE_TTL_SECONDS", "0")
+
+import httpx  # noqa: E402
+
+from core import database  # noqa: E402
+from core.backends.memory import MemoryBackend  # noqa: E402
+from main import app  # noqa: E402
+from services.executor import execute_channel  # noqa: E402
+from services.write_buffer import write_buffer  # noqa: E402
+
+ENDPOINTS = [
+    "/api/channels",
+    "/api/groups",
+    "/api/schedules",
+    "/api/stats/overview",
+    "/api/stats/groups",
+    "/api/stats/logs?limit=100",
+]
+
+
+def _summary(latencies: list, elapsed: float, calls: int) -> str:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+    return (
+        f"처리량 {len(latencies) / elapsed:.1f} req/s | "
+        f"p50 {statistics.median(latencies) * 1000:.1f}ms | "
+        f"p95 {p95 * 1000:.1f}ms | "
+        f"요청당 DB 호출 {calls / len(latencies):.1f}회"
+    )
+
+
+async def bench_endpoint(client: httpx.AsyncClient, backend: MemoryBackend, path: str,
+                         requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    backend.calls = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    print(f"{path:<28} {_summary(latencies, time.perf_counter() - started, backend.calls)}")
+
+
+async def bench_executor(backend: MemoryBackend, channels: int, concurrency: int):
+    channel_ids = [c["id"] for c in (await backend.get_all_channels())[:channels]]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(channel_id: str):
+        async with semaphore:
+            started = time.perf_counter()
+            await execute_channel(channel_id)
+            latencies.append(time.perf_counter() - started)
+
+    backend.calls = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(one(channel_id) for channel_id in channel_ids))
+    await write_buffer.flush()
+    print(f"{'execute_channel':<28} {_summary(latencies, time.perf_counter() - started, backend.calls)}")
+
+
+async def main(args):
+    backend = MemoryBackend(latency=args.latency, jitter=args.jitter)
+    created = backend.seed(
+        platforms=3,
+        groups_per_platform=args.groups,
+        channels_per_group=args.channels,
+        run_logs_per_channel=args.logs,
+    )
+    database.set_backend(backend)
+    print(
+        f"시드: {created} | DB 지연 {args.latency * 1000:.0f}ms(+0~{args.jitter * 1000:.0f}ms) | "
+        f"동시성 {args.concurrency} | 엔드포인트당 요청 {args.requests}회"
+    )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ENDPOINTS:
+            await bench_endpoint(client, backend, path, args.requests, args.concurrency)
+    await bench_executor(backend, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="메모리 백엔드 기반 API/실행기 부하 테스트")
+    parser.add_argument("--groups", type=int, default=20, help="플랫폼당 그룹 수")
+    parser.add_argument("--channels", type=int, default=5, help="그룹당 채널 수")
+    parser.add_argument("--logs", type=int, default=20, help="채널당 실행 로그 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="DB 호출당 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="DB 호출당 추가 무작위 지연(초)")
+    parser.add_argument("--requests", type=int, default=100, help="엔드포인트당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,154 @@
+"""
+벤치마크용 PostgREST 대역(stand-in)
+
+실제 postgrest 쿼리 빌더가 만든 HTTP 요청을 httpx.MockTransport로 받아
+메모리 데이터셋에서 응답합니다. 요청마다 왕복 지연(rtt)을 더해
+네트워크 왕복 횟수와 URL 길이의 영향을 재현합니다.
+
+지원 범위 (벤치마크에 필요한 만큼만):
+- select=* / 컬럼 목록 / 임베디드 inner join (예: groups!inner(platform_id))
+- 필터: eq, in
+- order, offset/limit
+- max-rows: 한 번에 반환하는 최대 행 수 (Supabase 기본값 1000)
+"""
+
+import json
+import time
+import uuid
+from typing import Dict, List
+
+import httpx
+from postgrest import SyncPostgrestClient
+
+
+def build_dataset(platforms: int, groups_per_platform: int, channels_per_group: int) -> Dict[str, List[Dict]]:
+    """합성 데이터셋 생성 (platforms → groups → channels)"""
+    dataset: Dict[str, List[Dict]] = {"platforms": [], "groups": [], "channels": []}
+    seq = 0
+    for p in range(platforms):
+        platform_id = str(uuid.uuid4())
+        dataset["platforms"].append({"id": platform_id, "key": f"platform_{p}", "name": f"Platform {p}"})
+        for g in range(groups_per_platform):
+            group_id = str(uuid.uuid4())
+            dataset["groups"].append({"id": group_id, "platform_id": platform_id, "name": f"group {p}-{g}"})
+            for c in range(channels_per_group):
+                seq += 1
+                dataset["channels"].append({
+                    "id": str(uuid.uuid4()),
+                    "group_id": group_id,
+                    "name": f"channel {p}-{g}-{c}",
+                    "type": "youtube_shorts",
+                    "status": "active",
+                    "config": {},
+                    "created_at": f"2024-01-01T00:00:{seq:09d}",
+                })
+    return dataset
+
+
+def _parse_filter(value: str):
+    """PostgREST 필터 문자열 파싱 (eq.x, in.(a,b))"""
+    op, _, operand = value.partition(".")
+    if op == "eq":
+        return lambda v: str(v) == operand
+    if op == "in":
+        items = set(operand.strip("()").split(","))
+        return lambda v: str(v) in items
+    raise ValueError(f"지원하지 않는 필터: {value}")
+
+
+class PostgrestStub:
+    """메모리 데이터셋 기반 PostgREST 대역"""
+
+    # 테이블 간 FK (자식 테이블 → {부모 테이블: FK 컬럼})
+    relations = {"channels": {"groups": "group_id"}, "groups": {"platforms": "platform_id"}}
+
+    def __init__(self, dataset: Dict[str, List[Dict]], rtt: float = 0.02, max_rows: int = 1000):
+        self.dataset = dataset
+        self.rtt = rtt
+        self.max_rows = max_rows
+        self.requests = 0
+        self.max_url_length = 0
+        self._index = {table: {row["id"]: row for row in rows} for table, rows in dataset.items()}
+        # 동일 쿼리(페이지 제외) 결과 메모 - 대역 자체의 CPU 비용이 측정을 왜곡하지 않도록
+        self._memo: Dict[tuple, List[Dict]] = {}
+
+    def reset_counters(self):
+        self.requests = 0
+        self.max_url_length = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.max_url_length = max(self.max_url_length, len(str(request.url)))
+        time.sleep(self.rtt)
+
+        table = request.url.path.rstrip("/").split("/")[-1]
+        params = request.url.params
+        memo_key = (table, tuple(
+            (k, v) for k, v in params.multi_items() if k not in ("offset", "limit")
+        ))
+        result = self._memo.get(memo_key)
+        if result is None:
+            result = self._memo[memo_key] = self._query(table, params)
+
+        offset = int(params.get("offset", 0))
+        limit = min(int(params.get("limit", self.max_rows)), self.max_rows)
+        result = result[offset:offset + limit]
+
+        if "vnd.pgrst.object" in request.headers.get("accept", ""):
+            if len(result) != 1:
+                return httpx.Response(406, json={"code": "PGRST116", "message": "No rows"})
+            return httpx.Response(200, content=json.dumps(result[0]))
+        return httpx.Response(200, content=json.dumps(result))
+
+    def _query(self, table: str, params) -> List[Dict]:
+        """필터/조인/정렬 적용 (페이지 처리 전 전체 결과)"""
+        rows = self.dataset[table]
+
+        # 임베디드 inner join: select=*,groups!inner(platform_id)
+        embeds = {}
+        for part in params.get("select", "*").split(","):
+            if "!inner(" in part:
+                parent, _, columns = part.partition("!inner(")
+                embeds[parent] = columns.rstrip(")").split(",")
+
+        filters = []
+        for key, value in params.multi_items():
+            if key in ("select", "order", "offset", "limit"):
+                continue
+            parent, _, column = key.rpartition(".")
+            filters.append((parent or None, column, _parse_filter(value)))
+
+        result = []
+        for row in rows:
+            joined = {}
+            for parent, columns in embeds.items():
+                fk = self.relations[table][parent]
+                parent_row = self._index[parent].get(row[fk])
+                if parent_row is None:
+                    break
+                joined[parent] = {c: parent_row[c] for c in columns}
+            else:
+                if all(
+                    match((joined[parent] if parent else row).get(column))
+                    for parent, column, match in filters
+                ):
+                    result.append({**row, **joined})
+
+        if "order" in params:
+            column = params["order"].split(".")[0]
+            result.sort(key=lambda r: r[column])
+        return result
+
+
+class StubSupabase:
+    """supabase.Client 대역 (table()만 제공)"""
+
+    def __init__(self, stub: PostgrestStub):
+        http_client = httpx.Client(
+            base_url="http://stub/rest/v1",
+            transport=httpx.MockTransport(stub.handle),
+        )
+        self.postgrest = SyncPostgrestClient("http://stub/rest/v1", http_client=http_client)
+
+    def table(self, table_name: str):
+        return self.postgrest.from_(table_name)
@@ -0,0 +1 @@
+# 운영 명령 모듈
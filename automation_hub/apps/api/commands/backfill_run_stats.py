@@ -0,0 +1,61 @@
+"""
+일별 실행 통계 롤업(run_stats_daily) 백필
+
+run_logs에 쌓인 기존 기록으로 롤업을 다시 계산합니다.
+008 마이그레이션 적용 직후, 또는 롤업과 로그가 어긋났을 때 실행합니다.
+큰 기간은 chunk-days 단위로 나눠 DB 함수 호출 한 번의 부담을 제한합니다.
+
+실행 (apps/api 디렉토리에서, .env 필요):
+    python -m commands.backfill_run_stats --start 2024-01-01 --end 2024-12-31 --chunk-days 31
+"""
+
+import argparse
+import asyncio
+from datetime import date, datetime, timedelta
+
+from core.database import backfill_run_stats_daily, close_database
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+async def backfill(start_date: date, end_date: date, chunk_days: int) -> int:
+    """기간을 나눠 백필하고 생성된 롤업 행 수 합계를 반환"""
+    total = 0
+    chunk_start = start_date
+    try:
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+            rows = await backfill_run_stats_daily(chunk_start, chunk_end)
+            logger.info(f"롤업 백필: {chunk_start} ~ {chunk_end}, {rows}행")
+            total += rows
+            chunk_start = chunk_end + timedelta(days=1)
+    finally:
+        await close_database()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일별 실행 통계 롤업 백필")
+    parser.add_argument("--start", type=_parse_date, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument(
+        "--end", type=_parse_date, default=datetime.utcnow().date(), help="종료일 (기본: 오늘, UTC)"
+    )
+    parser.add_argument("--chunk-days", type=int, default=31, help="한 번에 처리할 일 수")
+    args = parser.parse_args()
+
+    if args.start > args.end:
+        parser.error("시작일이 종료일보다 늦습니다")
+    if args.chunk_days <= 0:
+        parser.error("chunk-days는 1 이상이어야 합니다")
+
+    total = asyncio.run(backfill(args.start, args.end, args.chunk_days))
+    logger.info(f"롤업 백필 완료: 총 {total}행")
+
+
+if __name__ == "__main__":
+    main()
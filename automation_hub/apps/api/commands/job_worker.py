@@ -0,0 +1,64 @@
+"""
+실행 작업 큐 워커
+
+job_queue에 쌓인 그룹/채널 실행 작업을 가져가 실행합니다.
+API 서버와 별도 프로세스로 띄우며, 같은 DB를 바라보는 여러 프로세스/호스트에서
+동시에 실행해도 작업이 겹치지 않습니다.
+
+SIGINT/SIGTERM을 받으면 새 작업을 가져가지 않고 실행 중인 작업이 끝난 뒤
+쓰기 버퍼를 flush하고 종료합니다.
+
+실행 (apps/api 디렉토리에서, .env 필요):
+    python -m commands.job_worker --concurrency 4
+"""
+
+import argparse
+import asyncio
+import signal
+
+from core.database import close_database
+from core.logger import setup_logger
+from services.job_queue import create_worker
+from services.process_pool import cpu_pool
+from services.write_buffer import write_buffer
+
+logger = setup_logger(__name__)
+
+
+async def run_worker(worker_id: str = None, concurrency: int = None):
+    """워커 실행 (종료 신호까지)"""
+    worker = create_worker(worker_id, concurrency)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:  # Windows
+            pass
+
+    write_buffer.start()
+    try:
+        await worker.run()
+    finally:
+        await write_buffer.stop()
+        await close_database()
+        cpu_pool.shutdown()
+    logger.info(f"작업 워커 통계: {worker.get_stats()}, CPU 풀: {cpu_pool.get_stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실행 작업 큐 워커")
+    parser.add_argument("--worker-id", help="워커 ID (기본: 호스트명:PID)")
+    parser.add_argument(
+        "--concurrency", type=int, help="동시 실행 작업 수 (기본: JOB_WORKER_CONCURRENCY)"
+    )
+    args = parser.parse_args()
+
+    if args.concurrency is not None and args.concurrency <= 0:
+        parser.error("concurrency는 1 이상이어야 합니다")
+
+    asyncio.run(run_worker(args.worker_id, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
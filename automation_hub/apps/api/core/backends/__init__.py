@@ -0,0 +1,51 @@
+"""
+DB 백엔드 모음
+
+설정(DB_BACKEND)에 따라 core.database가 사용할 구현을 생성합니다.
+- supabase: Supabase REST(PostgREST) - 기본값
+- postgres: asyncpg로 Postgres 직접 연결 (DATABASE_URL 필요)
+- memory: 프로세스 메모리 (테스트, 오프라인 부하 테스트)
+"""
+
+from core.backends.base import DatabaseBackend
+
+
+def create_backend(settings) -> DatabaseBackend:
+    """설정에 맞는 DB 백엔드 생성 (선택된 백엔드의 의존성만 import)"""
+    if settings.db_backend == "supabase":
+        from core.backends.supabase import SupabaseBackend
+
+        return SupabaseBackend(
+            settings.supabase_url,
+            settings.supabase_key,
+            max_workers=settings.db_max_workers,
+            lock_ttl_seconds=settings.channel_lock_ttl_seconds,
+        )
+
+    if settings.db_backend == "postgres":
+        from core.backends.postgres import PostgresBackend
+
+        if not settings.database_url:
+            raise ValueError("DB_BACKEND=postgres 사용 시 DATABASE_URL이 필요합니다")
+        return PostgresBackend(
+            settings.database_url,
+            min_size=settings.db_pool_min_size,
+            max_size=settings.db_pool_max_size,
+            statement_cache_size=settings.db_statement_cache_size,
+        )
+
+    if settings.db_backend == "memory":
+        from core.backends.memory import MemoryBackend
+
+        backend = MemoryBackend(
+            latency=settings.memory_db_latency,
+            jitter=settings.memory_db_jitter,
+        )
+        if settings.memory_db_seed:
+            backend.seed()
+        return backend
+
+    raise ValueError(f"지원하지 않는 DB_BACKEND: {settings.db_backend}")
+
+
+__all__ = ["DatabaseBackend", "create_backend"]
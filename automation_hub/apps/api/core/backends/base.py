@@ -0,0 +1,311 @@
+"""
+DB 백엔드 인터페이스
+
+core.database의 CRUD 함수가 호출하는 저장소 구현의 공통 인터페이스입니다.
+구현체는 아래 메서드를 같은 의미로 제공해야 하며,
+반환 행은 Supabase(PostgREST) 응답과 같은 형태의 dict입니다.
+
+- UUID: 문자열
+- 날짜/시각: ISO 8601 문자열
+- JSONB: dict/list
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class DatabaseBackend(ABC):
+    """DB 백엔드 기본 클래스"""
+
+    # 설정(DB_BACKEND)에서 선택할 때 쓰는 이름
+    name: str = ""
+
+    async def close(self):
+        """연결/스레드 풀 등 자원 정리 (기본: 없음)"""
+
+    # ============ 플랫폼 ============
+
+    @abstractmethod
+    async def get_all_platforms(self, active_only: bool = False) -> List[Dict]:
+        """모든 플랫폼 조회 (created_at 순)"""
+
+    @abstractmethod
+    async def get_platform_by_id(self, platform_id: str) -> Optional[Dict]:
+        """ID로 플랫폼 조회 (없으면 None)"""
+
+    @abstractmethod
+    async def get_platform_by_key(self, platform_key: str) -> Optional[Dict]:
+        """플랫폼 키로 조회 (없으면 None)"""
+
+    @abstractmethod
+    async def create_platform(self, platform_data: dict) -> Optional[Dict]:
+        """플랫폼 생성"""
+
+    @abstractmethod
+    async def update_platform(self, platform_id: str, platform_data: dict) -> Optional[Dict]:
+        """플랫폼 수정"""
+
+    @abstractmethod
+    async def delete_platform(self, platform_id: str) -> List:
+        """플랫폼 삭제 (삭제된 행 반환)"""
+
+    # ============ 그룹 ============
+
+    @abstractmethod
+    async def get_all_groups(self, platform_id: str = None) -> List[Dict]:
+        """모든 그룹 조회 (created_at 순, 플랫폼 필터 선택적)"""
+
+    @abstractmethod
+    async def get_groups_with_platform(self) -> List[Dict]:
+        """플랫폼 정보(platform 키)를 포함한 그룹 목록 조회"""
+
+    @abstractmethod
+    async def get_group_by_id(self, group_id: str) -> Optional[Dict]:
+        """ID로 그룹 조회 (없으면 None)"""
+
+    @abstractmethod
+    async def get_groups_by_ids(self, group_ids: List[str], columns: str = "*") -> List[Dict]:
+        """여러 그룹을 한 번에 조회 (columns: "*" 또는 "id, name" 형식)"""
+
+    @abstractmethod
+    async def get_group_with_platform(self, group_id: str) -> Optional[Dict]:
+        """플랫폼 정보(platform 키)를 포함한 그룹 조회"""
+
+    @abstractmethod
+    async def create_group(self, group_data: dict) -> Optional[Dict]:
+        """그룹 생성"""
+
+    @abstractmethod
+    async def update_group(self, group_id: str, group_data: dict) -> Optional[Dict]:
+        """그룹 수정"""
+
+    @abstractmethod
+    async def delete_group(self, group_id: str) -> List:
+        """그룹 삭제 (삭제된 행 반환)"""
+
+    # ============ 채널 ============
+
+    @abstractmethod
+    async def get_all_channels(self, group_id: str = None) -> List[Dict]:
+        """모든 채널 조회 (created_at 순, 그룹 필터 선택적)"""
+
+    @abstractmethod
+    async def get_channels_by_platform(self, platform_id: str) -> List[Dict]:
+        """특정 플랫폼에 속한 모든 채널 조회 (created_at 순)"""
+
+    @abstractmethod
+    async def get_channel_by_id(self, channel_id: str) -> Optional[Dict]:
+        """ID로 채널 조회 (없으면 None)"""
+
+    @abstractmethod
+    async def get_channels_by_ids(self, channel_ids: List[str], columns: str = "*") -> List[Dict]:
+        """여러 채널을 한 번에 조회 (columns: "*" 또는 "id, name" 형식)"""
+
+    @abstractmethod
+    async def create_channel(self, channel_data: dict) -> Optional[Dict]:
+        """채널 생성"""
+
+    @abstractmethod
+    async def update_channel(self, channel_id: str, channel_data: dict) -> Optional[Dict]:
+        """채널 수정"""
+
+    @abstractmethod
+    async def bulk_update_channel_runs(self, updates: List[Dict]) -> int:
+        """채널 last_run_at/last_run_status/status 일괄 수정 (없는 필드는 유지)"""
+
+    @abstractmethod
+    async def delete_channel(self, channel_id: str) -> List:
+        """채널 삭제 (삭제된 행 반환)"""
+
+    # ============ 스케줄 ============
+
+    @abstractmethod
+    async def get_all_schedules(self) -> List[Dict]:
+        """모든 스케줄 조회 (created_at 순)"""
+
+    @abstractmethod
+    async def get_schedule_by_id(self, schedule_id: str) -> Optional[Dict]:
+        """ID로 스케줄 조회 (없으면 None)"""
+
+    @abstractmethod
+    async def get_schedules_by_target(self, target_type: str, target_id: str) -> List[Dict]:
+        """대상별 스케줄 조회"""
+
+    @abstractmethod
+    async def get_active_schedules(self) -> List[Dict]:
+        """활성 스케줄만 조회 (created_at 순)"""
+
+    @abstractmethod
+    async def create_schedule(self, schedule_data: dict) -> Optional[Dict]:
+        """스케줄 생성"""
+
+    @abstractmethod
+    async def update_schedule(self, schedule_id: str, schedule_data: dict) -> Optional[Dict]:
+        """스케줄 수정"""
+
+    @abstractmethod
+    async def delete_schedule(self, schedule_id: str) -> List:
+        """스케줄 삭제 (삭제된 행 반환)"""
+
+    # ============ 실행 로그 ============
+
+    @abstractmethod
+    async def create_run_log(self, log_data: dict) -> Optional[Dict]:
+        """실행 로그 생성"""
+
+    @abstractmethod
+    async def update_run_log(self, log_id: str, log_data: dict) -> Optional[Dict]:
+        """실행 로그 수정"""
+
+    @abstractmethod
+    async def upsert_run_logs(self, logs: List[Dict]) -> List[Dict]:
+        """실행 로그 일괄 업서트 (id 기준)"""
+
+    @abstractmethod
+    async def get_run_logs(
+        self,
+        channel_id: str = None,
+        limit: int = 50,
+        after: Optional[Tuple[str, str]] = None,
+        started_from: Optional[datetime] = None,
+        started_to: Optional[datetime] = None,
+    ) -> List[Dict]:
+        """실행 로그 조회 ((started_at, id) 내림차순, after 다음 행부터)"""
+
+    @abstractmethod
+    async def get_run_log_by_id(self, log_id: str) -> Optional[Dict]:
+        """ID로 실행 로그 조회 (없으면 None)"""
+
+    # ============ 단계 체크포인트 ============
+
+    @abstractmethod
+    async def upsert_stage_checkpoints(self, checkpoints: List[Dict]) -> int:
+        """단계 체크포인트 일괄 업서트 ((run_log_id, stage) 기준, 반영된 행 수 반환)"""
+
+    @abstractmethod
+    async def get_stage_checkpoints(self, run_log_id: str) -> List[Dict]:
+        """실행 로그의 단계 체크포인트 조회 (created_at 순)"""
+
+    # ============ 실행 통계 집계 / 롤업 ============
+
+    @abstractmethod
+    async def get_daily_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        """[{"run_date", "status", "run_count"}, ...]"""
+
+    @abstractmethod
+    async def get_group_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        """[{"group_id", "status", "run_count"}, ...]"""
+
+    @abstractmethod
+    async def get_channel_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        """[{"channel_id", "group_id", "status", "run_count"}, ...]"""
+
+    @abstractmethod
+    async def get_channel_durations(self, start_date: date, end_date: date) -> List[Dict]:
+        """채널별 완료된 실행 횟수와 소요 시간 합계 [{"channel_id", "run_count", "total_duration_seconds"}, ...]"""
+
+    @abstractmethod
+    async def bump_run_stats_daily(self, deltas: List[Dict]) -> int:
+        """일별 실행 통계 롤업 증분 반영"""
+
+    @abstractmethod
+    async def backfill_run_stats_daily(self, start_date: date, end_date: date) -> int:
+        """기간 내 롤업을 run_logs에서 재계산 (생성된 행 수 반환)"""
+
+    # ============ 작업 큐 ============
+
+    @abstractmethod
+    async def enqueue_job(self, job_data: dict) -> Optional[Dict]:
+        """작업 추가 (status=queued)"""
+
+    @abstractmethod
+    async def claim_jobs(self, worker_id: str, limit: int) -> List[Dict]:
+        """실행 가능한 대기 작업을 최대 limit개 running으로 바꿔 반환 (워커 간 중복 없음)"""
+
+    @abstractmethod
+    async def update_job(self, job_id: str, job_data: dict) -> Optional[Dict]:
+        """작업 수정"""
+
+    @abstractmethod
+    async def heartbeat_jobs(self, worker_id: str) -> int:
+        """워커가 실행 중인 작업의 locked_at 갱신 (갱신된 작업 수 반환)"""
+
+    @abstractmethod
+    async def requeue_stale_jobs(self, timeout_seconds: int) -> int:
+        """heartbeat가 끊긴 실행 중 작업을 재대기/실패 처리 (처리된 작업 수 반환)"""
+
+    @abstractmethod
+    async def get_job_by_id(self, job_id: str) -> Optional[Dict]:
+        """ID로 작업 조회 (없으면 None)"""
+
+    @abstractmethod
+    async def get_jobs(self, status: str = None, limit: int = 50) -> List[Dict]:
+        """작업 목록 조회 (최신순, 상태 필터 선택적)"""
+
+    # ============ 실행 취소 ============
+
+    @abstractmethod
+    async def create_cancel_request(self, request_data: dict) -> Optional[Dict]:
+        """실행 취소 요청 기록 ({"scope", "target_id", "requested_at"})"""
+
+    @abstractmethod
+    async def get_cancel_requests(self, since: datetime) -> List[Dict]:
+        """since 이후의 취소 요청 조회 (requested_at 순)"""
+
+    @abstractmethod
+    async def cancel_queued_jobs(self, group_id: str = None) -> int:
+        """대기 중인 작업 취소 (group_id가 있으면 해당 그룹 작업만, 취소된 수 반환)"""
+
+    # ============ 워커 상태 보고 ============
+
+    @abstractmethod
+    async def upsert_worker_stats(self, worker_id: str, stats: dict) -> None:
+        """워커 상태 보고 (worker_id 행을 덮어쓰고 updated_at 갱신)"""
+
+    @abstractmethod
+    async def get_worker_stats(self, since: datetime) -> List[Dict]:
+        """since 이후에 보고한 워커 상태 조회 ([{"worker_id", "stats", "updated_at"}], worker_id 순)"""
+
+    # ============ 프로세스 간 잠금 ============
+
+    @abstractmethod
+    async def try_advisory_lock(self, key: str) -> bool:
+        """
+        프로세스 간 잠금 획득 시도 (기다리지 않음)
+
+        이 프로세스가 잠금을 보유한 동안 다른 프로세스는 같은 key를 얻을 수 없습니다.
+        같은 프로세스 안의 중복은 호출자가 막아야 합니다.
+        """
+
+    @abstractmethod
+    async def advisory_unlock(self, key: str) -> None:
+        """try_advisory_lock으로 얻은 잠금 해제"""
+
+    @abstractmethod
+    async def renew_advisory_lock(self, key: str) -> bool:
+        """
+        보유 중인 잠금 연장 (만료가 있는 잠금은 만료 시각을 다시 늘림)
+
+        잠금을 잃었으면(만료 후 다른 프로세스가 가져감) False
+        """
+
+    # ============ 전역 설정 (settings 테이블) ============
+
+    @abstractmethod
+    async def get_setting_values(self, prefix: str = None) -> Dict[str, Any]:
+        """settings 테이블 조회 ({key: value}, prefix가 있으면 그 문자열로 시작하는 key만)"""
+
+    @abstractmethod
+    async def set_setting_value(self, key: str, value: Any) -> Optional[Dict]:
+        """settings 테이블 업서트"""
+
+    # ============ 통계 ============
+
+    @abstractmethod
+    async def get_stats(self, channel_id: str, days: int = 30) -> List[Dict]:
+        """채널 통계 조회 (최신 날짜순)"""
+
+    @abstractmethod
+    async def upsert_stats(self, stats_data: dict) -> Optional[Dict]:
+        """통계 업서트"""
@@ -0,0 +1,817 @@
+"""
+메모리 백엔드
+
+프로세스 메모리의 dict에 데이터를 보관하는 DB 백엔드입니다.
+외부 DB 없이 테스트를 실행하거나, 라우터/실행기를 노트북에서 부하 테스트할 때 사용합니다.
+
+- seed(): 플랫폼/그룹/채널/스케줄/실행 로그 합성 데이터 생성 (random_seed로 재현 가능)
+- latency / jitter: 호출마다 await하는 인공 지연 (초) - 네트워크 왕복 재현
+- 스키마 동작 재현: 기본값, created_at/updated_at, FK 확인, ON DELETE CASCADE / RESTRICT,
+  run_stats_daily 롤업과 집계 함수
+- 반환 행은 복사본이므로 호출자가 수정해도 저장된 데이터는 바뀌지 않음
+"""
+
+import asyncio
+import copy
+import random
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.backends.base import DatabaseBackend
+
+# 테이블별 기본값 (supabase/migrations 스키마와 동일)
+_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "platforms": {"description": None, "config": {}, "is_active": True},
+    "groups": {
+        "description": None,
+        "schedule_cron": "0 9 * * *",
+        "is_active": True,
+        "platform_id": None,
+    },
+    "channels": {"config": {}, "status": "active", "last_run_at": None, "last_run_status": None},
+    "schedules": {
+        "is_active": True, "last_run_at": None, "next_run_at": None,
+        "misfire_policy": "skip", "last_planned_at": None, "last_lateness_seconds": None,
+    },
+    "run_logs": {
+        "group_id": None,
+        "finished_at": None,
+        "duration_seconds": None,
+        "result": {},
+        "error_message": None,
+        "resumed_from": None,
+    },
+    "stage_checkpoints": {"size_bytes": 0, "host": None},
+    "stats": {"views": 0, "subscribers": 0, "likes": 0, "comments": 0, "posts_count": 0},
+    "run_cancel_requests": {"target_id": None},
+    "settings": {},
+    "worker_stats": {},
+    "job_queue": {
+        "status": "queued",
+        "source": "manual",
+        "schedule_id": None,
+        "priority": 0,
+        "attempts": 0,
+        "max_attempts": 3,
+        "locked_by": None,
+        "locked_at": None,
+        "result": None,
+        "error_message": None,
+        "finished_at": None,
+    },
+}
+
+# updated_at 컬럼이 있는 테이블
+_UPDATED_AT_TABLES = {"platforms", "groups", "channels", "schedules", "job_queue"}
+
+# 시각 컬럼 (저장 시 UTC ISO 문자열로 정규화)
+_TIMESTAMP_COLUMNS = {
+    "created_at", "updated_at", "started_at", "finished_at", "last_run_at", "next_run_at",
+    "run_after", "locked_at", "requested_at", "last_planned_at",
+}
+
+# FK (자식 테이블 → [(컬럼, 부모 테이블)])
+_FOREIGN_KEYS = {
+    "groups": [("platform_id", "platforms")],
+    "channels": [("group_id", "groups")],
+    "run_logs": [("channel_id", "channels"), ("group_id", "groups"), ("resumed_from", "run_logs")],
+    "stage_checkpoints": [("run_log_id", "run_logs")],
+    "stats": [("channel_id", "channels")],
+    "job_queue": [("schedule_id", "schedules")],
+}
+
+# 시드 데이터용 플랫폼 키 (005 마이그레이션의 허용 키) → 채널 설정 예시
+_SEED_PLATFORMS = {
+    "youtube_shorts": {"youtube_channel_id": "UCseed", "content_topic": "seed"},
+    "naver_blog": {"blog_id": "seed", "content_category": "seed"},
+    "nextjs_blog": {"repo_url": "https://example.com/seed.git", "content_path": "posts", "content_topic": "seed"},
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """ISO 문자열 → aware datetime (시간대가 없으면 UTC로 간주)"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _normalize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """입력 행 정규화 (시각 → UTC ISO 문자열, date → 문자열)"""
+    row = {}
+    for key, value in data.items():
+        if key in _TIMESTAMP_COLUMNS and value is not None:
+            if isinstance(value, datetime):
+                value = _as_utc(value).isoformat()
+            else:
+                value = _parse_timestamp(str(value)).isoformat()
+        elif isinstance(value, date):
+            value = value.isoformat()
+        row[key] = copy.deepcopy(value)
+    return row
+
+
+def _copy(row: Dict[str, Any]) -> Dict[str, Any]:
+    """반환용 복사 (JSON 컬럼은 깊은 복사)"""
+    return {k: copy.deepcopy(v) if isinstance(v, (dict, list)) else v for k, v in row.items()}
+
+
+def _select(row: Dict[str, Any], columns: str) -> Dict[str, Any]:
+    """PostgREST 형식 컬럼 목록("*" 또는 "id, name")만 남김"""
+    if columns.strip() == "*":
+        return _copy(row)
+    return {name: row.get(name) for name in (c.strip() for c in columns.split(","))}
+
+
+class MemoryBackend(DatabaseBackend):
+    """dict 기반 메모리 백엔드"""
+
+    name = "memory"
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0):
+        """
+        Args:
+            latency: 호출마다 추가하는 지연 (초)
+            jitter: 0~jitter 사이의 추가 무작위 지연 (초)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = 0
+        self.tables: Dict[str, Dict[str, Dict[str, Any]]] = {table: {} for table in _DEFAULTS}
+        # run_stats_daily: (date, channel_id, group_id, status) → {run_count, total_duration_seconds}
+        self.run_stats: Dict[Tuple[str, str, str, str], Dict[str, int]] = {}
+        # run_logs 정렬 키 (id → started_at datetime), 조회마다 문자열을 파싱하지 않도록 보관
+        self._started_at: Dict[str, datetime] = {}
+        # 보유 중인 프로세스 간 잠금 key (다른 프로세스가 잡은 잠금은 테스트에서 직접 추가)
+        self.advisory_locks: Set[str] = set()
+
+    async def _delay(self):
+        """호출 횟수 집계 + 인공 지연"""
+        self.calls += 1
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            # 지연이 없어도 실제 I/O처럼 이벤트 루프에 양보
+            await asyncio.sleep(0)
+
+    def reset(self):
+        """모든 데이터 삭제 (호출 횟수 포함)"""
+        for rows in self.tables.values():
+            rows.clear()
+        self.run_stats.clear()
+        self._started_at.clear()
+        self.advisory_locks.clear()
+        self.calls = 0
+
+    # ============ 공통 연산 ============
+
+    def _check_foreign_keys(self, table: str, row: Dict[str, Any]):
+        for column, parent in _FOREIGN_KEYS.get(table, []):
+            value = row.get(column)
+            if value is not None and value not in self.tables[parent]:
+                raise ValueError(f"FK 위반: {table}.{column}={value} ({parent}에 없음)")
+
+    def _insert_row(self, table: str, data: dict) -> Dict[str, Any]:
+        now = _now()
+        row = {"id": str(uuid.uuid4()), **copy.deepcopy(_DEFAULTS[table]), "created_at": now}
+        if table in _UPDATED_AT_TABLES:
+            row["updated_at"] = now
+        if table == "run_logs":
+            row["started_at"] = now
+        if table == "job_queue":
+            row["run_after"] = now
+        if table == "run_cancel_requests":
+            row["requested_at"] = now
+        row.update(_normalize(data))
+        self._check_foreign_keys(table, row)
+        self.tables[table][row["id"]] = row
+        if table == "run_logs":
+            self._started_at[row["id"]] = _parse_timestamp(row["started_at"])
+        return row
+
+    def _update_row(self, table: str, row_id: str, data: dict) -> Optional[Dict[str, Any]]:
+        row = self.tables[table].get(row_id)
+        if row is None:
+            return None
+        updated = {**row, **_normalize(data)}
+        if table in _UPDATED_AT_TABLES:
+            updated["updated_at"] = _now()
+        self._check_foreign_keys(table, updated)
+        self.tables[table][row_id] = updated
+        if table == "run_logs":
+            self._started_at[row_id] = _parse_timestamp(updated["started_at"])
+        return updated
+
+    def _delete_row(self, table: str, row_id: str) -> List[Dict]:
+        row = self.tables[table].pop(row_id, None)
+        if row is None:
+            return []
+        # ON DELETE 동작 (스키마와 동일)
+        if table == "groups":
+            for channel_id in [c["id"] for c in self.tables["channels"].values() if c["group_id"] == row_id]:
+                self._delete_row("channels", channel_id)
+            for log in self.tables["run_logs"].values():
+                if log["group_id"] == row_id:
+                    log["group_id"] = None
+            self.run_stats = {k: v for k, v in self.run_stats.items() if k[2] != row_id}
+        elif table == "channels":
+            for child in ("run_logs", "stats"):
+                self.tables[child] = {
+                    k: v for k, v in self.tables[child].items() if v["channel_id"] != row_id
+                }
+            logs = self.tables["run_logs"]
+            self.tables["stage_checkpoints"] = {
+                k: v for k, v in self.tables["stage_checkpoints"].items() if v["run_log_id"] in logs
+            }
+            for log in logs.values():
+                if log["resumed_from"] is not None and log["resumed_from"] not in logs:
+                    log["resumed_from"] = None
+            self.run_stats = {k: v for k, v in self.run_stats.items() if k[1] != row_id}
+        elif table == "schedules":
+            for job in self.tables["job_queue"].values():
+                if job["schedule_id"] == row_id:
+                    job["schedule_id"] = None
+        return [_copy(row)]
+
+    def _rows(self, table: str, order_by: str = "created_at", **filters) -> List[Dict]:
+        """필터(컬럼=값) 적용 후 정렬된 복사본 목록"""
+        rows = [
+            row for row in self.tables[table].values()
+            if all(row.get(column) == value for column, value in filters.items())
+        ]
+        if order_by in _TIMESTAMP_COLUMNS:
+            rows.sort(key=lambda row: _parse_timestamp(row[order_by]))
+        else:
+            rows.sort(key=lambda row: row[order_by])
+        return [_copy(row) for row in rows]
+
+    def _get(self, table: str, row_id: str) -> Optional[Dict]:
+        row = self.tables[table].get(row_id)
+        return _copy(row) if row is not None else None
+
+    # ============ 플랫폼 CRUD ============
+
+    async def get_all_platforms(self, active_only: bool = False) -> List[Dict]:
+        await self._delay()
+        if active_only:
+            return self._rows("platforms", is_active=True)
+        return self._rows("platforms")
+
+    async def get_platform_by_id(self, platform_id: str) -> Optional[Dict]:
+        await self._delay()
+        return self._get("platforms", platform_id)
+
+    async def get_platform_by_key(self, platform_key: str) -> Optional[Dict]:
+        await self._delay()
+        rows = self._rows("platforms", key=platform_key)
+        return rows[0] if rows else None
+
+    async def create_platform(self, platform_data: dict) -> Optional[Dict]:
+        await self._delay()
+        return _copy(self._insert_row("platforms", platform_data))
+
+    async def update_platform(self, platform_id: str, platform_data: dict) -> Optional[Dict]:
+        await self._delay()
+        row = self._update_row("platforms", platform_id, platform_data)
+        return _copy(row) if row else None
+
+    async def delete_platform(self, platform_id: str) -> List:
+        await self._delay()
+        # ON DELETE RESTRICT
+        if any(g["platform_id"] == platform_id for g in self.tables["groups"].values()):
+            raise ValueError(f"FK 위반: 플랫폼 {platform_id}에 연결된 그룹이 있습니다")
+        return self._delete_row("platforms", platform_id)
+
+    # ============ 그룹 CRUD ============
+
+    async def get_all_groups(self, platform_id: str = None) -> List[Dict]:
+        await self._delay()
+        if platform_id:
+            return self._rows("groups", platform_id=platform_id)
+        return self._rows("groups")
+
+    def _with_platform(self, group: Dict) -> Dict:
+        return {**group, "platform": self._get("platforms", group.get("platform_id"))}
+
+    async def get_groups_with_platform(self) -> List[Dict]:
+        await self._delay()
+        return [self._with_platform(group) for group in self._rows("groups")]
+
+    async def get_group_by_id(self, group_id: str) -> Optional[Dict]:
+        await self._delay()
+        return self._get("groups", group_id)
+
+    async def get_groups_by_ids(self, group_ids: List[str], columns: str = "*") -> List[Dict]:
+        await self._delay()
+        rows = self.tables["groups"]
+        return [_select(rows[i], columns) for i in dict.fromkeys(group_ids) if i in rows]
+
+    async def get_group_with_platform(self, group_id: str) -> Optional[Dict]:
+        await self._delay()
+        group = self._get("groups", group_id)
+        return self._with_platform(group) if group else None
+
+    async def create_group(self, group_data: dict) -> Optional[Dict]:
+        await self._delay()
+        return _copy(self._insert_row("groups", group_data))
+
+    async def update_group(self, group_id: str, group_data: dict) -> Optional[Dict]:
+        await self._delay()
+        row = self._update_row("groups", group_id, group_data)
+        return _copy(row) if row else None
+
+    async def delete_group(self, group_id: str) -> List:
+        await self._delay()
+        return self._delete_row("groups", group_id)
+
+    # ============ 채널 CRUD ============
+
+    async def get_all_channels(self, group_id: str = None) -> List[Dict]:
+        await self._delay()
+        if group_id:
+            return self._rows("channels", group_id=group_id)
+        return self._rows("channels")
+
+    async def get_channels_by_platform(self, platform_id: str) -> List[Dict]:
+        await self._delay()
+        group_ids = {
+            g["id"] for g in self.tables["groups"].values() if g["platform_id"] == platform_id
+        }
+        return [c for c in self._rows("channels") if c["group_id"] in group_ids]
+
+    async def get_channel_by_id(self, channel_id: str) -> Optional[Dict]:
+        await self._delay()
+        return self._get("channels", channel_id)
+
+    async def get_channels_by_ids(self, channel_ids: List[str], columns: str = "*") -> List[Dict]:
+        await self._delay()
+        rows = self.tables["channels"]
+        return [_select(rows[i], columns) for i in dict.fromkeys(channel_ids) if i in rows]
+
+    async def create_channel(self, channel_data: dict) -> Optional[Dict]:
+        await self._delay()
+        return _copy(self._insert_row("channels", channel_data))
+
+    async def update_channel(self, channel_id: str, channel_data: dict) -> Optional[Dict]:
+        await self._delay()
+        row = self._update_row("channels", channel_id, channel_data)
+        return _copy(row) if row else None
+
+    async def bulk_update_channel_runs(self, updates: List[Dict]) -> int:
+        await self._delay()
+        updated = 0
+        for update in updates:
+            # 값이 없는(None) 필드는 기존 값 유지 (007 함수와 동일)
+            data = {
+                key: update[key]
+                for key in ("last_run_at", "last_run_status", "status")
+                if update.get(key) is not None
+            }
+            if update["id"] in self.tables["channels"]:
+                self._update_row("channels", update["id"], data)
+                updated += 1
+        return updated
+
+    async def delete_channel(self, channel_id: str) -> List:
+        await self._delay()
+        return self._delete_row("channels", channel_id)
+
+    # ============ 스케줄 CRUD ============
+
+    async def get_all_schedules(self) -> List[Dict]:
+        await self._delay()
+        return self._rows("schedules")
+
+    async def get_schedule_by_id(self, schedule_id: str) -> Optional[Dict]:
+        await self._delay()
+        return self._get("schedules", schedule_id)
+
+    async def get_schedules_by_target(self, target_type: str, target_id: str) -> List[Dict]:
+        await self._delay()
+        return self._rows("schedules", target_type=target_type, target_id=target_id)
+
+    async def get_active_schedules(self) -> List[Dict]:
+        await self._delay()
+        return self._rows("schedules", is_active=True)
+
+    async def create_schedule(self, schedule_data: dict) -> Optional[Dict]:
+        await self._delay()
+        return _copy(self._insert_row("schedules", schedule_data))
+
+    async def update_schedule(self, schedule_id: str, schedule_data: dict) -> Optional[Dict]:
+        await self._delay()
+        row = self._update_row("schedules", schedule_id, schedule_data)
+        return _copy(row) if row else None
+
+    async def delete_schedule(self, schedule_id: str) -> List:
+        await self._delay()
+        return self._delete_row("schedules", schedule_id)
+
+    # ============ 실행 로그 CRUD ============
+
+    async def create_run_log(self, log_data: dict) -> Optional[Dict]:
+        await self._delay()
+        return _copy(self._insert_row("run_logs", log_data))
+
+    async def update_run_log(self, log_id: str, log_data: dict) -> Optional[Dict]:
+        await self._delay()
+        row = self._update_row("run_logs", log_id, log_data)
+        return _copy(row) if row else None
+
+    async def upsert_run_logs(self, logs: List[Dict]) -> List[Dict]:
+        await self._delay()
+        rows = []
+        for log in logs:
+            if log.get("id") in self.tables["run_logs"]:
+                rows.append(self._update_row("run_logs", log["id"], log))
+            else:
+                rows.append(self._insert_row("run_logs", log))
+        return [_copy(row) for row in rows]
+
+    async def get_run_logs(
+        self,
+        channel_id: str = None,
+        limit: int = 50,
+        after: Optional[Tuple[str, str]] = None,
+        started_from: Optional[datetime] = None,
+        started_to: Optional[datetime] = None,
+    ) -> List[Dict]:
+        await self._delay()
+        lower = _as_utc(started_from) if started_from else None
+        upper = _as_utc(started_to) if started_to else None
+        cursor = (_parse_timestamp(after[0]), after[1]) if after else None
+
+        matched = []
+        for log in self.tables["run_logs"].values():
+            key = (self._started_at[log["id"]], log["id"])
+            if channel_id and log["channel_id"] != channel_id:
+                continue
+            if lower and key[0] < lower:
+                continue
+            if upper and key[0] >= upper:
+                continue
+            if cursor and not key < cursor:
+                continue
+            matched.append((key, log))
+        matched.sort(key=lambda item: item[0], reverse=True)
+        return [_copy(log) for _, log in matched[:limit]]
+
+    async def get_run_log_by_id(self, log_id: str) -> Optional[Dict]:
+        await self._delay()
+        return self._get("run_logs", log_id)
+
+    # ============ 단계 체크포인트 ============
+
+    async def upsert_stage_checkpoints(self, checkpoints: List[Dict]) -> int:
+        await self._delay()
+        existing = {
+            (row["run_log_id"], row["stage"]): row_id
+            for row_id, row in self.tables["stage_checkpoints"].items()
+        }
+        for checkpoint in checkpoints:
+            row_id = existing.get((checkpoint["run_log_id"], checkpoint["stage"]))
+            if row_id is not None:
+                self._update_row("stage_checkpoints", row_id, {**checkpoint, "created_at": _now()})
+            else:
+                row = self._insert_row("stage_checkpoints", checkpoint)
+                existing[(row["run_log_id"], row["stage"])] = row["id"]
+        return len(checkpoints)
+
+    async def get_stage_checkpoints(self, run_log_id: str) -> List[Dict]:
+        await self._delay()
+        return self._rows("stage_checkpoints", run_log_id=run_log_id)
+
+    # ============ 실행 통계 집계 / 롤업 ============
+
+    def _count_rows(self, start_date: date, end_date: date, dimensions: Tuple[int, ...]) -> List[Tuple]:
+        """
+        롤업을 지정한 키 위치(dimensions)와 상태별로 합산 (합이 0 이하인 키 제외)
+
+        그룹(2)은 롤업의 실행 시점 그룹이 아니라 채널의 현재 소속 그룹 (017 함수와 동일)
+        """
+        start, end = start_date.isoformat(), end_date.isoformat()
+        channels = self.tables["channels"]
+        totals: Dict[tuple, int] = {}
+        for key, counts in self.run_stats.items():
+            if start <= key[0] <= end:
+                if 2 in dimensions:
+                    channel = channels.get(key[1])
+                    if channel is None:
+                        continue
+                    key = key[:2] + (channel["group_id"],) + key[3:]
+                group_key = tuple(key[i] for i in dimensions) + (key[3],)
+                totals[group_key] = totals.get(group_key, 0) + counts["run_count"]
+        return sorted((k, v) for k, v in totals.items() if v > 0)
+
+    async def get_daily_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        await self._delay()
+        return [
+            {"run_date": run_date, "status": status, "run_count": count}
+            for (run_date, status), count in self._count_rows(start_date, end_date, (0,))
+        ]
+
+    async def get_group_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        await self._delay()
+        return [
+            {"group_id": group_id, "status": status, "run_count": count}
+            for (group_id, status), count in self._count_rows(start_date, end_date, (2,))
+        ]
+
+    async def get_channel_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        await self._delay()
+        return [
+            {"channel_id": channel_id, "group_id": group_id, "status": status, "run_count": count}
+            for (channel_id, group_id, status), count in self._count_rows(start_date, end_date, (1, 2))
+        ]
+
+    async def get_channel_durations(self, start_date: date, end_date: date) -> List[Dict]:
+        await self._delay()
+        start, end = start_date.isoformat(), end_date.isoformat()
+        totals: Dict[str, Dict[str, int]] = {}
+        for (run_date, channel_id, _, status), counts in self.run_stats.items():
+            if start <= run_date <= end and status in ("success", "failed"):
+                total = totals.setdefault(channel_id, {"run_count": 0, "total_duration_seconds": 0})
+                total["run_count"] += counts["run_count"]
+                total["total_duration_seconds"] += counts["total_duration_seconds"]
+        return [
+            {"channel_id": channel_id, **total}
+            for channel_id, total in sorted(totals.items())
+            if total["run_count"] > 0
+        ]
+
+    def _bump(self, key: Tuple[str, str, str, str], run_count: int, duration: int):
+        counts = self.run_stats.setdefault(key, {"run_count": 0, "total_duration_seconds": 0})
+        counts["run_count"] += run_count
+        counts["total_duration_seconds"] += duration
+
+    async def bump_run_stats_daily(self, deltas: List[Dict]) -> int:
+        await self._delay()
+        for delta in deltas:
+            key = (str(delta["date"]), delta["channel_id"], delta["group_id"], delta["status"])
+            self._bump(key, delta.get("run_count") or 0, delta.get("total_duration_seconds") or 0)
+        return len(deltas)
+
+    def _rebuild_run_stats(self, start_date: date, end_date: date) -> int:
+        """기간 내 롤업을 run_logs에서 재계산 (008 백필 함수와 동일)"""
+        start, end = start_date.isoformat(), end_date.isoformat()
+        self.run_stats = {k: v for k, v in self.run_stats.items() if not start <= k[0] <= end}
+        before = len(self.run_stats)
+        for log in self.tables["run_logs"].values():
+            run_date = self._started_at[log["id"]].date().isoformat()
+            channel = self.tables["channels"].get(log["channel_id"])
+            if channel is None or not start <= run_date <= end:
+                continue
+            key = (run_date, log["channel_id"], channel["group_id"], log["status"])
+            self._bump(key, 1, log.get("duration_seconds") or 0)
+        return len(self.run_stats) - before
+
+    async def backfill_run_stats_daily(self, start_date: date, end_date: date) -> int:
+        await self._delay()
+        return self._rebuild_run_stats(start_date, end_date)
+
+    # ============ 작업 큐 ============
+
+    async def enqueue_job(self, job_data: dict) -> Optional[Dict]:
+        await self._delay()
+        return _copy(self._insert_row("job_queue", job_data))
+
+    async def claim_jobs(self, worker_id: str, limit: int) -> List[Dict]:
+        await self._delay()
+        # 010 claim_jobs와 같은 순서 (priority DESC, run_after, created_at)
+        now = datetime.now(timezone.utc)
+        ready = [
+            job for job in self.tables["job_queue"].values()
+            if job["status"] == "queued" and _parse_timestamp(job["run_after"]) <= now
+        ]
+        ready.sort(key=lambda job: (
+            -job["priority"], _parse_timestamp(job["run_after"]), _parse_timestamp(job["created_at"])
+        ))
+        claimed = []
+        for job in ready[:limit]:
+            claimed.append(self._update_row("job_queue", job["id"], {
+                "status": "running",
+                "locked_by": worker_id,
+                "locked_at": _now(),
+                "attempts": job["attempts"] + 1,
+            }))
+        return [_copy(job) for job in claimed]
+
+    async def update_job(self, job_id: str, job_data: dict) -> Optional[Dict]:
+        await self._delay()
+        row = self._update_row("job_queue", job_id, job_data)
+        return _copy(row) if row else None
+
+    async def heartbeat_jobs(self, worker_id: str) -> int:
+        await self._delay()
+        running = self._rows("job_queue", status="running", locked_by=worker_id)
+        for job in running:
+            self._update_row("job_queue", job["id"], {"locked_at": _now()})
+        return len(running)
+
+    async def requeue_stale_jobs(self, timeout_seconds: int) -> int:
+        await self._delay()
+        deadline = datetime.now(timezone.utc) - timedelta(seconds=timeout_seconds)
+        stale = [
+            job for job in self._rows("job_queue", status="running")
+            if _parse_timestamp(job["locked_at"]) < deadline
+        ]
+        for job in stale:
+            retry = job["attempts"] < job["max_attempts"]
+            self._update_row("job_queue", job["id"], {
+                "status": "queued" if retry else "failed",
+                "finished_at": None if retry else _now(),
+                "error_message": f"워커 응답 없음 ({job['locked_by'] or '?'})",
+                "locked_by": None,
+                "locked_at": None,
+            })
+        return len(stale)
+
+    async def get_job_by_id(self, job_id: str) -> Optional[Dict]:
+        await self._delay()
+        return self._get("job_queue", job_id)
+
+    async def get_jobs(self, status: str = None, limit: int = 50) -> List[Dict]:
+        await self._delay()
+        filters = {"status": status} if status else {}
+        return self._rows("job_queue", **filters)[::-1][:limit]
+
+    # ============ 실행 취소 ============
+
+    async def create_cancel_request(self, request_data: dict) -> Optional[Dict]:
+        await self._delay()
+        return _copy(self._insert_row("run_cancel_requests", request_data))
+
+    async def get_cancel_requests(self, since: datetime) -> List[Dict]:
+        await self._delay()
+        since = _as_utc(since)
+        return [
+            row for row in self._rows("run_cancel_requests", order_by="requested_at")
+            if _parse_timestamp(row["requested_at"]) > since
+        ]
+
+    async def cancel_queued_jobs(self, group_id: str = None) -> int:
+        await self._delay()
+        # 016 cancel_queued_jobs와 동일 (그룹이면 그룹 채널의 채널 작업 포함)
+        channels = self.tables["channels"]
+        jobs = [
+            job for job in self._rows("job_queue", status="queued")
+            if group_id is None
+            or (job["job_type"] == "group" and job["target_id"] == group_id)
+            or (
+                job["job_type"] == "channel"
+                and job["target_id"] in channels
+                and channels[job["target_id"]]["group_id"] == group_id
+            )
+        ]
+        for job in jobs:
+            self._update_row("job_queue", job["id"], {"status": "cancelled", "finished_at": _now()})
+        return len(jobs)
+
+    # ============ 워커 상태 보고 ============
+
+    async def upsert_worker_stats(self, worker_id: str, stats: dict) -> None:
+        await self._delay()
+        # worker_stats는 worker_id가 기본 키 (id 없음)
+        self.tables["worker_stats"][worker_id] = {
+            "worker_id": worker_id,
+            "stats": copy.deepcopy(stats),
+            "updated_at": _now(),
+        }
+
+    async def get_worker_stats(self, since: datetime) -> List[Dict]:
+        await self._delay()
+        since = _as_utc(since)
+        return [
+            _copy(row) for _, row in sorted(self.tables["worker_stats"].items())
+            if _parse_timestamp(row["updated_at"]) > since
+        ]
+
+    # ============ 프로세스 간 잠금 ============
+
+    async def try_advisory_lock(self, key: str) -> bool:
+        await self._delay()
+        if key in self.advisory_locks:
+            return False
+        self.advisory_locks.add(key)
+        return True
+
+    async def advisory_unlock(self, key: str) -> None:
+        await self._delay()
+        self.advisory_locks.discard(key)
+
+    async def renew_advisory_lock(self, key: str) -> bool:
+        await self._delay()
+        return key in self.advisory_locks
+
+    # ============ 전역 설정 (settings 테이블) ============
+
+    async def get_setting_values(self, prefix: str = None) -> Dict[str, Any]:
+        await self._delay()
+        return {
+            key: copy.deepcopy(row["value"])
+            for key, row in self.tables["settings"].items()
+            if prefix is None or key.startswith(prefix)
+        }
+
+    async def set_setting_value(self, key: str, value: Any) -> Optional[Dict]:
+        await self._delay()
+        # settings는 key가 기본 키 (id 없음)
+        row = {"key": key, "value": copy.deepcopy(value), "updated_at": _now()}
+        self.tables["settings"][key] = row
+        return _copy(row)
+
+    # ============ 통계 CRUD ============
+
+    async def get_stats(self, channel_id: str, days: int = 30) -> List[Dict]:
+        await self._delay()
+        rows = self._rows("stats", order_by="date", channel_id=channel_id)
+        return rows[::-1][:days]
+
+    async def upsert_stats(self, stats_data: dict) -> Optional[Dict]:
+        await self._delay()
+        if stats_data.get("id") in self.tables["stats"]:
+            row = self._update_row("stats", stats_data["id"], stats_data)
+        else:
+            row = self._insert_row("stats", stats_data)
+        return _copy(row)
+
+    # ============ 시드 데이터 ============
+
+    def seed(
+        self,
+        platforms: int = 2,
+        groups_per_platform: int = 2,
+        channels_per_group: int = 3,
+        run_logs_per_channel: int = 10,
+        days: int = 14,
+        random_seed: int = 0,
+    ) -> Dict[str, int]:
+        """
+        합성 데이터 생성 (platforms → groups → channels, 그룹별 스케줄, 채널별 실행 로그)
+
+        실행 로그는 최근 days일에 분산되며, 롤업(run_stats_daily)도 함께 채워집니다.
+
+        Args:
+            platforms: 플랫폼 수 (최대 3, 워커가 있는 플랫폼만 사용)
+            random_seed: 같은 값이면 같은 구성/분포 (ID는 매번 새로 생성)
+
+        Returns:
+            테이블별 생성 행 수
+        """
+        rng = random.Random(random_seed)
+        now = datetime.now(timezone.utc)
+        created = {table: 0 for table in _DEFAULTS}
+
+        for platform_key, channel_config in list(_SEED_PLATFORMS.items())[:platforms]:
+            platform = self._insert_row(
+                "platforms", {"key": platform_key, "name": platform_key.replace("_", " ").title()}
+            )
+            created["platforms"] += 1
+            for g in range(groups_per_platform):
+                group = self._insert_row("groups", {
+                    "name": f"{platform_key} 그룹 {g + 1}",
+                    "type": platform_key,
+                    "platform_id": platform["id"],
+                })
+                self._insert_row("schedules", {
+                    "target_type": "group",
+                    "target_id": group["id"],
+                    "cron": f"{rng.randrange(60)} {rng.randrange(24)} * * *",
+                })
+                created["groups"] += 1
+                created["schedules"] += 1
+
+                for c in range(channels_per_group):
+                    channel = self._insert_row("channels", {
+                        "group_id": group["id"],
+                        "name": f"{group['name']} 채널 {c + 1}",
+                        "type": platform_key,
+                        "config": dict(channel_config),
+                    })
+                    created["channels"] += 1
+
+                    for _ in range(run_logs_per_channel):
+                        started_at = now - timedelta(seconds=rng.uniform(0, days * 86400))
+                        duration = rng.randint(5, 300)
+                        succeeded = rng.random() < 0.9
+                        self._insert_row("run_logs", {
+                            "channel_id": channel["id"],
+                            "group_id": group["id"],
+                            "status": "success" if succeeded else "failed",
+                            "started_at": started_at,
+                            "finished_at": started_at + timedelta(seconds=duration),
+                            "duration_seconds": duration,
+                            "error_message": None if succeeded else "시드 데이터 실패",
+                        })
+                        created["run_logs"] += 1
+
+        self._rebuild_run_stats((now - timedelta(days=days + 1)).date(), now.date())
+        return created
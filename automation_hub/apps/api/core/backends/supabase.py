@@ -0,0 +1,748 @@
+"""
+Supabase(PostgREST) 백엔드
+
+supabase 클라이언트는 동기(블로킹) HTTP 호출을 사용하므로,
+모든 쿼리는 _execute()를 통해 전용 스레드 풀에서 실행됩니다.
+이벤트 루프(API 요청, APScheduler)는 DB 응답을 기다리는 동안 멈추지 않으며,
+스레드 수(DB_MAX_WORKERS)가 동시 DB 호출 수의 상한이 됩니다.
+모든 스레드는 하나의 클라이언트(httpx 커넥션 풀)를 공유합니다.
+"""
+
+import asyncio
+import os
+import socket
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from supabase import create_client, Client
+from postgrest.exceptions import APIError
+
+from core.backends.base import DatabaseBackend
+
+
+def _date_range_params(start_date: date, end_date: date) -> Dict[str, str]:
+    """집계 함수 기간 파라미터"""
+    return {"p_start_date": start_date.isoformat(), "p_end_date": end_date.isoformat()}
+
+
+class SupabaseBackend(DatabaseBackend):
+    """Supabase REST(PostgREST) 백엔드"""
+
+    name = "supabase"
+
+    def __init__(self, url: str, key: str, max_workers: int, lock_ttl_seconds: int = 3600):
+        """
+        Args:
+            url: Supabase 프로젝트 URL
+            key: service_role 키
+            max_workers: DB 호출 스레드 수
+            lock_ttl_seconds: 임대 잠금 만료 시간 (보유 중에는 주기적으로 연장,
+                보유 프로세스가 죽은 경우 이 시간 후 해제)
+        """
+        self.client: Client = create_client(url, key)
+        self.max_workers = max_workers
+        self.lock_ttl_seconds = lock_ttl_seconds
+        # 임대 잠금 보유자 ID (프로세스마다 고유)
+        self.lock_owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # DB 호출 전용 스레드 풀 (동시 DB 호출 수 제한, 첫 호출 시 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """DB 스레드 풀 반환 (없으면 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="db",
+            )
+        return self._executor
+
+    async def _execute(self, query):
+        """
+        쿼리를 DB 스레드 풀에서 실행
+
+        Args:
+            query: supabase 쿼리 빌더 (execute() 호출 전 상태)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), query.execute)
+
+    async def _execute_all(self, build_query: Callable, page_size: int = 1000) -> List[Dict]:
+        """
+        모든 행을 페이지 단위로 조회
+
+        PostgREST는 한 번에 반환하는 행 수(max-rows)를 제한하므로
+        range()로 나누어 끝까지 조회합니다.
+        페이지 경계에서 행이 중복/누락되지 않도록 쿼리의 정렬은 유일해야 합니다
+        (created_at처럼 같은 값이 있을 수 있는 열은 id로 보조 정렬).
+
+        Args:
+            build_query: 새 쿼리 빌더를 반환하는 함수 (페이지마다 호출)
+            page_size: 페이지 크기 (서버 max-rows 이하)
+        """
+        rows: List[Dict] = []
+        offset = 0
+        while True:
+            response = await self._execute(build_query().range(offset, offset + page_size - 1))
+            rows.extend(response.data)
+            if len(response.data) < page_size:
+                return rows
+            offset += page_size
+
+    async def close(self):
+        """DB 스레드 풀 종료 (진행 중인 쿼리는 완료까지 대기)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # ============ 플랫폼 CRUD ============
+
+    async def get_all_platforms(self, active_only: bool = False) -> List[Dict]:
+        """
+        모든 플랫폼 조회
+
+        Args:
+            active_only: True이면 활성 플랫폼만 조회
+        """
+        query = self.client.table("platforms").select("*")
+        if active_only:
+            query = query.eq("is_active", True)
+        response = await self._execute(query.order("created_at").order("id"))
+        return response.data
+
+    async def get_platform_by_id(self, platform_id: str) -> Optional[Dict]:
+        """ID로 플랫폼 조회"""
+        try:
+            response = await self._execute(
+                self.client.table("platforms")
+                .select("*")
+                .eq("id", platform_id)
+                .single()
+            )
+            return response.data
+        except APIError as e:
+            if e.code == "PGRST116":  # No rows found
+                return None
+            raise
+
+    async def get_platform_by_key(self, platform_key: str) -> Optional[Dict]:
+        """
+        플랫폼 키로 조회
+
+        Args:
+            platform_key: 플랫폼 식별 키 (예: 'youtube_shorts', 'naver_blog')
+        """
+        try:
+            response = await self._execute(
+                self.client.table("platforms")
+                .select("*")
+                .eq("key", platform_key)
+                .single()
+            )
+            return response.data
+        except APIError as e:
+            if e.code == "PGRST116":  # No rows found
+                return None
+            raise
+
+    async def create_platform(self, platform_data: dict) -> Optional[Dict]:
+        """플랫폼 생성"""
+        response = await self._execute(self.client.table("platforms").insert(platform_data))
+        return response.data[0] if response.data else None
+
+    async def update_platform(self, platform_id: str, platform_data: dict) -> Optional[Dict]:
+        """플랫폼 수정"""
+        response = await self._execute(
+            self.client.table("platforms")
+            .update(platform_data)
+            .eq("id", platform_id)
+        )
+        return response.data[0] if response.data else None
+
+    async def delete_platform(self, platform_id: str) -> List:
+        """
+        플랫폼 삭제
+
+        주의: 플랫폼에 연결된 그룹이 있으면 FK 제약으로 삭제 실패
+        """
+        response = await self._execute(self.client.table("platforms").delete().eq("id", platform_id))
+        return response.data
+
+    # ============ 그룹 CRUD ============
+
+    async def get_all_groups(self, platform_id: str = None) -> List[Dict]:
+        """
+        모든 그룹 조회
+
+        Args:
+            platform_id: 특정 플랫폼의 그룹만 조회 (선택)
+        """
+        query = self.client.table("groups").select("*")
+        if platform_id:
+            query = query.eq("platform_id", platform_id)
+        response = await self._execute(query.order("created_at").order("id"))
+        return response.data
+
+    async def get_groups_with_platform(self) -> List[Dict]:
+        """플랫폼 정보를 포함한 그룹 목록 조회"""
+        response = await self._execute(
+            self.client.table("groups")
+            .select("*, platform:platforms(*)")
+            .order("created_at").order("id")
+        )
+        return response.data
+
+    async def get_group_by_id(self, group_id: str) -> Optional[Dict]:
+        """ID로 그룹 조회"""
+        try:
+            response = await self._execute(
+                self.client.table("groups").select("*").eq("id", group_id).single()
+            )
+            return response.data
+        except APIError as e:
+            if e.code == "PGRST116":  # No rows found
+                return None
+            raise
+
+    async def get_groups_by_ids(self, group_ids: List[str], columns: str = "*") -> List[Dict]:
+        """
+        여러 그룹을 한 번에 조회
+
+        Args:
+            group_ids: 조회할 그룹 ID 목록
+            columns: 조회할 컬럼 (예: "id, name")
+        """
+        if not group_ids:
+            return []
+        response = await self._execute(
+            self.client.table("groups").select(columns).in_("id", list(group_ids))
+        )
+        return response.data
+
+    async def get_group_with_platform(self, group_id: str) -> Optional[Dict]:
+        """플랫폼 정보를 포함한 그룹 조회"""
+        try:
+            response = await self._execute(
+                self.client.table("groups")
+                .select("*, platform:platforms(*)")
+                .eq("id", group_id)
+                .single()
+            )
+            return response.data
+        except APIError as e:
+            if e.code == "PGRST116":  # No rows found
+                return None
+            raise
+
+    async def create_group(self, group_data: dict) -> Optional[Dict]:
+        """그룹 생성"""
+        response = await self._execute(self.client.table("groups").insert(group_data))
+        return response.data[0] if response.data else None
+
+    async def update_group(self, group_id: str, group_data: dict) -> Optional[Dict]:
+        """그룹 수정"""
+        response = await self._execute(
+            self.client.table("groups").update(group_data).eq("id", group_id)
+        )
+        return response.data[0] if response.data else None
+
+    async def delete_group(self, group_id: str) -> List:
+        """그룹 삭제"""
+        response = await self._execute(self.client.table("groups").delete().eq("id", group_id))
+        return response.data
+
+    # ============ 채널 CRUD ============
+
+    async def get_all_channels(self, group_id: str = None) -> List[Dict]:
+        """모든 채널 조회 (그룹 필터 선택적)"""
+        query = self.client.table("channels").select("*")
+        if group_id:
+            query = query.eq("group_id", group_id)
+        response = await self._execute(query.order("created_at").order("id"))
+        return response.data
+
+    async def get_channels_by_platform(self, platform_id: str) -> List[Dict]:
+        """
+        특정 플랫폼의 모든 채널 조회
+
+        그룹을 통해 플랫폼과 연결된 채널 목록 반환.
+        groups 임베디드 inner join으로 그룹 필터까지 한 번의 쿼리로 처리합니다.
+        """
+        rows = await self._execute_all(
+            lambda: self.client.table("channels")
+            .select("*, groups!inner(platform_id)")
+            .eq("groups.platform_id", platform_id)
+            .order("created_at").order("id")
+        )
+        # 조인용 임베디드 필드 제거 (기존 응답 형태 유지)
+        for row in rows:
+            row.pop("groups", None)
+        return rows
+
+    async def get_channel_by_id(self, channel_id: str) -> Optional[Dict]:
+        """ID로 채널 조회"""
+        try:
+            response = await self._execute(
+                self.client.table("channels")
+                .select("*")
+                .eq("id", channel_id)
+                .single()
+            )
+            return response.data
+        except APIError as e:
+            if e.code == "PGRST116":  # No rows found
+                return None
+            raise
+
+    async def get_channels_by_ids(self, channel_ids: List[str], columns: str = "*") -> List[Dict]:
+        """
+        여러 채널을 한 번에 조회
+
+        Args:
+            channel_ids: 조회할 채널 ID 목록
+            columns: 조회할 컬럼 (예: "id, name")
+        """
+        if not channel_ids:
+            return []
+        response = await self._execute(
+            self.client.table("channels").select(columns).in_("id", list(channel_ids))
+        )
+        return response.data
+
+    async def create_channel(self, channel_data: dict) -> Optional[Dict]:
+        """채널 생성"""
+        response = await self._execute(self.client.table("channels").insert(channel_data))
+        return response.data[0] if response.data else None
+
+    async def update_channel(self, channel_id: str, channel_data: dict) -> Optional[Dict]:
+        """채널 수정"""
+        response = await self._execute(
+            self.client.table("channels").update(channel_data).eq("id", channel_id)
+        )
+        return response.data[0] if response.data else None
+
+    async def bulk_update_channel_runs(self, updates: List[Dict]) -> int:
+        """
+        채널 실행 상태 일괄 수정 (RPC)
+
+        Args:
+            updates: [{"id": ..., "last_run_at": ..., "last_run_status": ..., "status": ...}, ...]
+                     없는 필드는 기존 값 유지
+
+        Returns:
+            수정된 채널 수
+        """
+        if not updates:
+            return 0
+        response = await self._execute(self.client.rpc("bulk_update_channel_runs", {"p_updates": updates}))
+        return response.data or 0
+
+    async def delete_channel(self, channel_id: str) -> List:
+        """채널 삭제"""
+        response = await self._execute(self.client.table("channels").delete().eq("id", channel_id))
+        return response.data
+
+    # ============ 스케줄 CRUD ============
+
+    async def get_all_schedules(self) -> List[Dict]:
+        """모든 스케줄 조회"""
+        response = await self._execute(
+            self.client.table("schedules").select("*").order("created_at").order("id")
+        )
+        return response.data
+
+    async def get_schedule_by_id(self, schedule_id: str) -> Optional[Dict]:
+        """ID로 스케줄 조회"""
+        try:
+            response = await self._execute(
+                self.client.table("schedules")
+                .select("*")
+                .eq("id", schedule_id)
+                .single()
+            )
+            return response.data
+        except APIError as e:
+            if e.code == "PGRST116":  # No rows found
+                return None
+            raise
+
+    async def get_schedules_by_target(self, target_type: str, target_id: str) -> List[Dict]:
+        """대상별 스케줄 조회"""
+        response = await self._execute(
+            self.client.table("schedules")
+            .select("*")
+            .eq("target_type", target_type)
+            .eq("target_id", target_id)
+        )
+        return response.data
+
+    async def get_active_schedules(self) -> List[Dict]:
+        """활성 스케줄만 조회"""
+        response = await self._execute(
+            self.client.table("schedules")
+            .select("*")
+            .eq("is_active", True)
+            .order("created_at").order("id")
+        )
+        return response.data
+
+    async def create_schedule(self, schedule_data: dict) -> Optional[Dict]:
+        """스케줄 생성"""
+        response = await self._execute(self.client.table("schedules").insert(schedule_data))
+        return response.data[0] if response.data else None
+
+    async def update_schedule(self, schedule_id: str, schedule_data: dict) -> Optional[Dict]:
+        """스케줄 수정"""
+        response = await self._execute(
+            self.client.table("schedules")
+            .update(schedule_data)
+            .eq("id", schedule_id)
+        )
+        return response.data[0] if response.data else None
+
+    async def delete_schedule(self, schedule_id: str) -> List:
+        """스케줄 삭제"""
+        response = await self._execute(self.client.table("schedules").delete().eq("id", schedule_id))
+        return response.data
+
+    # ============ 실행 로그 CRUD ============
+
+    async def create_run_log(self, log_data: dict) -> Optional[Dict]:
+        """실행 로그 생성"""
+        response = await self._execute(self.client.table("run_logs").insert(log_data))
+        return response.data[0] if response.data else None
+
+    async def update_run_log(self, log_id: str, log_data: dict) -> Optional[Dict]:
+        """실행 로그 수정"""
+        response = await self._execute(
+            self.client.table("run_logs").update(log_data).eq("id", log_id)
+        )
+        return response.data[0] if response.data else None
+
+    async def upsert_run_logs(self, logs: List[Dict]) -> List[Dict]:
+        """
+        실행 로그 일괄 업서트 (id 기준)
+
+        PostgREST 일괄 쓰기는 모든 행의 컬럼 구성이 같아야 하므로
+        컬럼 구성별로 나누어 요청합니다.
+        """
+        by_columns: Dict[tuple, List[Dict]] = {}
+        for log in logs:
+            by_columns.setdefault(tuple(sorted(log)), []).append(log)
+
+        rows: List[Dict] = []
+        for batch in by_columns.values():
+            response = await self._execute(self.client.table("run_logs").upsert(batch))
+            rows.extend(response.data)
+        return rows
+
+    async def get_run_logs(
+        self,
+        channel_id: str = None,
+        limit: int = 50,
+        after: Optional[Tuple[str, str]] = None,
+        started_from: Optional[datetime] = None,
+        started_to: Optional[datetime] = None,
+    ) -> List[Dict]:
+        """
+        실행 로그 조회 (최신순, (started_at, id) 키셋 페이지네이션)
+
+        offset 대신 직전 페이지 마지막 행의 (started_at, id) 다음부터 조회하므로
+        몇 번째 페이지든 인덱스(idx_run_logs_started_at_id)에서 바로 시작합니다.
+
+        Args:
+            after: 직전 페이지 마지막 행의 (started_at, id). 없으면 처음부터
+            started_from: started_at 하한 (포함)
+            started_to: started_at 상한 (미포함)
+        """
+        query = self.client.table("run_logs").select("*")
+        if channel_id:
+            query = query.eq("channel_id", channel_id)
+        if started_from:
+            query = query.gte("started_at", started_from.isoformat())
+        if started_to:
+            query = query.lt("started_at", started_to.isoformat())
+        if after:
+            started_at, log_id = after
+            # 값에 ':' '+' 등이 포함되므로 따옴표로 감쌈
+            query = query.or_(
+                f'started_at.lt."{started_at}",'
+                f'and(started_at.eq."{started_at}",id.lt.{log_id})'
+            )
+        response = await self._execute(
+            query.order("started_at", desc=True).order("id", desc=True).limit(limit)
+        )
+        return response.data
+
+    async def get_run_log_by_id(self, log_id: str) -> Optional[Dict]:
+        """ID로 실행 로그 조회"""
+        try:
+            response = await self._execute(
+                self.client.table("run_logs").select("*").eq("id", log_id).single()
+            )
+            return response.data
+        except APIError as e:
+            if e.code == "PGRST116":  # No rows found
+                return None
+            raise
+
+    # ============ 단계 체크포인트 ============
+
+    async def upsert_stage_checkpoints(self, checkpoints: List[Dict]) -> int:
+        """단계 체크포인트 일괄 업서트 ((run_log_id, stage) 기준)"""
+        if not checkpoints:
+            return 0
+        response = await self._execute(
+            self.client.table("stage_checkpoints").upsert(checkpoints, on_conflict="run_log_id,stage")
+        )
+        return len(response.data)
+
+    async def get_stage_checkpoints(self, run_log_id: str) -> List[Dict]:
+        """실행 로그의 단계 체크포인트 조회"""
+        response = await self._execute(
+            self.client.table("stage_checkpoints")
+            .select("*")
+            .eq("run_log_id", run_log_id)
+            .order("created_at").order("id")
+        )
+        return response.data
+
+    # ============ 실행 통계 집계 (RPC, run_stats_daily 롤업 기반) ============
+
+    async def get_daily_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        """
+        일별/상태별 실행 횟수 (DB 집계)
+
+        Returns:
+            [{"run_date": "YYYY-MM-DD", "status": str, "run_count": int}, ...]
+        """
+        params = _date_range_params(start_date, end_date)
+        return await self._execute_all(lambda: self.client.rpc("stats_daily_counts", params))
+
+    async def get_group_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        """
+        그룹별/상태별 실행 횟수 (DB 집계)
+
+        Returns:
+            [{"group_id": str, "status": str, "run_count": int}, ...]
+        """
+        params = _date_range_params(start_date, end_date)
+        return await self._execute_all(lambda: self.client.rpc("stats_group_counts", params))
+
+    async def get_channel_run_counts(self, start_date: date, end_date: date) -> List[Dict]:
+        """
+        채널별/상태별 실행 횟수 (DB 집계)
+
+        Returns:
+            [{"channel_id": str, "group_id": str, "status": str, "run_count": int}, ...]
+        """
+        params = _date_range_params(start_date, end_date)
+        return await self._execute_all(lambda: self.client.rpc("stats_channel_counts", params))
+
+    async def get_channel_durations(self, start_date: date, end_date: date) -> List[Dict]:
+        """
+        채널별 완료된 실행(success/failed) 횟수와 소요 시간 합계 (DB 집계)
+
+        Returns:
+            [{"channel_id": str, "run_count": int, "total_duration_seconds": int}, ...]
+        """
+        params = _date_range_params(start_date, end_date)
+        return await self._execute_all(lambda: self.client.rpc("stats_channel_durations", params))
+
+    # ============ 일별 실행 통계 롤업 ============
+
+    async def bump_run_stats_daily(self, deltas: List[Dict]) -> int:
+        """
+        일별 실행 통계 롤업 증분 반영 (RPC)
+
+        Args:
+            deltas: [{"date", "channel_id", "group_id", "status",
+                      "run_count", "total_duration_seconds"}, ...] (키 중복 없음)
+        """
+        if not deltas:
+            return 0
+        response = await self._execute(self.client.rpc("bump_run_stats_daily", {"p_deltas": deltas}))
+        return response.data or 0
+
+    async def backfill_run_stats_daily(self, start_date: date, end_date: date) -> int:
+        """
+        기간 내 일별 실행 통계 롤업을 run_logs에서 재계산 (RPC)
+
+        Returns:
+            생성된 롤업 행 수
+        """
+        response = await self._execute(
+            self.client.rpc("backfill_run_stats_daily", _date_range_params(start_date, end_date))
+        )
+        return response.data or 0
+
+    # ============ 작업 큐 ============
+
+    async def enqueue_job(self, job_data: dict) -> Optional[Dict]:
+        """작업 추가"""
+        response = await self._execute(self.client.table("job_queue").insert(job_data))
+        return response.data[0] if response.data else None
+
+    async def claim_jobs(self, worker_id: str, limit: int) -> List[Dict]:
+        """대기 작업 가져오기 (RPC, FOR UPDATE SKIP LOCKED)"""
+        response = await self._execute(
+            self.client.rpc("claim_jobs", {"p_worker_id": worker_id, "p_limit": limit})
+        )
+        return response.data or []
+
+    async def update_job(self, job_id: str, job_data: dict) -> Optional[Dict]:
+        """작업 수정"""
+        response = await self._execute(
+            self.client.table("job_queue").update(job_data).eq("id", job_id)
+        )
+        return response.data[0] if response.data else None
+
+    async def heartbeat_jobs(self, worker_id: str) -> int:
+        """워커 heartbeat (RPC)"""
+        response = await self._execute(
+            self.client.rpc("heartbeat_jobs", {"p_worker_id": worker_id})
+        )
+        return response.data or 0
+
+    async def requeue_stale_jobs(self, timeout_seconds: int) -> int:
+        """중단된 작업 복구 (RPC)"""
+        response = await self._execute(
+            self.client.rpc("requeue_stale_jobs", {"p_timeout_seconds": timeout_seconds})
+        )
+        return response.data or 0
+
+    async def get_job_by_id(self, job_id: str) -> Optional[Dict]:
+        """ID로 작업 조회"""
+        try:
+            response = await self._execute(
+                self.client.table("job_queue").select("*").eq("id", job_id).single()
+            )
+            return response.data
+        except APIError as e:
+            if e.code == "PGRST116":  # No rows found
+                return None
+            raise
+
+    async def get_jobs(self, status: str = None, limit: int = 50) -> List[Dict]:
+        """작업 목록 조회 (최신순)"""
+        query = self.client.table("job_queue").select("*")
+        if status:
+            query = query.eq("status", status)
+        response = await self._execute(query.order("created_at", desc=True).limit(limit))
+        return response.data
+
+    # ============ 실행 취소 ============
+
+    async def create_cancel_request(self, request_data: dict) -> Optional[Dict]:
+        """실행 취소 요청 기록"""
+        response = await self._execute(self.client.table("run_cancel_requests").insert(request_data))
+        return response.data[0] if response.data else None
+
+    async def get_cancel_requests(self, since: datetime) -> List[Dict]:
+        """since 이후의 취소 요청 조회"""
+        response = await self._execute(
+            self.client.table("run_cancel_requests")
+            .select("*")
+            .gt("requested_at", since.isoformat())
+            .order("requested_at")
+        )
+        return response.data
+
+    async def cancel_queued_jobs(self, group_id: str = None) -> int:
+        """대기 중인 작업 취소 (RPC)"""
+        response = await self._execute(
+            self.client.rpc("cancel_queued_jobs", {"p_group_id": group_id})
+        )
+        return response.data or 0
+
+    # ============ 워커 상태 보고 ============
+
+    async def upsert_worker_stats(self, worker_id: str, stats: dict) -> None:
+        """워커 상태 업서트"""
+        await self._execute(
+            self.client.table("worker_stats").upsert(
+                {
+                    "worker_id": worker_id,
+                    "stats": stats,
+                    "updated_at": datetime.now(timezone.utc).isoformat(),
+                },
+                on_conflict="worker_id",
+            )
+        )
+
+    async def get_worker_stats(self, since: datetime) -> List[Dict]:
+        """since 이후에 보고한 워커 상태 조회"""
+        response = await self._execute(
+            self.client.table("worker_stats")
+            .select("*")
+            .gt("updated_at", since.isoformat())
+            .order("worker_id")
+        )
+        return response.data
+
+    # ============ 프로세스 간 잠금 ============
+    # REST 호출은 DB 세션을 유지하지 않으므로 advisory lock 대신 lease_locks 임대 잠금 (012)
+
+    async def try_advisory_lock(self, key: str) -> bool:
+        """임대 잠금 획득 시도 (RPC)"""
+        response = await self._execute(
+            self.client.rpc("try_lease_lock", {
+                "p_key": key,
+                "p_owner": self.lock_owner,
+                "p_ttl_seconds": self.lock_ttl_seconds,
+            })
+        )
+        return bool(response.data)
+
+    async def advisory_unlock(self, key: str) -> None:
+        """임대 잠금 해제 (RPC)"""
+        await self._execute(
+            self.client.rpc("release_lease_lock", {"p_key": key, "p_owner": self.lock_owner})
+        )
+
+    async def renew_advisory_lock(self, key: str) -> bool:
+        """임대 잠금 연장 (같은 보유자의 try_lease_lock은 만료 시각을 갱신)"""
+        return await self.try_advisory_lock(key)
+
+    # ============ 전역 설정 (settings 테이블) ============
+
+    async def get_setting_values(self, prefix: str = None) -> Dict[str, Any]:
+        """전역 설정 조회"""
+        query = self.client.table("settings").select("key, value")
+        if prefix:
+            # prefix의 LIKE 와일드카드(%, _)는 문자 그대로 비교
+            pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query = query.like("key", f"{pattern}%")
+        response = await self._execute(query)
+        # PostgREST는 like 패턴의 *도 와일드카드로 쓰므로 한 번 더 거름
+        return {
+            row["key"]: row["value"]
+            for row in response.data
+            if not prefix or row["key"].startswith(prefix)
+        }
+
+    async def set_setting_value(self, key: str, value: Any) -> Optional[Dict]:
+        """전역 설정 업서트"""
+        response = await self._execute(
+            self.client.table("settings").upsert({"key": key, "value": value}, on_conflict="key")
+        )
+        return response.data[0] if response.data else None
+
+    # ============ 통계 CRUD ============
+
+    async def get_stats(self, channel_id: str, days: int = 30) -> List[Dict]:
+        """채널 통계 조회"""
+        response = await self._execute(
+            self.client.table("stats")
+            .select("*")
+            .eq("channel_id", channel_id)
+            .order("date", desc=True)
+            .limit(days)
+        )
+        return response.data
+
+    async def upsert_stats(self, stats_data: dict) -> Optional[Dict]:
+        """통계 업서트"""
+        response = await self._execute(self.client.table("stats").upsert(stats_data))
+        return response.data[0] if response.data else None
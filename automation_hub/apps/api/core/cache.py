@@ -0,0 +1,77 @@
+"""
+프로세스 내 TTL 캐시
+
+자주 바뀌지 않는 마스터 데이터(플랫폼, 그룹) 조회 결과를 보관합니다.
+- TTL: 항목별 만료 시간 (초)
+- 최대 크기: 초과 시 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+- 히트/미스 카운터: 절약한 DB 왕복 횟수 확인용
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """TTL과 크기 제한이 있는 LRU 캐시"""
+
+    def __init__(self, name: str, ttl_seconds: float, max_size: int):
+        """
+        Args:
+            name: 캐시 이름 (통계 표시용)
+            ttl_seconds: 항목 유지 시간 (초)
+            max_size: 최대 항목 수
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._items: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._items[key]
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """캐시 저장 (크기 초과 시 LRU 제거)"""
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        self._items[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        """특정 항목 무효화"""
+        self._items.pop(key, None)
+
+    def clear(self):
+        """전체 무효화"""
+        self._items.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """히트/미스 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total * 100, 1) if total > 0 else 0.0,
+        }
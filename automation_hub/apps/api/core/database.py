@@ -1,5 +1,5 @@
 """
-Supabase 데이터베이스 연결 관리
+데이터베이스 접근 계층
 
 데이터 계층 구조:
   platforms → groups → channels
@@ -8,25 +8,61 @@ Supabase 데이터베이스 연결 관리
 - Platform: 콘텐츠 플랫폼 마스터 데이터
 - Group: 플랫폼별 채널 그룹 (platform_id로 플랫폼 참조)
 - Channel: 개별 채널 (group_id로 그룹/플랫폼 참조)
-"""
 
-from functools import lru_cache
-from typing import Optional, List, Dict
+백엔드:
+  실제 쿼리는 설정(DB_BACKEND)으로 선택한 백엔드(core.backends)가 실행하고,
+  이 모듈의 함수는 모든 호출자가 쓰는 공통 진입점입니다.
+  - supabase: Supabase REST(PostgREST), 동기 클라이언트를 스레드 풀에서 실행
+  - postgres: asyncpg 커넥션 풀로 Postgres 직접 연결
+  - memory: 프로세스 메모리 (테스트, 오프라인 부하 테스트)
+
+캐시:
+  플랫폼/그룹은 거의 바뀌지 않으므로 ID(또는 키) 단건 조회 결과를
+  프로세스 내 TTL 캐시에 보관합니다. 생성/수정/삭제 함수가 직접 무효화하며,
+  다른 인스턴스에서 수정된 내용은 TTL이 지나면 반영됩니다.
+  (백엔드와 무관하게 이 모듈에서 처리)
+"""
 
-from supabase import create_client, Client
-from postgrest.exceptions import APIError
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Optional, List, Dict, Tuple
 
+from core.backends import DatabaseBackend, create_backend
+from core.cache import TTLCache
 from core.config import settings
 
 
-@lru_cache()
-def get_supabase_client() -> Client:
-    """Supabase 클라이언트 반환 (캐시됨)"""
-    return create_client(settings.supabase_url, settings.supabase_key)
+# 전역 DB 백엔드
+backend: DatabaseBackend = create_backend(settings)
+
+# 플랫폼/그룹 단건 조회 캐시
+_platform_cache = TTLCache("platforms", settings.cache_ttl_seconds, settings.cache_max_size)
+_group_cache = TTLCache("groups", settings.cache_ttl_seconds, settings.cache_max_size)
+
+
+def get_cache_stats() -> List[Dict]:
+    """캐시 히트/미스 통계 반환"""
+    return [_platform_cache.get_stats(), _group_cache.get_stats()]
+
+
+def set_backend(new_backend: DatabaseBackend) -> DatabaseBackend:
+    """
+    DB 백엔드 교체 (테스트/벤치마크용)
+
+    이전 백엔드의 조회 결과가 남지 않도록 캐시도 비웁니다.
+
+    Returns:
+        이전 백엔드
+    """
+    global backend
+    previous, backend = backend, new_backend
+    _platform_cache.clear()
+    _group_cache.clear()
+    return previous
 
 
-# 전역 Supabase 클라이언트
-supabase = get_supabase_client()
+async def close_database():
+    """DB 백엔드 자원 정리 (스레드 풀/커넥션 풀, 진행 중인 쿼리는 완료까지 대기)"""
+    await backend.close()
 
 
 # ============ 플랫폼 CRUD ============
@@ -39,67 +75,50 @@ async def get_all_platforms(active_only: bool = False) -> List[Dict]:
     Args:
         active_only: True이면 활성 플랫폼만 조회
     """
-    query = supabase.table("platforms").select("*")
-    if active_only:
-        query = query.eq("is_active", True)
-    response = query.order("created_at").execute()
-    return response.data
+    return await backend.get_all_platforms(active_only)
 
 
 async def get_platform_by_id(platform_id: str) -> Optional[Dict]:
-    """ID로 플랫폼 조회"""
-    try:
-        response = (
-            supabase.table("platforms")
-            .select("*")
-            .eq("id", platform_id)
-            .single()
-            .execute()
-        )
-        return response.data
-    except APIError as e:
-        if e.code == "PGRST116":  # No rows found
-            return None
-        raise
+    """ID로 플랫폼 조회 (캐시 사용)"""
+    cached = _platform_cache.get(("id", platform_id))
+    if cached is not None:
+        return dict(cached)
+
+    platform = await backend.get_platform_by_id(platform_id)
+    if platform is not None:
+        _platform_cache.set(("id", platform_id), dict(platform))
+    return platform
 
 
 async def get_platform_by_key(platform_key: str) -> Optional[Dict]:
     """
-    플랫폼 키로 조회
+    플랫폼 키로 조회 (캐시 사용)
 
     Args:
         platform_key: 플랫폼 식별 키 (예: 'youtube_shorts', 'naver_blog')
     """
-    try:
-        response = (
-            supabase.table("platforms")
-            .select("*")
-            .eq("key", platform_key)
-            .single()
-            .execute()
-        )
-        return response.data
-    except APIError as e:
-        if e.code == "PGRST116":  # No rows found
-            return None
-        raise
+    cached = _platform_cache.get(("key", platform_key))
+    if cached is not None:
+        return dict(cached)
+
+    platform = await backend.get_platform_by_key(platform_key)
+    if platform is not None:
+        _platform_cache.set(("key", platform_key), dict(platform))
+    return platform
 
 
 async def create_platform(platform_data: dict) -> Optional[Dict]:
     """플랫폼 생성"""
-    response = supabase.table("platforms").insert(platform_data).execute()
-    return response.data[0] if response.data else None
+    result = await backend.create_platform(platform_data)
+    _platform_cache.clear()
+    return result
 
 
 async def update_platform(platform_id: str, platform_data: dict) -> Optional[Dict]:
     """플랫폼 수정"""
-    response = (
-        supabase.table("platforms")
-        .update(platform_data)
-        .eq("id", platform_id)
-        .execute()
-    )
-    return response.data[0] if response.data else None
+    result = await backend.update_platform(platform_id, platform_data)
+    _platform_cache.clear()
+    return result
 
 
 async def delete_platform(platform_id: str) -> List:
@@ -108,8 +127,9 @@ async def delete_platform(platform_id: str) -> List:
 
     주의: 플랫폼에 연결된 그룹이 있으면 FK 제약으로 삭제 실패
     """
-    response = supabase.table("platforms").delete().eq("id", platform_id).execute()
-    return response.data
+    result = await backend.delete_platform(platform_id)
+    _platform_cache.clear()
+    return result
 
 
 # ============ 그룹 CRUD ============
@@ -122,72 +142,59 @@ async def get_all_groups(platform_id: str = None) -> List[Dict]:
     Args:
         platform_id: 특정 플랫폼의 그룹만 조회 (선택)
     """
-    query = supabase.table("groups").select("*")
-    if platform_id:
-        query = query.eq("platform_id", platform_id)
-    response = query.order("created_at").execute()
-    return response.data
+    return await backend.get_all_groups(platform_id)
 
 
 async def get_groups_with_platform() -> List[Dict]:
     """플랫폼 정보를 포함한 그룹 목록 조회"""
-    response = (
-        supabase.table("groups")
-        .select("*, platform:platforms(*)")
-        .order("created_at")
-        .execute()
-    )
-    return response.data
+    return await backend.get_groups_with_platform()
 
 
 async def get_group_by_id(group_id: str) -> Optional[Dict]:
-    """ID로 그룹 조회"""
-    try:
-        response = (
-            supabase.table("groups").select("*").eq("id", group_id).single().execute()
-        )
-        return response.data
-    except APIError as e:
-        if e.code == "PGRST116":  # No rows found
-            return None
-        raise
+    """ID로 그룹 조회 (캐시 사용)"""
+    cached = _group_cache.get(group_id)
+    if cached is not None:
+        return dict(cached)
+
+    group = await backend.get_group_by_id(group_id)
+    if group is not None:
+        _group_cache.set(group_id, dict(group))
+    return group
+
+
+async def get_groups_by_ids(group_ids: List[str], columns: str = "*") -> List[Dict]:
+    """
+    여러 그룹을 한 번에 조회
+
+    Args:
+        group_ids: 조회할 그룹 ID 목록
+        columns: 조회할 컬럼 (예: "id, name")
+    """
+    return await backend.get_groups_by_ids(group_ids, columns)
 
 
 async def get_group_with_platform(group_id: str) -> Optional[Dict]:
     """플랫폼 정보를 포함한 그룹 조회"""
-    try:
-        response = (
-            supabase.table("groups")
-            .select("*, platform:platforms(*)")
-            .eq("id", group_id)
-            .single()
-            .execute()
-        )
-        return response.data
-    except APIError as e:
-        if e.code == "PGRST116":  # No rows found
-            return None
-        raise
+    return await backend.get_group_with_platform(group_id)
 
 
 async def create_group(group_data: dict) -> Optional[Dict]:
     """그룹 생성"""
-    response = supabase.table("groups").insert(group_data).execute()
-    return response.data[0] if response.data else None
+    return await backend.create_group(group_data)
 
 
 async def update_group(group_id: str, group_data: dict) -> Optional[Dict]:
     """그룹 수정"""
-    response = (
-        supabase.table("groups").update(group_data).eq("id", group_id).execute()
-    )
-    return response.data[0] if response.data else None
+    result = await backend.update_group(group_id, group_data)
+    _group_cache.invalidate(group_id)
+    return result
 
 
 async def delete_group(group_id: str) -> List:
     """그룹 삭제"""
-    response = supabase.table("groups").delete().eq("id", group_id).execute()
-    return response.data
+    result = await backend.delete_group(group_id)
+    _group_cache.invalidate(group_id)
+    return result
 
 
 # ============ 채널 CRUD ============
@@ -195,77 +202,62 @@ async def delete_group(group_id: str) -> List:
 
 async def get_all_channels(group_id: str = None) -> List[Dict]:
     """모든 채널 조회 (그룹 필터 선택적)"""
-    query = supabase.table("channels").select("*")
-    if group_id:
-        query = query.eq("group_id", group_id)
-    response = query.order("created_at").execute()
-    return response.data
+    return await backend.get_all_channels(group_id)
 
 
 async def get_channels_by_platform(platform_id: str) -> List[Dict]:
     """
     특정 플랫폼의 모든 채널 조회
 
-    그룹을 통해 플랫폼과 연결된 채널 목록 반환
+    그룹을 통해 플랫폼과 연결된 채널 목록 반환.
+    그룹 조인으로 그룹 필터까지 한 번의 쿼리로 처리합니다.
     """
-    # 먼저 해당 플랫폼의 그룹 ID들을 조회
-    groups_response = (
-        supabase.table("groups")
-        .select("id")
-        .eq("platform_id", platform_id)
-        .execute()
-    )
-    group_ids = [g["id"] for g in groups_response.data]
-
-    if not group_ids:
-        return []
-
-    # 해당 그룹들의 채널 조회
-    response = (
-        supabase.table("channels")
-        .select("*")
-        .in_("group_id", group_ids)
-        .order("created_at")
-        .execute()
-    )
-    return response.data
+    return await backend.get_channels_by_platform(platform_id)
 
 
 async def get_channel_by_id(channel_id: str) -> Optional[Dict]:
     """ID로 채널 조회"""
-    try:
-        response = (
-            supabase.table("channels")
-            .select("*")
-            .eq("id", channel_id)
-            .single()
-            .execute()
-        )
-        return response.data
-    except APIError as e:
-        if e.code == "PGRST116":  # No rows found
-            return None
-        raise
+    return await backend.get_channel_by_id(channel_id)
+
+
+async def get_channels_by_ids(channel_ids: List[str], columns: str = "*") -> List[Dict]:
+    """
+    여러 채널을 한 번에 조회
+
+    Args:
+        channel_ids: 조회할 채널 ID 목록
+        columns: 조회할 컬럼 (예: "id, name")
+    """
+    return await backend.get_channels_by_ids(channel_ids, columns)
 
 
 async def create_channel(channel_data: dict) -> Optional[Dict]:
     """채널 생성"""
-    response = supabase.table("channels").insert(channel_data).execute()
-    return response.data[0] if response.data else None
+    return await backend.create_channel(channel_data)
 
 
 async def update_channel(channel_id: str, channel_data: dict) -> Optional[Dict]:
     """채널 수정"""
-    response = (
-        supabase.table("channels").update(channel_data).eq("id", channel_id).execute()
-    )
-    return response.data[0] if response.data else None
+    return await backend.update_channel(channel_id, channel_data)
+
+
+async def bulk_update_channel_runs(updates: List[Dict]) -> int:
+    """
+    채널 실행 상태 일괄 수정 (DB 함수 1회)
+
+    Args:
+        updates: [{"id": ..., "last_run_at": ..., "last_run_status": ..., "status": ...}, ...]
+                 없는 필드는 기존 값 유지
+
+    Returns:
+        수정된 채널 수
+    """
+    return await backend.bulk_update_channel_runs(updates)
 
 
 async def delete_channel(channel_id: str) -> List:
     """채널 삭제"""
-    response = supabase.table("channels").delete().eq("id", channel_id).execute()
-    return response.data
+    return await backend.delete_channel(channel_id)
 
 
 # ============ 스케줄 CRUD ============
@@ -273,72 +265,37 @@ async def delete_channel(channel_id: str) -> List:
 
 async def get_all_schedules() -> List[Dict]:
     """모든 스케줄 조회"""
-    response = supabase.table("schedules").select("*").order("created_at").execute()
-    return response.data
+    return await backend.get_all_schedules()
 
 
 async def get_schedule_by_id(schedule_id: str) -> Optional[Dict]:
     """ID로 스케줄 조회"""
-    try:
-        response = (
-            supabase.table("schedules")
-            .select("*")
-            .eq("id", schedule_id)
-            .single()
-            .execute()
-        )
-        return response.data
-    except APIError as e:
-        if e.code == "PGRST116":  # No rows found
-            return None
-        raise
+    return await backend.get_schedule_by_id(schedule_id)
 
 
 async def get_schedules_by_target(target_type: str, target_id: str) -> List[Dict]:
     """대상별 스케줄 조회"""
-    response = (
-        supabase.table("schedules")
-        .select("*")
-        .eq("target_type", target_type)
-        .eq("target_id", target_id)
-        .execute()
-    )
-    return response.data
+    return await backend.get_schedules_by_target(target_type, target_id)
 
 
 async def get_active_schedules() -> List[Dict]:
     """활성 스케줄만 조회"""
-    response = (
-        supabase.table("schedules")
-        .select("*")
-        .eq("is_active", True)
-        .order("created_at")
-        .execute()
-    )
-    return response.data
+    return await backend.get_active_schedules()
 
 
 async def create_schedule(schedule_data: dict) -> Optional[Dict]:
     """스케줄 생성"""
-    response = supabase.table("schedules").insert(schedule_data).execute()
-    return response.data[0] if response.data else None
+    return await backend.create_schedule(schedule_data)
 
 
 async def update_schedule(schedule_id: str, schedule_data: dict) -> Optional[Dict]:
     """스케줄 수정"""
-    response = (
-        supabase.table("schedules")
-        .update(schedule_data)
-        .eq("id", schedule_id)
-        .execute()
-    )
-    return response.data[0] if response.data else None
+    return await backend.update_schedule(schedule_id, schedule_data)
 
 
 async def delete_schedule(schedule_id: str) -> List:
     """스케줄 삭제"""
-    response = supabase.table("schedules").delete().eq("id", schedule_id).execute()
-    return response.data
+    return await backend.delete_schedule(schedule_id)
 
 
 # ============ 실행 로그 CRUD ============
@@ -346,25 +303,257 @@ async def delete_schedule(schedule_id: str) -> List:
 
 async def create_run_log(log_data: dict) -> Optional[Dict]:
     """실행 로그 생성"""
-    response = supabase.table("run_logs").insert(log_data).execute()
-    return response.data[0] if response.data else None
+    return await backend.create_run_log(log_data)
 
 
 async def update_run_log(log_id: str, log_data: dict) -> Optional[Dict]:
     """실행 로그 수정"""
-    response = (
-        supabase.table("run_logs").update(log_data).eq("id", log_id).execute()
-    )
-    return response.data[0] if response.data else None
+    return await backend.update_run_log(log_id, log_data)
+
+
+async def upsert_run_logs(logs: List[Dict]) -> List[Dict]:
+    """
+    실행 로그 일괄 업서트 (id 기준)
+
+    행마다 전달한 컬럼만 쓰고 나머지 컬럼은 기존 값(또는 기본값)을 유지합니다.
+    """
+    return await backend.upsert_run_logs(logs)
+
+
+async def get_run_logs(
+    channel_id: str = None,
+    limit: int = 50,
+    after: Optional[Tuple[str, str]] = None,
+    started_from: Optional[datetime] = None,
+    started_to: Optional[datetime] = None,
+) -> List[Dict]:
+    """
+    실행 로그 조회 (최신순, (started_at, id) 키셋 페이지네이션)
+
+    offset 대신 직전 페이지 마지막 행의 (started_at, id) 다음부터 조회하므로
+    몇 번째 페이지든 인덱스(idx_run_logs_started_at_id)에서 바로 시작합니다.
+
+    Args:
+        after: 직전 페이지 마지막 행의 (started_at, id). 없으면 처음부터
+        started_from: started_at 하한 (포함)
+        started_to: started_at 상한 (미포함)
+    """
+    return await backend.get_run_logs(channel_id, limit, after, started_from, started_to)
+
+
+async def iter_run_logs(
+    channel_id: str = None,
+    started_from: Optional[datetime] = None,
+    started_to: Optional[datetime] = None,
+    page_size: int = 1000,
+) -> AsyncIterator[Dict]:
+    """
+    실행 로그 전체 순회 (최신순)
+
+    키셋 페이지 단위로 조회하며 한 번에 한 페이지만 메모리에 유지하므로
+    기간이 길어도 메모리 사용량이 일정합니다.
+    """
+    after = None
+    while True:
+        page = await get_run_logs(channel_id, page_size, after, started_from, started_to)
+        for row in page:
+            yield row
+        if len(page) < page_size:
+            return
+        after = (page[-1]["started_at"], page[-1]["id"])
+
+
+async def get_run_log_by_id(log_id: str) -> Optional[Dict]:
+    """ID로 실행 로그 조회"""
+    return await backend.get_run_log_by_id(log_id)
+
+
+# ============ 단계 체크포인트 ============
+
+
+async def upsert_stage_checkpoints(checkpoints: List[Dict]) -> int:
+    """
+    단계 체크포인트 일괄 업서트 ((run_log_id, stage) 기준)
+
+    실행 로그(FK)보다 먼저 반영되지 않도록 쓰기 버퍼(services/write_buffer.py)에서 호출합니다.
+    """
+    return await backend.upsert_stage_checkpoints(checkpoints)
+
+
+async def get_stage_checkpoints(run_log_id: str) -> List[Dict]:
+    """실행 로그의 단계 체크포인트 조회 (저장 순)"""
+    return await backend.get_stage_checkpoints(run_log_id)
+
+
+# ============ 실행 통계 집계 (DB 함수, run_stats_daily 롤업 기반) ============
+
+
+async def get_daily_run_counts(start_date: date, end_date: date) -> List[Dict]:
+    """
+    일별/상태별 실행 횟수 (DB 집계)
+
+    Returns:
+        [{"run_date": "YYYY-MM-DD", "status": str, "run_count": int}, ...]
+    """
+    return await backend.get_daily_run_counts(start_date, end_date)
+
+
+async def get_group_run_counts(start_date: date, end_date: date) -> List[Dict]:
+    """
+    그룹별/상태별 실행 횟수 (DB 집계)
+
+    Returns:
+        [{"group_id": str, "status": str, "run_count": int}, ...]
+    """
+    return await backend.get_group_run_counts(start_date, end_date)
+
+
+async def get_channel_run_counts(start_date: date, end_date: date) -> List[Dict]:
+    """
+    채널별/상태별 실행 횟수 (DB 집계)
+
+    Returns:
+        [{"channel_id": str, "group_id": str, "status": str, "run_count": int}, ...]
+    """
+    return await backend.get_channel_run_counts(start_date, end_date)
+
+
+async def get_channel_durations(start_date: date, end_date: date) -> List[Dict]:
+    """
+    채널별 완료된 실행(success/failed) 횟수와 소요 시간 합계 (DB 집계)
+
+    Returns:
+        [{"channel_id": str, "run_count": int, "total_duration_seconds": int}, ...]
+    """
+    return await backend.get_channel_durations(start_date, end_date)
+
+
+# ============ 일별 실행 통계 롤업 ============
+
+
+async def bump_run_stats_daily(deltas: List[Dict]) -> int:
+    """
+    일별 실행 통계 롤업 증분 반영 (DB 함수 1회)
+
+    Args:
+        deltas: [{"date", "channel_id", "group_id", "status",
+                  "run_count", "total_duration_seconds"}, ...] (키 중복 없음)
+    """
+    return await backend.bump_run_stats_daily(deltas)
+
+
+async def backfill_run_stats_daily(start_date: date, end_date: date) -> int:
+    """
+    기간 내 일별 실행 통계 롤업을 run_logs에서 재계산 (DB 함수)
+
+    Returns:
+        생성된 롤업 행 수
+    """
+    return await backend.backfill_run_stats_daily(start_date, end_date)
+
+
+# ============ 작업 큐 ============
+
+
+async def enqueue_job(job_data: dict) -> Optional[Dict]:
+    """작업 추가 (status=queued)"""
+    return await backend.enqueue_job(job_data)
+
+
+async def claim_jobs(worker_id: str, limit: int) -> List[Dict]:
+    """
+    실행 가능한 대기 작업을 최대 limit개 가져오기
+
+    가져온 작업은 running으로 바뀌며, 여러 워커가 동시에 호출해도 겹치지 않습니다.
+    """
+    return await backend.claim_jobs(worker_id, limit)
+
+
+async def update_job(job_id: str, job_data: dict) -> Optional[Dict]:
+    """작업 수정"""
+    return await backend.update_job(job_id, job_data)
+
+
+async def heartbeat_jobs(worker_id: str) -> int:
+    """워커가 실행 중인 작업의 heartbeat 갱신"""
+    return await backend.heartbeat_jobs(worker_id)
+
+
+async def requeue_stale_jobs(timeout_seconds: int) -> int:
+    """heartbeat가 timeout_seconds 이상 끊긴 작업을 재대기/실패 처리"""
+    return await backend.requeue_stale_jobs(timeout_seconds)
+
+
+async def get_job_by_id(job_id: str) -> Optional[Dict]:
+    """ID로 작업 조회"""
+    return await backend.get_job_by_id(job_id)
+
+
+async def get_jobs(status: str = None, limit: int = 50) -> List[Dict]:
+    """작업 목록 조회 (최신순)"""
+    return await backend.get_jobs(status, limit)
+
+
+# ============ 실행 취소 ============
+
+
+async def create_cancel_request(request_data: dict) -> Optional[Dict]:
+    """실행 취소 요청 기록 ({"scope": run|group|all, "target_id", "requested_at"})"""
+    return await backend.create_cancel_request(request_data)
+
+
+async def get_cancel_requests(since: datetime) -> List[Dict]:
+    """since 이후의 취소 요청 조회 (requested_at 순)"""
+    return await backend.get_cancel_requests(since)
+
+
+async def cancel_queued_jobs(group_id: str = None) -> int:
+    """대기 중인 작업 취소 (group_id가 있으면 해당 그룹 작업만)"""
+    return await backend.cancel_queued_jobs(group_id)
+
+
+# ============ 워커 상태 보고 ============
+
+
+async def upsert_worker_stats(worker_id: str, stats: dict) -> None:
+    """작업 워커 상태 보고 (워커별로 마지막 보고만 남음)"""
+    await backend.upsert_worker_stats(worker_id, stats)
+
+
+async def get_worker_stats(since: datetime) -> List[Dict]:
+    """since 이후에 보고한 워커 상태 조회"""
+    return await backend.get_worker_stats(since)
+
+
+# ============ 프로세스 간 잠금 ============
+
+
+async def try_advisory_lock(key: str) -> bool:
+    """프로세스 간 잠금 획득 시도 (기다리지 않음, 획득 여부 반환)"""
+    return await backend.try_advisory_lock(key)
+
+
+async def advisory_unlock(key: str) -> None:
+    """프로세스 간 잠금 해제"""
+    return await backend.advisory_unlock(key)
+
+
+async def renew_advisory_lock(key: str) -> bool:
+    """보유 중인 프로세스 간 잠금 연장 (잃었으면 False)"""
+    return await backend.renew_advisory_lock(key)
+
+
+# ============ 전역 설정 (settings 테이블) ============
+
+
+async def get_setting_values(prefix: str = None) -> Dict[str, Any]:
+    """전역 설정 조회 ({key: value}, prefix로 시작하는 key만)"""
+    return await backend.get_setting_values(prefix)
 
 
-async def get_run_logs(channel_id: str = None, limit: int = 50) -> List[Dict]:
-    """실행 로그 조회"""
-    query = supabase.table("run_logs").select("*")
-    if channel_id:
-        query = query.eq("channel_id", channel_id)
-    response = query.order("started_at", desc=True).limit(limit).execute()
-    return response.data
+async def set_setting_value(key: str, value: Any) -> Optional[Dict]:
+    """전역 설정 업서트"""
+    return await backend.set_setting_value(key, value)
 
 
 # ============ 통계 CRUD ============
@@ -372,18 +561,9 @@ async def get_run_logs(channel_id: str = None, limit: int = 50) -> List[Dict]:
 
 async def get_stats(channel_id: str, days: int = 30) -> List[Dict]:
     """채널 통계 조회"""
-    response = (
-        supabase.table("stats")
-        .select("*")
-        .eq("channel_id", channel_id)
-        .order("date", desc=True)
-        .limit(days)
-        .execute()
-    )
-    return response.data
+    return await backend.get_stats(channel_id, days)
 
 
 async def upsert_stats(stats_data: dict) -> Optional[Dict]:
     """통계 업서트"""
-    response = supabase.table("stats").upsert(stats_data).execute()
-    return response.data[0] if response.data else None
+    return await backend.upsert_stats(stats_data)
@@ -3,13 +3,29 @@
 FastAPI를 사용한 중앙 통제 API
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from core.config import settings
 from core.logger import setup_logger
-from services.scheduler import scheduler
+from core.database import close_database, get_cache_stats
+from services.channel_lock import channel_lock
+from services.checkpoint_store import checkpoint_store
+from services.job_queue import create_worker
+from services.process_pool import cpu_pool
+from services.run_limiter import run_limiter
+from services.scheduler import (
+    scheduler,
+    reconcile_schedules,
+    get_reconcile_report,
+    get_lateness_stats,
+    start_schedule_sync,
+    stop_schedule_sync,
+)
+from services.worker_stats import get_worker_report
+from services.write_buffer import write_buffer
 from routers import platforms, groups, channels, schedules, run, stats
 
 
@@ -24,12 +40,35 @@ async def lifespan(app: FastAPI):
     logger.info("자동화 허브 API 서버 시작")
     scheduler.start()
     logger.info("스케줄러 시작됨")
+    # 재배포/장애 후에도 스케줄이 바로 동작하도록 DB의 활성 스케줄을 다시 등록
+    if settings.schedule_reconcile_on_startup:
+        try:
+            await reconcile_schedules()
+        except Exception as e:
+            logger.error(f"시작 시 스케줄 동기화 실패 (주기적 동기화 또는 POST /api/schedules/sync로 다시 시도): {e}")
+    start_schedule_sync(settings.schedule_sync_interval)
+    write_buffer.start()
+
+    # 별도 워커 프로세스 없이 실행 (로컬 개발용)
+    worker_task = None
+    if settings.job_worker_embedded:
+        app.state.job_worker = create_worker()
+        worker_task = asyncio.create_task(app.state.job_worker.run())
+        logger.info("내장 작업 워커 시작됨")
 
     yield
 
     # 종료 시
+    await stop_schedule_sync()
     scheduler.shutdown()
     logger.info("스케줄러 종료됨")
+    if worker_task is not None:
+        app.state.job_worker.stop()
+        await worker_task
+    await write_buffer.stop()
+    logger.info("쓰기 버퍼 flush 완료")
+    cpu_pool.shutdown()
+    await close_database()
     logger.info("자동화 허브 API 서버 종료")
 
 
@@ -54,6 +93,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 대시보드에서 실행 로그 페이지 커서를 읽을 수 있도록 노출
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -79,11 +120,31 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """상세 헬스 체크"""
+    """
+    상세 헬스 체크
+
+    실행 상태(서킷 브레이커, CPU 풀, 속도 제한, 결과물 캐시)는 API 프로세스가 아니라 작업 워커들이 보고한 값을 합친 것
+    """
+    worker_report = await get_worker_report()
     return {
         "status": "healthy",
         "scheduler_running": scheduler.running,
         "jobs_count": len(scheduler.get_jobs()),
+        "schedule_reconcile": get_reconcile_report(),
+        "schedule_lateness": get_lateness_stats(),
+        "cache": get_cache_stats(),
+        "write_buffer": write_buffer.get_stats(),
+        "executor": run_limiter.get_stats(),
+        "channel_lock": channel_lock.get_stats(),
+        "workers": worker_report["workers"],
+        "circuit_breaker": worker_report["circuit_breaker"],
+        "rate_limiter": worker_report["rate_limiter"],
+        "cpu_pool": worker_report["cpu_pool"],
+        "checkpoints": checkpoint_store.get_stats(),
+        "artifact_cache": worker_report["artifact_cache"],
+        "job_worker": (
+            app.state.job_worker.get_stats() if getattr(app.state, "job_worker", None) else None
+        ),
     }
 
 
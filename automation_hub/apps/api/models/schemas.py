@@ -26,8 +26,12 @@ PlatformKey = Literal["youtube_shorts", "naver_blog", "nextjs_blog", "instagram"
 ChannelType = Literal["youtube_shorts", "naver_blog", "nextjs_blog"]
 
 ChannelStatus = Literal["active", "paused", "error"]
-RunStatus = Literal["running", "success", "failed"]
+RunStatus = Literal["running", "success", "failed", "cancelled", "skipped"]
 TargetType = Literal["group", "channel"]
+MisfirePolicy = Literal["skip", "coalesce", "catch_up"]
+# resume: 실패/취소된 실행 이어하기 (target_id = 원래 실행 로그 ID)
+JobType = Literal["group", "channel", "resume"]
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled", "skipped"]
 
 
 # ============ 플랫폼 스키마 ============
@@ -230,6 +234,7 @@ class ScheduleBase(BaseModel):
     target_id: str = Field(..., description="대상 ID (group_id 또는 channel_id)")
     cron: str = Field(..., description="Cron 표현식")
     is_active: bool = Field(True, description="활성화 여부")
+    misfire_policy: MisfirePolicy = Field("skip", description="지연된 실행 처리: skip, coalesce, catch_up")
 
 
 class ScheduleCreate(ScheduleBase):
@@ -243,6 +248,7 @@ class ScheduleUpdate(BaseModel):
 
     cron: Optional[str] = None
     is_active: Optional[bool] = None
+    misfire_policy: Optional[MisfirePolicy] = None
 
 
 class Schedule(ScheduleBase):
@@ -251,6 +257,8 @@ class Schedule(ScheduleBase):
     id: str
     last_run_at: Optional[datetime] = None
     next_run_at: Optional[datetime] = None
+    last_planned_at: Optional[datetime] = None
+    last_lateness_seconds: Optional[float] = None
     created_at: datetime
     updated_at: datetime
 
@@ -286,6 +294,32 @@ class RunLog(BaseModel):
     duration_seconds: Optional[int] = None
     result: Dict[str, Any] = Field(default_factory=dict)
     error_message: Optional[str] = None
+    resumed_from: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+# ============ 작업 큐 스키마 ============
+
+
+class Job(BaseModel):
+    """실행 작업 응답 스키마"""
+
+    id: str
+    job_type: JobType
+    target_id: str
+    status: JobStatus
+    source: str
+    schedule_id: Optional[str] = None
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    locked_by: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -44,11 +44,10 @@ async def list_channels(
     - platform_id: 특정 플랫폼의 모든 채널 조회 (그룹 통해 필터)
     """
     if platform_id:
-        # 플랫폼 존재 확인
-        platform = await get_platform_by_id(platform_id)
-        if not platform:
-            raise HTTPException(status_code=404, detail="플랫폼을 찾을 수 없습니다")
         channels = await get_channels_by_platform(platform_id)
+        # 채널이 없을 때만 플랫폼 존재 확인 (결과가 있으면 플랫폼도 존재)
+        if not channels and not await get_platform_by_id(platform_id):
+            raise HTTPException(status_code=404, detail="플랫폼을 찾을 수 없습니다")
     else:
         channels = await get_all_channels(group_id)
     return channels
@@ -2,22 +2,28 @@
 실행 제어 API 라우터
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from typing import List, Optional
 
-from models.schemas import MessageResponse
+from fastapi import APIRouter, HTTPException, Query
+
+from models.schemas import Job, JobStatus, MessageResponse
 from core.database import (
     get_all_groups,
     get_group_by_id,
     get_channel_by_id,
     get_all_channels,
+    get_jobs,
+    get_job_by_id,
+    get_run_log_by_id,
 )
-from services.executor import execute_group, execute_channel, stop_all_tasks
+from services.executor import RESUMABLE_STATUSES, get_running_runs
+from services.job_queue import enqueue_channel, enqueue_group, enqueue_resume, request_cancel
 
 router = APIRouter()
 
 
 @router.post("/run/all", response_model=MessageResponse)
-async def run_all(background_tasks: BackgroundTasks):
+async def run_all():
     """모든 활성 그룹 즉시 실행"""
     groups = await get_all_groups()
     active_groups = [g for g in groups if g["is_active"]]
@@ -25,17 +31,17 @@ async def run_all(background_tasks: BackgroundTasks):
     if not active_groups:
         raise HTTPException(status_code=400, detail="실행할 활성 그룹이 없습니다")
 
-    # 백그라운드에서 실행
+    # 작업 큐에 추가 (워커가 실행)
     for group in active_groups:
-        background_tasks.add_task(execute_group, group["id"])
+        await enqueue_group(group["id"])
 
     return MessageResponse(
-        message=f"{len(active_groups)}개 그룹의 작업이 시작되었습니다"
+        message=f"{len(active_groups)}개 그룹의 작업이 실행 대기열에 추가되었습니다"
     )
 
 
 @router.post("/run/group/{group_id}", response_model=MessageResponse)
-async def run_group(group_id: str, background_tasks: BackgroundTasks):
+async def run_group(group_id: str):
     """특정 그룹 즉시 실행"""
     group = await get_group_by_id(group_id)
     if not group:
@@ -46,16 +52,16 @@ async def run_group(group_id: str, background_tasks: BackgroundTasks):
     if not channels:
         raise HTTPException(status_code=400, detail="그룹에 채널이 없습니다")
 
-    # 백그라운드에서 실행
-    background_tasks.add_task(execute_group, group_id)
+    # 작업 큐에 추가 (워커가 실행)
+    await enqueue_group(group_id)
 
     return MessageResponse(
-        message=f"그룹 '{group['name']}'의 {len(channels)}개 채널 작업이 시작되었습니다"
+        message=f"그룹 '{group['name']}'의 {len(channels)}개 채널 작업이 실행 대기열에 추가되었습니다"
     )
 
 
 @router.post("/run/channel/{channel_id}", response_model=MessageResponse)
-async def run_channel(channel_id: str, background_tasks: BackgroundTasks):
+async def run_channel(channel_id: str):
     """특정 채널 즉시 실행"""
     channel = await get_channel_by_id(channel_id)
     if not channel:
@@ -64,14 +70,87 @@ async def run_channel(channel_id: str, background_tasks: BackgroundTasks):
     if channel["status"] == "paused":
         raise HTTPException(status_code=400, detail="일시정지된 채널입니다")
 
-    # 백그라운드에서 실행
-    background_tasks.add_task(execute_channel, channel_id)
+    # 작업 큐에 추가 (워커가 실행)
+    await enqueue_channel(channel_id)
+
+    return MessageResponse(message=f"채널 '{channel['name']}' 작업이 실행 대기열에 추가되었습니다")
+
+
+@router.post("/run/resume/{log_id}", response_model=MessageResponse)
+async def resume_run(log_id: str):
+    """실패/취소된 실행 이어하기 (완료된 단계는 체크포인트 결과를 쓰고 첫 미완료 단계부터 실행)"""
+    log = await get_run_log_by_id(log_id)
+    if not log:
+        raise HTTPException(status_code=404, detail="실행 로그를 찾을 수 없습니다")
+
+    if log["status"] not in RESUMABLE_STATUSES:
+        raise HTTPException(
+            status_code=400, detail=f"실패/취소된 실행만 이어서 실행할 수 있습니다 (상태: {log['status']})"
+        )
+
+    channel = await get_channel_by_id(log["channel_id"])
+    if not channel:
+        raise HTTPException(status_code=404, detail="채널을 찾을 수 없습니다")
+    if channel["status"] == "paused":
+        raise HTTPException(status_code=400, detail="일시정지된 채널입니다")
+
+    # 작업 큐에 추가 (워커가 실행)
+    await enqueue_resume(log_id)
 
-    return MessageResponse(message=f"채널 '{channel['name']}' 작업이 시작되었습니다")
+    return MessageResponse(message=f"채널 '{channel['name']}' 이어하기 작업이 실행 대기열에 추가되었습니다")
+
+
+def _cancel_message(result: dict) -> str:
+    return (
+        f"취소 요청됨 (이 서버에서 실행 중 {result['cancelled_runs']}개, "
+        f"대기 작업 {result['cancelled_jobs']}개, 다른 워커는 곧 적용)"
+    )
 
 
 @router.post("/stop/all", response_model=MessageResponse)
 async def stop_all():
-    """실행 중인 모든 작업 중지"""
-    stopped_count = await stop_all_tasks()
-    return MessageResponse(message=f"{stopped_count}개 작업이 중지되었습니다")
+    """실행 중인 모든 작업 및 대기 작업 취소"""
+    result = await request_cancel("all")
+    return MessageResponse(message=_cancel_message(result))
+
+
+@router.post("/stop/group/{group_id}", response_model=MessageResponse)
+async def stop_group(group_id: str):
+    """그룹의 실행 중인 채널 실행 및 대기 중인 그룹 작업 취소"""
+    group = await get_group_by_id(group_id)
+    if not group:
+        raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다")
+
+    result = await request_cancel("group", group_id)
+    return MessageResponse(message=f"그룹 '{group['name']}' {_cancel_message(result)}")
+
+
+@router.post("/stop/run/{log_id}", response_model=MessageResponse)
+async def stop_run(log_id: str):
+    """실행 로그 ID로 실행 중인 채널 실행 취소"""
+    result = await request_cancel("run", log_id)
+    return MessageResponse(message=_cancel_message(result))
+
+
+@router.get("/runs/active")
+async def list_active_runs():
+    """이 서버 프로세스에서 실행 중인 채널 실행 목록 (별도 워커 프로세스는 run_logs 참고)"""
+    return get_running_runs()
+
+
+@router.get("/jobs", response_model=List[Job])
+async def list_jobs(
+    status: Optional[JobStatus] = Query(None, description="작업 상태 필터"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """실행 작업 목록 (최신순)"""
+    return await get_jobs(status, limit)
+
+
+@router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(job_id: str):
+    """실행 작업 조회"""
+    job = await get_job_by_id(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return job
@@ -3,10 +3,11 @@
 schedules 테이블 기반 CRUD 및 스케줄러 연동
 """
 
+import asyncio
 from typing import List
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from models.schemas import (
     Schedule,
@@ -18,18 +19,24 @@ from models.schemas import (
 from core.database import (
     get_all_schedules,
     get_schedule_by_id,
-    get_active_schedules,
     create_schedule,
     update_schedule,
     delete_schedule,
     get_group_by_id,
     get_channel_by_id,
+    get_groups_by_ids,
+    get_channels_by_ids,
 )
+from services.load_forecast import forecast_schedule_load
 from services.scheduler import (
     scheduler,
     register_schedule,
     remove_schedule,
-    get_next_run_time,
+    get_next_run_times,
+    reconcile_schedules,
+    get_reconcile_report,
+    get_minute_load,
+    get_lateness_stats,
 )
 
 router = APIRouter()
@@ -40,32 +47,40 @@ router = APIRouter()
 
 @router.get("", response_model=List[ScheduleWithTarget])
 async def list_schedules():
-    """모든 스케줄 목록 조회 (대상 정보 포함)"""
+    """
+    모든 스케줄 목록 조회 (대상 정보 포함)
+
+    대상 이름은 그룹/채널별로 한 번씩 일괄 조회하고,
+    다음 실행 시간은 스케줄러에서 한 번에 읽어옵니다.
+    """
     schedules = await get_all_schedules()
-    result = []
 
-    for schedule in schedules:
-        target_name = None
+    # 대상 이름 일괄 조회 (그룹 1회, 채널 1회를 동시에)
+    group_ids = {s["target_id"] for s in schedules if s["target_type"] == "group"}
+    channel_ids = {s["target_id"] for s in schedules if s["target_type"] == "channel"}
 
-        # 대상 이름 조회
-        if schedule["target_type"] == "group":
-            group = await get_group_by_id(schedule["target_id"])
-            target_name = group["name"] if group else None
-        elif schedule["target_type"] == "channel":
-            channel = await get_channel_by_id(schedule["target_id"])
-            target_name = channel["name"] if channel else None
+    groups, channels = await asyncio.gather(
+        get_groups_by_ids(group_ids, "id, name"),
+        get_channels_by_ids(channel_ids, "id, name"),
+    )
+    target_names = {
+        "group": {g["id"]: g["name"] for g in groups},
+        "channel": {c["id"]: c["name"] for c in channels},
+    }
 
-        # 다음 실행 시간 업데이트
-        next_run = get_next_run_time(schedule["id"])
+    # 다음 실행 시간 일괄 조회
+    next_run_times = get_next_run_times()
 
+    result = []
+    for schedule in schedules:
         # next_run_at 필드를 덮어쓰기 위해 복사본 생성
         schedule_data = {**schedule}
-        schedule_data["next_run_at"] = next_run
+        schedule_data["next_run_at"] = next_run_times.get(schedule["id"])
 
         result.append(
             ScheduleWithTarget(
                 **schedule_data,
-                target_name=target_name,
+                target_name=target_names.get(schedule["target_type"], {}).get(schedule["target_id"]),
             )
         )
 
@@ -116,6 +131,7 @@ async def create_new_schedule(schedule_data: ScheduleCreate):
             target_type=schedule["target_type"],
             target_id=schedule["target_id"],
             cron_expression=schedule["cron"],
+            misfire_policy=schedule.get("misfire_policy") or "skip",
         )
 
     return schedule
@@ -143,6 +159,7 @@ async def update_existing_schedule(schedule_id: str, schedule_data: ScheduleUpda
             target_type=schedule["target_type"],
             target_id=schedule["target_id"],
             cron_expression=schedule["cron"],
+            misfire_policy=schedule.get("misfire_policy") or "skip",
         )
 
     return schedule
@@ -198,6 +215,7 @@ async def resume_schedule(schedule_id: str):
         target_type=schedule["target_type"],
         target_id=schedule["target_id"],
         cron_expression=schedule["cron"],
+        misfire_policy=schedule.get("misfire_policy") or "skip",
     )
 
     return MessageResponse(message="스케줄이 재개되었습니다")
@@ -208,29 +226,62 @@ async def resume_schedule(schedule_id: str):
 
 @router.post("/sync", response_model=MessageResponse)
 async def sync_schedules():
-    """데이터베이스와 스케줄러 동기화"""
-    # 기존 스케줄 모두 제거
-    for job in scheduler.get_jobs():
-        scheduler.remove_job(job.id)
-
-    # 활성 스케줄만 조회하여 등록
-    active_schedules = await get_active_schedules()
-    registered_count = 0
-
-    for schedule in active_schedules:
-        register_schedule(
-            schedule_id=schedule["id"],
-            target_type=schedule["target_type"],
-            target_id=schedule["target_id"],
-            cron_expression=schedule["cron"],
-        )
-        registered_count += 1
-
-    all_schedules = await get_all_schedules()
-
-    return MessageResponse(
-        message=f"스케줄 동기화 완료: 전체 {len(all_schedules)}개 중 {registered_count}개 활성화"
+    """
+    데이터베이스와 스케줄러 동기화 (바뀐 스케줄만 반영)
+
+    서버 시작 시와 schedule_sync_interval마다 자동으로도 실행됩니다.
+    놓친 실행은 GET /status/reconcile에서 확인합니다.
+    """
+    report = await reconcile_schedules()
+
+    message = (
+        f"스케줄 동기화 완료: 활성 {report['active']}개 "
+        f"(추가 {report['added']}, 변경 {report['rescheduled']}, 제거 {report['removed']}, "
+        f"유지 {report['unchanged']})"
     )
+    if report["failed"]:
+        message += f", 등록 실패 {len(report['failed'])}개"
+    if report["missed_runs_detected"]:
+        message += f", 놓친 실행 {report['missed_runs_detected']}회"
+    return MessageResponse(message=message)
+
+
+@router.get("/status/reconcile")
+async def get_schedule_reconcile_report():
+    """마지막 동기화 결과 (등록/제거된 Job 수, 등록 실패, 스케줄별 놓친 실행)"""
+    report = get_reconcile_report()
+    if report is None:
+        raise HTTPException(status_code=404, detail="아직 스케줄 동기화가 실행되지 않았습니다")
+    return report
+
+
+@router.get("/status/load")
+async def get_schedule_load(
+    hours: float = Query(24.0, gt=0, le=168, description="조회 구간 (시간)"),
+    top: int = Query(20, ge=1, le=1440, description="Job이 많은 분부터 돌려줄 개수"),
+):
+    """분 단위 실행 부하 (각 분에 실행될 Job 수, 최고치 분산 확인용)"""
+    return get_minute_load(hours=hours, top=top)
+
+
+@router.get("/status/forecast")
+async def get_schedule_forecast(
+    hours: float = Query(24.0, gt=0, le=168, description="예측 구간 (시간)"),
+    lookback_days: int = Query(14, ge=1, le=90, description="평균 소요 시간 계산 기간 (일)"),
+):
+    """
+    분 단위 부하 예측
+
+    등록된 스케줄을 앞으로 hours시간 동안 펼쳐 분마다 시작될 채널 실행 수와
+    채널별 평균 소요 시간으로 계산한 예상 동시 실행 수를 돌려줍니다.
+    """
+    return await forecast_schedule_load(hours=hours, lookback_days=lookback_days)
+
+
+@router.get("/status/lateness")
+async def get_schedule_lateness():
+    """트리거 지연(실제 - 예정) 분포와 misfire 처리 결과 (건너뜀/합침/나눠서 실행)"""
+    return get_lateness_stats()
 
 
 @router.get("/status/jobs")
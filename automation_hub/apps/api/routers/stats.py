@@ -1,17 +1,43 @@
 """
 통계 API 라우터
+
+기간별 통계(overview, daily, groups, top-channels)는 DB 집계 함수(RPC)가
+일별 롤업(run_stats_daily)에서 계산한 (날짜/그룹/채널, 상태)별 실행 횟수만 받아
+응답 형태로 변환합니다. 응답 시간은 누적된 실행 기록 양과 무관합니다.
+
+건너뛴(skipped: 중복 실행 방지/서킷 차단) 실행과 취소된(cancelled) 실행은
+게시 수(posts)와 성공률 분모에서 제외합니다 (EXCLUDED_STATUSES).
+
+실행 로그(logs)는 (started_at, id) 커서 기반으로 페이지를 넘기며,
+logs/export는 전체 기간을 NDJSON으로 스트리밍합니다.
 """
 
-from typing import List, Optional
-from datetime import datetime, timedelta, date
+import base64
+import json
+import uuid
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta, date, time
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from models.schemas import RunLog, Stats, DashboardSummary
-from core.database import get_run_logs, get_stats, get_all_channels, get_all_groups
+from core.database import (
+    get_run_logs,
+    iter_run_logs,
+    get_stats,
+    get_all_channels,
+    get_all_groups,
+    get_daily_run_counts,
+    get_group_run_counts,
+    get_channel_run_counts,
+)
 
 router = APIRouter()
 
+# 게시 수/성공률 집계에서 제외하는 실행 상태 (실행하지 않았거나 중간에 취소됨)
+EXCLUDED_STATUSES = ("skipped", "cancelled")
+
 
 @router.get("/summary", response_model=DashboardSummary)
 async def get_dashboard_summary():
@@ -35,16 +61,78 @@ async def get_dashboard_summary():
     return summary
 
 
+def encode_log_cursor(log: dict) -> str:
+    """실행 로그 행 → 페이지 커서 (started_at, id를 담은 불투명 문자열)"""
+    raw = json.dumps([log["started_at"], log["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_log_cursor(cursor: str) -> Tuple[str, str]:
+    """페이지 커서 → (started_at, id). 형식이 잘못되면 400"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        started_at, log_id = json.loads(base64.urlsafe_b64decode(padded))
+        # 쿼리 필터에 그대로 들어가므로 형식 검증
+        datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+        return started_at, str(uuid.UUID(log_id))
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
+def _started_at_range(
+    start_date: Optional[date], end_date: Optional[date]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """날짜 필터 → started_at 범위 [하한, 상한)"""
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다")
+    started_from = datetime.combine(start_date, time.min) if start_date else None
+    started_to = datetime.combine(end_date + timedelta(days=1), time.min) if end_date else None
+    return started_from, started_to
+
+
 @router.get("/logs", response_model=List[RunLog])
 async def list_run_logs(
+    response: Response,
     channel_id: Optional[str] = Query(None, description="채널 ID 필터"),
     limit: int = Query(50, ge=1, le=500, description="조회 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    start_date: Optional[date] = Query(None, description="시작일 (포함)"),
+    end_date: Optional[date] = Query(None, description="종료일 (포함)"),
 ):
-    """실행 로그 목록 조회"""
-    logs = await get_run_logs(channel_id, limit)
+    """
+    실행 로그 목록 조회 (최신순)
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    """
+    after = decode_log_cursor(cursor) if cursor else None
+    started_from, started_to = _started_at_range(start_date, end_date)
+    logs = await get_run_logs(channel_id, limit, after, started_from, started_to)
+    if len(logs) == limit:
+        response.headers["X-Next-Cursor"] = encode_log_cursor(logs[-1])
     return logs
 
 
+@router.get("/logs/export")
+async def export_run_logs(
+    channel_id: Optional[str] = Query(None, description="채널 ID 필터"),
+    start_date: Optional[date] = Query(None, description="시작일 (포함)"),
+    end_date: Optional[date] = Query(None, description="종료일 (포함)"),
+):
+    """
+    실행 로그 내보내기 (NDJSON 스트리밍, 최신순)
+
+    한 줄에 로그 하나씩 페이지 단위로 조회하며 바로 전송하므로
+    기간이 길어도 서버 메모리 사용량이 일정합니다.
+    """
+    started_from, started_to = _started_at_range(start_date, end_date)
+
+    async def stream():
+        async for log in iter_run_logs(channel_id, started_from, started_to):
+            yield json.dumps(log, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get("/channel/{channel_id}", response_model=List[Stats])
 async def get_stats_by_channel(
     channel_id: str,
@@ -62,7 +150,6 @@ async def get_overview_stats(
 ):
     """전체 개요 통계 (기간별)"""
     channels = await get_all_channels()
-    logs = await get_run_logs(limit=5000)
 
     # 기본값: 최근 7일
     if not end_date:
@@ -70,33 +157,34 @@ async def get_overview_stats(
     if not start_date:
         start_date = end_date - timedelta(days=7)
 
-    # 현재 기간 로그 필터링
-    current_logs = []
-    for log in logs:
-        log_date = datetime.fromisoformat(log["started_at"].replace("Z", "+00:00")).date()
-        if start_date <= log_date <= end_date:
-            current_logs.append(log)
-
     # 이전 기간 (동일한 기간 길이)
     period_length = (end_date - start_date).days + 1
     prev_start = start_date - timedelta(days=period_length)
     prev_end = start_date - timedelta(days=1)
 
-    prev_logs = []
-    for log in logs:
-        log_date = datetime.fromisoformat(log["started_at"].replace("Z", "+00:00")).date()
-        if prev_start <= log_date <= prev_end:
-            prev_logs.append(log)
+    # 이전 기간 ~ 현재 기간 일별 집계를 한 번에 조회 후 기간별로 합산
+    daily_counts = await get_daily_run_counts(prev_start, end_date)
+
+    current_counts = {"total": 0, "success": 0, "failed": 0}
+    prev_counts = {"total": 0, "success": 0, "failed": 0}
+    for row in daily_counts:
+        if row["status"] in EXCLUDED_STATUSES:
+            continue
+        run_date = date.fromisoformat(row["run_date"])
+        counts = current_counts if run_date >= start_date else prev_counts
+        counts["total"] += row["run_count"]
+        if row["status"] in ("success", "failed"):
+            counts[row["status"]] += row["run_count"]
 
     # 현재 기간 통계
-    total_runs = len(current_logs)
-    successful_runs = len([l for l in current_logs if l["status"] == "success"])
-    failed_runs = len([l for l in current_logs if l["status"] == "failed"])
+    total_runs = current_counts["total"]
+    successful_runs = current_counts["success"]
+    failed_runs = current_counts["failed"]
     success_rate = (successful_runs / total_runs * 100) if total_runs > 0 else 0
 
     # 이전 기간 통계
-    prev_total_runs = len(prev_logs)
-    prev_successful = len([l for l in prev_logs if l["status"] == "success"])
+    prev_total_runs = prev_counts["total"]
+    prev_successful = prev_counts["success"]
     prev_success_rate = (prev_successful / prev_total_runs * 100) if prev_total_runs > 0 else 0
 
     # 변화율 계산
@@ -144,8 +232,6 @@ async def get_daily_stats(
     end_date: Optional[date] = Query(None, description="종료 날짜"),
 ):
     """일별 통계"""
-    logs = await get_run_logs(limit=5000)
-
     # 기본값: 최근 7일
     if not end_date:
         end_date = datetime.now().date()
@@ -166,19 +252,19 @@ async def get_daily_stats(
         }
         current_date += timedelta(days=1)
 
-    # 로그 집계
-    for log in logs:
-        log_date = datetime.fromisoformat(log["started_at"].replace("Z", "+00:00")).date()
-        date_key = log_date.isoformat()
-        if date_key in daily_data:
-            daily_data[date_key]["posts"] += 1
-            if log["status"] == "success":
-                daily_data[date_key]["success"] += 1
+    # 일별/상태별 집계 반영
+    for row in await get_daily_run_counts(start_date, end_date):
+        date_key = row["run_date"]
+        count = row["run_count"]
+        if date_key in daily_data and row["status"] not in EXCLUDED_STATUSES:
+            daily_data[date_key]["posts"] += count
+            if row["status"] == "success":
+                daily_data[date_key]["success"] += count
                 # 목업: 성공한 실행당 조회수/구독자 추가
-                daily_data[date_key]["views"] += 350
-                daily_data[date_key]["subscribers"] += 8
-            elif log["status"] == "failed":
-                daily_data[date_key]["failed"] += 1
+                daily_data[date_key]["views"] += 350 * count
+                daily_data[date_key]["subscribers"] += 8 * count
+            elif row["status"] == "failed":
+                daily_data[date_key]["failed"] += count
 
     # 정렬된 리스트 반환
     return sorted(daily_data.values(), key=lambda x: x["date"])
@@ -191,8 +277,6 @@ async def get_group_stats(
 ):
     """그룹별 통계"""
     groups = await get_all_groups()
-    channels = await get_all_channels()
-    logs = await get_run_logs(limit=5000)
 
     # 기본값: 최근 7일
     if not end_date:
@@ -200,9 +284,6 @@ async def get_group_stats(
     if not start_date:
         start_date = end_date - timedelta(days=7)
 
-    # 채널 -> 그룹 매핑
-    channel_to_group = {c["id"]: c["group_id"] for c in channels}
-
     # 그룹별 집계 초기화
     group_stats = {}
     for group in groups:
@@ -217,20 +298,18 @@ async def get_group_stats(
             "failed_count": 0,
         }
 
-    # 로그 집계
-    for log in logs:
-        log_date = datetime.fromisoformat(log["started_at"].replace("Z", "+00:00")).date()
-        if start_date <= log_date <= end_date:
-            channel_id = log.get("channel_id")
-            group_id = channel_to_group.get(channel_id)
-            if group_id and group_id in group_stats:
-                group_stats[group_id]["total_posts"] += 1
-                if log["status"] == "success":
-                    group_stats[group_id]["success_count"] += 1
-                    group_stats[group_id]["total_views"] += 350
-                    group_stats[group_id]["total_subscribers"] += 8
-                elif log["status"] == "failed":
-                    group_stats[group_id]["failed_count"] += 1
+    # 그룹별/상태별 집계 반영 (채널의 현재 소속 그룹 기준)
+    for row in await get_group_run_counts(start_date, end_date):
+        group_id = row["group_id"]
+        count = row["run_count"]
+        if group_id in group_stats and row["status"] not in EXCLUDED_STATUSES:
+            group_stats[group_id]["total_posts"] += count
+            if row["status"] == "success":
+                group_stats[group_id]["success_count"] += count
+                group_stats[group_id]["total_views"] += 350 * count
+                group_stats[group_id]["total_subscribers"] += 8 * count
+            elif row["status"] == "failed":
+                group_stats[group_id]["failed_count"] += count
 
     # 성공률 계산 및 리스트 변환
     result = []
@@ -261,7 +340,6 @@ async def get_top_channels(
     """채널별 TOP N"""
     groups = await get_all_groups()
     channels = await get_all_channels()
-    logs = await get_run_logs(limit=5000)
 
     # 기본값: 최근 7일
     if not end_date:
@@ -285,16 +363,15 @@ async def get_top_channels(
             "posts": 0,
         }
 
-    # 로그 집계
-    for log in logs:
-        log_date = datetime.fromisoformat(log["started_at"].replace("Z", "+00:00")).date()
-        if start_date <= log_date <= end_date:
-            channel_id = log.get("channel_id")
-            if channel_id and channel_id in channel_stats:
-                channel_stats[channel_id]["posts"] += 1
-                if log["status"] == "success":
-                    channel_stats[channel_id]["views"] += 350
-                    channel_stats[channel_id]["subscribers"] += 8
+    # 채널별/상태별 집계 반영
+    for row in await get_channel_run_counts(start_date, end_date):
+        channel_id = row["channel_id"]
+        count = row["run_count"]
+        if channel_id in channel_stats and row["status"] not in EXCLUDED_STATUSES:
+            channel_stats[channel_id]["posts"] += count
+            if row["status"] == "success":
+                channel_stats[channel_id]["views"] += 350 * count
+                channel_stats[channel_id]["subscribers"] += 8 * count
 
     # 정렬
     result = list(channel_stats.values())
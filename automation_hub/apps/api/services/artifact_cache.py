@@ -0,0 +1,375 @@
+"""
+생성 결과물 캐시 (content-addressed)
+
+같은 content_topic / content_category를 쓰는 채널들이 거의 같은 스크립트, 키워드,
+이미지를 매번 다시 생성하지 않도록, 워커 단계 결과를 입력 기준으로 디스크에 캐시합니다.
+단계는 @cached_stage(workers/base.py)로 선택적으로 사용합니다.
+
+- 키: sha256(단계 이름, 입력(인자), 버전) - 입력이 같으면 같은 결과를 재사용
+  버전: 단계별 version(모델/프롬프트가 바뀌면 올림) + ARTIFACT_CACHE_VERSION(전체 무효화)
+- 결과값은 JSON으로 저장하고, 결과 안의 파일 경로(존재하는 파일의 절대 경로)는 파일 사본을 함께 저장
+  캐시에서 꺼낼 때 파일은 임시 파일로 복사해 반환 (캐시 정리와 무관하게 유지되며,
+  사본 경로를 copies로 받아 실행이 끝나면 release_copies로 삭제 - @cached_stage는 워커가 처리)
+- 입력의 파일 경로는 내용이 아니라 경로 문자열로 키에 반영됨
+- 제거: 전체 크기가 ARTIFACT_CACHE_MAX_MB를 넘으면 가장 오래 쓰지 않은 항목부터 (LRU)
+- 같은 키를 동시에 요청하면 하나만 생성하고 나머지는 그 결과를 기다림 (프로세스 내)
+- 색인은 프로세스별 (시작 시 디렉터리를 읽어 만듦). 다른 프로세스가 지운 항목은 미스로 처리
+- 캐시 읽기/쓰기 실패는 로그만 남기고 단계를 그대로 실행
+- 히트율 등 통계는 작업 워커가 heartbeat마다 보고하고 /health에서 워커 합계로 확인
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from core.config import settings
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 결과 안의 파일 자리 표시 (JSON 값 → {"__artifact__": 파일 이름})
+_ARTIFACT_MARKER = "__artifact__"
+
+# 항목 디렉터리 안의 결과값 파일 (마지막 사용 시각 = 수정 시각)
+_VALUE_FILE = "value.json"
+
+# 미스 표시
+_MISS = object()
+
+
+def cache_key(stage: str, inputs: Any, version: str) -> str:
+    """단계 이름, 입력, 버전 → 캐시 키 (sha256 hex)"""
+    payload = json.dumps(
+        {"stage": stage, "inputs": inputs, "version": version},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ArtifactCache:
+    """디스크 LRU 캐시"""
+
+    def __init__(self, root: str, max_bytes: int, version: str = "1", enabled: bool = True):
+        """
+        Args:
+            root: 캐시 디렉터리
+            max_bytes: 전체 크기 상한 (바이트)
+            version: 전체 캐시 버전 (바꾸면 기존 항목을 쓰지 않음)
+            enabled: False면 캐시하지 않고 항상 생성
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.version = version
+        self.enabled = enabled
+
+        # 키 → 항목 크기 (앞쪽이 가장 오래 쓰지 않은 항목)
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._index_lock: Optional[asyncio.Lock] = None
+        self.total_bytes = 0
+        # 생성 중인 키 → 끝나면 set되는 이벤트
+        self._inflight: Dict[str, asyncio.Event] = {}
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,  # 같은 키의 생성이 끝나기를 기다린 횟수
+            "stored": 0,
+            "unstorable": 0,
+            "evictions": 0,
+            "evicted_bytes": 0,
+            "copies": 0,  # 히트 시 만든 파일 사본
+            "released": 0,  # 삭제한 파일 사본
+            "errors": 0,
+        }
+        # 단계 이름 → {"hits", "misses"}
+        self.stage_stats: Dict[str, Dict[str, int]] = {}
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    # ============ 조회 / 생성 ============
+
+    async def get_or_create(
+        self,
+        stage: str,
+        inputs: Any,
+        version: str,
+        create: Callable[[], Awaitable[Any]],
+        copies: Optional[List[str]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        캐시된 결과를 반환하고, 없으면 create()로 생성해 저장
+
+        Args:
+            stage: 단계 이름
+            inputs: 단계 입력 (JSON 변환 가능한 값, 키에 반영)
+            version: 단계 버전 (모델/프롬프트 변경 시 올림)
+            create: 결과를 생성하는 코루틴 함수
+            copies: 히트 시 만든 파일 사본 경로를 추가할 리스트 (다 쓰면 release_copies로 삭제)
+
+        Returns:
+            (결과, 캐시 히트 여부)
+        """
+        if not self.enabled:
+            return await create(), False
+
+        key = cache_key(stage, inputs, f"{self.version}:{version}")
+        await self._ensure_index()
+
+        waited = False
+        while True:
+            value = await self._lookup(key, stage, copies)
+            if value is not _MISS:
+                self._record(stage, hit=True)
+                return value, True
+            event = self._inflight.get(key)
+            if event is None:
+                break
+            # 같은 입력으로 생성 중인 단계가 있으면 끝날 때까지 기다렸다 다시 조회
+            if not waited:
+                self.stats["coalesced"] += 1
+                waited = True
+            await event.wait()
+
+        self._record(stage, hit=False)
+        event = self._inflight[key] = asyncio.Event()
+        try:
+            value = await create()
+            await self._store(key, stage, value)
+            return value, False
+        finally:
+            del self._inflight[key]
+            event.set()
+
+    def _record(self, stage: str, hit: bool):
+        name = "hits" if hit else "misses"
+        self.stats[name] += 1
+        stats = self.stage_stats.setdefault(stage, {"hits": 0, "misses": 0})
+        stats[name] += 1
+
+    async def _lookup(self, key: str, stage: str, copies: Optional[List[str]]) -> Any:
+        if key not in self._index:
+            return _MISS
+        restored: List[str] = []
+        try:
+            value = await asyncio.to_thread(self._read_entry, key, stage, restored)
+        except FileNotFoundError:
+            # 다른 프로세스가 제거함
+            self._forget(key)
+            return _MISS
+        except (OSError, ValueError) as e:
+            self.stats["errors"] += 1
+            logger.warning(f"캐시 항목 읽기 실패 (다시 생성): {stage} {key[:12]}, {e}")
+            self._forget(key)
+            await self.release_copies(restored)
+            return _MISS
+        self._index.move_to_end(key)
+        self.stats["copies"] += len(restored)
+        if copies is not None:
+            copies.extend(restored)
+        return value
+
+    def _read_entry(self, key: str, stage: str, restored: List[str]) -> Any:
+        """항목 읽기 (파일은 임시 파일로 복사해 restored에 추가) + 마지막 사용 시각 갱신"""
+        directory = self._entry_dir(key)
+        value_path = os.path.join(directory, _VALUE_FILE)
+        with open(value_path, encoding="utf-8") as f:
+            value = json.load(f)
+        os.utime(value_path)
+
+        def restore(node: Any) -> Any:
+            if isinstance(node, dict):
+                if set(node) == {_ARTIFACT_MARKER}:
+                    name = node[_ARTIFACT_MARKER]
+                    fd, path = tempfile.mkstemp(prefix=f"{stage}_", suffix=os.path.splitext(name)[1])
+                    os.close(fd)
+                    restored.append(path)
+                    shutil.copyfile(os.path.join(directory, name), path)
+                    return path
+                return {k: restore(v) for k, v in node.items()}
+            if isinstance(node, list):
+                return [restore(v) for v in node]
+            return node
+
+        return restore(value)
+
+    async def release_copies(self, paths: List[str]):
+        """히트 시 만든 파일 사본 삭제 (paths는 비움)"""
+        if not paths:
+            return
+        removed = await asyncio.to_thread(self._remove_copies, list(paths))
+        self.stats["released"] += removed
+        paths.clear()
+
+    @staticmethod
+    def _remove_copies(paths: List[str]) -> int:
+        removed = 0
+        for path in paths:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"캐시 파일 사본 삭제 실패: {path}, {e}")
+        return removed
+
+    # ============ 저장 ============
+
+    async def _store(self, key: str, stage: str, value: Any):
+        try:
+            size = await asyncio.to_thread(self._write_entry, key, value)
+        except (TypeError, ValueError) as e:
+            self.stats["unstorable"] += 1
+            logger.warning(f"캐시 저장 안 함 (JSON 변환 불가): {stage}, {e}")
+            return
+        except OSError as e:
+            self.stats["errors"] += 1
+            logger.error(f"캐시 저장 실패: {stage} {key[:12]}, {e}")
+            return
+
+        self.stats["stored"] += 1
+        self._forget(key)
+        self._index[key] = size
+        self.total_bytes += size
+        await self._evict()
+
+    def _write_entry(self, key: str, value: Any) -> int:
+        """
+        항목 쓰기 (임시 디렉터리에 쓴 뒤 이름 변경), 항목 크기 반환
+
+        결과 안의 파일 경로는 사본으로 바꿔 저장합니다.
+        """
+        staging = os.path.join(self.root, f".tmp-{key}-{uuid.uuid4().hex[:8]}")
+        os.makedirs(staging)
+        try:
+            files = []
+
+            def replace(node: Any) -> Any:
+                if isinstance(node, str) and os.path.isabs(node) and os.path.isfile(node):
+                    name = f"{len(files)}{os.path.splitext(node)[1]}"
+                    shutil.copyfile(node, os.path.join(staging, name))
+                    files.append(name)
+                    return {_ARTIFACT_MARKER: name}
+                if isinstance(node, dict):
+                    return {k: replace(v) for k, v in node.items()}
+                if isinstance(node, (list, tuple)):
+                    return [replace(v) for v in node]
+                return node
+
+            data = json.dumps(replace(value), ensure_ascii=False)
+            with open(os.path.join(staging, _VALUE_FILE), "w", encoding="utf-8") as f:
+                f.write(data)
+
+            directory = self._entry_dir(key)
+            os.makedirs(os.path.dirname(directory), exist_ok=True)
+            if os.path.isdir(directory):
+                # 다른 프로세스가 먼저 저장함 (같은 입력 → 같은 결과로 간주)
+                shutil.rmtree(staging)
+            else:
+                os.rename(staging, directory)
+            return self._dir_size(directory)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    # ============ 색인 / 제거 ============
+
+    @staticmethod
+    def _dir_size(directory: str) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+    async def _ensure_index(self):
+        """첫 사용 시 디렉터리를 읽어 색인 생성 (마지막 사용 순)"""
+        if self._index is not None:
+            return
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+        async with self._index_lock:
+            if self._index is None:
+                entries = await asyncio.to_thread(self._scan)
+                self._index = OrderedDict((key, size) for _, key, size in sorted(entries))
+                self.total_bytes = sum(self._index.values())
+                if self._index:
+                    logger.info(f"생성 결과물 캐시: {len(self._index)}개, {self.total_bytes}바이트")
+
+    def _scan(self):
+        """[(마지막 사용 시각, 키, 크기), ...] (쓰다 남은 임시 디렉터리는 삭제)"""
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for prefix in os.scandir(self.root):
+            if prefix.name.startswith(".tmp-"):
+                shutil.rmtree(prefix.path, ignore_errors=True)
+                continue
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                try:
+                    used_at = os.stat(os.path.join(entry.path, _VALUE_FILE)).st_mtime
+                    entries.append((used_at, entry.name, self._dir_size(entry.path)))
+                except OSError:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+        return entries
+
+    def _forget(self, key: str):
+        size = self._index.pop(key, None)
+        if size is not None:
+            self.total_bytes -= size
+
+    async def _evict(self):
+        """크기 상한을 넘으면 가장 오래 쓰지 않은 항목부터 제거"""
+        evicted = []
+        while self.total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self.total_bytes -= size
+            evicted.append(key)
+            self.stats["evictions"] += 1
+            self.stats["evicted_bytes"] += size
+        if evicted:
+            await asyncio.to_thread(
+                lambda: [shutil.rmtree(self._entry_dir(key), ignore_errors=True) for key in evicted]
+            )
+
+    async def clear(self):
+        """캐시 전체 삭제"""
+        await asyncio.to_thread(shutil.rmtree, self.root, True)
+        self._index = OrderedDict()
+        self.total_bytes = 0
+
+    def get_stats(self) -> dict:
+        """히트율과 크기 통계"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "root": self.root,
+            "entries": len(self._index) if self._index is not None else None,
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "stages": {
+                stage: {
+                    **stats,
+                    "hit_rate": stats["hits"] / (stats["hits"] + stats["misses"]),
+                }
+                for stage, stats in self.stage_stats.items()
+            },
+        }
+
+
+# 전역 생성 결과물 캐시
+artifact_cache = ArtifactCache(
+    root=settings.artifact_cache_dir or os.path.join(tempfile.gettempdir(), "automation_hub_artifact_cache"),
+    max_bytes=settings.artifact_cache_max_mb * 1024 * 1024,
+    version=settings.artifact_cache_version,
+    enabled=settings.artifact_cache_enabled,
+)
@@ -0,0 +1,206 @@
+"""
+채널 중복 실행 방지 (single-flight)
+
+채널 스케줄, 그룹 스케줄, 수동 실행이 겹쳐도 같은 채널은 한 번에 하나만 실행합니다.
+
+- 프로세스 안: 채널별 asyncio.Lock
+- 프로세스 간: DB 잠금 (postgres: 세션 advisory lock, supabase: lease_locks 임대 잠금)
+- 이미 실행 중일 때 정책 (CHANNEL_RUN_POLICY)
+  - skip: 바로 건너뜀 (실행 로그에 skipped로 기록)
+  - queue: 앞 실행이 끝날 때까지 대기 (channel_lock_wait_timeout을 넘으면 건너뜀)
+- DB 잠금 조회가 실패하면 프로세스 안 잠금만으로 실행 (DB 장애로 실행이 모두 멈추지 않도록)
+- 만료가 있는 DB 잠금(supabase 임대 잠금)은 실행 중 renew_interval마다 연장
+  (실행이 CHANNEL_LOCK_TTL_SECONDS보다 길어도 다른 프로세스가 같은 채널을 시작하지 않도록)
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+from core.config import settings
+from core.database import advisory_unlock, renew_advisory_lock, try_advisory_lock
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _lock_key(channel_id: str) -> str:
+    return f"channel_run:{channel_id}"
+
+
+class ChannelLock:
+    """채널별 실행 잠금"""
+
+    def __init__(
+        self,
+        policy: str,
+        wait_timeout: float,
+        poll_interval: float,
+        renew_interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            policy: 이미 실행 중일 때 skip (건너뜀) | queue (대기)
+            wait_timeout: queue 정책 최대 대기 시간 (초)
+            poll_interval: queue 정책에서 다른 프로세스의 잠금 해제 확인 간격 (초)
+            renew_interval: 보유 중인 DB 잠금 연장 간격 (초, None이면 연장하지 않음)
+        """
+        self.policy = policy
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.renew_interval = renew_interval
+
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._users: Dict[str, int] = {}
+        # DB 잠금까지 잡은 채널 ID (해제 시 DB 잠금도 풀어야 하는 채널)
+        self._db_held: Set[str] = set()
+
+        self.stats = {
+            "acquired": 0,
+            "waited": 0,  # queue 정책에서 앞 실행을 기다린 횟수
+            "skipped": 0,
+            "db_errors": 0,
+            "renewed": 0,  # DB 잠금 연장 횟수
+            "lost": 0,  # 실행 중 DB 잠금을 잃은 횟수 (만료 후 다른 프로세스가 가져감)
+        }
+
+    @property
+    def held(self) -> int:
+        """이 프로세스에서 실행 중(잠금 보유)인 채널 수"""
+        return sum(1 for lock in self._locks.values() if lock.locked())
+
+    @asynccontextmanager
+    async def hold(self, channel_id: str) -> AsyncIterator[bool]:
+        """
+        채널 실행 잠금
+
+        사용법:
+            async with channel_lock.hold(channel_id) as acquired:
+                if not acquired:
+                    ...  # 건너뜀
+
+        Yields:
+            잠금 획득 여부 (False면 실행하지 말 것)
+        """
+        lock = self._locks.get(channel_id)
+        if lock is None:
+            lock = self._locks[channel_id] = asyncio.Lock()
+        self._users[channel_id] = self._users.get(channel_id, 0) + 1
+
+        try:
+            acquired = await self._acquire(channel_id, lock)
+            if not acquired:
+                self.stats["skipped"] += 1
+                yield False
+                return
+
+            self.stats["acquired"] += 1
+            renew_task = None
+            if channel_id in self._db_held and self.renew_interval:
+                renew_task = asyncio.create_task(self._renew_loop(channel_id))
+            try:
+                yield True
+            finally:
+                if renew_task is not None:
+                    renew_task.cancel()
+                    try:
+                        await renew_task
+                    except asyncio.CancelledError:
+                        pass
+                await self._release(channel_id, lock)
+        finally:
+            # 기다리는 호출자가 없으면 채널별 잠금 정리
+            self._users[channel_id] -= 1
+            if self._users[channel_id] == 0:
+                del self._users[channel_id]
+                self._locks.pop(channel_id, None)
+
+    async def _acquire(self, channel_id: str, lock: asyncio.Lock) -> bool:
+        queue = self.policy == "queue"
+        deadline = time.monotonic() + self.wait_timeout
+
+        # 1. 프로세스 안 잠금
+        waited = lock.locked()
+        if not waited:
+            # 비어 있으면 양보 없이 바로 획득 (wait_for는 태스크를 거치므로 사이에 다른 호출이 끼어듦)
+            await lock.acquire()
+        elif not queue:
+            return False
+        else:
+            self.stats["waited"] += 1
+            try:
+                await asyncio.wait_for(lock.acquire(), max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                return False
+
+        # 2. 프로세스 간 잠금 (queue 정책이면 풀릴 때까지 주기적으로 재시도)
+        try:
+            while True:
+                try:
+                    if await try_advisory_lock(_lock_key(channel_id)):
+                        self._db_held.add(channel_id)
+                        return True
+                except Exception as e:
+                    self.stats["db_errors"] += 1
+                    logger.error(f"채널 잠금 조회 실패, 프로세스 안 잠금만 사용: {channel_id}, 오류: {e}")
+                    return True
+
+                remaining = deadline - time.monotonic()
+                if not queue or remaining <= 0:
+                    lock.release()
+                    return False
+                if not waited:
+                    waited = True
+                    self.stats["waited"] += 1
+                await asyncio.sleep(min(self.poll_interval, remaining))
+        except BaseException:
+            lock.release()
+            raise
+
+    async def _renew_loop(self, channel_id: str):
+        """실행 중 DB 잠금 주기적 연장 (실패해도 실행은 계속, 잃으면 기록)"""
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            try:
+                renewed = await renew_advisory_lock(_lock_key(channel_id))
+            except Exception as e:
+                self.stats["db_errors"] += 1
+                logger.error(f"채널 잠금 연장 실패: {channel_id}, 오류: {e}")
+                continue
+            if renewed:
+                self.stats["renewed"] += 1
+            else:
+                self.stats["lost"] += 1
+                logger.error(f"채널 잠금을 잃음 (만료 후 다른 프로세스가 가져감): {channel_id}")
+                return
+
+    async def _release(self, channel_id: str, lock: asyncio.Lock):
+        try:
+            if channel_id in self._db_held:
+                self._db_held.discard(channel_id)
+                await advisory_unlock(_lock_key(channel_id))
+        except Exception as e:
+            # postgres는 커넥션이 끊기면 해제되고, supabase 임대 잠금은 만료 후 해제됨
+            self.stats["db_errors"] += 1
+            logger.error(f"채널 잠금 해제 실패: {channel_id}, 오류: {e}")
+        finally:
+            lock.release()
+
+    def get_stats(self) -> dict:
+        """잠금 현황"""
+        return {
+            "policy": self.policy,
+            "held": self.held,
+            "waiting": sum(self._users.values()) - self.held,
+            **self.stats,
+        }
+
+
+# 전역 채널 실행 잠금
+channel_lock = ChannelLock(
+    policy=settings.channel_run_policy,
+    wait_timeout=settings.channel_lock_wait_timeout,
+    poll_interval=settings.channel_lock_poll_interval,
+    renew_interval=settings.channel_lock_ttl_seconds / 3,
+)
@@ -0,0 +1,273 @@
+"""
+워커 단계 체크포인트 저장소
+
+실패/취소된 실행을 처음부터 다시 하지 않고 이어서 실행(resume)할 수 있도록,
+run_stages의 단계 결과를 실행 로그 ID별로 로컬 디렉터리에 저장하고
+메타데이터(stage_checkpoints 테이블)는 쓰기 버퍼로 기록합니다.
+
+- 결과값: JSON 파일로 저장 (<root>/<실행 로그 ID>/<단계>.json)
+- 결과 파일 (존재하는 파일의 절대 경로를 반환한 단계, 예: 영상/썸네일):
+  다음 실행이 같은 경로를 덮어써도 남도록 사본을 저장 (<root>/<실행 로그 ID>/<단계><확장자>)
+- JSON으로 저장할 수 없는 결과는 저장하지 않음 (이어하기 시 그 단계부터 다시 실행)
+- 결과물은 저장한 호스트에만 있으므로 워커 호스트가 여럿이면 공유 볼륨을 CHECKPOINT_DIR로 지정
+  (파일을 찾을 수 없는 체크포인트는 불러오지 않고 그 단계부터 다시 실행)
+- 성공한 실행의 결과물은 바로 삭제하고, 이어하지 않은 실행의 결과물은
+  checkpoint_retention_hours가 지나면 삭제
+- 저장/삭제 실패는 로그만 남기고 실행에는 영향을 주지 않음
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import socket
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from core.config import settings
+from core.database import get_stage_checkpoints
+from core.logger import setup_logger
+from services.write_buffer import write_buffer
+
+logger = setup_logger(__name__)
+
+# 보관 기간이 지난 결과물 정리 간격 (초)
+_PRUNE_INTERVAL_SECONDS = 3600.0
+
+
+def _is_file_result(value: Any) -> bool:
+    """단계 결과가 결과 파일 경로인지 (절대 경로이고 파일이 존재)"""
+    return isinstance(value, str) and os.path.isabs(value) and os.path.isfile(value)
+
+
+class CheckpointStore:
+    """실행 로그 ID별 단계 결과 저장소"""
+
+    def __init__(self, root: str, retention_hours: float, enabled: bool = True):
+        """
+        Args:
+            root: 결과물 저장 디렉터리
+            retention_hours: 이어하지 않은 실행의 결과물 보관 시간 (0 이하이면 삭제하지 않음)
+            enabled: False면 저장/불러오기를 하지 않음
+        """
+        self.root = root
+        self.retention_hours = retention_hours
+        self.enabled = enabled
+        self.host = socket.gethostname()
+        self._pruned_at: Optional[float] = None
+
+        self.stats = {
+            "saved": 0,
+            "saved_bytes": 0,
+            "unsaved": 0,
+            "restored": 0,
+            "missing": 0,
+            "discarded": 0,
+            "pruned_runs": 0,
+        }
+
+    def _run_dir(self, run_log_id: str) -> str:
+        return os.path.join(self.root, run_log_id)
+
+    # ============ 저장 ============
+
+    async def save(self, run_log_id: str, stage: str, value: Any) -> Optional[Dict[str, Any]]:
+        """
+        단계 결과 저장
+
+        Returns:
+            체크포인트 메타데이터 (stage_checkpoints 행), 저장하지 못하면 None
+        """
+        if not self.enabled:
+            return None
+        try:
+            if _is_file_result(value):
+                kind = "file"
+                path = os.path.join(self._run_dir(run_log_id), stage + os.path.splitext(value)[1])
+                await asyncio.to_thread(self._copy_file, value, path)
+            else:
+                kind = "value"
+                path = os.path.join(self._run_dir(run_log_id), f"{stage}.json")
+                data = json.dumps(value, ensure_ascii=False)
+                await asyncio.to_thread(self._write_text, path, data)
+            size = os.path.getsize(path)
+        except (TypeError, ValueError) as e:
+            self.stats["unsaved"] += 1
+            logger.warning(f"체크포인트 저장 안 함 (JSON 변환 불가): {run_log_id} {stage}, {e}")
+            return None
+        except OSError as e:
+            self.stats["unsaved"] += 1
+            logger.error(f"체크포인트 저장 실패: {run_log_id} {stage}, {e}")
+            return None
+
+        self.stats["saved"] += 1
+        self.stats["saved_bytes"] += size
+        checkpoint = {
+            "run_log_id": run_log_id,
+            "stage": stage,
+            "kind": kind,
+            "artifact_path": path,
+            "size_bytes": size,
+            "host": self.host,
+        }
+        await write_buffer.add_stage_checkpoint(checkpoint)
+        await self._maybe_prune()
+        return checkpoint
+
+    async def carry_over(self, run_log_id: str, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        이전 실행에서 불러온 체크포인트를 이번 실행에도 기록 (결과물은 복사하지 않고 같은 경로 참조)
+
+        이어하기 실행이 다시 실패해도 그 실행에서 바로 이어할 수 있도록 합니다.
+        """
+        carried = {
+            "run_log_id": run_log_id,
+            **{key: checkpoint[key] for key in ("stage", "kind", "artifact_path", "size_bytes", "host")},
+        }
+        await write_buffer.add_stage_checkpoint(carried)
+        return carried
+
+    @staticmethod
+    def _copy_file(source: str, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copyfile(source, path)
+
+    @staticmethod
+    def _write_text(path: str, data: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 쓰다가 죽어도 읽을 수 있는 파일만 남도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    # ============ 불러오기 ============
+
+    async def load(self, run_log_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        실행 로그의 단계 결과 불러오기
+
+        Returns:
+            단계 이름 → {"value": 결과, "checkpoint": 메타데이터}
+            (결과물 파일이 없거나 읽을 수 없는 단계는 제외)
+        """
+        if not self.enabled:
+            return {}
+
+        try:
+            checkpoints = await get_stage_checkpoints(run_log_id)
+        except Exception as e:
+            logger.error(f"체크포인트 조회 실패, 처음부터 실행: {run_log_id}, {e}")
+            return {}
+
+        restored: Dict[str, Dict[str, Any]] = {}
+        for checkpoint in checkpoints:
+            path = checkpoint["artifact_path"]
+            try:
+                if checkpoint["kind"] == "file":
+                    if not os.path.isfile(path):
+                        raise FileNotFoundError(path)
+                    value = path
+                else:
+                    value = json.loads(await asyncio.to_thread(self._read_text, path))
+            except (OSError, ValueError) as e:
+                self.stats["missing"] += 1
+                logger.warning(
+                    f"체크포인트를 불러올 수 없어 다시 실행: {run_log_id} {checkpoint['stage']} "
+                    f"(저장 호스트 {checkpoint.get('host')}), {e}"
+                )
+                continue
+            restored[checkpoint["stage"]] = {"value": value, "checkpoint": checkpoint}
+
+        self.stats["restored"] += len(restored)
+        return restored
+
+    @staticmethod
+    def _read_text(path: str) -> str:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    # ============ 정리 ============
+
+    async def discard(self, checkpoints: Dict[str, Dict[str, Any]]):
+        """
+        더 이상 필요 없는 결과물 삭제 (성공한 실행)
+
+        Args:
+            checkpoints: 단계 이름 → 체크포인트 메타데이터 (이전 실행에서 이어받은 결과물 포함)
+        """
+        if not checkpoints:
+            return
+        paths = [checkpoint["artifact_path"] for checkpoint in checkpoints.values()]
+        removed = await asyncio.to_thread(self._remove_files, paths)
+        self.stats["discarded"] += removed
+
+    @staticmethod
+    def _remove_files(paths) -> int:
+        removed = 0
+        directories = set()
+        for path in paths:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"체크포인트 결과물 삭제 실패: {path}, {e}")
+            directories.add(os.path.dirname(path))
+        for directory in directories:
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass  # 다른 결과물이 남아 있음
+        return removed
+
+    async def _maybe_prune(self):
+        if self.retention_hours <= 0:
+            return
+        now = time.monotonic()
+        if self._pruned_at is not None and now - self._pruned_at < _PRUNE_INTERVAL_SECONDS:
+            return
+        self._pruned_at = now
+        await self.prune()
+
+    async def prune(self) -> int:
+        """보관 기간이 지난 실행의 결과물 삭제 (삭제한 실행 수 반환)"""
+        pruned = await asyncio.to_thread(self._prune, time.time() - self.retention_hours * 3600)
+        if pruned:
+            self.stats["pruned_runs"] += pruned
+            logger.info(f"보관 기간이 지난 체크포인트 결과물 삭제: 실행 {pruned}개")
+        return pruned
+
+    def _prune(self, cutoff: float) -> int:
+        pruned = 0
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            try:
+                if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                    shutil.rmtree(entry.path)
+                    pruned += 1
+            except OSError as e:
+                logger.warning(f"체크포인트 결과물 정리 실패: {entry.path}, {e}")
+        return pruned
+
+    def get_stats(self) -> dict:
+        """저장소 설정과 통계"""
+        return {
+            "enabled": self.enabled,
+            "root": self.root,
+            "retention_hours": self.retention_hours,
+            **self.stats,
+        }
+
+
+# 전역 체크포인트 저장소
+checkpoint_store = CheckpointStore(
+    root=settings.checkpoint_dir or os.path.join(tempfile.gettempdir(), "automation_hub_checkpoints"),
+    retention_hours=settings.checkpoint_retention_hours,
+    enabled=settings.checkpoint_enabled,
+)
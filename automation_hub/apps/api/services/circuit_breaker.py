@@ -0,0 +1,159 @@
+"""
+플랫폼별 서킷 브레이커
+
+유튜브/네이버 등 플랫폼 장애 시 채널마다 재시도를 모두 소진하며 실패하지 않도록,
+플랫폼(channel["type"])별로 연속 실패를 세어 실행을 차단합니다.
+
+- closed: 정상 실행. 외부 호출 단계 실패(StageFailed)가 failure_threshold번 연속되면 open
+- open: 실행하지 않고 바로 건너뜀. recovery_timeout이 지나면 half_open
+- half_open: 시험 실행 1개만 허용. 성공하면 closed, 실패하면 다시 open
+- 설정 오류 등 플랫폼과 무관한 실패, 취소된 실행은 집계하지 않음
+
+상태는 워커 프로세스별이며, 각 워커가 heartbeat마다 보고한 상태를
+/health에서 플랫폼별로 합쳐 확인할 수 있습니다 (services/worker_stats.py).
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from core.config import settings
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class CircuitBreaker:
+    """플랫폼별 서킷 브레이커"""
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        """
+        Args:
+            failure_threshold: 차단까지 연속 실패 횟수 (0 이하이면 차단하지 않음)
+            recovery_timeout: 차단 후 시험 실행을 허용하기까지 대기 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        # 플랫폼 → {state, failures, opened_at(monotonic), probing, trips, rejected, last_error, ...}
+        self._circuits: Dict[str, dict] = {}
+
+    def _circuit(self, key: str) -> dict:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = {
+                "state": "closed",
+                "failures": 0,
+                "opened_at": None,
+                "opened_at_iso": None,
+                "probing": False,
+                "trips": 0,
+                "rejected": 0,
+                "last_error": None,
+            }
+        return circuit
+
+    def acquire(self, key: str) -> Optional[dict]:
+        """
+        실행 허용 여부 확인
+
+        Returns:
+            허용되면 실행 표 ({"key", "probe"}), 차단되면 None.
+            실행이 끝나면 결과와 함께 record()에 넘겨야 함
+        """
+        if self.failure_threshold <= 0:
+            return {"key": key, "probe": False}
+
+        circuit = self._circuit(key)
+        if circuit["state"] == "open":
+            if time.monotonic() - circuit["opened_at"] < self.recovery_timeout:
+                circuit["rejected"] += 1
+                return None
+            circuit["state"] = "half_open"
+            logger.info(f"서킷 시험 실행 허용: {key}")
+
+        if circuit["state"] == "half_open":
+            if circuit["probing"]:
+                circuit["rejected"] += 1
+                return None
+            circuit["probing"] = True
+            return {"key": key, "probe": True}
+
+        return {"key": key, "probe": False}
+
+    def record(self, ticket: dict, success: Optional[bool], error: str = None):
+        """
+        실행 결과 반영
+
+        Args:
+            ticket: acquire()가 반환한 실행 표
+            success: True (성공) | False (플랫폼 실패) | None (집계하지 않음: 취소, 설정 오류 등)
+            error: 실패 메시지
+        """
+        if self.failure_threshold <= 0:
+            return
+
+        key = ticket["key"]
+        circuit = self._circuit(key)
+        if ticket["probe"]:
+            circuit["probing"] = False
+
+        if success is None:
+            # 시험 실행이 결과 없이 끝나면 다음 실행을 다시 시험 실행으로 허용
+            return
+
+        if success:
+            if circuit["state"] != "closed":
+                logger.info(f"서킷 복구: {key}")
+            circuit.update(state="closed", failures=0, opened_at=None, opened_at_iso=None)
+            return
+
+        circuit["failures"] += 1
+        circuit["last_error"] = error
+        if ticket["probe"] or (
+            circuit["state"] == "closed" and circuit["failures"] >= self.failure_threshold
+        ):
+            self._open(key, circuit)
+
+    def _open(self, key: str, circuit: dict):
+        circuit.update(
+            state="open",
+            opened_at=time.monotonic(),
+            opened_at_iso=datetime.utcnow().isoformat(),
+        )
+        circuit["trips"] += 1
+        logger.warning(
+            f"서킷 차단: {key} (연속 실패 {circuit['failures']}회, "
+            f"{self.recovery_timeout:.0f}초 후 시험 실행), 마지막 오류: {circuit['last_error']}"
+        )
+
+    def reset(self, key: str = None):
+        """서킷 초기화 (key가 없으면 전체)"""
+        if key is None:
+            self._circuits.clear()
+        else:
+            self._circuits.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """플랫폼별 서킷 상태"""
+        return {
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout": self.recovery_timeout,
+            "circuits": {
+                key: {
+                    "state": circuit["state"],
+                    "failures": circuit["failures"],
+                    "opened_at": circuit["opened_at_iso"],
+                    "trips": circuit["trips"],
+                    "rejected": circuit["rejected"],
+                    "last_error": circuit["last_error"],
+                }
+                for key, circuit in self._circuits.items()
+            },
+        }
+
+
+# 전역 서킷 브레이커
+circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.circuit_failure_threshold,
+    recovery_timeout=settings.circuit_recovery_timeout,
+)
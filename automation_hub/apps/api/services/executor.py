@@ -4,29 +4,40 @@
 """
 
 import asyncio
-from datetime import datetime
-from typing import Dict, Set
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
 
+from core.config import settings
 from core.logger import setup_logger
 from core.database import (
     get_all_channels,
     get_channel_by_id,
     get_group_by_id,
-    create_run_log,
-    update_run_log,
-    update_channel,
+    get_run_log_by_id,
 )
-from workers.base import BaseWorker
+from services.channel_lock import channel_lock
+from services.checkpoint_store import checkpoint_store
+from services.circuit_breaker import circuit_breaker
+from services.run_limiter import run_limiter
+from services.write_buffer import write_buffer
+from workers.base import BaseWorker, RunCancelled, StageFailed
 from workers.youtube_shorts.worker import YouTubeShortsWorker
 from workers.naver_blog.worker import NaverBlogWorker
 from workers.nextjs_blog.worker import NextJSBlogWorker
 
 logger = setup_logger(__name__)
 
-# 실행 중인 작업 추적
-running_tasks: Dict[str, asyncio.Task] = {}
+# 실행 중인 채널 실행 (실행 로그 ID → 실행 정보, 이 프로세스 기준)
+running_runs: Dict[str, dict] = {}
+# 실행 중인 그룹 실행 (그룹 ID → 실행 정보)
+running_groups: Dict[str, dict] = {}
+# 남은 채널을 시작하지 않을 그룹 ID
 stop_requested: Set[str] = set()
 
+# 이어서 실행할 수 있는 실행 로그 상태
+RESUMABLE_STATUSES = ("failed", "cancelled")
+
 
 def get_worker_for_channel(channel: dict) -> BaseWorker:
     """채널 유형에 맞는 워커 반환"""
@@ -46,91 +57,266 @@ def get_worker_for_channel(channel: dict) -> BaseWorker:
 async def execute_channel(channel_id: str) -> dict:
     """
     개별 채널 작업 실행
+
+    채널 실행 잠금(중복 실행 방지)과 실행 슬롯(전역/그룹/플랫폼 상한)을 얻은 뒤 실행합니다.
+    같은 채널이 이미 실행 중이면 CHANNEL_RUN_POLICY에 따라 건너뛰거나 기다리고,
+    플랫폼 서킷이 열려 있으면 건너뜁니다.
     """
     channel = await get_channel_by_id(channel_id)
     if not channel:
         logger.error(f"채널을 찾을 수 없음: {channel_id}")
         return {"success": False, "error": "채널을 찾을 수 없습니다"}
 
-    # 실행 로그 생성
+    return await _run_guarded(channel, channel.get("group_id"))
+
+
+async def execute_resume(log_id: str) -> dict:
+    """
+    실패/취소된 실행 이어하기
+
+    원래 실행에서 끝난 단계의 체크포인트를 불러와 첫 번째 미완료 단계부터 실행합니다.
+    이어하기 실행은 새 실행 로그(resumed_from = 원래 실행 로그 ID)로 기록되며,
+    잠금/실행 슬롯/서킷은 일반 채널 실행과 같게 적용됩니다.
+    """
+    # 원래 실행의 로그/체크포인트가 이 프로세스의 쓰기 버퍼에 남아 있을 수 있음
+    await write_buffer.flush()
+
+    log = await get_run_log_by_id(log_id)
+    if not log:
+        logger.error(f"실행 로그를 찾을 수 없음: {log_id}")
+        return {"success": False, "error": "실행 로그를 찾을 수 없습니다"}
+    if log["status"] not in RESUMABLE_STATUSES:
+        return {"success": False, "error": f"이어서 실행할 수 없는 실행입니다 (상태: {log['status']})"}
+
+    channel = await get_channel_by_id(log["channel_id"])
+    if not channel:
+        logger.error(f"채널을 찾을 수 없음: {log['channel_id']}")
+        return {"success": False, "error": "채널을 찾을 수 없습니다"}
+
+    return await _run_guarded(channel, channel.get("group_id"), resume_from=log_id)
+
+
+async def _run_guarded(
+    channel: dict,
+    group_id: Optional[str],
+    stop_group: bool = False,
+    resume_from: Optional[str] = None,
+) -> Optional[dict]:
+    """
+    채널 실행 잠금 → 실행 슬롯 → 플랫폼 서킷 순으로 확인한 뒤 실행
+
+    잠금을 먼저 잡아 앞 실행을 기다리는 동안 실행 슬롯을 차지하지 않도록 하고,
+    서킷은 슬롯을 얻은 직후 확인해 슬롯을 기다리는 동안 열린 서킷도 반영합니다.
+
+    Args:
+        group_id: 그룹 슬롯 키
+        stop_group: True면 슬롯을 얻은 뒤 그룹 중지 요청을 확인 (요청되었으면 None 반환)
+        resume_from: 이어하기 실행이면 원래 실행 로그 ID
+    """
+    async with channel_lock.hold(channel["id"]) as acquired:
+        if not acquired:
+            return await _skip_run(channel, "같은 채널이 이미 실행 중이어서 건너뜀")
+
+        async with run_limiter.slot(channel["type"], group_id):
+            # 중지 요청 확인 (잠금/슬롯 대기 중 요청된 경우 시작하지 않음)
+            if stop_group and group_id in stop_requested:
+                return None
+
+            ticket = circuit_breaker.acquire(channel["type"])
+            if ticket is None:
+                return await _skip_run(channel, f"플랫폼 장애로 차단됨 (서킷 열림: {channel['type']})")
+
+            outcome = None
+            result = None
+            try:
+                result = await _run_channel(channel, resume_from)
+                if result["success"]:
+                    outcome = True
+                elif result.get("platform_error"):
+                    outcome = False
+                return result
+            finally:
+                circuit_breaker.record(ticket, outcome, result.get("error") if result else None)
+
+
+async def _run_channel(channel: dict, resume_from: Optional[str] = None) -> dict:
+    """
+    채널 작업 실행 (실행 슬롯은 호출자가 확보)
+
+    실행 중에는 running_runs에 등록되어 cancel_run/cancel_group/cancel_all로 취소할 수 있습니다.
+    실행 로그와 채널 상태는 쓰기 버퍼를 통해 일괄 반영됩니다.
+    워커 단계 결과는 실행 로그 ID별로 체크포인트에 저장되며, 성공하면 삭제됩니다.
+
+    Args:
+        resume_from: 이어하기 실행이면 원래 실행 로그 ID (그 실행의 체크포인트를 불러옴)
+    """
+    channel_id = channel["id"]
+
+    # 실행 로그 생성 (ID는 미리 생성하여 버퍼 반영 전에도 사용)
+    log_id = str(uuid.uuid4())
     log_data = {
+        "id": log_id,
         "channel_id": channel_id,
         "group_id": channel.get("group_id"),
         "status": "running",
         "started_at": datetime.utcnow().isoformat(),
         "result": {},
     }
-    run_log = await create_run_log(log_data)
-    log_id = run_log["id"]
+    if resume_from:
+        log_data["resumed_from"] = resume_from
+    await write_buffer.add_run_log(log_data)
+
+    # 일별 롤업 키 (실행 시작일 기준)
+    stats_key = {
+        "run_date": log_data["started_at"][:10],
+        "channel_id": channel_id,
+        "group_id": channel.get("group_id"),
+    }
+    await write_buffer.add_run_stats(**stats_key, status="running", run_count=1)
+
+    run = {
+        "log_id": log_id,
+        "channel_id": channel_id,
+        "channel_name": channel["name"],
+        "group_id": channel.get("group_id"),
+        "started_at": log_data["started_at"],
+        "task": asyncio.current_task(),
+        "worker": None,
+        "cancel_requested": False,
+    }
+    running_runs[log_id] = run
 
     try:
         logger.info(f"채널 실행 시작: {channel['name']} ({channel_id})")
 
         # 워커 생성 및 실행
         worker = get_worker_for_channel(channel)
+        run["worker"] = worker
+        if isinstance(worker, BaseWorker):
+            worker.run_log_id = log_id
+            if resume_from:
+                worker.restored_stages = await checkpoint_store.load(resume_from)
+                logger.info(
+                    f"채널 실행 이어하기: {channel['name']} ({resume_from} → {log_id}, "
+                    f"불러온 단계 {len(worker.restored_stages)}개)"
+                )
+        if run["cancel_requested"]:
+            worker.stop()
         result = await worker.run()
 
-        # 성공 처리
-        finished_at = datetime.utcnow()
-        started_at = datetime.fromisoformat(log_data["started_at"])
-        duration = int((finished_at - started_at).total_seconds())
-
-        await update_run_log(
-            log_id,
-            {
-                "status": "success",
-                "finished_at": finished_at.isoformat(),
-                "duration_seconds": duration,
-                "result": result,
-            },
-        )
-
-        # 채널 상태 업데이트
-        await update_channel(
-            channel_id,
-            {
-                "last_run_at": finished_at.isoformat(),
-                "last_run_status": "success",
-            },
+        # 성공 처리 (단계 실행 결과가 있으면 실행 로그 result.stages에 함께 기록)
+        log_result = result
+        stage_report = getattr(worker, "stage_report", None)
+        if stage_report and isinstance(result, dict):
+            log_result = {**result, "stages": stage_report}
+        duration = await _finish_run(
+            log_data, stats_key, "success", {"result": log_result}, {"last_run_status": "success"}
         )
-
+        # 성공한 실행은 이어할 일이 없으므로 결과물 삭제 (이전 실행에서 이어받은 결과물 포함)
+        if isinstance(worker, BaseWorker):
+            await checkpoint_store.discard(worker.checkpoints)
         logger.info(f"채널 실행 완료: {channel['name']} (소요시간: {duration}초)")
         return {"success": True, "result": result}
 
+    except (RunCancelled, asyncio.CancelledError) as e:
+        # 취소 처리 (단계 경계에서 중단되었거나 유예 시간 후 강제 취소)
+        logger.info(f"채널 실행 취소됨: {channel['name']}")
+        external = isinstance(e, asyncio.CancelledError) and not run["cancel_requested"]
+        if isinstance(e, asyncio.CancelledError) and not external:
+            asyncio.current_task().uncancel()
+        await _finish_run(log_data, stats_key, "cancelled", {"error_message": "실행 취소됨"})
+        if external:
+            # 종료 등 외부에서 취소된 경우 호출자에게 전달
+            raise
+        return {"success": False, "cancelled": True, "error": "실행 취소됨"}
+
     except Exception as e:
         # 실패 처리
         error_message = str(e)
         logger.error(f"채널 실행 실패: {channel['name']}, 오류: {error_message}")
 
-        finished_at = datetime.utcnow()
-        started_at = datetime.fromisoformat(log_data["started_at"])
-        duration = int((finished_at - started_at).total_seconds())
-
-        await update_run_log(
-            log_id,
-            {
-                "status": "failed",
-                "finished_at": finished_at.isoformat(),
-                "duration_seconds": duration,
-                "error_message": error_message,
-            },
-        )
+        # 외부 호출 단계 실패(플랫폼 장애 등)는 채널을 error로 바꾸지 않음 (서킷 브레이커가 처리)
+        platform_error = isinstance(e, StageFailed)
+        channel_update = {"last_run_status": "failed"}
+        if not platform_error:
+            channel_update["status"] = "error"
 
-        await update_channel(
-            channel_id,
-            {
-                "last_run_at": finished_at.isoformat(),
-                "last_run_status": "failed",
-                "status": "error",
-            },
+        await _finish_run(
+            log_data, stats_key, "failed", {"error_message": error_message}, channel_update
         )
+        return {"success": False, "platform_error": platform_error, "error": error_message}
+
+    finally:
+        running_runs.pop(log_id, None)
 
-        return {"success": False, "error": error_message}
+
+async def _skip_run(channel: dict, error_message: str) -> dict:
+    """실행하지 않고 건너뛴 실행 기록 (중복 실행, 플랫폼 서킷 열림)"""
+    logger.warning(f"채널 실행 건너뜀: {channel['name']} ({error_message})")
+
+    now = datetime.utcnow().isoformat()
+    await write_buffer.add_run_log({
+        "id": str(uuid.uuid4()),
+        "channel_id": channel["id"],
+        "group_id": channel.get("group_id"),
+        "status": "skipped",
+        "started_at": now,
+        "finished_at": now,
+        "duration_seconds": 0,
+        "error_message": error_message,
+        "result": {},
+    })
+    await write_buffer.add_run_stats(
+        run_date=now[:10],
+        channel_id=channel["id"],
+        group_id=channel.get("group_id"),
+        status="skipped",
+        run_count=1,
+    )
+    return {"success": False, "skipped": True, "error": error_message}
+
+
+async def _finish_run(
+    log_data: dict,
+    stats_key: dict,
+    status: str,
+    log_fields: dict,
+    channel_update: Optional[dict] = None,
+) -> int:
+    """실행 종료 기록 (실행 로그, 롤업, 채널 상태), 소요 시간(초) 반환"""
+    finished_at = datetime.utcnow()
+    started_at = datetime.fromisoformat(log_data["started_at"])
+    duration = int((finished_at - started_at).total_seconds())
+
+    await write_buffer.add_run_log(
+        {
+            **log_data,
+            "status": status,
+            "finished_at": finished_at.isoformat(),
+            "duration_seconds": duration,
+            **log_fields,
+        },
+    )
+
+    await write_buffer.add_run_stats(**stats_key, status="running", run_count=-1)
+    await write_buffer.add_run_stats(
+        **stats_key, status=status, run_count=1, duration_seconds=duration
+    )
+
+    # 채널 상태 업데이트 (취소는 마지막 실행 상태를 바꾸지 않음)
+    if channel_update:
+        await write_buffer.add_channel_update(
+            log_data["channel_id"],
+            {"last_run_at": finished_at.isoformat(), **channel_update},
+        )
+    return duration
 
 
 async def execute_group(group_id: str) -> dict:
     """
-    그룹 내 모든 채널 실행
+    그룹 내 모든 활성 채널 동시 실행
+
+    동시 실행 수와 시작 간격은 run_limiter 설정(전역/그룹/플랫폼 상한)을 따릅니다.
     """
     group = await get_group_by_id(group_id)
     if not group:
@@ -146,46 +332,154 @@ async def execute_group(group_id: str) -> dict:
 
     logger.info(f"그룹 실행 시작: {group['name']} ({len(active_channels)}개 채널)")
 
-    results = []
-    for channel in active_channels:
-        # 중지 요청 확인
-        if group_id in stop_requested:
-            logger.info(f"그룹 실행 중지됨: {group['name']}")
-            stop_requested.discard(group_id)
-            break
-
-        result = await execute_channel(channel["id"])
-        results.append({
+    entry = running_groups.setdefault(group_id, {
+        "group_id": group_id,
+        "group_name": group["name"],
+        "started_at": datetime.utcnow().isoformat(),
+        "executions": 0,
+    })
+    entry["executions"] += 1
+
+    async def run_one(channel: dict) -> Optional[dict]:
+        result = await _run_guarded(channel, group_id, stop_group=True)
+        if result is None:
+            return None
+        return {
             "channel_id": channel["id"],
             "channel_name": channel["name"],
             **result,
-        })
+        }
 
-        # 채널 간 간격 (과부하 방지)
-        await asyncio.sleep(2)
+    # 동시 실행 (상한은 run_limiter), 결과는 끝난 순서대로 수집
+    results = []
+    tasks = [asyncio.create_task(run_one(channel)) for channel in active_channels]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            if result is not None:
+                results.append(result)
+    finally:
+        for task in tasks:
+            task.cancel()
+        entry["executions"] -= 1
+        if entry["executions"] <= 0:
+            running_groups.pop(group_id, None)
+
+    stopped = group_id in stop_requested
+    if stopped:
+        logger.info(f"그룹 실행 중지됨: {group['name']}")
+        if group_id not in running_groups:
+            stop_requested.discard(group_id)
 
     success_count = len([r for r in results if r.get("success")])
+    skipped_count = len([r for r in results if r.get("skipped")])
     logger.info(
         f"그룹 실행 완료: {group['name']} "
-        f"(성공: {success_count}/{len(results)})"
+        f"(성공: {success_count}/{len(results)}, 건너뜀: {skipped_count})"
     )
 
     return {
         "success": True,
         "executed": len(results),
         "success_count": success_count,
+        "skipped_count": skipped_count,
+        "cancelled": stopped,
         "results": results,
     }
 
 
-async def stop_all_tasks() -> int:
-    """실행 중인 모든 작업 중지 요청"""
-    count = 0
+# ============ 실행 취소 ============
 
-    # 실행 중인 그룹에 중지 요청
-    for task_id in list(running_tasks.keys()):
-        stop_requested.add(task_id)
-        count += 1
 
+def _started_before(started_at: str, requested_at: Optional[datetime]) -> bool:
+    """취소 요청 시각 이전에 시작한 실행인지 (요청 시각이 없으면 항상 True)"""
+    if requested_at is None:
+        return True
+    started = datetime.fromisoformat(started_at).replace(tzinfo=timezone.utc)
+    return started <= requested_at
+
+
+def _cancel(run: dict) -> bool:
+    """
+    채널 실행 취소
+
+    워커에 중지를 요청해 다음 단계 경계에서 멈추게 하고,
+    유예 시간(run_cancel_grace_seconds) 안에 끝나지 않으면 실행 태스크를 강제 취소합니다.
+    """
+    if run["cancel_requested"]:
+        return False
+    run["cancel_requested"] = True
+    if run["worker"] is not None:
+        run["worker"].stop()
+
+    def force_cancel():
+        if running_runs.get(run["log_id"]) is run and not run["task"].done():
+            logger.warning(f"채널 실행 강제 취소: {run['channel_name']} ({run['log_id']})")
+            run["task"].cancel()
+
+    asyncio.get_running_loop().call_later(settings.run_cancel_grace_seconds, force_cancel)
+    logger.info(f"채널 실행 취소 요청: {run['channel_name']} ({run['log_id']})")
+    return True
+
+
+def cancel_run(log_id: str, requested_at: Optional[datetime] = None) -> bool:
+    """실행 로그 ID로 이 프로세스에서 실행 중인 채널 실행 취소"""
+    run = running_runs.get(log_id)
+    if run is None or not _started_before(run["started_at"], requested_at):
+        return False
+    return _cancel(run)
+
+
+def cancel_group(group_id: str, requested_at: Optional[datetime] = None) -> int:
+    """그룹의 남은 채널 실행을 막고 실행 중인 채널 실행 취소 (취소한 실행 수 반환)"""
+    entry = running_groups.get(group_id)
+    if entry is not None and _started_before(entry["started_at"], requested_at):
+        stop_requested.add(group_id)
+    return sum(
+        _cancel(run)
+        for run in list(running_runs.values())
+        if run["group_id"] == group_id and _started_before(run["started_at"], requested_at)
+    )
+
+
+def cancel_all(requested_at: Optional[datetime] = None) -> int:
+    """이 프로세스에서 실행 중인 모든 그룹/채널 실행 취소 (취소한 실행 수 반환)"""
+    for group_id, entry in list(running_groups.items()):
+        if _started_before(entry["started_at"], requested_at):
+            stop_requested.add(group_id)
+    return sum(
+        _cancel(run)
+        for run in list(running_runs.values())
+        if _started_before(run["started_at"], requested_at)
+    )
+
+
+def apply_cancel_request(request: dict) -> int:
+    """run_cancel_requests 행을 이 프로세스에 적용 (취소한 실행 수 반환)"""
+    requested_at = datetime.fromisoformat(str(request["requested_at"]).replace("Z", "+00:00"))
+    if requested_at.tzinfo is None:
+        requested_at = requested_at.replace(tzinfo=timezone.utc)
+
+    if request["scope"] == "run":
+        return int(cancel_run(request["target_id"], requested_at))
+    if request["scope"] == "group":
+        return cancel_group(request["target_id"], requested_at)
+    return cancel_all(requested_at)
+
+
+def get_running_runs() -> List[dict]:
+    """이 프로세스에서 실행 중인 채널 실행 목록 (시작 순)"""
+    return sorted(
+        (
+            {key: value for key, value in run.items() if key not in ("task", "worker")}
+            for run in running_runs.values()
+        ),
+        key=lambda run: run["started_at"],
+    )
+
+
+async def stop_all_tasks() -> int:
+    """이 프로세스에서 실행 중인 모든 작업 중지 요청"""
+    count = cancel_all()
     logger.info(f"전체 작업 중지 요청: {count}개")
     return count
@@ -0,0 +1,361 @@
+"""
+실행 작업 큐
+
+API(수동 실행)와 스케줄러는 enqueue_*로 job_queue 테이블에 작업을 넣기만 하고,
+실제 실행은 JobWorker가 합니다. 워커는 별도 프로세스(commands/job_worker.py)로
+여러 개를 여러 호스트에 띄울 수 있으며, 작업은 claim_jobs(FOR UPDATE SKIP LOCKED)로
+워커 간 겹치지 않게 나눠 가집니다.
+
+- 재시작 내구성: 대기 작업은 DB에 남고, 실행 중 죽은 워커의 작업은
+  heartbeat가 끊기면(job_stale_timeout) 다시 대기열로 돌아감 (max_attempts까지)
+- 실행 중 예외: job_retry_delay × 시도 횟수만큼 뒤로 미뤄 재시도
+- 채널 실행 실패(워커 오류)는 run_logs에 기록되고 작업은 failed로 끝남 (재시도 없음)
+- 정상 종료(stop): 새 작업을 가져가지 않고 실행 중인 작업이 끝날 때까지 대기
+- 같은 채널이 이미 실행 중이라 건너뛴 채널 작업은 skipped로 끝남
+- 이어하기(resume) 작업: 실패/취소된 실행을 체크포인트부터 다시 실행 (target_id = 실행 로그 ID)
+- 실행 취소: request_cancel이 run_cancel_requests에 기록하고,
+  각 워커가 job_cancel_poll_interval마다 읽어 자기 프로세스의 실행에 적용
+- 상태 보고: heartbeat마다 워커/서킷 브레이커/CPU 풀/속도 제한/결과물 캐시 상태를
+  worker_stats에 기록 (/health에서 합산)
+"""
+
+import asyncio
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from core.config import settings
+from core.database import (
+    cancel_queued_jobs,
+    claim_jobs,
+    create_cancel_request,
+    enqueue_job,
+    get_cancel_requests,
+    heartbeat_jobs,
+    requeue_stale_jobs,
+    update_job,
+)
+from core.logger import setup_logger
+from services.worker_stats import publish_worker_stats
+
+logger = setup_logger(__name__)
+
+
+# ============ 작업 추가 ============
+
+
+async def enqueue_channel(
+    channel_id: str, source: str = "manual", schedule_id: str = None, run_after: datetime = None
+) -> Optional[Dict]:
+    """채널 실행 작업 추가 (run_after: 이 시각 이후에 실행, 없으면 바로)"""
+    return await _enqueue("channel", channel_id, source, schedule_id, run_after)
+
+
+async def enqueue_group(
+    group_id: str, source: str = "manual", schedule_id: str = None, run_after: datetime = None
+) -> Optional[Dict]:
+    """그룹 실행 작업 추가 (run_after: 이 시각 이후에 실행, 없으면 바로)"""
+    return await _enqueue("group", group_id, source, schedule_id, run_after)
+
+
+async def enqueue_resume(log_id: str, source: str = "manual") -> Optional[Dict]:
+    """실패/취소된 실행 이어하기 작업 추가"""
+    return await _enqueue("resume", log_id, source, None)
+
+
+async def _enqueue(
+    job_type: str,
+    target_id: str,
+    source: str,
+    schedule_id: Optional[str],
+    run_after: Optional[datetime] = None,
+) -> Optional[Dict]:
+    job_data = {
+        "job_type": job_type,
+        "target_id": target_id,
+        "source": source,
+        "schedule_id": schedule_id,
+        "max_attempts": settings.job_max_attempts,
+    }
+    if run_after is not None:
+        job_data["run_after"] = run_after.isoformat()
+    job = await enqueue_job(job_data)
+    logger.info(f"작업 추가: {job_type} {target_id} ({source}), 작업 ID: {job['id'] if job else '?'}")
+    return job
+
+
+# ============ 실행 취소 ============
+
+
+async def request_cancel(scope: str, target_id: str = None) -> dict:
+    """
+    실행 취소 요청
+
+    모든 워커 프로세스가 읽을 수 있도록 취소 요청을 기록하고,
+    이 프로세스에서 실행 중인 해당 실행에도 바로 적용합니다.
+    그룹/전체 취소는 아직 시작하지 않은 대기 작업도 취소합니다.
+
+    Args:
+        scope: run (실행 로그 ID) | group (그룹 ID) | all
+        target_id: scope가 run/group일 때 대상 ID
+
+    Returns:
+        {"cancelled_runs": 이 프로세스에서 취소한 실행 수, "cancelled_jobs": 취소한 대기 작업 수}
+    """
+    from services.executor import apply_cancel_request
+
+    request = await create_cancel_request({
+        "scope": scope,
+        "target_id": target_id,
+        "requested_at": datetime.now(timezone.utc).isoformat(),
+    })
+
+    cancelled_jobs = 0
+    if scope == "group":
+        cancelled_jobs = await cancel_queued_jobs(target_id)
+    elif scope == "all":
+        cancelled_jobs = await cancel_queued_jobs()
+
+    cancelled_runs = apply_cancel_request(request)
+    logger.info(
+        f"실행 취소 요청: {scope} {target_id or ''} "
+        f"(실행 {cancelled_runs}개, 대기 작업 {cancelled_jobs}개)"
+    )
+    return {"cancelled_runs": cancelled_runs, "cancelled_jobs": cancelled_jobs}
+
+
+# ============ 워커 ============
+
+
+def default_worker_id() -> str:
+    """호스트명:PID 형식 워커 ID"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobWorker:
+    """job_queue 작업을 가져가 실행하는 워커"""
+
+    def __init__(
+        self,
+        worker_id: str,
+        concurrency: int,
+        poll_interval: float,
+        heartbeat_interval: float,
+        stale_timeout: int,
+        retry_delay: float,
+        cancel_poll_interval: float = 2.0,
+    ):
+        """
+        Args:
+            worker_id: 워커 ID (locked_by에 기록)
+            concurrency: 동시에 실행할 작업 수
+            poll_interval: 대기 작업이 없을 때 다시 확인하는 간격 (초)
+            heartbeat_interval: heartbeat / 중단 작업 확인 간격 (초)
+            stale_timeout: heartbeat가 이 시간(초) 이상 끊긴 작업을 중단된 것으로 간주
+            retry_delay: 실행 중 예외 시 재시도 대기 (초, 시도 횟수만큼 곱함)
+            cancel_poll_interval: 취소 요청 확인 간격 (초)
+        """
+        self.worker_id = worker_id
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_timeout = stale_timeout
+        self.retry_delay = retry_delay
+        self.cancel_poll_interval = cancel_poll_interval
+
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+        self.stats = {
+            "claimed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retried": 0,
+            "requeued_stale": 0,
+            "cancelled": 0,
+            "skipped": 0,
+        }
+
+    @property
+    def running_count(self) -> int:
+        """실행 중인 작업 수"""
+        return len(self._tasks)
+
+    def stop(self):
+        """새 작업 가져오기 중지 (실행 중인 작업은 끝까지 실행)"""
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self):
+        """stop()이 호출될 때까지 작업을 가져와 실행"""
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        background = [
+            asyncio.create_task(self._heartbeat_loop()),
+            asyncio.create_task(self._cancel_loop()),
+        ]
+        logger.info(f"작업 워커 시작: {self.worker_id} (동시 실행 {self.concurrency})")
+
+        try:
+            while not self._stopping:
+                claimed = await self.run_once()
+                # 빈 슬롯이 남았는데 가져온 작업이 없으면 poll_interval 대기
+                if claimed == 0 or self.running_count >= self.concurrency:
+                    await self._wait()
+
+            if self._tasks:
+                logger.info(f"작업 워커 종료 대기: 실행 중 {self.running_count}개")
+                await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        finally:
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            logger.info(f"작업 워커 종료: {self.worker_id}")
+
+    async def run_once(self) -> int:
+        """빈 슬롯만큼 작업을 가져와 실행 시작 (가져온 작업 수 반환)"""
+        free = self.concurrency - self.running_count
+        if free <= 0:
+            return 0
+
+        try:
+            jobs = await claim_jobs(self.worker_id, free)
+        except Exception as e:
+            logger.error(f"작업 가져오기 실패: {e}")
+            return 0
+
+        for job in jobs:
+            self.stats["claimed"] += 1
+            task = asyncio.create_task(self._execute(job))
+            self._tasks[job["id"]] = task
+            task.add_done_callback(lambda _, job_id=job["id"]: self._on_done(job_id))
+        return len(jobs)
+
+    async def _wait(self):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def _on_done(self, job_id: str):
+        self._tasks.pop(job_id, None)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _execute(self, job: dict):
+        """작업 1개 실행 후 결과 기록"""
+        from services.executor import execute_channel, execute_group, execute_resume
+
+        logger.info(f"작업 실행: {job['job_type']} {job['target_id']} (시도 {job['attempts']}회)")
+        try:
+            if job["job_type"] == "group":
+                result = await execute_group(job["target_id"])
+            elif job["job_type"] == "resume":
+                result = await execute_resume(job["target_id"])
+            else:
+                result = await execute_channel(job["target_id"])
+        except Exception as e:
+            await self._fail(job, str(e))
+            return
+
+        if result.get("cancelled"):
+            status = "cancelled"
+        elif result.get("skipped"):
+            # 같은 채널이 이미 실행 중 (channel_lock)
+            status = "skipped"
+        else:
+            status = "succeeded" if result.get("success") else "failed"
+        self.stats[status] += 1
+        await self._finish(job["id"], {
+            "status": status,
+            "result": result,
+            "error_message": None if status == "succeeded" else result.get("error"),
+        })
+
+    async def _fail(self, job: dict, error_message: str):
+        """실행 중 예외: 시도 횟수가 남았으면 재시도 대기, 아니면 실패"""
+        if job["attempts"] < job["max_attempts"]:
+            self.stats["retried"] += 1
+            run_after = datetime.now(timezone.utc) + timedelta(seconds=self.retry_delay * job["attempts"])
+            logger.warning(f"작업 재시도 예정: {job['id']} ({error_message}), {run_after.isoformat()}")
+            await self._finish(job["id"], {
+                "status": "queued",
+                "run_after": run_after.isoformat(),
+                "error_message": error_message,
+                "locked_by": None,
+                "locked_at": None,
+            }, finished=False)
+        else:
+            self.stats["failed"] += 1
+            logger.error(f"작업 실패: {job['id']} ({error_message})")
+            await self._finish(job["id"], {"status": "failed", "error_message": error_message})
+
+    async def _finish(self, job_id: str, data: dict, finished: bool = True):
+        if finished:
+            data = {**data, "finished_at": datetime.now(timezone.utc).isoformat()}
+        try:
+            await update_job(job_id, data)
+        except Exception as e:
+            # 기록 실패 시 작업은 running으로 남고 heartbeat가 끊긴 뒤 재대기됨
+            logger.error(f"작업 상태 기록 실패: {job_id}, 오류: {e}")
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                if self._tasks:
+                    await heartbeat_jobs(self.worker_id)
+                requeued = await requeue_stale_jobs(self.stale_timeout)
+                if requeued:
+                    self.stats["requeued_stale"] += requeued
+                    logger.warning(f"중단된 작업 {requeued}개 재대기/실패 처리")
+            except Exception as e:
+                logger.error(f"작업 heartbeat 오류: {e}")
+            try:
+                await publish_worker_stats(self)
+            except Exception as e:
+                logger.error(f"워커 상태 보고 오류: {e}")
+
+    async def _cancel_loop(self):
+        """취소 요청을 읽어 이 프로세스에서 실행 중인 실행에 적용"""
+        from services.executor import apply_cancel_request
+
+        since = datetime.now(timezone.utc)
+        while True:
+            await asyncio.sleep(self.cancel_poll_interval)
+            try:
+                if not self._tasks:
+                    # 실행 중인 작업이 없으면 이후 시작하는 실행은 취소 대상이 아님
+                    since = datetime.now(timezone.utc)
+                    continue
+                for request in await get_cancel_requests(since):
+                    apply_cancel_request(request)
+                    since = max(since, datetime.fromisoformat(request["requested_at"]))
+            except Exception as e:
+                logger.error(f"취소 요청 확인 오류: {e}")
+
+    def get_stats(self) -> dict:
+        """워커 상태"""
+        return {
+            "worker_id": self.worker_id,
+            "running": self.running_count,
+            "concurrency": self.concurrency,
+            **self.stats,
+        }
+
+
+def create_worker(worker_id: str = None, concurrency: int = None) -> JobWorker:
+    """설정값으로 워커 생성"""
+    return JobWorker(
+        worker_id=worker_id or default_worker_id(),
+        concurrency=concurrency or settings.job_worker_concurrency,
+        poll_interval=settings.job_poll_interval,
+        heartbeat_interval=settings.job_heartbeat_interval,
+        stale_timeout=settings.job_stale_timeout,
+        retry_delay=settings.job_retry_delay,
+        cancel_poll_interval=settings.job_cancel_poll_interval,
+    )
@@ -0,0 +1,171 @@
+"""
+스케줄 부하 예측
+
+등록된 모든 스케줄 Job의 트리거를 앞으로 N시간 동안 펼쳐서
+분 단위(스케줄러 시간대)로 예상 채널 실행 수와 동시 실행 수를 계산합니다.
+
+- 그룹 스케줄은 그룹의 활성 채널마다, 채널 스케줄은 그 채널 1회 실행
+- 실행 시간은 채널별 최근 lookback_days일 평균 소요 시간 (run_stats_daily 롤업)
+  기록이 없는 채널은 전체 평균 (기록이 전혀 없으면 _DEFAULT_DURATION_SECONDS)
+- 같은 cron은 한 번만 펼치고 스케줄별 분산 오프셋만 더하므로 스케줄이 수천 개여도
+  서로 다른 cron 수만큼만 계산
+- 동시 실행 수는 실행 상한(run_limiter)을 적용하기 전의 수요이므로
+  executor_max_concurrency를 넘는 분에는 대기가 생깁니다
+"""
+
+import asyncio
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from apscheduler.triggers.cron import CronTrigger
+
+from core.config import settings
+from core.database import get_all_channels, get_channel_durations
+from services.scheduler import iter_fire_times, scheduler
+
+# 실행 기록이 전혀 없을 때 가정하는 실행 시간 (초)
+_DEFAULT_DURATION_SECONDS = 60.0
+
+
+def _expand_cron(trigger: CronTrigger, start: datetime, end: datetime) -> List[datetime]:
+    """분산 오프셋을 빼고 cron 자체의 [start, end) 실행 시각"""
+    fire_times = []
+    fire_time = CronTrigger.get_next_fire_time(trigger, None, start)
+    while fire_time is not None and fire_time < end:
+        fire_times.append(fire_time)
+        fire_time = CronTrigger.get_next_fire_time(trigger, fire_time, fire_time)
+    return fire_times
+
+
+def _fire_times(job, start: datetime, end: datetime, max_offset: timedelta, cache: Dict[str, List[datetime]]):
+    """Job의 [start, end) 실행 시각 (같은 cron은 cache로 한 번만 펼침)"""
+    trigger = job.trigger
+    if not isinstance(trigger, CronTrigger):
+        return list(iter_fire_times(trigger, start, end))
+
+    offset = getattr(trigger, "offset", timedelta(0))
+    key = CronTrigger.__str__(trigger)
+    if key not in cache:
+        cache[key] = _expand_cron(trigger, start - max_offset, end)
+    return [fire_time + offset for fire_time in cache[key] if start <= fire_time + offset < end]
+
+
+async def forecast_schedule_load(hours: float = 24.0, lookback_days: int = 14) -> Dict[str, Any]:
+    """
+    앞으로 hours시간의 분 단위 예상 부하
+
+    Returns:
+        요약과 buckets (실행이 시작되거나 진행 중인 분만, 시간순)
+        [{"minute": "YYYY-MM-DD HH:MM", "runs": 시작 실행 수,
+          "run_seconds": 시작 실행의 예상 소요 시간 합계, "concurrent_runs": 예상 동시 실행 수}, ...]
+    """
+    now = datetime.now(timezone.utc)
+    window_start = now.replace(second=0, microsecond=0)
+    end = now + timedelta(hours=hours)
+    today = now.date()  # 롤업 날짜 기준 (UTC)
+
+    channels, durations = await asyncio.gather(
+        get_all_channels(),
+        get_channel_durations(today - timedelta(days=lookback_days), today),
+    )
+
+    # 대상 → 실행될 채널
+    active_channels = [channel for channel in channels if channel["status"] == "active"]
+    channels_by_group: Dict[str, List[str]] = defaultdict(list)
+    for channel in active_channels:
+        channels_by_group[channel.get("group_id")].append(channel["id"])
+    active_ids = {channel["id"] for channel in active_channels}
+
+    # 채널별 평균 소요 시간
+    mean_seconds = {
+        row["channel_id"]: row["total_duration_seconds"] / row["run_count"] for row in durations
+    }
+    total_runs = sum(row["run_count"] for row in durations)
+    default_seconds = (
+        sum(row["total_duration_seconds"] for row in durations) / total_runs
+        if total_runs else _DEFAULT_DURATION_SECONDS
+    )
+
+    jobs = [
+        job for job in scheduler.get_jobs()
+        if len(job.args) >= 3
+        # 시작 전에 추가된 Job은 next_run_time이 아직 없으므로 일시정지로 보지 않음
+        and not (scheduler.running and getattr(job, "next_run_time", None) is None)
+    ]
+    max_offset = max((getattr(job.trigger, "offset", timedelta(0)) for job in jobs), default=timedelta(0))
+
+    minutes = math.ceil((end - window_start).total_seconds() / 60)
+    runs = [0] * minutes
+    run_seconds = [0.0] * minutes
+    # 동시 실행 수: 실행이 시작되는 분에 +1, 끝나는 분에 -1 (창 밖으로 끝나는 실행 포함)
+    occupancy: Dict[int, int] = defaultdict(int)
+
+    cache: Dict[str, List[datetime]] = {}
+    without_history = set()
+    for job in jobs:
+        _, target_type, target_id = job.args[:3]
+        if target_type == "group":
+            targets = channels_by_group.get(target_id, [])
+        else:
+            targets = [target_id] if target_id in active_ids else []
+        if not targets:
+            continue
+
+        # Job마다 한 번만 계산: 시작 실행 수, 소요 시간 합계, 점유 분 수별 채널 수
+        job_seconds = 0.0
+        lengths: Dict[int, int] = defaultdict(int)
+        for channel_id in targets:
+            seconds = mean_seconds.get(channel_id)
+            if seconds is None:
+                without_history.add(channel_id)
+                seconds = default_seconds
+            job_seconds += seconds
+            lengths[max(1, math.ceil(seconds / 60))] += 1
+
+        for fire_time in _fire_times(job, now, end, max_offset, cache):
+            index = int((fire_time - window_start).total_seconds() // 60)
+            runs[index] += len(targets)
+            run_seconds[index] += job_seconds
+            for length, count in lengths.items():
+                occupancy[index] += count
+                occupancy[index + length] -= count
+
+    buckets = []
+    concurrent = 0
+    peak = None
+    limit = settings.executor_max_concurrency
+    over_limit_minutes = 0
+    for index in range(minutes):
+        concurrent += occupancy.get(index, 0)
+        if not runs[index] and not concurrent:
+            continue
+        minute = (window_start + timedelta(minutes=index)).astimezone(scheduler.timezone)
+        bucket = {
+            "minute": minute.strftime("%Y-%m-%d %H:%M"),
+            "runs": runs[index],
+            "run_seconds": round(run_seconds[index], 1),
+            "concurrent_runs": concurrent,
+        }
+        buckets.append(bucket)
+        if peak is None or concurrent > peak["concurrent_runs"]:
+            peak = {"minute": bucket["minute"], "concurrent_runs": concurrent}
+        if limit > 0 and concurrent > limit:
+            over_limit_minutes += 1
+
+    return {
+        "window_start": window_start.isoformat(),
+        "window_hours": hours,
+        "lookback_days": lookback_days,
+        "schedules": len(jobs),
+        "distinct_crons": len(cache),
+        "channels_without_history": len(without_history),
+        "default_duration_seconds": round(default_seconds, 1),
+        "concurrency_limit": limit,
+        "total_runs": sum(runs),
+        "total_run_seconds": round(sum(run_seconds), 1),
+        "peak": peak,
+        "over_limit_minutes": over_limit_minutes,
+        "buckets": buckets,
+    }
@@ -0,0 +1,142 @@
+"""
+CPU 작업용 프로세스 풀
+
+영상/이미지 합성처럼 CPU를 오래 쓰는 작업을 별도 프로세스에서 실행해
+API·스케줄러·작업 워커가 함께 쓰는 이벤트 루프가 멈추지 않도록 합니다.
+
+- 풀 크기: CPU_POOL_SIZE (처음 작업 제출 시 생성, spawn 방식)
+- 실행 대상: 모듈 최상위 함수 (인자/반환값이 pickle 가능해야 함)
+- 결과 전달: 큰 데이터(영상/이미지 바이트)는 파일로 쓰고 경로만 반환
+- 하위 프로세스가 죽으면(BrokenProcessPool) 다음 제출 때 풀을 다시 생성
+- 통계: 실행 중/대기 작업 수, 포화 횟수, 대기/실행 시간
+  (작업 워커가 heartbeat마다 보고, /health에서 워커 합계로 확인)
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from core.config import settings
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _resolve(module_name: str, qualname: str) -> Callable:
+    """모듈 경로와 qualname으로 함수 조회 (데코레이터로 감싼 경우 원본 함수)"""
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return getattr(target, "__wrapped__", target)
+
+
+def _invoke(module_name: str, qualname: str, args: tuple, kwargs: dict):
+    """하위 프로세스에서 실행: (결과, 시작 시각, 실행 시간) 반환"""
+    started_at = time.time()
+    result = _resolve(module_name, qualname)(*args, **kwargs)
+    return result, started_at, time.time() - started_at
+
+
+class ProcessPool:
+    """CPU 작업 프로세스 풀"""
+
+    def __init__(self, max_workers: int):
+        """
+        Args:
+            max_workers: 하위 프로세스 수
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.in_flight = 0
+
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "saturated": 0,  # 제출 시 모든 프로세스가 사용 중이던 횟수
+            "restarts": 0,
+            "queue_wait_seconds": 0.0,
+            "max_queue_wait_seconds": 0.0,
+            "run_seconds": 0.0,
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                # fork는 이벤트 루프/스레드/커넥션 상태를 복제하므로 spawn 사용
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"CPU 프로세스 풀 시작: {self.max_workers}개")
+        return self._executor
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        함수를 하위 프로세스에서 실행하고 결과 반환
+
+        Args:
+            func: 모듈 최상위 함수 (cpu_bound 데코레이터를 적용한 함수도 가능)
+        """
+        executor = self._get_executor()
+        if self.in_flight >= self.max_workers:
+            self.stats["saturated"] += 1
+        self.stats["submitted"] += 1
+        self.in_flight += 1
+
+        submitted_at = time.time()
+        loop = asyncio.get_running_loop()
+        try:
+            result, started_at, run_seconds = await loop.run_in_executor(
+                executor, _invoke, func.__module__, func.__qualname__, args, kwargs
+            )
+        except BrokenProcessPool:
+            self.stats["failed"] += 1
+            self._reset(executor)
+            raise
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+        wait = max(0.0, started_at - submitted_at)
+        self.stats["completed"] += 1
+        self.stats["queue_wait_seconds"] += wait
+        self.stats["max_queue_wait_seconds"] = max(self.stats["max_queue_wait_seconds"], wait)
+        self.stats["run_seconds"] += run_seconds
+        return result
+
+    def _reset(self, executor: ProcessPoolExecutor):
+        """하위 프로세스 비정상 종료 후 풀 폐기 (다음 제출 시 재생성)"""
+        if self._executor is executor:
+            logger.error("CPU 프로세스 풀 하위 프로세스 비정상 종료, 풀 재생성 예정")
+            self._executor = None
+            self.stats["restarts"] += 1
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait: bool = True):
+        """풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> dict:
+        """풀 사용 현황"""
+        completed = self.stats["completed"]
+        return {
+            "max_workers": self.max_workers,
+            "started": self._executor is not None,
+            "busy": min(self.in_flight, self.max_workers),
+            "queued": max(0, self.in_flight - self.max_workers),
+            **self.stats,
+            "avg_queue_wait_seconds": self.stats["queue_wait_seconds"] / completed if completed else 0.0,
+            "avg_run_seconds": self.stats["run_seconds"] / completed if completed else 0.0,
+        }
+
+
+# 전역 CPU 프로세스 풀
+cpu_pool = ProcessPool(max_workers=settings.cpu_pool_size)
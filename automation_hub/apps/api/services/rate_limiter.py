@@ -0,0 +1,197 @@
+"""
+외부 API 호출 속도 제한 (토큰 버킷)
+
+여러 채널이 동시에 실행되면 OpenAI/YouTube/네이버 호출이 한꺼번에 몰려 429가 나므로,
+워커는 외부 호출 전에 버킷에서 토큰을 받아 갑니다 (BaseWorker.throttle).
+
+- 버킷 이름: "서비스.엔드포인트 분류" (예: openai.chat, youtube.upload)
+- 버킷은 (이름, API 키)별로 따로 두므로 키가 다르면 서로 기다리지 않음 (키는 해시로만 보관)
+- 설정: RATE_LIMITS(Settings) 위에 settings 테이블의 "rate_limit.<이름>" 값을 덮어씀
+  {"per_minute": 분당 허용 호출 수, "burst": 한 번에 몰아 쓸 수 있는 호출 수}
+  이름이 정확히 없으면 서비스 이름(점 앞부분), 그것도 없으면 제한하지 않음
+- settings 테이블 값은 rate_limit_refresh_seconds마다 다시 읽어 재시작 없이 반영
+- 제한은 프로세스별이므로 워커 프로세스가 여럿이면 per_minute를 나눠 설정
+- 대기 시간은 버킷별로 집계 (작업 워커가 heartbeat마다 보고, /health에서 워커 합계로 확인)
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Dict, Optional, Tuple
+
+from core.config import settings
+from core.database import get_setting_values
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# settings 테이블 key 접두사
+SETTING_PREFIX = "rate_limit."
+
+# 이 시간(초) 이상 기다린 호출은 로그로 남김
+_SLOW_WAIT_SECONDS = 1.0
+
+
+def _key_id(api_key: Optional[str]) -> str:
+    """API 키 → 통계/로그에 써도 되는 짧은 해시"""
+    if not api_key:
+        return "-"
+    return hashlib.sha256(api_key.encode()).hexdigest()[:8]
+
+
+class RateLimiter:
+    """이름 있는 토큰 버킷 모음"""
+
+    def __init__(self, limits: Dict[str, dict], refresh_seconds: float):
+        """
+        Args:
+            limits: 버킷 이름 → {"per_minute", "burst"} (Settings 기본값)
+            refresh_seconds: settings 테이블 값을 다시 읽는 간격 (초, 0 이하이면 읽지 않음)
+        """
+        self.base_limits = dict(limits)
+        self.refresh_seconds = refresh_seconds
+        self.limits: Dict[str, dict] = dict(limits)
+        self._loaded_at: Optional[float] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+        # (이름, 키 해시) → {tokens, updated_at, per_minute, burst}
+        self._buckets: Dict[Tuple[str, str], dict] = {}
+        # 버킷 이름 → 통계
+        self.stats: Dict[str, dict] = {}
+
+    # ============ 설정 ============
+
+    def _limit_for(self, name: str) -> Optional[dict]:
+        """버킷 설정 (정확한 이름 → 서비스 이름 순으로 찾음)"""
+        limit = self.limits.get(name) or self.limits.get(name.split(".")[0])
+        if not limit or limit.get("per_minute", 0) <= 0:
+            return None
+        return limit
+
+    async def refresh(self):
+        """settings 테이블의 버킷 설정을 다시 읽어 반영"""
+        self._loaded_at = time.monotonic()
+        try:
+            rows = await get_setting_values(SETTING_PREFIX)
+        except Exception as e:
+            logger.error(f"속도 제한 설정 조회 실패, 기존 설정 유지: {e}")
+            return
+
+        limits = dict(self.base_limits)
+        for key, value in rows.items():
+            name = key[len(SETTING_PREFIX):]
+            if isinstance(value, dict):
+                limits[name] = {**limits.get(name, {}), **value}
+            else:
+                logger.warning(f"속도 제한 설정 형식 오류 (무시): {key}={value}")
+        if limits != self.limits:
+            logger.info(f"속도 제한 설정 변경: {limits}")
+            self.limits = limits
+
+    async def _maybe_refresh(self):
+        if self.refresh_seconds <= 0:
+            return
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            # 기다리는 동안 다른 호출이 이미 읽었으면 생략
+            if self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_seconds:
+                await self.refresh()
+
+    # ============ 토큰 ============
+
+    def _reserve(self, name: str, key_id: str, limit: dict, tokens: float) -> float:
+        """
+        토큰을 예약하고 기다려야 할 시간(초) 반환
+
+        부족한 토큰은 음수로 빌려 두므로, 먼저 예약한 호출이 먼저 진행됩니다 (잠금 불필요).
+        """
+        rate = limit["per_minute"] / 60.0
+        burst = max(1.0, float(limit.get("burst", 1)))
+        now = time.monotonic()
+
+        bucket = self._buckets.get((name, key_id))
+        if bucket is None or bucket["per_minute"] != limit["per_minute"] or bucket["burst"] != burst:
+            # 새 버킷은 가득 찬 상태로, 설정이 바뀐 버킷은 남은(빌려 둔) 토큰 유지
+            tokens_now = burst if bucket is None else min(bucket["tokens"], burst)
+            bucket = self._buckets[(name, key_id)] = {
+                "tokens": tokens_now,
+                "updated_at": now,
+                "per_minute": limit["per_minute"],
+                "burst": burst,
+            }
+
+        bucket["tokens"] = min(burst, bucket["tokens"] + (now - bucket["updated_at"]) * rate)
+        bucket["updated_at"] = now
+        bucket["tokens"] -= tokens
+        return 0.0 if bucket["tokens"] >= 0 else -bucket["tokens"] / rate
+
+    async def acquire(self, name: str, api_key: Optional[str] = None, tokens: float = 1) -> float:
+        """
+        버킷에서 토큰을 받을 때까지 대기
+
+        Args:
+            name: 버킷 이름 (예: openai.chat)
+            api_key: 호출에 쓰는 API 키 (키별로 버킷을 나눔, 없으면 공용)
+            tokens: 이번 호출이 쓰는 토큰 수
+
+        Returns:
+            기다린 시간 (초)
+        """
+        await self._maybe_refresh()
+        limit = self._limit_for(name)
+        if limit is None:
+            return 0.0
+
+        key_id = _key_id(api_key)
+        wait = self._reserve(name, key_id, limit, tokens)
+        self._record(name, wait)
+        if wait > 0:
+            if wait >= _SLOW_WAIT_SECONDS:
+                logger.info(f"속도 제한 대기: {name} (키 {key_id}) {wait:.1f}초")
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # 취소된 호출이 빌려 둔 토큰은 돌려줌
+                bucket = self._buckets.get((name, key_id))
+                if bucket is not None:
+                    bucket["tokens"] = min(bucket["burst"], bucket["tokens"] + tokens)
+                raise
+        return wait
+
+    def _record(self, name: str, wait: float):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = {
+                "acquired": 0,
+                "waited": 0,
+                "wait_seconds": 0.0,
+                "max_wait_seconds": 0.0,
+            }
+        stats["acquired"] += 1
+        if wait > 0:
+            stats["waited"] += 1
+            stats["wait_seconds"] += wait
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], wait)
+
+    def get_stats(self) -> dict:
+        """버킷별 설정과 대기 통계"""
+        return {
+            "limits": self.limits,
+            "buckets": {
+                name: {
+                    **stats,
+                    "avg_wait_seconds": stats["wait_seconds"] / stats["acquired"] if stats["acquired"] else 0.0,
+                }
+                for name, stats in self.stats.items()
+            },
+        }
+
+
+# 전역 속도 제한
+rate_limiter = RateLimiter(
+    limits=settings.rate_limits,
+    refresh_seconds=settings.rate_limit_refresh_seconds,
+)
@@ -0,0 +1,132 @@
+"""
+채널 실행 동시성 제한
+
+그룹/전체 실행 시 채널을 동시에 실행하되 아래 상한을 지킵니다.
+
+- 전역: 프로세스 전체 동시 실행 채널 수
+- 그룹: 같은 그룹 안에서 동시 실행 채널 수
+- 플랫폼: 같은 플랫폼(channel["type"]) 동시 실행 채널 수
+- 시작 간격: 같은 플랫폼 채널의 실행 시작 사이 최소 간격 (외부 API 과부하 방지)
+
+슬롯은 항상 그룹 → 플랫폼 → 전역 순서로 잡으므로 서로 기다리며 멈추지 않습니다.
+상한이 0 이하이면 해당 제한을 두지 않습니다.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager, AsyncExitStack
+from typing import Dict, Optional
+
+from core.config import settings
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class RunLimiter:
+    """채널 실행 슬롯/시작 간격 관리"""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        group_concurrency: int,
+        platform_concurrency: int,
+        start_interval: float,
+    ):
+        """
+        Args:
+            max_concurrency: 전역 동시 실행 상한
+            group_concurrency: 그룹별 동시 실행 상한
+            platform_concurrency: 플랫폼별 동시 실행 상한
+            start_interval: 같은 플랫폼 실행 시작 사이 최소 간격 (초)
+        """
+        self.max_concurrency = max_concurrency
+        self.group_concurrency = group_concurrency
+        self.platform_concurrency = platform_concurrency
+        self.start_interval = start_interval
+
+        self._global: Optional[asyncio.Semaphore] = None
+        self._groups: Dict[str, asyncio.Semaphore] = {}
+        self._platforms: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+        self._pace_lock = asyncio.Lock()
+
+        self._active: Dict[str, int] = {}
+        self.running = 0
+
+    # ============ 슬롯 ============
+
+    def _semaphore(self, pool: Dict[str, asyncio.Semaphore], key: str, limit: int) -> asyncio.Semaphore:
+        """키별 세마포어 (처음 요청 시 생성)"""
+        semaphore = pool.get(key)
+        if semaphore is None:
+            semaphore = pool[key] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def _global_semaphore(self) -> asyncio.Semaphore:
+        if self._global is None:
+            self._global = asyncio.Semaphore(self.max_concurrency)
+        return self._global
+
+    async def _pace(self, platform: str):
+        """같은 플랫폼의 직전 시작 이후 start_interval이 지날 때까지 대기"""
+        if self.start_interval <= 0:
+            return
+
+        # 시작 시각을 먼저 예약하고 잠금 밖에서 대기 (다른 플랫폼은 기다리지 않음)
+        async with self._pace_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(platform, now))
+            self._next_start[platform] = start_at + self.start_interval
+
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    @asynccontextmanager
+    async def slot(self, platform: str, group_id: Optional[str] = None):
+        """
+        채널 1개 실행 슬롯
+
+        그룹(group_id가 있을 때) → 플랫폼 → 전역 슬롯을 잡고 시작 간격을 지킨 뒤 진입합니다.
+        """
+        async with AsyncExitStack() as stack:
+            if group_id and self.group_concurrency > 0:
+                await stack.enter_async_context(
+                    self._semaphore(self._groups, group_id, self.group_concurrency)
+                )
+            if self.platform_concurrency > 0:
+                await stack.enter_async_context(
+                    self._semaphore(self._platforms, platform, self.platform_concurrency)
+                )
+            if self.max_concurrency > 0:
+                await stack.enter_async_context(self._global_semaphore())
+
+            await self._pace(platform)
+
+            self.running += 1
+            self._active[platform] = self._active.get(platform, 0) + 1
+            try:
+                yield
+            finally:
+                self.running -= 1
+                self._active[platform] -= 1
+
+    def get_stats(self) -> dict:
+        """현재 실행 중인 채널 수와 상한"""
+        return {
+            "running": self.running,
+            "running_by_platform": {k: v for k, v in self._active.items() if v},
+            "max_concurrency": self.max_concurrency,
+            "group_concurrency": self.group_concurrency,
+            "platform_concurrency": self.platform_concurrency,
+            "start_interval": self.start_interval,
+        }
+
+
+# 전역 실행 제한 인스턴스
+run_limiter = RunLimiter(
+    max_concurrency=settings.executor_max_concurrency,
+    group_concurrency=settings.executor_group_concurrency,
+    platform_concurrency=settings.executor_platform_concurrency,
+    start_interval=settings.executor_start_interval,
+)
@@ -1,12 +1,33 @@
 """
 APScheduler 기반 스케줄러 설정
 schedules 테이블과 연동
+
+스케줄 정의와 마지막 실행 시각(last_run_at)은 schedules 테이블에 영구 저장되고,
+스케줄러의 Job은 그 사본입니다. 서버가 시작되면 reconcile_schedules()로
+활성 스케줄을 한 번에 다시 등록하고, 중단된 동안 놓친 실행을 감지해 기록합니다.
+이후에도 schedule_sync_interval마다 바뀐 스케줄만 반영해 다른 인스턴스에서
+수정한 내용이 따라오도록 합니다.
+
+지연된 실행(misfire: 이벤트 루프 정체, 재시작)은 APScheduler가 버리지 않고 모두 넘겨받아
+스케줄별 misfire_policy로 처리하며, 지연(실제 트리거 시각 - 예정 시각)을 기록합니다.
+- 지연이 schedule_misfire_grace_seconds 이내: 정책과 관계없이 실행
+- skip: 지연된 실행은 건너뜀 / coalesce: 놓친 실행을 한 번으로 합쳐 실행
+- catch_up: 놓친 실행을 최근 schedule_catch_up_max_runs개까지 실행하되
+  CatchUpPacer로 시작 시각을 나눠서 작업 큐에 추가 (구간당 시작 수 제한)
 """
 
-from datetime import datetime
+import asyncio
+import hashlib
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from apscheduler.events import EVENT_JOB_SUBMITTED
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from core.config import settings
 from core.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -14,6 +35,91 @@ logger = setup_logger(__name__)
 # 전역 스케줄러 인스턴스
 scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
 
+# 스케줄별 놓친 실행 횟수 계산 상한 (오래 중단된 경우 cron을 끝까지 순회하지 않음)
+_MAX_MISSED_COUNT = 1000
+
+# 지연된 실행 처리 정책 (schedules.misfire_policy)
+MISFIRE_POLICIES = ("skip", "coalesce", "catch_up")
+
+# 지연 분포(p50/p95)를 계산할 최근 트리거 수
+_LATENESS_SAMPLES = 1000
+
+# 마지막 동기화 결과 (/health, GET /api/schedules/status/reconcile)
+_last_reconcile: Optional[Dict[str, Any]] = None
+
+# 등록된 Job의 스케줄 정의 (schedule_id → (대상 유형, 대상 ID, cron, misfire 정책)), 동기화 시 변경 비교용
+_job_specs: Dict[str, Tuple[str, str, str, str]] = {}
+# 등록에 실패한 스케줄 정의 (바뀌기 전까지 주기적 동기화에서 다시 시도하지 않음)
+_failed_specs: Dict[str, Tuple[Tuple[str, str, str, str], str]] = {}
+# 서버 시작 후 감지한 놓친 실행 (schedule_id → 마지막 감지 결과)
+_missed_runs: Dict[str, Dict[str, Any]] = {}
+
+_sync_lock = asyncio.Lock()
+_sync_task: Optional[asyncio.Task] = None
+
+# 제출된 Job의 예정 실행 시각 (schedule_id → 큐), execute_schedule_job이 꺼내 지연 계산
+_planned_run_times: Dict[str, deque] = {}
+
+# 트리거 지연/처리 결과 메트릭
+_lateness_samples: deque = deque(maxlen=_LATENESS_SAMPLES)
+_trigger_stats = {
+    "triggered": 0,
+    "on_time": 0,  # 지연이 유예 시간 이내
+    "skipped": 0,  # 지연되어 건너뜀 (skip, catch_up 상한 초과분 포함)
+    "coalesced": 0,  # 지연된 실행을 한 번으로 합쳐 실행
+    "caught_up": 0,  # 지연된 실행을 나눠서 실행
+    "max_lateness_seconds": 0.0,
+}
+
+
+class CatchUpPacer:
+    """
+    catch_up 실행의 작업 큐 실행 시각(run_after) 배분 (시작 속도 제한)
+
+    interval초 구간마다 max_concurrency개까지만 같은 시각에 시작되도록 하고,
+    넘는 실행은 다음 구간으로 미룹니다. 동시 실행 수를 보장하지는 않습니다:
+    실행이 interval보다 오래 걸리면 앞 구간의 실행과 겹치고, 이 API 프로세스가 배분한
+    실행만 세므로 다른 인스턴스가 추가한 catch_up 실행은 고려하지 않습니다.
+    동시 실행 상한은 워커의 실행 상한(executor_max_concurrency 등)이 맡습니다.
+    """
+
+    def __init__(self, max_concurrency: int, interval: float):
+        """
+        Args:
+            max_concurrency: 구간당 catch_up 시작 수 (0 이하이면 제한 없음)
+            interval: 구간 길이 (초)
+        """
+        self.max_concurrency = max_concurrency
+        self.interval = timedelta(seconds=interval)
+        self._slot: Optional[datetime] = None
+        self._used = 0
+
+    def next_run_after(self, now: datetime) -> datetime:
+        """다음 catch_up 실행의 실행 시각"""
+        if self.max_concurrency <= 0:
+            return now
+        if self._slot is None or self._slot + self.interval <= now:
+            self._slot, self._used = now, 0
+        if self._used >= self.max_concurrency:
+            self._slot += self.interval
+            self._used = 0
+        self._used += 1
+        return self._slot
+
+    def get_stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "interval_seconds": self.interval.total_seconds(),
+            "scheduled_until": self._slot.isoformat() if self._slot else None,
+        }
+
+
+# catch_up 시작 속도 제한 (프로세스별)
+catch_up_pacer = CatchUpPacer(
+    max_concurrency=settings.schedule_catch_up_max_concurrency,
+    interval=settings.schedule_catch_up_interval,
+)
+
 
 def parse_cron(cron_expression: str) -> dict:
     """
@@ -33,24 +139,155 @@ def parse_cron(cron_expression: str) -> dict:
     }
 
 
-async def execute_schedule_job(schedule_id: str, target_type: str, target_id: str):
+class OffsetCronTrigger(CronTrigger):
+    """cron 시각보다 고정 오프셋만큼 늦게 실행하는 트리거 (같은 시각 스케줄 분산용)"""
+
+    def __init__(self, offset_seconds: int, **kwargs):
+        super().__init__(**kwargs)
+        self.offset = timedelta(seconds=offset_seconds)
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        if previous_fire_time is not None:
+            previous_fire_time = previous_fire_time - self.offset
+        fire_time = super().get_next_fire_time(previous_fire_time, now - self.offset)
+        return fire_time + self.offset if fire_time is not None else None
+
+    def __str__(self):
+        return f"{super().__str__()} +{int(self.offset.total_seconds())}s"
+
+
+def spread_offset(schedule_id: str, spread_minutes: int) -> int:
+    """
+    스케줄 ID 해시로 정한 분산 오프셋 (초, 0 이상 spread_minutes * 60 미만)
+
+    같은 스케줄은 항상 같은 오프셋을 받으므로 재시작/재등록해도 실행 시각이 바뀌지 않습니다.
+    """
+    if spread_minutes <= 0:
+        return 0
+    digest = hashlib.sha256(schedule_id.encode()).digest()
+    return int.from_bytes(digest[:8], "big") % (spread_minutes * 60)
+
+
+def build_trigger(cron_expression: str, offset_seconds: int = 0) -> CronTrigger:
+    """Cron 표현식 → 스케줄러 시간대(Asia/Seoul) 기준 CronTrigger (offset_seconds만큼 늦게 실행)"""
+    if offset_seconds:
+        return OffsetCronTrigger(offset_seconds, **parse_cron(cron_expression), timezone=scheduler.timezone)
+    return CronTrigger(**parse_cron(cron_expression), timezone=scheduler.timezone)
+
+
+def _on_job_submitted(event):
+    """Job 제출 시 예정 실행 시각 보관 (제출 직후 같은 루프 차례에 호출되어 Job 실행보다 먼저 실행됨)"""
+    _planned_run_times.setdefault(event.job_id, deque()).extend(event.scheduled_run_times)
+
+
+def _cap_catch_up(schedule_id: str, planned_times: deque, now: datetime):
+    """
+    catch_up Job에 넘어온 지연된 실행 시각을 최근 schedule_catch_up_max_runs개로 제한
+
+    APScheduler는 coalesce=False인 Job을 놓친 실행 시각마다 한 번씩 호출하므로 큐에서
+    빼지 않고 None으로 바꿔 두고, 해당 호출은 execute_schedule_job에서 건너뜀
+    """
+    max_runs = max(settings.schedule_catch_up_max_runs, 0)
+    late = [
+        index for index, planned in enumerate(planned_times)
+        if planned is not None and (now - planned).total_seconds() > settings.schedule_misfire_grace_seconds
+    ]
+    dropped = late[:max(0, len(late) - max_runs)]
+    if not dropped:
+        return
+    first_dropped = planned_times[dropped[0]]
+    for index in dropped:
+        planned_times[index] = None
+    _trigger_stats["skipped"] += len(dropped)
+    logger.warning(
+        f"지연된 스케줄 실행 {len(dropped)}회 건너뜀 (catch_up 상한 {max_runs}회): {schedule_id}, "
+        f"예정 {first_dropped.isoformat()}부터"
+    )
+
+
+scheduler.add_listener(_on_job_submitted, EVENT_JOB_SUBMITTED)
+
+
+async def execute_schedule_job(
+    schedule_id: str,
+    target_type: str,
+    target_id: str,
+    misfire_policy: str = "skip",
+):
     """
     스케줄 Job 실행
-    target_type에 따라 그룹 또는 채널 실행
+    target_type에 따라 그룹 또는 채널 실행 작업을 작업 큐에 추가 (실행은 워커)
+    """
+    now = datetime.now(timezone.utc)
+    planned_times = _planned_run_times.get(schedule_id)
+    if misfire_policy == "catch_up" and planned_times:
+        _cap_catch_up(schedule_id, planned_times, now)
+    planned = planned_times.popleft() if planned_times else now
+    if planned_times is not None and not planned_times:
+        del _planned_run_times[schedule_id]
+    if planned is None:  # catch_up 상한으로 건너뜀 (_cap_catch_up에서 집계)
+        return
+
+    await _trigger(schedule_id, target_type, target_id, misfire_policy, planned, now)
+
+
+async def _trigger(
+    schedule_id: str,
+    target_type: str,
+    target_id: str,
+    misfire_policy: str,
+    planned: datetime,
+    now: datetime,
+) -> str:
+    """
+    예정 시각 planned의 실행을 misfire 정책에 따라 처리하고 지연 기록
+
+    Returns:
+        처리 결과 (on_time | skipped | coalesced | caught_up)
     """
-    from services.executor import execute_group, execute_channel
+    from services.job_queue import enqueue_group, enqueue_channel
     from core.database import update_schedule
 
-    logger.info(f"스케줄 트리거: {schedule_id} ({target_type}: {target_id})")
+    lateness = max(0.0, (now - planned).total_seconds())
+    _lateness_samples.append(lateness)
+    _trigger_stats["triggered"] += 1
+    _trigger_stats["max_lateness_seconds"] = max(_trigger_stats["max_lateness_seconds"], lateness)
+
+    if lateness <= settings.schedule_misfire_grace_seconds:
+        outcome = "on_time"
+    elif misfire_policy == "coalesce":
+        outcome = "coalesced"
+    elif misfire_policy == "catch_up":
+        outcome = "caught_up"
+    else:
+        outcome = "skipped"
+    _trigger_stats[outcome] += 1
+
+    fields = {"last_planned_at": planned.isoformat(), "last_lateness_seconds": round(lateness, 3)}
+    if outcome == "skipped":
+        logger.warning(f"지연된 스케줄 실행 건너뜀: {schedule_id} (예정 {planned.isoformat()}, {lateness:.0f}초 지연)")
+        await update_schedule(schedule_id, fields)
+        return outcome
+
+    run_after = catch_up_pacer.next_run_after(now) if outcome == "caught_up" else None
+    if outcome == "on_time":
+        logger.info(f"스케줄 트리거: {schedule_id} ({target_type}: {target_id})")
+    else:
+        logger.warning(
+            f"지연된 스케줄 실행 ({misfire_policy}): {schedule_id} ({target_type}: {target_id}), "
+            f"예정 {planned.isoformat()}, {lateness:.0f}초 지연"
+            + (f", 실행 {run_after.isoformat()}" if run_after and run_after > now else "")
+        )
 
-    # last_run_at 업데이트
-    await update_schedule(schedule_id, {"last_run_at": datetime.utcnow().isoformat()})
+    # last_run_at, 지연 업데이트
+    await update_schedule(schedule_id, {"last_run_at": datetime.utcnow().isoformat(), **fields})
 
-    # 대상 유형에 따라 실행
+    # 대상 유형에 따라 작업 추가
     if target_type == "group":
-        await execute_group(target_id)
+        await enqueue_group(target_id, source="schedule", schedule_id=schedule_id, run_after=run_after)
     elif target_type == "channel":
-        await execute_channel(target_id)
+        await enqueue_channel(target_id, source="schedule", schedule_id=schedule_id, run_after=run_after)
+    return outcome
 
 
 def register_schedule(
@@ -58,26 +295,46 @@ def register_schedule(
     target_type: str,
     target_id: str,
     cron_expression: str,
+    spread_minutes: Optional[int] = None,
+    misfire_policy: str = "skip",
 ):
-    """스케줄 등록"""
+    """
+    스케줄 등록
+
+    Args:
+        spread_minutes: 분산 구간 (분). cron 시각부터 이 구간 안에서 스케줄 ID별로 정해진 만큼
+            늦게 실행해 같은 시각(예: 기본값 "0 9 * * *")의 스케줄이 한꺼번에 실행되지 않도록 함.
+            None이면 settings.schedule_spread_minutes, 0이면 분산하지 않음
+        misfire_policy: 지연된 실행 처리 (skip | coalesce | catch_up)
+    """
     job_id = schedule_id  # 스케줄 ID를 Job ID로 사용
+    if spread_minutes is None:
+        spread_minutes = settings.schedule_spread_minutes
 
     # 기존 작업이 있으면 제거
     existing_job = scheduler.get_job(job_id)
     if existing_job:
         scheduler.remove_job(job_id)
+    _job_specs.pop(job_id, None)
 
     try:
-        cron_params = parse_cron(cron_expression)
-        trigger = CronTrigger(**cron_params)
+        if misfire_policy not in MISFIRE_POLICIES:
+            raise ValueError(f"잘못된 misfire 정책: {misfire_policy}")
+        trigger = build_trigger(cron_expression, spread_offset(schedule_id, spread_minutes))
 
         scheduler.add_job(
             execute_schedule_job,
             trigger=trigger,
             id=job_id,
             args=[schedule_id, target_type, target_id],
+            kwargs={"misfire_policy": misfire_policy},
+            # 지연된 실행도 버리지 않고 넘겨받아 execute_schedule_job에서 정책 적용
+            # (catch_up만 놓친 실행 시각을 하나씩, 나머지는 마지막 한 번으로 합쳐서)
+            misfire_grace_time=None,
+            coalesce=misfire_policy != "catch_up",
             replace_existing=True,
         )
+        _job_specs[job_id] = (target_type, target_id, cron_expression, misfire_policy)
         logger.info(f"스케줄 등록: {schedule_id} ({target_type}: {target_id}), Cron: {cron_expression}")
     except Exception as e:
         logger.error(f"스케줄 등록 실패: {schedule_id}, 오류: {e}")
@@ -87,6 +344,8 @@ def register_schedule(
 def remove_schedule(schedule_id: str):
     """스케줄 제거"""
     job = scheduler.get_job(schedule_id)
+    _job_specs.pop(schedule_id, None)
+    _planned_run_times.pop(schedule_id, None)
 
     if job:
         scheduler.remove_job(schedule_id)
@@ -120,6 +379,317 @@ def get_next_run_time(schedule_id: str) -> datetime | None:
     return None
 
 
+def get_next_run_times() -> dict[str, datetime]:
+    """
+    등록된 모든 Job의 다음 실행 시간 일괄 조회
+
+    Returns:
+        {schedule_id: next_run_time} (일시정지된 Job은 제외)
+    """
+    return {
+        job.id: job.next_run_time
+        for job in scheduler.get_jobs()
+        if getattr(job, "next_run_time", None)
+    }
+
+
+def iter_fire_times(trigger: CronTrigger, start: datetime, end: datetime, limit: int = 10000):
+    """트리거의 [start, end) 구간 실행 시각 (최대 limit개)"""
+    count = 0
+    fire_time = trigger.get_next_fire_time(None, start)
+    while fire_time is not None and fire_time < end and count < limit:
+        yield fire_time
+        count += 1
+        fire_time = trigger.get_next_fire_time(fire_time, fire_time)
+
+
+def get_minute_load(hours: float = 24.0, top: int = 20) -> Dict[str, Any]:
+    """
+    분 단위 실행 부하: 앞으로 hours시간 동안 각 분(스케줄러 시간대)에 실행될 Job 수
+
+    Job 수가 많은 분부터 top개를 돌려줍니다. 한 분에 몰린 Job이 많으면
+    SCHEDULE_SPREAD_MINUTES로 분산하거나 cron을 옮겨 최고치를 낮춥니다. (일시정지된 Job 제외)
+    """
+    start = datetime.now(timezone.utc)
+    end = start + timedelta(hours=hours)
+
+    buckets: Counter = Counter()
+    jobs = 0
+    for job in scheduler.get_jobs():
+        # 시작 전에 추가된 Job은 next_run_time이 아직 없으므로 일시정지로 보지 않음
+        if getattr(job, "next_run_time", None) is None and scheduler.running:
+            continue
+        jobs += 1
+        for fire_time in iter_fire_times(job.trigger, start, end):
+            buckets[fire_time.astimezone(scheduler.timezone).strftime("%Y-%m-%d %H:%M")] += 1
+
+    busiest = sorted(buckets.items(), key=lambda item: (-item[1], item[0]))
+    return {
+        "window_start": start.isoformat(),
+        "window_hours": hours,
+        "spread_minutes": settings.schedule_spread_minutes,
+        "jobs": jobs,
+        "fires": sum(buckets.values()),
+        "busy_minutes": len(buckets),
+        "peak": {"minute": busiest[0][0], "jobs": busiest[0][1]} if busiest else None,
+        "buckets": [{"minute": minute, "jobs": count} for minute, count in busiest[:top]],
+    }
+
+
+# ============ DB 동기화 (시작 시 복구) ============
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    """DB 시각 값(ISO 문자열 또는 datetime) → aware datetime (시간대가 없으면 UTC로 간주)"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def find_missed_runs(schedule: dict, now: datetime) -> Optional[Dict[str, Any]]:
+    """
+    스케줄이 실행되지 않은 cron 시각 감지
+
+    기준 시각(last_run_at/updated_at/created_at 중 가장 늦은 시각) 이후 now 이전의
+    cron 시각은 서버가 중단되어 실행되지 않은 것으로 봅니다.
+    (실행되면 last_run_at이, 수정되면 updated_at이 갱신되므로)
+
+    Returns:
+        놓친 실행 정보, 없으면 None
+    """
+    since = max(
+        filter(None, (_as_datetime(schedule.get(key)) for key in ("last_run_at", "updated_at", "created_at"))),
+        default=None,
+    )
+    if since is None:
+        return None
+
+    trigger = build_trigger(schedule["cron"], spread_offset(schedule["id"], settings.schedule_spread_minutes))
+    missed_count = 0
+    first_missed = last_missed = None
+    fire_time = trigger.get_next_fire_time(None, since)
+    while fire_time is not None and fire_time < now and missed_count < _MAX_MISSED_COUNT:
+        missed_count += 1
+        first_missed = first_missed or fire_time
+        last_missed = fire_time
+        fire_time = trigger.get_next_fire_time(fire_time, fire_time)
+
+    if not missed_count:
+        return None
+    return {
+        "schedule_id": schedule["id"],
+        "target_type": schedule["target_type"],
+        "target_id": schedule["target_id"],
+        "cron": schedule["cron"],
+        "since": since.isoformat(),
+        "missed_count": missed_count,
+        "first_missed_at": first_missed.isoformat(),
+        "last_missed_at": last_missed.isoformat(),
+    }
+
+
+async def _handle_missed_runs(schedule: dict, missed_runs: Dict[str, Any], now: datetime):
+    """
+    중단된 동안 놓친 실행을 misfire 정책대로 처리 (실행한 수를 missed_runs["enqueued"]에 기록)
+
+    - 마지막으로 놓친 실행이 유예 시간 이내면 정책과 관계없이 그 한 번은 실행
+    - coalesce: 마지막으로 놓친 실행 한 번
+    - catch_up: 최근 schedule_catch_up_max_runs개 (더 오래된 실행은 건너뜀)
+    """
+    policy = _policy(schedule)
+    last_missed = datetime.fromisoformat(missed_runs["last_missed_at"])
+
+    if policy == "catch_up":
+        trigger = build_trigger(schedule["cron"], spread_offset(schedule["id"], settings.schedule_spread_minutes))
+        since = datetime.fromisoformat(missed_runs["since"])
+        planned_times = list(iter_fire_times(trigger, since, now, limit=_MAX_MISSED_COUNT))
+        max_runs = settings.schedule_catch_up_max_runs
+        planned_times = planned_times[-max_runs:] if max_runs > 0 else []
+    elif policy == "coalesce" or (now - last_missed).total_seconds() <= settings.schedule_misfire_grace_seconds:
+        planned_times = [last_missed]
+    else:
+        planned_times = []
+
+    _trigger_stats["skipped"] += missed_runs["missed_count"] - len(planned_times)
+    for planned in planned_times:
+        await _trigger(schedule["id"], schedule["target_type"], schedule["target_id"], policy, planned, now)
+    missed_runs["policy"] = policy
+    missed_runs["enqueued"] = len(planned_times)
+
+
+def get_lateness_stats() -> Dict[str, Any]:
+    """트리거 지연(실제 - 예정) 분포와 misfire 처리 결과 (API 프로세스 시작 후)"""
+    samples = sorted(_lateness_samples)
+
+    def percentile(ratio: float) -> Optional[float]:
+        if not samples:
+            return None
+        return round(samples[min(len(samples) - 1, int(ratio * len(samples)))], 3)
+
+    return {
+        "misfire_grace_seconds": settings.schedule_misfire_grace_seconds,
+        **_trigger_stats,
+        "recent_samples": len(samples),
+        "mean_seconds": round(sum(samples) / len(samples), 3) if samples else None,
+        "p50_seconds": percentile(0.5),
+        "p95_seconds": percentile(0.95),
+        "catch_up": catch_up_pacer.get_stats(),
+    }
+
+
+def _policy(schedule: dict) -> str:
+    return schedule.get("misfire_policy") or "skip"
+
+
+def _spec(schedule: dict) -> Tuple[str, str, str, str]:
+    return (schedule["target_type"], schedule["target_id"], schedule["cron"], _policy(schedule))
+
+
+async def reconcile_schedules() -> Dict[str, Any]:
+    """
+    DB 활성 스케줄과 스케줄러 Job 맞추기 (서버 시작 시, 주기적으로, POST /api/schedules/sync)
+
+    활성 스케줄을 한 번에 조회해 등록된 Job과 비교하고 바뀐 것만 반영합니다.
+    바뀌지 않은 Job은 트리거와 다음 실행 시각을 그대로 둡니다.
+    - 추가: Job이 없는 활성 스케줄 (서버 시작 시에는 전부), 이때 중단된 동안 놓친 실행을 감지해
+      misfire 정책대로 처리 (_handle_missed_runs)
+    - 변경: cron/대상/misfire 정책이 바뀐 스케줄만 다시 등록
+      (updated_at은 실행할 때마다 last_run_at과 함께 바뀌므로 비교하지 않음)
+    - 제거: DB에 없거나 비활성인 스케줄의 Job
+    - cron이 잘못된 스케줄은 건너뛰고 결과에 기록 (바뀌기 전까지 다시 시도하지 않음)
+
+    Returns:
+        동기화 결과 (get_reconcile_report()로도 조회)
+    """
+    from core.database import get_active_schedules
+
+    global _last_reconcile
+
+    async with _sync_lock:
+        started = time.monotonic()
+        now = datetime.now(timezone.utc)
+        schedules = await get_active_schedules()
+        active = {schedule["id"]: schedule for schedule in schedules}
+
+        removed = 0
+        for job in scheduler.get_jobs():
+            if job.id not in active:
+                remove_schedule(job.id)
+                removed += 1
+        for schedule_id in set(_failed_specs) - set(active):
+            del _failed_specs[schedule_id]
+        for schedule_id in set(_missed_runs) - set(active):
+            del _missed_runs[schedule_id]
+
+        added = rescheduled = unchanged = 0
+        missed_now = 0
+        for schedule in schedules:
+            spec = _spec(schedule)
+            exists = scheduler.get_job(schedule["id"]) is not None
+            if exists and _job_specs.get(schedule["id"]) == spec:
+                unchanged += 1
+                continue
+            failed_before = _failed_specs.get(schedule["id"])
+            if failed_before is not None and failed_before[0] == spec:
+                continue
+
+            try:
+                register_schedule(
+                    schedule_id=schedule["id"],
+                    target_type=schedule["target_type"],
+                    target_id=schedule["target_id"],
+                    cron_expression=schedule["cron"],
+                    misfire_policy=_policy(schedule),
+                )
+            except Exception as e:
+                _failed_specs[schedule["id"]] = (spec, str(e))
+                continue
+            _failed_specs.pop(schedule["id"], None)
+
+            if exists:
+                rescheduled += 1
+                continue
+            added += 1
+
+            missed_runs = find_missed_runs(schedule, now)
+            if missed_runs:
+                _missed_runs[schedule["id"]] = missed_runs
+                missed_now += missed_runs["missed_count"]
+                logger.warning(
+                    f"놓친 스케줄 실행: {schedule['id']} ({schedule['target_type']}: {schedule['target_id']}), "
+                    f"{missed_runs['missed_count']}회 "
+                    f"({missed_runs['first_missed_at']} ~ {missed_runs['last_missed_at']}), "
+                    f"정책 {_policy(schedule)}"
+                )
+                await _handle_missed_runs(schedule, missed_runs, now)
+
+        _last_reconcile = {
+            "reconciled_at": now.isoformat(),
+            "duration_ms": round((time.monotonic() - started) * 1000, 1),
+            "active": len(schedules),
+            "registered": added + rescheduled + unchanged,
+            "added": added,
+            "rescheduled": rescheduled,
+            "removed": removed,
+            "unchanged": unchanged,
+            "failed": [
+                {"schedule_id": schedule_id, "error": error}
+                for schedule_id, (_, error) in _failed_specs.items()
+            ],
+            "missed_runs_detected": missed_now,
+            "missed_runs": sum(item["missed_count"] for item in _missed_runs.values()),
+            "missed": list(_missed_runs.values()),
+        }
+
+    if added or rescheduled or removed or missed_now:
+        logger.info(
+            f"스케줄 동기화: 활성 {len(schedules)}개 (추가 {added}, 변경 {rescheduled}, 제거 {removed}, "
+            f"유지 {unchanged}, 등록 실패 {len(_failed_specs)}), 놓친 실행 {missed_now}회"
+        )
+    return _last_reconcile
+
+
+def get_reconcile_report() -> Optional[Dict[str, Any]]:
+    """마지막 동기화 결과 (동기화 전이면 None, 놓친 실행은 서버 시작 후 감지한 전체)"""
+    return _last_reconcile
+
+
+def start_schedule_sync(interval: float):
+    """주기적 동기화 시작 (0 이하이면 시작하지 않음, 이미 실행 중이면 무시)"""
+    global _sync_task
+    if interval <= 0:
+        return
+    if (
+        _sync_task is None
+        or _sync_task.done()
+        or _sync_task.get_loop() is not asyncio.get_running_loop()
+    ):
+        _sync_task = asyncio.create_task(_sync_loop(interval))
+
+
+async def stop_schedule_sync():
+    """주기적 동기화 중지"""
+    global _sync_task
+    if _sync_task is not None:
+        _sync_task.cancel()
+        try:
+            await _sync_task
+        except asyncio.CancelledError:
+            pass
+        _sync_task = None
+
+
+async def _sync_loop(interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await reconcile_schedules()
+        except Exception as e:
+            logger.error(f"주기적 스케줄 동기화 오류: {e}")
+
+
 # ============ 기존 호환성 유지 (deprecated) ============
 
 
@@ -0,0 +1,225 @@
+"""
+작업 워커 상태 보고
+
+서킷 브레이커, CPU 풀, 속도 제한, 결과물 캐시처럼 실행 중에 쌓이는 상태는 실행이 일어나는 작업 워커 프로세스
+(commands/job_worker.py, 여러 호스트 가능)의 메모리에 있으므로,
+API 프로세스의 인스턴스는 JOB_WORKER_EMBEDDED가 아니면 비어 있습니다.
+
+- 워커는 heartbeat마다 collect_worker_stats()를 worker_stats 테이블에 보고 (워커별로 덮어씀)
+- /health는 get_worker_report()로 JOB_STALE_TIMEOUT 안에 보고한 워커만 모아
+  구성 요소별로 합친 상태를 보여줌 (종료/중단된 워커의 보고는 그 뒤로 빠짐)
+- 합치는 방법은 구성 요소마다 다름 (_MERGERS)
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from core.config import settings
+from core.database import get_worker_stats, upsert_worker_stats
+from core.logger import setup_logger
+from services.artifact_cache import artifact_cache
+from services.circuit_breaker import circuit_breaker
+from services.process_pool import cpu_pool
+from services.rate_limiter import rate_limiter
+
+logger = setup_logger(__name__)
+
+# 서킷 상태 심각도 (여러 워커의 상태가 다르면 가장 나쁜 상태로 표시)
+_STATE_SEVERITY = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def collect_worker_stats(worker) -> dict:
+    """이 프로세스의 구성 요소별 상태 (워커가 보고하는 내용)"""
+    return {
+        "job_worker": worker.get_stats(),
+        "circuit_breaker": circuit_breaker.get_stats(),
+        "cpu_pool": cpu_pool.get_stats(),
+        "rate_limiter": rate_limiter.get_stats(),
+        "artifact_cache": artifact_cache.get_stats(),
+    }
+
+
+async def publish_worker_stats(worker):
+    """이 프로세스의 상태를 worker_stats 테이블에 보고"""
+    await upsert_worker_stats(worker.worker_id, collect_worker_stats(worker))
+
+
+def _merge_circuit_breaker(reports: Dict[str, dict]) -> dict:
+    """
+    플랫폼별 서킷 합산
+
+    상태는 가장 나쁜 워커 기준 (그 워커의 연속 실패/차단 시각/마지막 오류),
+    차단/거부 횟수는 합계, workers에 워커별 상태
+    """
+    merged = {"failure_threshold": None, "recovery_timeout": None, "circuits": {}}
+    for worker_id, stats in reports.items():
+        merged["failure_threshold"] = stats["failure_threshold"]
+        merged["recovery_timeout"] = stats["recovery_timeout"]
+        for key, circuit in stats["circuits"].items():
+            current = merged["circuits"].get(key)
+            if current is None:
+                current = merged["circuits"][key] = {
+                    **circuit, "trips": 0, "rejected": 0, "workers": {},
+                }
+            elif _STATE_SEVERITY[circuit["state"]] > _STATE_SEVERITY[current["state"]]:
+                current.update(
+                    state=circuit["state"],
+                    failures=circuit["failures"],
+                    opened_at=circuit["opened_at"],
+                    last_error=circuit["last_error"],
+                )
+            current["trips"] += circuit["trips"]
+            current["rejected"] += circuit["rejected"]
+            current["workers"][worker_id] = circuit["state"]
+    return merged
+
+
+def _merge_cpu_pool(reports: Dict[str, dict]) -> dict:
+    """
+    CPU 풀 합산
+
+    프로세스 수/사용 중/대기/횟수/시간은 합계, 최대 대기는 최댓값,
+    평균은 합계로 다시 계산, workers에 워커별 사용 현황
+    """
+    merged = {
+        "max_workers": 0, "started": False, "busy": 0, "queued": 0,
+        "submitted": 0, "completed": 0, "failed": 0, "saturated": 0, "restarts": 0,
+        "queue_wait_seconds": 0.0, "max_queue_wait_seconds": 0.0, "run_seconds": 0.0,
+        "workers": {},
+    }
+    for worker_id, stats in reports.items():
+        for field in (
+            "max_workers", "busy", "queued", "submitted", "completed", "failed",
+            "saturated", "restarts", "queue_wait_seconds", "run_seconds",
+        ):
+            merged[field] += stats[field]
+        merged["started"] = merged["started"] or stats["started"]
+        merged["max_queue_wait_seconds"] = max(
+            merged["max_queue_wait_seconds"], stats["max_queue_wait_seconds"]
+        )
+        merged["workers"][worker_id] = {
+            "max_workers": stats["max_workers"],
+            "busy": stats["busy"],
+            "queued": stats["queued"],
+            "saturated": stats["saturated"],
+        }
+    completed = merged["completed"]
+    merged["avg_queue_wait_seconds"] = merged["queue_wait_seconds"] / completed if completed else 0.0
+    merged["avg_run_seconds"] = merged["run_seconds"] / completed if completed else 0.0
+    return merged
+
+
+def _merge_rate_limiter(reports: Dict[str, dict]) -> dict:
+    """
+    버킷별 속도 제한 합산
+
+    limits는 워커가 적용 중인 설정 (제한은 워커별이므로 전체 허용량은 워커 수만큼),
+    호출/대기 횟수와 대기 시간은 합계, 최대 대기는 최댓값, workers에 워커별 대기 통계
+    """
+    merged = {"limits": {}, "buckets": {}}
+    for worker_id, stats in reports.items():
+        merged["limits"].update(stats["limits"])
+        for name, bucket in stats["buckets"].items():
+            current = merged["buckets"].setdefault(name, {
+                "acquired": 0, "waited": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0,
+                "workers": {},
+            })
+            current["acquired"] += bucket["acquired"]
+            current["waited"] += bucket["waited"]
+            current["wait_seconds"] += bucket["wait_seconds"]
+            current["max_wait_seconds"] = max(current["max_wait_seconds"], bucket["max_wait_seconds"])
+            current["workers"][worker_id] = {
+                "acquired": bucket["acquired"],
+                "waited": bucket["waited"],
+                "max_wait_seconds": bucket["max_wait_seconds"],
+            }
+    for bucket in merged["buckets"].values():
+        bucket["avg_wait_seconds"] = (
+            bucket["wait_seconds"] / bucket["acquired"] if bucket["acquired"] else 0.0
+        )
+    return merged
+
+
+# 결과물 캐시 통계 중 워커 간에 합치는 횟수 항목
+_ARTIFACT_CACHE_COUNTERS = (
+    "hits", "misses", "coalesced", "stored", "unstorable",
+    "evictions", "evicted_bytes", "copies", "released", "errors",
+)
+
+
+def _merge_artifact_cache(reports: Dict[str, dict]) -> dict:
+    """
+    결과물 캐시 합산
+
+    히트/미스 등 횟수는 합계로 히트율을 다시 계산 (단계별도 동일).
+    캐시 디렉터리는 같은 호스트의 워커끼리 공유할 수 있어 크기는 합치지 않고 workers에 워커별로 표시
+    """
+    merged = {
+        "enabled": False,
+        **{name: 0 for name in _ARTIFACT_CACHE_COUNTERS},
+        "stages": {},
+        "workers": {},
+    }
+    for worker_id, stats in reports.items():
+        merged["enabled"] = merged["enabled"] or stats["enabled"]
+        for name in _ARTIFACT_CACHE_COUNTERS:
+            merged[name] += stats[name]
+        for stage, stage_stats in stats["stages"].items():
+            current = merged["stages"].setdefault(stage, {"hits": 0, "misses": 0})
+            current["hits"] += stage_stats["hits"]
+            current["misses"] += stage_stats["misses"]
+        merged["workers"][worker_id] = {
+            "root": stats["root"],
+            "entries": stats["entries"],
+            "total_bytes": stats["total_bytes"],
+            "max_bytes": stats["max_bytes"],
+            "hit_rate": stats["hit_rate"],
+        }
+    lookups = merged["hits"] + merged["misses"]
+    merged["hit_rate"] = merged["hits"] / lookups if lookups else 0.0
+    for stage_stats in merged["stages"].values():
+        stage_stats["hit_rate"] = stage_stats["hits"] / (stage_stats["hits"] + stage_stats["misses"])
+    return merged
+
+
+# 구성 요소 → 워커별 보고({worker_id: 상태})를 합치는 함수
+_MERGERS = {
+    "circuit_breaker": _merge_circuit_breaker,
+    "cpu_pool": _merge_cpu_pool,
+    "rate_limiter": _merge_rate_limiter,
+    "artifact_cache": _merge_artifact_cache,
+}
+
+
+def merge_worker_stats(rows: List[Dict]) -> dict:
+    """
+    워커 보고 합산
+
+    Args:
+        rows: get_worker_stats() 결과 ([{"worker_id", "stats", "updated_at"}])
+
+    Returns:
+        {"workers": {worker_id: 작업 워커 상태 + updated_at}, 구성 요소: 합친 상태, ...}
+    """
+    report = {
+        "workers": {
+            row["worker_id"]: {**row["stats"].get("job_worker", {}), "updated_at": row["updated_at"]}
+            for row in rows
+        },
+    }
+    for name, merge in _MERGERS.items():
+        report[name] = merge({
+            row["worker_id"]: row["stats"][name] for row in rows if name in row["stats"]
+        })
+    return report
+
+
+async def get_worker_report() -> dict:
+    """JOB_STALE_TIMEOUT 안에 보고한 워커의 상태를 합쳐 반환 (조회 실패 시 값은 None)"""
+    since = datetime.now(timezone.utc) - timedelta(seconds=settings.job_stale_timeout)
+    try:
+        rows = await get_worker_stats(since)
+    except Exception as e:
+        logger.error(f"워커 상태 조회 실패: {e}")
+        return {"workers": None, **{name: None for name in _MERGERS}}
+    return merge_worker_stats(rows)
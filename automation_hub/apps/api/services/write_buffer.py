@@ -0,0 +1,294 @@
+"""
+실행 기록 쓰기 버퍼 (write-behind)
+
+채널 실행마다 발생하는 run_logs 생성/수정, 채널 last_run_* 수정,
+일별 실행 통계 롤업(run_stats_daily) 증분, 단계 체크포인트를 메모리에 모았다가
+짧은 주기로 일괄 반영합니다.
+
+- 같은 실행 로그(id)나 같은 채널에 대한 연속 쓰기는 하나로 합쳐짐 (마지막 값 우선)
+- 같은 롤업 키에 대한 증분은 더해서 하나로 합쳐짐
+- run_logs: upsert 일괄 요청, 채널/롤업: 일괄 RPC 각 1회
+- 단계 체크포인트: 실행 로그(FK) 다음에 upsert 일괄 요청
+- 대기 건수가 상한(max_pending)을 넘으면 즉시 flush (메모리 상한)
+- 앱 종료 시(lifespan) 남은 항목을 모두 flush
+
+실행 로그 ID는 DB 대신 호출자가 미리 생성(uuid4)하므로
+쓰기가 반영되기 전에도 ID를 사용할 수 있습니다.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from core.config import settings
+from core.database import (
+    upsert_run_logs,
+    bulk_update_channel_runs,
+    bump_run_stats_daily,
+    upsert_stage_checkpoints,
+)
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class WriteBuffer:
+    """실행 로그/채널 상태 쓰기 버퍼"""
+
+    # 행 단위 재시도 후에도 실패하면 버리는 횟수
+    max_attempts = 3
+
+    def __init__(self, flush_interval: float, max_pending: int):
+        """
+        Args:
+            flush_interval: 주기적 flush 간격 (초)
+            max_pending: 대기 항목 상한 (초과 시 즉시 flush)
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._run_logs: Dict[str, Dict[str, Any]] = {}
+        self._channel_updates: Dict[str, Dict[str, Any]] = {}
+        self._stats_deltas: Dict[tuple, Dict[str, int]] = {}
+        self._checkpoints: Dict[tuple, Dict[str, Any]] = {}
+        self._attempts: Dict[tuple, int] = {}
+
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "flushes": 0,
+            "writes_requested": 0,
+            "rows_written": 0,
+            "failed_flushes": 0,
+            "dropped": 0,
+        }
+
+    @property
+    def pending_count(self) -> int:
+        """반영 대기 중인 항목 수"""
+        return (
+            len(self._run_logs)
+            + len(self._channel_updates)
+            + len(self._stats_deltas)
+            + len(self._checkpoints)
+        )
+
+    # ============ 수명 주기 ============
+
+    def start(self):
+        """주기적 flush 시작 (이미 실행 중이면 무시)"""
+        if (
+            self._task is None
+            or self._task.done()
+            or self._task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """주기적 flush 중지 후 남은 항목 모두 반영"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"쓰기 버퍼 flush 오류: {e}")
+
+    # ============ 쓰기 요청 ============
+
+    async def add_run_log(self, log: Dict[str, Any]):
+        """
+        실행 로그 쓰기 요청 (id 기준으로 합쳐짐)
+
+        Args:
+            log: id와 NOT NULL 컬럼(channel_id, status)을 포함한 행.
+                 이미 반영된 행도 다시 upsert되므로 항상 전체 행을 전달해야 함.
+        """
+        self._merge(self._run_logs, log["id"], log)
+        await self._after_add()
+
+    async def add_channel_update(self, channel_id: str, data: Dict[str, Any]):
+        """
+        채널 실행 상태 수정 요청 (채널별로 합쳐짐)
+
+        Args:
+            data: last_run_at, last_run_status, status 중 일부
+        """
+        self._merge(self._channel_updates, channel_id, data)
+        await self._after_add()
+
+    async def add_run_stats(
+        self,
+        run_date: str,
+        channel_id: str,
+        group_id: str,
+        status: str,
+        run_count: int,
+        duration_seconds: int = 0,
+    ):
+        """
+        일별 실행 통계 롤업 증분 요청 (같은 키끼리 더해짐)
+
+        Args:
+            run_date: 실행 시작일 (UTC, YYYY-MM-DD)
+            run_count: 실행 횟수 증분 (음수 가능)
+            duration_seconds: 소요 시간 증분
+        """
+        key = (run_date, channel_id, group_id, status)
+        self._add_counts(
+            self._stats_deltas,
+            key,
+            {"run_count": run_count, "total_duration_seconds": duration_seconds},
+        )
+        await self._after_add()
+
+    async def add_stage_checkpoint(self, checkpoint: Dict[str, Any]):
+        """
+        단계 체크포인트 쓰기 요청 ((run_log_id, stage) 기준으로 합쳐짐)
+
+        Args:
+            checkpoint: run_log_id, stage, kind, artifact_path, size_bytes, host
+        """
+        self._merge(self._checkpoints, (checkpoint["run_log_id"], checkpoint["stage"]), checkpoint)
+        await self._after_add()
+
+    @staticmethod
+    def _merge(pending: Dict, key, data: Dict[str, Any]):
+        """마지막 값 우선 병합"""
+        pending[key] = {**pending.get(key, {}), **data}
+
+    @staticmethod
+    def _add_counts(pending: Dict, key, data: Dict[str, int]):
+        """증분 합산 병합"""
+        current = pending.get(key, {})
+        pending[key] = {name: current.get(name, 0) + value for name, value in data.items()}
+
+    async def _after_add(self):
+        self.stats["writes_requested"] += 1
+        self.start()
+        if self.pending_count >= self.max_pending:
+            await self.flush()
+
+    # ============ 반영 ============
+
+    async def flush(self):
+        """대기 중인 항목을 DB에 일괄 반영"""
+        async with self._flush_lock:
+            run_logs, self._run_logs = self._run_logs, {}
+            channel_updates, self._channel_updates = self._channel_updates, {}
+            stats_deltas, self._stats_deltas = self._stats_deltas, {}
+            checkpoints, self._checkpoints = self._checkpoints, {}
+            if not run_logs and not channel_updates and not stats_deltas and not checkpoints:
+                return
+
+            self.stats["flushes"] += 1
+
+            if run_logs:
+                await self._write(
+                    "run_log",
+                    run_logs,
+                    lambda rows: upsert_run_logs(list(rows.values())),
+                    self._run_logs,
+                    self._merge,
+                )
+            if channel_updates:
+                await self._write(
+                    "channel",
+                    channel_updates,
+                    lambda rows: bulk_update_channel_runs(
+                        [{"id": key, **data} for key, data in rows.items()]
+                    ),
+                    self._channel_updates,
+                    self._merge,
+                )
+            # 롤업은 run_logs와 같은 flush에서 반영해 통계와 로그의 차이를 최소화
+            if stats_deltas:
+                await self._write(
+                    "run_stats",
+                    stats_deltas,
+                    lambda rows: bump_run_stats_daily([
+                        {
+                            "date": run_date,
+                            "channel_id": channel_id,
+                            "group_id": group_id,
+                            "status": status,
+                            **counts,
+                        }
+                        for (run_date, channel_id, group_id, status), counts in rows.items()
+                        if any(counts.values())
+                    ]),
+                    self._stats_deltas,
+                    self._add_counts,
+                )
+            # 체크포인트는 실행 로그를 참조(FK)하므로 실행 로그 다음에 반영
+            if checkpoints:
+                await self._write(
+                    "checkpoint",
+                    checkpoints,
+                    lambda rows: upsert_stage_checkpoints(list(rows.values())),
+                    self._checkpoints,
+                    self._merge,
+                )
+
+    async def _write(self, kind: str, rows: Dict, write, pending: Dict, merge):
+        """
+        일괄 쓰기 → 실패 시 행 단위 재시도 → 그래도 실패한 행은 다음 flush로 이월
+
+        같은 행이 max_attempts번 실패하면 버림 (FK 위반 등 영구 오류로 간주)
+
+        Args:
+            merge: 이월 시 그 사이 새로 들어온 값과 합치는 방식 (_merge 또는 _add_counts)
+        """
+        try:
+            await write(rows)
+            self.stats["rows_written"] += len(rows)
+            for key in rows:
+                self._attempts.pop((kind, key), None)
+            return
+        except Exception as e:
+            self.stats["failed_flushes"] += 1
+            logger.warning(f"쓰기 버퍼 일괄 반영 실패 ({kind} {len(rows)}건), 행 단위 재시도: {e}")
+
+        for key, data in rows.items():
+            try:
+                await write({key: data})
+                self.stats["rows_written"] += 1
+                self._attempts.pop((kind, key), None)
+            except Exception as e:
+                attempts = self._attempts.get((kind, key), 0) + 1
+                if attempts >= self.max_attempts:
+                    self._attempts.pop((kind, key), None)
+                    self.stats["dropped"] += 1
+                    logger.error(f"쓰기 버퍼 항목 폐기 ({kind} {key}, {attempts}회 실패): {e}")
+                    continue
+                self._attempts[(kind, key)] = attempts
+                # 이월된 값 위에 이후 들어온 값을 다시 병합
+                newer = pending.pop(key, None)
+                pending[key] = data
+                if newer is not None:
+                    merge(pending, key, newer)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """버퍼 통계 반환"""
+        return {
+            **self.stats,
+            "pending": self.pending_count,
+            "max_pending": self.max_pending,
+            "flush_interval": self.flush_interval,
+        }
+
+
+# 전역 쓰기 버퍼 인스턴스
+write_buffer = WriteBuffer(
+    flush_interval=settings.write_buffer_flush_interval,
+    max_pending=settings.write_buffer_max_pending,
+)
@@ -4,6 +4,15 @@ Pytest 설정 및 공통 Fixture
 
 import os
 import sys
+import tempfile
+
+# 기본은 메모리 백엔드 + 합성 데이터 (외부 DB 없이 실행)
+# 실제 DB로 테스트하려면 DB_BACKEND=supabase|postgres 를 지정
+os.environ.setdefault("DB_BACKEND", "memory")
+os.environ.setdefault("MEMORY_DB_SEED", "true")
+# 워커 결과물(체크포인트, 생성 결과물 캐시)은 테스트 실행마다 새 임시 디렉터리에 저장
+os.environ.setdefault("CHECKPOINT_DIR", tempfile.mkdtemp(prefix="automation_hub_checkpoints_"))
+os.environ.setdefault("ARTIFACT_CACHE_DIR", tempfile.mkdtemp(prefix="automation_hub_artifact_cache_"))
 
 # .env 파일 로드 (main import 전에 실행되어야 함)
 from dotenv import load_dotenv
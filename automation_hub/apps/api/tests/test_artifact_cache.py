@@ -0,0 +1,186 @@
+"""
+생성 결과물 캐시 (content-addressed, LRU) 테스트
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from services.artifact_cache import ArtifactCache, cache_key
+from workers import base
+from workers.naver_blog.worker import NaverBlogWorker
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArtifactCache(str(tmp_path / "cache"), max_bytes=10_000)
+
+
+def _creator(value, calls: list, delay: float = 0.0):
+    async def create():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return value
+    return create
+
+
+def test_cache_key_depends_on_stage_inputs_and_version():
+    """키가 단계 이름/입력/버전에 따라 바뀌고 dict 키 순서와는 무관한지 테스트"""
+    key = cache_key("script", [{"a": 1, "b": 2}], "1")
+    assert key == cache_key("script", [{"b": 2, "a": 1}], "1")
+    assert key != cache_key("thumbnail", [{"a": 1, "b": 2}], "1")
+    assert key != cache_key("script", [{"a": 1, "b": 3}], "1")
+    assert key != cache_key("script", [{"a": 1, "b": 2}], "2")
+
+
+async def test_hit_after_miss_and_stats(cache):
+    """같은 입력은 다시 생성하지 않고, 히트율이 집계되는지 테스트"""
+    calls = []
+    assert await cache.get_or_create("keywords", ["여행"], "1", _creator(["a", "b"], calls)) == (["a", "b"], False)
+    assert await cache.get_or_create("keywords", ["여행"], "1", _creator(["x"], calls)) == (["a", "b"], True)
+    assert await cache.get_or_create("keywords", ["음식"], "1", _creator(["c"], calls)) == (["c"], False)
+    assert calls == [["a", "b"], ["c"]]
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+    assert stats["stages"]["keywords"]["hits"] == 1
+    assert stats["entries"] == 2
+
+
+async def test_file_results_are_copied(cache, tmp_path):
+    """결과 안의 파일은 사본으로 저장되고, 히트 시 새 임시 파일로 돌려주는지 테스트"""
+    image = tmp_path / "image1.jpg"
+    image.write_bytes(b"jpeg-1")
+
+    await cache.get_or_create("images", ["여행"], "1", _creator([str(image)], []))
+    image.write_bytes(b"overwritten")
+
+    copies = []
+    (paths, hit) = await cache.get_or_create("images", ["여행"], "1", _creator([], []), copies=copies)
+    assert hit
+    assert paths[0] != str(image) and paths[0].endswith(".jpg")
+    assert copies == paths
+    with open(paths[0], "rb") as f:
+        assert f.read() == b"jpeg-1"
+
+    await cache.release_copies(copies)
+    assert copies == [] and not os.path.exists(paths[0])
+    assert cache.get_stats()["copies"] == cache.get_stats()["released"] == 1
+
+
+async def test_lru_eviction_by_size(tmp_path):
+    """크기 상한을 넘으면 가장 오래 쓰지 않은 항목부터 제거되는지 테스트"""
+    cache = ArtifactCache(str(tmp_path / "cache"), max_bytes=2_500)
+    body = "x" * 1_000
+    for topic in ("a", "b"):
+        await cache.get_or_create("script", [topic], "1", _creator(body, []))
+    # a를 사용해 b가 가장 오래된 항목이 됨
+    assert (await cache.get_or_create("script", ["a"], "1", _creator("", [])))[1]
+    await cache.get_or_create("script", ["c"], "1", _creator(body, []))
+
+    assert cache.stats["evictions"] == 1
+    assert cache.total_bytes <= 2_500
+    assert (await cache.get_or_create("script", ["a"], "1", _creator("", [])))[1]
+    assert not (await cache.get_or_create("script", ["b"], "1", _creator(body, [])))[1]
+
+    # 새 프로세스(인스턴스)는 디스크에서 색인을 다시 만듦
+    reopened = ArtifactCache(cache.root, max_bytes=2_500)
+    assert (await reopened.get_or_create("script", ["b"], "1", _creator("", [])))[1]
+    assert reopened.get_stats()["entries"] == 2
+
+
+async def test_concurrent_requests_generate_once(cache):
+    """같은 입력을 동시에 요청하면 한 번만 생성하고, 생성이 실패하면 기다리던 요청이 다시 생성하는지 테스트"""
+    calls = []
+    results = await asyncio.gather(*(
+        cache.get_or_create("script", ["여행"], "1", _creator("script", calls, 0.02)) for _ in range(3)
+    ))
+    assert calls == ["script"]
+    assert [hit for _, hit in results] == [False, True, True]
+    assert cache.stats["coalesced"] == 2
+
+    async def broken():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("생성 실패")
+
+    first = asyncio.create_task(cache.get_or_create("script", ["음식"], "1", broken))
+    await asyncio.sleep(0)
+    second = await cache.get_or_create("script", ["음식"], "1", _creator("retry", calls))
+    with pytest.raises(ConnectionError):
+        await first
+    assert second == ("retry", False)
+
+
+async def test_cached_stage_shares_results_between_channels(cache, monkeypatch):
+    """같은 카테고리 채널끼리 키워드/이미지 단계 결과를 재사용하는지 테스트"""
+    monkeypatch.setattr(base, "artifact_cache", cache)
+
+    def worker(channel_id: str, category: str) -> NaverBlogWorker:
+        return NaverBlogWorker({
+            "id": channel_id,
+            "name": channel_id,
+            "type": "naver_blog",
+            "config": {"blog_id": channel_id, "content_category": category},
+        })
+
+    first = worker("c1", "여행")
+    await first.run()
+    assert first.cache_hits == []
+
+    second = worker("c2", "여행")
+    await second.run()
+    assert sorted(second.cache_hits) == ["prepare_images", "research_keywords"]
+    assert sorted(second.stage_report["cache_hits"]) == ["prepare_images", "research_keywords"]
+
+    other = worker("c3", "음식")
+    await other.run()
+    assert other.cache_hits == []
+    assert cache.get_stats()["stages"]["research_keywords"] == {"hits": 1, "misses": 2, "hit_rate": 1 / 3}
+
+
+async def test_cached_stage_file_copies_removed_after_run(cache, monkeypatch, tmp_path):
+    """캐시 히트로 받은 파일 사본이 실행이 끝나면(성공/실패) 삭제되는지 테스트"""
+    monkeypatch.setattr(base, "artifact_cache", cache)
+
+    class ThumbnailWorker(base.BaseWorker):
+        async def validate_config(self) -> bool:
+            return True
+
+        async def run(self):
+            await self.before_run()
+            try:
+                path = await self._render(self.config["title"])
+                with open(path, "rb") as f:
+                    result = {"thumbnail": f.read()}
+                if self.config.get("fail"):
+                    raise RuntimeError("업로드 실패")
+                await self.after_run(result)
+                return path
+            except Exception as e:
+                await self.on_error(e)
+                raise
+
+        @base.cached_stage
+        async def _render(self, title: str) -> str:
+            path = tmp_path / f"{self.channel_id}.jpg"
+            path.write_bytes(title.encode())
+            return str(path)
+
+    def worker(channel_id: str, fail: bool = False):
+        return ThumbnailWorker({
+            "id": channel_id, "name": channel_id, "type": "youtube_shorts",
+            "config": {"title": "같은 제목", "fail": fail},
+        })
+
+    await worker("c1").run()
+    copy = await worker("c2").run()
+    assert not os.path.exists(copy)
+
+    failing = worker("c3", fail=True)
+    with pytest.raises(RuntimeError):
+        await failing.run()
+    assert failing.cache_hits == ["render"] and failing.cache_files == []
+    assert cache.get_stats()["copies"] == cache.get_stats()["released"] == 2
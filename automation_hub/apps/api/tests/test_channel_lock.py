@@ -0,0 +1,159 @@
+"""
+채널 중복 실행 방지 (single-flight) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from core import database
+from core.backends.memory import MemoryBackend
+from services import executor
+from services.channel_lock import ChannelLock
+from services.run_limiter import RunLimiter
+from services.write_buffer import write_buffer
+
+
+class _OverlapWorker:
+    """같은 채널이 겹쳐 실행되었는지 기록하는 테스트 워커"""
+
+    running = {}
+    overlaps = 0
+
+    def __init__(self, channel):
+        self.channel = channel
+
+    async def run(self):
+        channel_id = self.channel["id"]
+        if _OverlapWorker.running.get(channel_id):
+            _OverlapWorker.overlaps += 1
+        _OverlapWorker.running[channel_id] = True
+        await asyncio.sleep(0.05)
+        _OverlapWorker.running[channel_id] = False
+        return {"channel": channel_id}
+
+
+@pytest.fixture
+async def backend(monkeypatch):
+    """채널 3개짜리 그룹이 들어간 메모리 백엔드"""
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=1, channels_per_group=3, run_logs_per_channel=0)
+    previous = database.set_backend(backend)
+    monkeypatch.setattr(executor, "get_worker_for_channel", _OverlapWorker)
+    monkeypatch.setattr(executor, "run_limiter", RunLimiter(0, 0, 0, 0))
+    monkeypatch.setattr(_OverlapWorker, "running", {})
+    monkeypatch.setattr(_OverlapWorker, "overlaps", 0)
+    yield backend
+    await write_buffer.flush()
+    database.set_backend(previous)
+
+
+def _use_lock(monkeypatch, policy: str, wait_timeout: float = 5.0) -> ChannelLock:
+    lock = ChannelLock(policy, wait_timeout=wait_timeout, poll_interval=0.01)
+    monkeypatch.setattr(executor, "channel_lock", lock)
+    return lock
+
+
+async def _statuses(backend: MemoryBackend) -> list:
+    await write_buffer.flush()
+    return sorted(log["status"] for log in await backend.get_run_logs(limit=20))
+
+
+async def test_skip_policy_records_skipped_run(backend, monkeypatch):
+    """skip 정책: 같은 채널 동시 실행 중 하나만 실행되고 나머지는 skipped로 기록되는지 테스트"""
+    lock = _use_lock(monkeypatch, "skip")
+    channel = (await backend.get_all_channels())[0]
+
+    results = await asyncio.gather(*(executor.execute_channel(channel["id"]) for _ in range(3)))
+
+    assert [r["success"] for r in results].count(True) == 1
+    assert [r.get("skipped") for r in results].count(True) == 2
+    assert _OverlapWorker.overlaps == 0
+    assert await _statuses(backend) == ["skipped", "skipped", "success"]
+    assert lock.get_stats()["held"] == 0
+    assert backend.advisory_locks == set()
+
+
+async def test_queue_policy_runs_one_after_another(backend, monkeypatch):
+    """queue 정책: 같은 채널 실행이 겹치지 않고 차례로 모두 실행되는지 테스트"""
+    lock = _use_lock(monkeypatch, "queue")
+    channel = (await backend.get_all_channels())[0]
+
+    results = await asyncio.gather(*(executor.execute_channel(channel["id"]) for _ in range(3)))
+
+    assert all(r["success"] for r in results)
+    assert _OverlapWorker.overlaps == 0
+    assert await _statuses(backend) == ["success"] * 3
+    assert lock.stats["waited"] == 2
+
+
+async def test_group_run_skips_channel_already_running(backend, monkeypatch):
+    """수동 채널 실행 중 그룹 실행이 겹치면 해당 채널만 건너뛰는지 테스트"""
+    _use_lock(monkeypatch, "skip")
+    group = (await backend.get_all_groups())[0]
+    channel = (await backend.get_all_channels(group["id"]))[0]
+
+    manual = asyncio.create_task(executor.execute_channel(channel["id"]))
+    await asyncio.sleep(0.01)
+    result = await executor.execute_group(group["id"])
+    await manual
+
+    assert result["success_count"] == 2
+    assert result["skipped_count"] == 1
+    skipped = [r for r in result["results"] if r.get("skipped")]
+    assert skipped[0]["channel_id"] == channel["id"]
+    assert _OverlapWorker.overlaps == 0
+
+
+async def test_lock_held_by_other_process(backend, monkeypatch):
+    """다른 프로세스가 DB 잠금을 보유하면 skip은 바로, queue는 대기 시간 초과 후 건너뛰는지 테스트"""
+    channel = (await backend.get_all_channels())[0]
+    backend.advisory_locks.add(f"channel_run:{channel['id']}")
+
+    _use_lock(monkeypatch, "skip")
+    assert (await executor.execute_channel(channel["id"]))["skipped"]
+
+    _use_lock(monkeypatch, "queue", wait_timeout=0.05)
+    assert (await executor.execute_channel(channel["id"]))["skipped"]
+
+    # 다른 프로세스가 잠금을 풀면 queue 정책 실행이 이어서 시작
+    lock = _use_lock(monkeypatch, "queue")
+    task = asyncio.create_task(executor.execute_channel(channel["id"]))
+    await asyncio.sleep(0.05)
+    backend.advisory_locks.clear()
+    assert (await task)["success"]
+    assert lock.stats["waited"] == 1
+    assert await _statuses(backend) == ["skipped", "skipped", "success"]
+
+
+async def test_db_lock_is_renewed_while_held(backend, monkeypatch):
+    """실행 중에는 DB 잠금을 주기적으로 연장하고, 잃으면 기록하고 연장을 멈추는지 테스트"""
+    channel = (await backend.get_all_channels())[0]
+    key = f"channel_run:{channel['id']}"
+    renewals = []
+    original = backend.renew_advisory_lock
+
+    async def counting_renew(lock_key):
+        renewals.append(lock_key)
+        return await original(lock_key)
+
+    monkeypatch.setattr(backend, "renew_advisory_lock", counting_renew)
+    lock = ChannelLock("skip", wait_timeout=1, poll_interval=0.01, renew_interval=0.01)
+
+    async with lock.hold(channel["id"]) as acquired:
+        assert acquired
+        await asyncio.sleep(0.06)
+    count = len(renewals)
+    assert count >= 2 and set(renewals) == {key}
+    assert lock.stats["renewed"] == count and lock.stats["lost"] == 0
+    assert key not in backend.advisory_locks
+
+    # 해제 후에는 연장하지 않음
+    await asyncio.sleep(0.03)
+    assert len(renewals) == count
+
+    # 만료되어 다른 프로세스가 가져간 경우 (메모리 백엔드에서는 잠금이 사라진 것으로 표현)
+    async with lock.hold(channel["id"]) as acquired:
+        backend.advisory_locks.discard(key)
+        await asyncio.sleep(0.05)
+    assert lock.stats["lost"] == 1
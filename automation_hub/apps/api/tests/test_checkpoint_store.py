@@ -0,0 +1,199 @@
+"""
+워커 단계 체크포인트 / 실행 이어하기 테스트
+"""
+
+import os
+
+import pytest
+
+from core import database
+from core.backends.memory import MemoryBackend
+from services import executor
+from services.channel_lock import ChannelLock
+from services.checkpoint_store import CheckpointStore
+from services.circuit_breaker import CircuitBreaker
+from services.run_limiter import RunLimiter
+from services.write_buffer import write_buffer
+from workers import base
+from workers.base import BaseWorker
+
+
+class _VideoWorker(BaseWorker):
+    """업로드 단계가 fail_upload인 동안 실패하는 테스트 워커 (단계 호출 횟수 기록)"""
+
+    calls = {}
+    fail_upload = True
+    output_dir = ""
+
+    async def validate_config(self) -> bool:
+        return True
+
+    async def run(self):
+        results = await self.run_stages([
+            {"name": "idea", "func": self._idea},
+            {"name": "video", "func": self._video, "after": ["idea"]},
+            {"name": "upload", "func": self._upload, "after": ["video", "idea"]},
+        ])
+        return {"video_id": results["upload"]}
+
+    def _called(self, stage: str):
+        _VideoWorker.calls[stage] = _VideoWorker.calls.get(stage, 0) + 1
+
+    async def _idea(self):
+        self._called("idea")
+        return {"title": "제목", "tags": ["a", "b"]}
+
+    async def _video(self, idea):
+        self._called("video")
+        # 매 실행 같은 경로를 덮어쓰는 결과 파일
+        path = os.path.join(_VideoWorker.output_dir, "video.mp4")
+        with open(path, "w") as f:
+            f.write(f"video:{idea['title']}:{_VideoWorker.calls['video']}")
+        return path
+
+    async def _upload(self, video_path, idea):
+        self._called("upload")
+        if _VideoWorker.fail_upload:
+            raise ConnectionError("업로드 실패")
+        with open(video_path) as f:
+            return f"{f.read()}|{idea['title']}"
+
+
+@pytest.fixture
+async def backend():
+    """채널 1개짜리 메모리 백엔드"""
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=1, channels_per_group=1, run_logs_per_channel=0)
+    previous = database.set_backend(backend)
+    yield backend
+    await write_buffer.flush()
+    database.set_backend(previous)
+
+
+@pytest.fixture
+def store(backend, tmp_path, monkeypatch):
+    """임시 디렉터리 체크포인트 저장소"""
+    store = CheckpointStore(str(tmp_path / "checkpoints"), retention_hours=1)
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    monkeypatch.setattr(base, "checkpoint_store", store)
+    monkeypatch.setattr(executor, "checkpoint_store", store)
+    monkeypatch.setattr(executor, "get_worker_for_channel", _VideoWorker)
+    monkeypatch.setattr(executor, "run_limiter", RunLimiter(0, 0, 0, 0))
+    monkeypatch.setattr(executor, "channel_lock", ChannelLock("skip", 0, 0))
+    monkeypatch.setattr(executor, "circuit_breaker", CircuitBreaker(0, 0))
+    monkeypatch.setattr(_VideoWorker, "calls", {})
+    monkeypatch.setattr(_VideoWorker, "fail_upload", True)
+    monkeypatch.setattr(_VideoWorker, "output_dir", str(output_dir))
+    return store
+
+
+async def _failed_run(backend: MemoryBackend) -> dict:
+    """업로드에서 실패한 실행 1회 → 실행 로그"""
+    channel = (await backend.get_all_channels())[0]
+    result = await executor.execute_channel(channel["id"])
+    assert result["success"] is False
+    await write_buffer.flush()
+    return (await backend.get_run_logs(limit=1))[0]
+
+
+async def test_resume_skips_completed_stages(backend, store):
+    """이어하기 실행이 완료된 단계를 다시 실행하지 않고 저장된 결과(파일 사본 포함)를 쓰는지 테스트"""
+    failed = await _failed_run(backend)
+    checkpoints = await backend.get_stage_checkpoints(failed["id"])
+    assert {c["stage"]: c["kind"] for c in checkpoints} == {"idea": "value", "video": "file"}
+
+    # 다른 실행이 같은 경로의 결과 파일을 덮어써도 사본을 씀
+    with open(os.path.join(_VideoWorker.output_dir, "video.mp4"), "w") as f:
+        f.write("overwritten")
+
+    _VideoWorker.fail_upload = False
+    result = await executor.execute_resume(failed["id"])
+
+    assert result["success"] is True
+    assert result["result"]["video_id"] == "video:제목:1|제목"
+    assert _VideoWorker.calls == {"idea": 1, "video": 1, "upload": 2}
+
+    await write_buffer.flush()
+    resumed = (await backend.get_run_logs(limit=1))[0]
+    assert resumed["resumed_from"] == failed["id"]
+    assert resumed["result"]["stages"]["restored"] == ["idea", "video"]
+    # 성공한 실행의 결과물은 삭제
+    assert store.stats["discarded"] == 3
+    assert os.listdir(store.root) == []
+
+
+async def test_resume_chain_and_missing_artifacts(backend, store):
+    """결과물이 없는 단계와 그 뒤 단계는 다시 실행하고, 다시 실패한 이어하기 실행에서 또 이어할 수 있는지 테스트"""
+    failed = await _failed_run(backend)
+    os.remove(os.path.join(store.root, failed["id"], "idea.json"))
+
+    # idea를 다시 실행하므로 결과가 남아 있는 video도 다시 실행
+    assert (await executor.execute_resume(failed["id"]))["success"] is False
+    assert _VideoWorker.calls == {"idea": 2, "video": 2, "upload": 2}
+
+    await write_buffer.flush()
+    second = (await backend.get_run_logs(limit=1))[0]
+    assert second["resumed_from"] == failed["id"]
+
+    _VideoWorker.fail_upload = False
+    assert (await executor.execute_resume(second["id"]))["success"] is True
+    assert _VideoWorker.calls == {"idea": 2, "video": 2, "upload": 3}
+
+
+async def test_only_failed_or_cancelled_runs_resume(backend, store):
+    """성공한 실행이나 없는 실행 로그는 이어하지 않는지 테스트"""
+    _VideoWorker.fail_upload = False
+    channel = (await backend.get_all_channels())[0]
+    assert (await executor.execute_channel(channel["id"]))["success"] is True
+    await write_buffer.flush()
+    succeeded = (await backend.get_run_logs(limit=1))[0]
+
+    result = await executor.execute_resume(succeeded["id"])
+    assert result["success"] is False
+    assert "success" in result["error"]
+    assert (await executor.execute_resume("00000000-0000-0000-0000-000000000000"))["success"] is False
+    assert _VideoWorker.calls == {"idea": 1, "video": 1, "upload": 1}
+
+
+async def test_unserializable_result_is_not_saved(backend, store):
+    """JSON으로 저장할 수 없는 결과는 체크포인트를 남기지 않는지 테스트"""
+    failed = await _failed_run(backend)
+
+    assert await store.save(failed["id"], "extra", object()) is None
+    assert store.stats["unsaved"] == 1
+    assert not os.path.exists(os.path.join(store.root, failed["id"], "extra.json"))
+
+    restored = await store.load(failed["id"])
+    assert restored["idea"]["value"] == {"title": "제목", "tags": ["a", "b"]}
+    assert set(restored) == {"idea", "video"}
+
+
+def test_resume_endpoint_enqueues_resume_job(client):
+    """이어하기 API가 실패한 실행만 resume 작업으로 큐에 넣는지 테스트"""
+    logs = client.get("/api/stats/logs", params={"limit": 200}).json()
+    failed = next(log for log in logs if log["status"] == "failed")
+    succeeded = next(log for log in logs if log["status"] == "success")
+
+    assert client.post(f"/api/run/resume/{failed['id']}").status_code == 200
+    jobs = client.get("/api/jobs", params={"status": "queued"}).json()
+    assert any(job["job_type"] == "resume" and job["target_id"] == failed["id"] for job in jobs)
+
+    assert client.post(f"/api/run/resume/{succeeded['id']}").status_code == 400
+    assert client.post("/api/run/resume/00000000-0000-0000-0000-000000000000").status_code == 404
+
+
+def test_resume_endpoint_returns_404_for_deleted_channel(client, monkeypatch):
+    """채널이 삭제된 실행을 이어하려 하면 404를 반환하는지 테스트"""
+    from routers import run as run_router
+
+    logs = client.get("/api/stats/logs", params={"limit": 200}).json()
+    failed = next(log for log in logs if log["status"] == "failed")
+
+    async def deleted_channel(channel_id):
+        return None
+
+    monkeypatch.setattr(run_router, "get_channel_by_id", deleted_channel)
+    response = client.post(f"/api/run/resume/{failed['id']}")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "채널을 찾을 수 없습니다"
@@ -0,0 +1,153 @@
+"""
+단계 재시도 / 플랫폼 서킷 브레이커 테스트
+"""
+
+import pytest
+
+from core import database
+from core.backends.memory import MemoryBackend
+from services import executor
+from services.channel_lock import ChannelLock
+from services.circuit_breaker import CircuitBreaker
+from services.run_limiter import RunLimiter
+from services.write_buffer import write_buffer
+from workers.base import BaseWorker, StageFailed, backoff_delay, retry_stage
+
+
+class _FlakyWorker(BaseWorker):
+    """업로드 단계가 failures번 실패한 뒤 성공하는 테스트 워커"""
+
+    failures = 0
+    calls = 0
+
+    async def validate_config(self) -> bool:
+        return True
+
+    async def run(self):
+        return {"post_id": await self._upload()}
+
+    @retry_stage(attempts=3, base_delay=0.01, max_delay=0.01)
+    async def _upload(self) -> str:
+        _FlakyWorker.calls += 1
+        if _FlakyWorker.calls <= _FlakyWorker.failures:
+            raise ConnectionError("플랫폼 응답 없음")
+        return "post"
+
+
+def test_backoff_delay_grows_and_caps():
+    """재시도 대기 상한이 실패마다 2배로 늘고 max_delay를 넘지 않는지 테스트"""
+    for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (6, 10.0)]:
+        delays = [backoff_delay(attempt, 1.0, 10.0) for _ in range(200)]
+        assert all(0 <= d <= ceiling for d in delays)
+        assert max(delays) > ceiling / 2
+
+
+async def test_retry_stage(monkeypatch):
+    """일시 실패는 재시도로 성공하고, 모두 실패하면 StageFailed가 나는지 테스트"""
+    worker = _FlakyWorker({"id": "c1", "name": "채널", "type": "naver_blog"})
+
+    monkeypatch.setattr(_FlakyWorker, "calls", 0)
+    monkeypatch.setattr(_FlakyWorker, "failures", 2)
+    assert await worker.run() == {"post_id": "post"}
+    assert _FlakyWorker.calls == 3
+
+    monkeypatch.setattr(_FlakyWorker, "calls", 0)
+    monkeypatch.setattr(_FlakyWorker, "failures", 5)
+    with pytest.raises(StageFailed) as error:
+        await worker.run()
+    assert error.value.stage == "upload"
+    assert error.value.attempts == 3
+    assert isinstance(error.value.error, ConnectionError)
+
+
+def test_circuit_breaker_states(monkeypatch):
+    """연속 실패로 차단되고, 시험 실행 결과에 따라 복구/재차단되는지 테스트"""
+    now = [100.0]
+    monkeypatch.setattr("services.circuit_breaker.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+
+    for _ in range(2):
+        breaker.record(breaker.acquire("youtube_shorts"), False, "503")
+    assert breaker.acquire("youtube_shorts") is None
+    # 다른 플랫폼은 영향 없음
+    assert breaker.acquire("naver_blog") is not None
+
+    # 복구 대기 후 시험 실행 1개만 허용, 실패하면 다시 차단
+    now[0] += 31
+    probe = breaker.acquire("youtube_shorts")
+    assert probe["probe"]
+    assert breaker.acquire("youtube_shorts") is None
+    breaker.record(probe, False, "503")
+    assert breaker.acquire("youtube_shorts") is None
+
+    # 시험 실행이 결과 없이 끝나면(취소 등) 다음 실행을 다시 시험
+    now[0] += 31
+    breaker.record(breaker.acquire("youtube_shorts"), None)
+    probe = breaker.acquire("youtube_shorts")
+    breaker.record(probe, True)
+
+    stats = breaker.get_stats()["circuits"]["youtube_shorts"]
+    assert stats["state"] == "closed"
+    assert stats["failures"] == 0
+    assert stats["trips"] == 2
+    assert stats["rejected"] == 3
+
+
+@pytest.fixture
+async def backend(monkeypatch):
+    """채널 6개짜리 그룹이 들어간 메모리 백엔드"""
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=1, channels_per_group=6, run_logs_per_channel=0)
+    previous = database.set_backend(backend)
+    monkeypatch.setattr(executor, "get_worker_for_channel", _FlakyWorker)
+    monkeypatch.setattr(executor, "run_limiter", RunLimiter(0, 1, 0, 0))
+    monkeypatch.setattr(executor, "channel_lock", ChannelLock("skip", 0, 0))
+    monkeypatch.setattr(_FlakyWorker, "calls", 0)
+    yield backend
+    await write_buffer.flush()
+    database.set_backend(previous)
+
+
+async def test_open_circuit_short_circuits_group(backend, monkeypatch):
+    """플랫폼 장애 시 서킷이 열린 뒤 남은 채널은 건너뛰고 채널 상태는 error가 되지 않는지 테스트"""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    monkeypatch.setattr(executor, "circuit_breaker", breaker)
+    monkeypatch.setattr(_FlakyWorker, "failures", 100)
+    group = (await backend.get_all_groups())[0]
+
+    # 그룹 슬롯 1개 → 채널이 차례로 실행
+    result = await executor.execute_group(group["id"])
+    await write_buffer.flush()
+
+    assert [r.get("platform_error") for r in result["results"]].count(True) == 2
+    assert result["skipped_count"] == 4
+    # 실패한 2개 채널만 재시도 (3회씩)
+    assert _FlakyWorker.calls == 6
+
+    channel_type = (await backend.get_all_channels())[0]["type"]
+    assert breaker.get_stats()["circuits"][channel_type]["state"] == "open"
+    assert all(c["status"] == "active" for c in await backend.get_all_channels())
+    statuses = sorted(log["status"] for log in await backend.get_run_logs(limit=10))
+    assert statuses == ["failed"] * 2 + ["skipped"] * 4
+
+
+async def test_config_errors_do_not_trip_circuit(backend, monkeypatch):
+    """플랫폼과 무관한 실패(설정 오류)는 서킷에 집계되지 않는지 테스트"""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    monkeypatch.setattr(executor, "circuit_breaker", breaker)
+
+    class _BadConfigWorker(_FlakyWorker):
+        async def run(self):
+            raise ValueError("설정이 유효하지 않습니다")
+
+    monkeypatch.setattr(executor, "get_worker_for_channel", _BadConfigWorker)
+    channel = (await backend.get_all_channels())[0]
+
+    for _ in range(2):
+        result = await executor.execute_channel(channel["id"])
+        assert result["success"] is False
+        assert result["platform_error"] is False
+    assert breaker.get_stats()["circuits"][channel["type"]]["state"] == "closed"
+
+    await write_buffer.flush()
+    assert (await backend.get_channel_by_id(channel["id"]))["status"] == "error"
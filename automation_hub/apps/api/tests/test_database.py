@@ -0,0 +1,189 @@
+"""
+데이터베이스 계층 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.backends.supabase import SupabaseBackend
+
+
+class SlowQuery:
+    """execute() 호출 시 블로킹하는 가짜 쿼리"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def execute(self):
+        time.sleep(self.latency)
+        return self.latency
+
+
+async def test_execute_does_not_block_event_loop():
+    """동기 쿼리가 이벤트 루프를 막지 않고 동시에 실행되는지 테스트"""
+    backend = SupabaseBackend("https://test.supabase.co", "test-key", max_workers=10)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(backend._execute(SlowQuery(0.2)) for _ in range(5)))
+    elapsed = time.perf_counter() - started
+    await backend.close()
+
+    assert results == [0.2] * 5
+    # 순차 실행(1.0초)보다 훨씬 빨라야 함
+    assert elapsed < 0.6
+
+
+def test_ttl_cache_hit_miss_and_invalidate():
+    """TTL 캐시 히트/미스 집계 및 무효화 테스트"""
+    from core.cache import TTLCache
+
+    cache = TTLCache("test", ttl_seconds=60, max_size=2)
+    assert cache.get("a") is None
+
+    cache.set("a", {"id": "a"})
+    assert cache.get("a") == {"id": "a"}
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_ttl_cache_size_limit_and_expiry():
+    """최대 크기 초과 시 LRU 제거 및 TTL 만료 테스트"""
+    from core.cache import TTLCache
+
+    cache = TTLCache("test", ttl_seconds=60, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.set("c", 3)  # 가장 오래된 b 제거
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    expired = TTLCache("expired", ttl_seconds=0.01, max_size=10)
+    expired.set("a", 1)
+    time.sleep(0.02)
+    assert expired.get("a") is None
+
+
+async def test_iter_run_logs_walks_pages_with_keyset_cursor(monkeypatch):
+    """iter_run_logs가 직전 페이지 마지막 행을 커서로 다음 페이지를 조회하는지 테스트"""
+    import core.database as database
+
+    logs = [{"started_at": f"2024-01-01T00:00:{59 - i:02d}", "id": f"log-{i}"} for i in range(5)]
+    calls = []
+
+    async def fake_get_run_logs(channel_id, limit, after, started_from, started_to):
+        calls.append(after)
+        start = 0 if after is None else next(i for i, l in enumerate(logs) if l["id"] == after[1]) + 1
+        return logs[start:start + limit]
+
+    monkeypatch.setattr(database, "get_run_logs", fake_get_run_logs)
+    rows = [row async for row in database.iter_run_logs(page_size=2)]
+
+    assert rows == logs
+    assert calls == [
+        None,
+        ("2024-01-01T00:00:58", "log-1"),
+        ("2024-01-01T00:00:56", "log-3"),
+    ]
+
+
+def test_postgres_backend_row_conversion():
+    """Postgres 백엔드가 Supabase 응답과 같은 형태로 값을 변환하는지 테스트"""
+    import uuid
+    from datetime import datetime, timezone
+    from decimal import Decimal
+
+    from core.backends.postgres import _column_list, _to_json_value
+
+    row_id = uuid.uuid4()
+    assert _to_json_value(row_id) == str(row_id)
+    assert _to_json_value(datetime(2024, 1, 1, tzinfo=timezone.utc)) == "2024-01-01T00:00:00+00:00"
+    assert _to_json_value(Decimal("3")) == 3
+
+    assert _column_list(["name", "last_run_at"]) == '"name", "last_run_at"'
+    with pytest.raises(ValueError):
+        _column_list(['name"; DROP TABLE channels; --'])
+
+
+def test_create_backend_requires_database_url_for_postgres():
+    """postgres 백엔드 선택 시 DATABASE_URL이 없으면 오류"""
+    from core.backends import create_backend
+    from core.config import Settings
+
+    with pytest.raises(ValueError):
+        create_backend(Settings(db_backend="postgres", database_url=""))
+
+
+async def test_execute_all_pages_have_unique_order(monkeypatch):
+    """created_at이 같은 행이 많아도 페이지 경계에서 중복/누락 없이 모두 조회하는지 테스트"""
+    import random
+    from types import SimpleNamespace
+
+    backend = SupabaseBackend("https://test.supabase.co", "test-key", max_workers=1)
+    rows = [{"id": f"channel-{i:02d}", "created_at": "2024-01-01T00:00:00", "groups": {}} for i in range(25)]
+    shuffle = random.Random(0)
+
+    async def fake_execute(query):
+        # PostgREST처럼 정렬 열이 같은 행끼리의 순서는 요청마다 달라질 수 있음
+        params = query.request.params
+        keys = [order.split(".")[0] for order in params["order"].split(",")]
+        page = shuffle.sample(rows, len(rows))
+        page.sort(key=lambda row: [row[key] for key in keys])
+        offset, limit = int(params["offset"]), int(params["limit"])
+        return SimpleNamespace(data=[dict(row) for row in page[offset:offset + limit]])
+
+    monkeypatch.setattr(backend, "_execute", fake_execute)
+    monkeypatch.setattr(
+        backend, "_execute_all",
+        lambda build_query, page_size=1000: SupabaseBackend._execute_all(backend, build_query, page_size=10),
+    )
+    channels = await backend.get_channels_by_platform("platform-1")
+
+    assert [channel["id"] for channel in channels] == [row["id"] for row in rows]
+    assert all("groups" not in channel for channel in channels)
+
+
+async def test_setting_prefix_is_not_a_like_pattern(monkeypatch):
+    """prefix의 _/%가 와일드카드로 쓰이지 않고 모든 백엔드에서 같은 키만 조회하는지 테스트"""
+    import re
+    from types import SimpleNamespace
+    from core.backends.memory import MemoryBackend
+
+    settings_rows = {
+        "rate_limit.openai": {"per_minute": 60},
+        "rateXlimit.foo": 1,
+        "rate_limit_other": 2,
+        "cache_ttl": 300,
+    }
+
+    backend = SupabaseBackend("https://test.supabase.co", "test-key", max_workers=1)
+
+    async def fake_execute(query):
+        # PostgREST like: *와 %는 임의 문자열, _는 한 문자, \는 이스케이프
+        like = query.request.params.get("key", "like.*").removeprefix("like.")
+        regex = "".join(
+            re.escape(token[1]) if token.startswith("\\") else
+            ".*" if token in ("%", "*") else "." if token == "_" else re.escape(token)
+            for token in re.findall(r"\\.|.", like)
+        )
+        rows = [{"key": key, "value": value} for key, value in settings_rows.items() if re.fullmatch(regex, key)]
+        return SimpleNamespace(data=rows)
+
+    monkeypatch.setattr(backend, "_execute", fake_execute)
+    memory = MemoryBackend()
+    for key, value in settings_rows.items():
+        await memory.set_setting_value(key, value)
+
+    for prefix in ("rate_limit.", "rate%"):
+        expected = {key: value for key, value in settings_rows.items() if key.startswith(prefix)}
+        assert await backend.get_setting_values(prefix) == expected
+        assert await memory.get_setting_values(prefix) == expected
+    assert await backend.get_setting_values() == settings_rows
@@ -0,0 +1,212 @@
+"""
+실행기 / 실행 동시성 제한 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core import database
+from core.backends.memory import MemoryBackend
+from services import executor
+from services.run_limiter import RunLimiter
+from services.write_buffer import write_buffer
+from workers.base import BaseWorker
+
+
+async def _peak(limiter: RunLimiter, keys: list, hold: float = 0.02) -> int:
+    """keys[(platform, group_id)]를 동시에 실행했을 때 최대 동시 실행 수"""
+    peak = 0
+
+    async def one(platform, group_id):
+        nonlocal peak
+        async with limiter.slot(platform, group_id):
+            peak = max(peak, limiter.running)
+            await asyncio.sleep(hold)
+
+    await asyncio.gather(*(one(p, g) for p, g in keys))
+    return peak
+
+
+async def test_run_limiter_caps():
+    """전역/그룹/플랫폼 상한이 각각 지켜지는지 테스트"""
+    keys = [("a", "g1")] * 10
+    assert await _peak(RunLimiter(0, 2, 0, 0), keys) == 2
+    assert await _peak(RunLimiter(0, 0, 3, 0), keys) == 3
+    assert await _peak(RunLimiter(4, 0, 0, 0), keys) == 4
+
+    # 그룹/플랫폼이 다르면 전역 상한까지 동시 실행
+    keys = [("a", "g1"), ("b", "g2"), ("c", "g3")] * 3
+    assert await _peak(RunLimiter(5, 1, 1, 0), keys) == 3
+
+
+async def test_run_limiter_paces_starts_per_platform():
+    """같은 플랫폼의 실행 시작 간격이 지켜지는지 테스트"""
+    limiter = RunLimiter(0, 0, 0, start_interval=0.05)
+    starts = {}
+
+    async def one(platform):
+        async with limiter.slot(platform):
+            starts.setdefault(platform, []).append(time.monotonic())
+
+    started = time.monotonic()
+    await asyncio.gather(*(one(p) for p in ["a", "a", "a", "b"]))
+
+    gaps = [b - a for a, b in zip(starts["a"], starts["a"][1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+    # 다른 플랫폼은 기다리지 않음
+    assert starts["b"][0] - started < 0.04
+
+
+class _SlowWorker:
+    def __init__(self, channel):
+        self.channel = channel
+
+    async def run(self):
+        await asyncio.sleep(0.05)
+        if self.channel["name"].endswith("채널 1"):
+            raise RuntimeError("업로드 실패")
+        return {"channel": self.channel["id"]}
+
+
+@pytest.fixture
+async def memory_group(monkeypatch):
+    """채널 6개짜리 그룹이 들어간 메모리 백엔드"""
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=1, channels_per_group=6, run_logs_per_channel=0)
+    previous = database.set_backend(backend)
+    monkeypatch.setattr(executor, "get_worker_for_channel", _SlowWorker)
+    yield backend
+    await write_buffer.flush()
+    database.set_backend(previous)
+
+
+async def test_execute_group_runs_channels_concurrently(memory_group, monkeypatch):
+    """그룹 채널이 상한 내에서 동시에 실행되고 결과가 모두 모이는지 테스트"""
+    limiter = RunLimiter(10, 3, 10, 0)
+    monkeypatch.setattr(executor, "run_limiter", limiter)
+    group = (await memory_group.get_all_groups())[0]
+
+    started = time.monotonic()
+    result = await executor.execute_group(group["id"])
+    elapsed = time.monotonic() - started
+    await write_buffer.flush()
+
+    assert result["executed"] == 6
+    assert result["success_count"] == 5
+    assert {r["channel_id"] for r in result["results"]} == {
+        c["id"] for c in await memory_group.get_all_channels(group["id"])
+    }
+    # 그룹 상한 3 → 0.05초 실행 2번 (순차 실행이면 0.3초 이상)
+    assert 0.1 <= elapsed < 0.25
+    assert limiter.running == 0
+
+    logs = await memory_group.get_run_logs(limit=10)
+    assert sorted(log["status"] for log in logs) == ["failed"] + ["success"] * 5
+
+
+class _StagedWorker(BaseWorker):
+    """단계 사이에서 중지 요청을 확인하는 테스트 워커 (단계당 0.05초)"""
+
+    stages = 10
+
+    async def validate_config(self) -> bool:
+        return True
+
+    async def run(self):
+        await self.before_run()
+        try:
+            for _ in range(self.stages):
+                self.check_stop()
+                await asyncio.sleep(0.05)
+            result = {"stages": self.stages}
+            await self.after_run(result)
+            return result
+        except Exception as e:
+            await self.on_error(e)
+            raise
+
+
+class _StuckWorker(_StagedWorker):
+    """중지 요청을 확인하지 않는 워커"""
+
+    async def run(self):
+        await asyncio.sleep(10)
+        return {}
+
+
+async def _wait_running(count: int):
+    while len(executor.running_runs) < count:
+        await asyncio.sleep(0.005)
+
+
+async def test_cancel_run_stops_worker_at_stage_boundary(memory_group, monkeypatch):
+    """실행 취소 시 다음 단계 경계에서 멈추고 cancelled로 기록되는지 테스트"""
+    monkeypatch.setattr(executor, "get_worker_for_channel", _StagedWorker)
+    channel = (await memory_group.get_all_channels())[0]
+
+    task = asyncio.create_task(executor.execute_channel(channel["id"]))
+    await _wait_running(1)
+    log_id = executor.get_running_runs()[0]["log_id"]
+    assert executor.cancel_run(log_id) is True
+    assert executor.cancel_run(log_id) is False  # 중복 요청 무시
+
+    started = time.monotonic()
+    result = await task
+    assert time.monotonic() - started < 0.1
+    assert result["cancelled"] is True
+    assert executor.running_runs == {}
+
+    await write_buffer.flush()
+    log = (await memory_group.get_run_logs(channel["id"]))[0]
+    assert log["id"] == log_id
+    assert log["status"] == "cancelled"
+    # 취소는 채널 마지막 실행 상태를 바꾸지 않음
+    assert (await memory_group.get_channel_by_id(channel["id"]))["last_run_status"] is None
+
+
+async def test_cancel_run_force_cancels_after_grace(memory_group, monkeypatch):
+    """단계 경계에 도달하지 않는 실행은 유예 시간 후 강제 취소되는지 테스트"""
+    monkeypatch.setattr(executor, "get_worker_for_channel", _StuckWorker)
+    monkeypatch.setattr(executor.settings, "run_cancel_grace_seconds", 0.05)
+    channel = (await memory_group.get_all_channels())[0]
+
+    task = asyncio.create_task(executor.execute_channel(channel["id"]))
+    await _wait_running(1)
+    executor.cancel_run(executor.get_running_runs()[0]["log_id"])
+
+    result = await asyncio.wait_for(task, 1)
+    assert result["cancelled"] is True
+    assert not task.cancelled()
+
+
+async def test_cancel_group_stops_running_and_pending_channels(memory_group, monkeypatch):
+    """그룹 취소 시 실행 중인 채널은 멈추고 남은 채널은 시작하지 않는지 테스트"""
+    monkeypatch.setattr(executor, "get_worker_for_channel", _StagedWorker)
+    monkeypatch.setattr(executor, "run_limiter", RunLimiter(10, 2, 10, 0))
+    group = (await memory_group.get_all_groups())[0]
+
+    task = asyncio.create_task(executor.execute_group(group["id"]))
+    await _wait_running(2)
+    assert executor.cancel_group(group["id"]) == 2
+
+    result = await asyncio.wait_for(task, 1)
+    assert result["cancelled"] is True
+    assert result["executed"] == 2
+    assert all(r["cancelled"] for r in result["results"])
+    assert group["id"] not in executor.stop_requested
+    assert executor.running_groups == {}
+
+
+async def test_cancel_request_ignores_runs_started_later(memory_group, monkeypatch):
+    """취소 요청 이후 시작한 실행은 취소되지 않는지 테스트"""
+    monkeypatch.setattr(executor, "get_worker_for_channel", _StagedWorker)
+    channel = (await memory_group.get_all_channels())[0]
+    request = await memory_group.create_cancel_request({"scope": "all"})
+
+    task = asyncio.create_task(executor.execute_channel(channel["id"]))
+    await _wait_running(1)
+    assert executor.apply_cancel_request(request) == 0
+    executor.cancel_all()
+    assert (await task)["cancelled"] is True
@@ -0,0 +1,222 @@
+"""
+실행 작업 큐 / 작업 워커 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from core import database
+from core.backends.memory import MemoryBackend
+from services import executor
+from services.job_queue import JobWorker, enqueue_channel, enqueue_group
+from services.write_buffer import write_buffer
+
+
+class _FakeWorker:
+    def __init__(self, channel):
+        self.channel = channel
+
+    async def run(self):
+        await asyncio.sleep(0.01)
+        return {"channel": self.channel["id"]}
+
+
+@pytest.fixture
+async def backend(monkeypatch):
+    """채널 2개짜리 그룹이 들어간 메모리 백엔드"""
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=1, channels_per_group=2, run_logs_per_channel=0)
+    previous = database.set_backend(backend)
+    monkeypatch.setattr(executor, "get_worker_for_channel", _FakeWorker)
+    yield backend
+    await write_buffer.flush()
+    database.set_backend(previous)
+
+
+def _worker(worker_id: str = "test:1", concurrency: int = 2) -> JobWorker:
+    return JobWorker(
+        worker_id=worker_id,
+        concurrency=concurrency,
+        poll_interval=0.01,
+        heartbeat_interval=60,
+        stale_timeout=60,
+        retry_delay=60,
+    )
+
+
+async def _drain(worker: JobWorker):
+    """가져온 작업이 모두 끝날 때까지 대기"""
+    while worker.running_count:
+        await asyncio.sleep(0.01)
+
+
+async def test_claim_jobs_does_not_hand_out_same_job_twice(backend):
+    """여러 워커가 동시에 가져가도 작업이 겹치지 않는지 테스트"""
+    channel = (await backend.get_all_channels())[0]
+    for _ in range(5):
+        await enqueue_channel(channel["id"])
+
+    claimed = await asyncio.gather(*(backend.claim_jobs(f"w{i}", 2) for i in range(4)))
+    ids = [job["id"] for jobs in claimed for job in jobs]
+    assert len(ids) == len(set(ids)) == 5
+    assert all(job["status"] == "running" and job["attempts"] == 1 for jobs in claimed for job in jobs)
+
+
+async def test_worker_executes_channel_and_group_jobs(backend):
+    """워커가 채널/그룹 작업을 실행하고 결과를 기록하는지 테스트"""
+    group = (await backend.get_all_groups())[0]
+    channel = (await backend.get_all_channels())[0]
+    channel_job = await enqueue_channel(channel["id"])
+    group_job = await enqueue_group(group["id"], source="schedule")
+
+    worker = _worker()
+    assert await worker.run_once() == 2
+    await _drain(worker)
+    await write_buffer.flush()
+
+    for job in (channel_job, group_job):
+        saved = await backend.get_job_by_id(job["id"])
+        assert saved["status"] == "succeeded"
+        assert saved["finished_at"] is not None
+    assert (await backend.get_job_by_id(group_job["id"]))["result"]["executed"] == 2
+    assert len(await backend.get_run_logs()) == 3
+    assert worker.stats["succeeded"] == 2
+
+
+async def test_worker_retries_then_fails_on_exception(backend, monkeypatch):
+    """실행 중 예외 시 재시도 대기 후 max_attempts에서 실패 처리되는지 테스트"""
+    async def broken(channel_id):
+        raise RuntimeError("DB 연결 끊김")
+
+    monkeypatch.setattr(executor, "execute_channel", broken)
+    channel = (await backend.get_all_channels())[0]
+    job = await backend.enqueue_job({"job_type": "channel", "target_id": channel["id"], "max_attempts": 2})
+
+    worker = _worker()
+    await worker.run_once()
+    await _drain(worker)
+    saved = await backend.get_job_by_id(job["id"])
+    assert saved["status"] == "queued"
+    assert saved["error_message"] == "DB 연결 끊김"
+    # retry_delay 동안은 다시 가져가지 않음
+    assert await worker.run_once() == 0
+
+    await backend.update_job(job["id"], {"run_after": saved["created_at"]})
+    await worker.run_once()
+    await _drain(worker)
+    saved = await backend.get_job_by_id(job["id"])
+    assert saved["status"] == "failed"
+    assert saved["attempts"] == 2
+
+
+async def test_requeue_stale_jobs(backend):
+    """heartbeat가 끊긴 작업이 다시 대기열로 돌아가는지 테스트"""
+    channel = (await backend.get_all_channels())[0]
+    job = await enqueue_channel(channel["id"])
+    await backend.claim_jobs("dead:1", 1)
+
+    assert await backend.requeue_stale_jobs(60) == 0
+    await backend.update_job(job["id"], {"locked_at": "2000-01-01T00:00:00+00:00"})
+    assert await backend.requeue_stale_jobs(60) == 1
+
+    saved = await backend.get_job_by_id(job["id"])
+    assert saved["status"] == "queued"
+    assert saved["locked_by"] is None
+
+
+async def test_worker_stop_waits_for_running_jobs(backend):
+    """stop() 후 실행 중인 작업이 끝난 뒤 run()이 반환되는지 테스트"""
+    channel = (await backend.get_all_channels())[0]
+    job = await enqueue_channel(channel["id"])
+
+    worker = _worker()
+    task = asyncio.create_task(worker.run())
+    while worker.stats["claimed"] == 0:
+        await asyncio.sleep(0.005)
+    worker.stop()
+    await asyncio.wait_for(task, 1)
+
+    assert (await backend.get_job_by_id(job["id"]))["status"] == "succeeded"
+
+
+def test_run_channel_endpoint_enqueues_job(client):
+    """수동 실행 API가 작업을 큐에 넣는지 테스트"""
+    channel_id = client.get("/api/channels").json()[0]["id"]
+
+    response = client.post(f"/api/run/channel/{channel_id}")
+    assert response.status_code == 200
+
+    jobs = client.get("/api/jobs", params={"status": "queued"}).json()
+    assert any(job["target_id"] == channel_id and job["job_type"] == "channel" for job in jobs)
+    job_id = jobs[0]["id"]
+    assert client.get(f"/api/jobs/{job_id}").json()["id"] == job_id
+
+
+async def test_worker_applies_cancel_requests_from_other_processes(backend, monkeypatch):
+    """다른 프로세스(API)가 기록한 취소 요청을 워커가 읽어 실행을 취소하는지 테스트"""
+    class SlowWorker(_FakeWorker):
+        # 단계 경계가 없는 워커: 유예 시간 후 강제 취소
+        def stop(self):
+            pass
+
+        async def run(self):
+            await asyncio.sleep(10)
+
+    monkeypatch.setattr(executor, "get_worker_for_channel", SlowWorker)
+    monkeypatch.setattr(executor.settings, "run_cancel_grace_seconds", 0.01)
+    channel = (await backend.get_all_channels())[0]
+    job = await enqueue_channel(channel["id"])
+
+    worker = _worker()
+    worker.cancel_poll_interval = 0.01
+    task = asyncio.create_task(worker.run())
+    while not executor.running_runs:
+        await asyncio.sleep(0.005)
+
+    # API 프로세스에서 기록한 것처럼 DB에만 요청 추가
+    log_id = next(iter(executor.running_runs))
+    await backend.create_cancel_request({"scope": "run", "target_id": log_id})
+    while worker.running_count:
+        await asyncio.sleep(0.01)
+    worker.stop()
+    await asyncio.wait_for(task, 1)
+
+    saved = await backend.get_job_by_id(job["id"])
+    assert saved["status"] == "cancelled"
+    assert worker.stats["cancelled"] == 1
+
+
+def test_stop_all_endpoint_cancels_queued_jobs(client):
+    """전체 중지 API가 대기 작업을 취소하는지 테스트"""
+    group_id = client.get("/api/groups").json()[0]["id"]
+    client.post(f"/api/run/group/{group_id}")
+
+    response = client.post("/api/stop/all")
+    assert response.status_code == 200
+    assert client.get("/api/jobs", params={"status": "queued"}).json() == []
+    assert client.post(f"/api/stop/group/{group_id}").status_code == 200
+    assert client.get("/api/runs/active").json() == []
+
+
+async def test_cancel_group_cancels_queued_channel_jobs_of_group(backend):
+    """그룹 취소가 그룹 작업과 그 그룹 채널의 채널 작업만 취소하는지 테스트"""
+    from services.job_queue import request_cancel
+
+    group = (await backend.get_all_groups())[0]
+    other_group = await backend.create_group({"platform_id": group["platform_id"], "name": "다른 그룹"})
+    other_channel = await backend.create_channel({
+        "group_id": other_group["id"], "name": "다른 채널", "type": "naver_blog", "config": {},
+    })
+    channels = await backend.get_all_channels(group["id"])
+
+    group_job = await enqueue_group(group["id"])
+    channel_jobs = [await enqueue_channel(channel["id"]) for channel in channels]
+    other_job = await enqueue_channel(other_channel["id"])
+
+    result = await request_cancel("group", group["id"])
+
+    assert result["cancelled_jobs"] == 1 + len(channel_jobs)
+    for job in [group_job, *channel_jobs]:
+        assert (await backend.get_job_by_id(job["id"]))["status"] == "cancelled"
+    assert (await backend.get_job_by_id(other_job["id"]))["status"] == "queued"
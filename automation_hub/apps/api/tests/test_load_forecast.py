@@ -0,0 +1,95 @@
+"""
+스케줄 부하 예측 테스트
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from core import database
+from core.backends.memory import MemoryBackend
+from services.load_forecast import forecast_schedule_load
+from services.scheduler import scheduler, register_schedule
+
+
+@pytest.fixture
+async def backend():
+    """채널 3개(A: 평균 300초, B: 60초, C: 기록 없음)짜리 그룹 1개"""
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=1, channels_per_group=3, run_logs_per_channel=0)
+    channels = sorted(await backend.get_all_channels(), key=lambda c: c["name"])
+    today = datetime.now(timezone.utc).date().isoformat()
+    await backend.bump_run_stats_daily([
+        {"date": today, "channel_id": channels[0]["id"], "group_id": channels[0]["group_id"],
+         "status": "success", "run_count": 1, "total_duration_seconds": 240},
+        {"date": today, "channel_id": channels[0]["id"], "group_id": channels[0]["group_id"],
+         "status": "failed", "run_count": 1, "total_duration_seconds": 360},
+        {"date": today, "channel_id": channels[1]["id"], "group_id": channels[1]["group_id"],
+         "status": "success", "run_count": 1, "total_duration_seconds": 60},
+        # 건너뛴 실행은 평균에 포함하지 않음
+        {"date": today, "channel_id": channels[2]["id"], "group_id": channels[2]["group_id"],
+         "status": "skipped", "run_count": 5, "total_duration_seconds": 0},
+    ])
+    previous = database.set_backend(backend)
+    scheduler.remove_all_jobs()
+    backend.channels = channels
+    yield backend
+    database.set_backend(previous)
+    scheduler.remove_all_jobs()
+
+
+async def test_forecast_weights_runs_by_mean_duration(backend):
+    """분마다 시작 실행 수와 평균 소요 시간으로 계산한 동시 실행 수를 예측하는지 테스트"""
+    a, b, c = backend.channels
+    # 지금부터 2시간 뒤 정각 (24시간 구간에 한 번씩만 포함)
+    hour = (datetime.now(scheduler.timezone).hour + 2) % 24
+    register_schedule("group-schedule", "group", a["group_id"], f"0 {hour} * * *", spread_minutes=0)
+    register_schedule("channel-schedule", "channel", a["id"], f"3 {hour} * * *", spread_minutes=0)
+    register_schedule("unknown-target", "channel", "00000000-0000-0000-0000-000000000000", "* * * * *")
+
+    forecast = await forecast_schedule_load(hours=24)
+
+    # C는 기록이 없어 전체 평균 (600 + 60) / 3 = 220초 → 4분
+    assert forecast["default_duration_seconds"] == 220
+    assert forecast["channels_without_history"] == 1
+    assert forecast["total_runs"] == 4
+
+    by_minute = {bucket["minute"][11:]: bucket for bucket in forecast["buckets"]}
+    concurrent = [by_minute[f"{hour:02d}:{minute:02d}"]["concurrent_runs"] for minute in range(8)]
+    # 그룹: A 5분, B 1분, C 4분 / 채널 스케줄: A가 3분부터 5분
+    assert concurrent == [3, 2, 2, 3, 2, 1, 1, 1]
+    assert len(forecast["buckets"]) == 8
+    assert by_minute[f"{hour:02d}:00"]["runs"] == 3
+    assert by_minute[f"{hour:02d}:00"]["run_seconds"] == 580
+    assert forecast["peak"]["concurrent_runs"] == 3
+    assert forecast["over_limit_minutes"] == 0
+
+
+async def test_forecast_expands_each_cron_once(backend):
+    """분산된 스케줄 수천 개도 cron별로 한 번만 펼치고 오프셋만 더하는지 테스트"""
+    group_id = backend.channels[0]["group_id"]
+    for i in range(2000):
+        register_schedule(f"schedule-{i}", "group", group_id, "0 9 * * *", spread_minutes=60)
+    register_schedule("hourly", "group", group_id, "30 * * * *", spread_minutes=0)
+
+    forecast = await forecast_schedule_load(hours=24)
+
+    assert forecast["distinct_crons"] == 2
+    assert forecast["total_runs"] == 2000 * 3 + 24 * 3
+    assert forecast["peak"]["concurrent_runs"] > forecast["concurrency_limit"]
+    assert forecast["over_limit_minutes"] > 0
+    # 09:00~10:00 사이 분산 시작 + 최대 5분, 매시 30분 실행 + 최대 5분
+    assert all(
+        "09:00" <= bucket["minute"][11:] < "10:05" or "30" <= bucket["minute"][14:] < "35"
+        for bucket in forecast["buckets"]
+    )
+
+
+def test_forecast_endpoint(client):
+    """부하 예측 API 테스트"""
+    response = client.get("/api/schedules/status/forecast", params={"hours": 12, "lookback_days": 7})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["window_hours"] == 12
+    assert data["lookback_days"] == 7
+    assert client.get("/api/schedules/status/forecast", params={"hours": 200}).status_code == 422
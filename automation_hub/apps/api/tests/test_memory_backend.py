@@ -0,0 +1,136 @@
+"""
+메모리 백엔드 테스트
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.backends.memory import MemoryBackend
+
+
+@pytest.fixture
+def seeded():
+    """작은 합성 데이터셋이 들어간 메모리 백엔드"""
+    backend = MemoryBackend()
+    backend.seed(platforms=2, groups_per_platform=2, channels_per_group=3, run_logs_per_channel=5)
+    return backend
+
+
+async def test_seed_creates_hierarchy_and_rollup(seeded):
+    """시드 데이터의 계층 구조와 롤업이 run_logs와 일치하는지 테스트"""
+    platforms = await seeded.get_all_platforms()
+    assert len(platforms) == 2
+    assert len(await seeded.get_all_groups(platforms[0]["id"])) == 2
+    assert len(await seeded.get_channels_by_platform(platforms[0]["id"])) == 6
+    assert len(await seeded.get_active_schedules()) == 4
+
+    today = datetime.now(timezone.utc).date()
+    daily = await seeded.get_daily_run_counts(today - timedelta(days=15), today)
+    assert sum(row["run_count"] for row in daily) == 2 * 2 * 3 * 5
+
+
+async def test_keyset_pagination_walks_all_logs_once(seeded):
+    """(started_at, id) 커서로 모든 로그를 중복/누락 없이 순회하는지 테스트"""
+    seen, after = [], None
+    while True:
+        page = await seeded.get_run_logs(limit=7, after=after)
+        seen.extend(log["id"] for log in page)
+        if len(page) < 7:
+            break
+        after = (page[-1]["started_at"], page[-1]["id"])
+
+    assert len(seen) == len(set(seen)) == len(seeded.tables["run_logs"])
+
+
+async def test_foreign_keys_and_cascade(seeded):
+    """FK 확인과 ON DELETE CASCADE / RESTRICT 동작 테스트"""
+    group = (await seeded.get_all_groups())[0]
+    channel_ids = [c["id"] for c in await seeded.get_all_channels(group["id"])]
+
+    with pytest.raises(ValueError):
+        await seeded.create_channel({"group_id": "missing", "name": "x", "type": "naver_blog"})
+    with pytest.raises(ValueError):
+        await seeded.delete_platform(group["platform_id"])
+
+    await seeded.delete_group(group["id"])
+    assert await seeded.get_channels_by_ids(channel_ids) == []
+    assert all(log["channel_id"] not in channel_ids for log in seeded.tables["run_logs"].values())
+
+
+async def test_returned_rows_are_copies(seeded):
+    """반환된 행을 수정해도 저장된 데이터가 바뀌지 않는지 테스트"""
+    channel = (await seeded.get_all_channels())[0]
+    channel["config"]["changed"] = True
+    assert "changed" not in (await seeded.get_channel_by_id(channel["id"]))["config"]
+
+
+async def test_artificial_latency():
+    """호출마다 설정한 지연이 추가되는지 테스트"""
+    backend = MemoryBackend(latency=0.05)
+    started = time.perf_counter()
+    await backend.get_all_platforms()
+    assert time.perf_counter() - started >= 0.05
+    assert backend.calls == 1
+
+
+async def test_execute_channel_records_run_through_write_buffer():
+    """실행기가 메모리 백엔드에 실행 로그/채널 상태/롤업을 반영하는지 테스트"""
+    from core import database
+    from services.executor import execute_channel
+    from services.write_buffer import write_buffer
+
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=1, channels_per_group=1, run_logs_per_channel=0)
+    previous = database.set_backend(backend)
+    try:
+        channel = (await backend.get_all_channels())[0]
+        result = await execute_channel(channel["id"])
+        await write_buffer.flush()
+    finally:
+        database.set_backend(previous)
+
+    assert result["success"] is True
+    logs = await backend.get_run_logs(channel["id"])
+    assert [log["status"] for log in logs] == ["success"]
+    assert (await backend.get_channel_by_id(channel["id"]))["last_run_status"] == "success"
+
+    today = datetime.now(timezone.utc).date()
+    assert await backend.get_daily_run_counts(today, today) == [
+        {"run_date": today.isoformat(), "status": "success", "run_count": 1}
+    ]
+
+
+async def test_group_counts_follow_channel_current_group(seeded):
+    """채널을 다른 그룹으로 옮기면 그룹별 실행 횟수가 현재 소속 그룹으로 집계되는지 테스트"""
+    today = datetime.now(timezone.utc).date()
+    start = today - timedelta(days=15)
+    channel = (await seeded.get_all_channels())[0]
+    old_group, new_group = channel["group_id"], next(
+        g["id"] for g in await seeded.get_all_groups() if g["id"] != channel["group_id"]
+    )
+    await seeded.update_channel(channel["id"], {"group_id": new_group})
+    # 옮긴 뒤의 실행 (롤업에는 실행 시점의 새 그룹으로 기록)
+    await seeded.bump_run_stats_daily([{
+        "date": today.isoformat(), "channel_id": channel["id"], "group_id": new_group,
+        "status": "success", "run_count": 1, "total_duration_seconds": 10,
+    }])
+
+    def totals(rows, key):
+        result = {}
+        for row in rows:
+            result[row[key]] = result.get(row[key], 0) + row["run_count"]
+        return result
+
+    groups = totals(await seeded.get_group_run_counts(start, today), "group_id")
+    assert groups[old_group] == 2 * 5
+    assert groups[new_group] == 4 * 5 + 1
+
+    channel_rows = [
+        row for row in await seeded.get_channel_run_counts(start, today) if row["channel_id"] == channel["id"]
+    ]
+    assert {row["group_id"] for row in channel_rows} == {new_group}
+    assert sum(row["run_count"] for row in channel_rows) == 6
+    keys = [(row["channel_id"], row["group_id"], row["status"]) for row in channel_rows]
+    assert len(keys) == len(set(keys))
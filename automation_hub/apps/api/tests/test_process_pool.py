@@ -0,0 +1,83 @@
+"""
+CPU 프로세스 풀 / cpu_bound 단계 테스트
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from services.process_pool import ProcessPool, cpu_pool
+from workers.base import cpu_bound
+
+
+def busy_pid(seconds: float) -> int:
+    """seconds 동안 CPU를 점유한 뒤 프로세스 ID 반환"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return os.getpid()
+
+
+def fail(message: str):
+    raise ValueError(message)
+
+
+@cpu_bound
+def write_file(path: str, text: str) -> str:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessPool(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+async def test_runs_in_child_process_without_blocking_loop(pool):
+    """CPU 작업이 하위 프로세스에서 실행되고 이벤트 루프는 계속 동작하는지 테스트"""
+    await pool.run(busy_pid, 0)  # 프로세스 기동 (spawn) 시간 제외
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    pids = await asyncio.gather(*(pool.run(busy_pid, 0.3) for _ in range(3)))
+    task.cancel()
+
+    assert os.getpid() not in pids
+    # 3개 작업 / 프로세스 2개 → 1개는 대기
+    stats = pool.get_stats()
+    assert stats["completed"] == 4
+    assert stats["saturated"] >= 1
+    assert stats["max_queue_wait_seconds"] > 0.1
+    assert stats["busy"] == stats["queued"] == 0
+    # 0.6초 동안 루프가 멈추지 않았음
+    assert ticks >= 20
+
+
+async def test_exception_propagates(pool):
+    """하위 프로세스 예외가 호출자에게 전달되는지 테스트"""
+    with pytest.raises(ValueError, match="합성 실패"):
+        await pool.run(fail, "합성 실패")
+    assert pool.get_stats()["failed"] == 1
+
+
+async def test_cpu_bound_decorator_returns_file_path(tmp_path):
+    """cpu_bound 함수가 전역 풀에서 실행되고 결과를 파일 경로로 돌려주는지 테스트"""
+    completed = cpu_pool.stats["completed"]
+    path = await write_file(str(tmp_path / "out.txt"), "영상")
+
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8") == "영상"
+    assert path == str(tmp_path / "out.txt")
+    assert write_file.cpu_bound is True
+    assert cpu_pool.stats["completed"] == completed + 1
@@ -0,0 +1,93 @@
+"""
+외부 API 속도 제한 (토큰 버킷) 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core import database
+from core.backends.memory import MemoryBackend
+from services.rate_limiter import RateLimiter, _key_id
+
+
+async def _acquire_times(limiter: RateLimiter, count: int, name: str = "openai.chat", api_key: str = "k1") -> list:
+    started = time.monotonic()
+    times = []
+
+    async def one():
+        await limiter.acquire(name, api_key)
+        times.append(time.monotonic() - started)
+
+    await asyncio.gather(*(one() for _ in range(count)))
+    return sorted(times)
+
+
+async def test_burst_then_paced():
+    """버스트만큼 바로 통과한 뒤 분당 호출 수 간격으로 통과하는지 테스트"""
+    # 초당 50회 (0.02초 간격), 버스트 3
+    limiter = RateLimiter({"openai": {"per_minute": 3000, "burst": 3}}, refresh_seconds=0)
+
+    times = await _acquire_times(limiter, 6)
+
+    assert all(t < 0.01 for t in times[:3])
+    assert 0.05 <= times[-1] < 0.1
+    stats = limiter.get_stats()["buckets"]["openai.chat"]
+    assert stats["acquired"] == 6
+    assert stats["waited"] == 3
+    assert stats["max_wait_seconds"] == pytest.approx(0.06, abs=0.01)
+
+
+async def test_buckets_are_separate_per_name_and_key():
+    """API 키/엔드포인트 분류가 다르면 서로 기다리지 않고, 설정 없는 버킷은 제한하지 않는지 테스트"""
+    limiter = RateLimiter(
+        {"openai": {"per_minute": 60, "burst": 1}, "openai.images": {"per_minute": 60, "burst": 1}},
+        refresh_seconds=0,
+    )
+
+    waits = [
+        await limiter.acquire("openai.chat", "k1"),
+        await limiter.acquire("openai.chat", "k2"),
+        await limiter.acquire("openai.images", "k1"),
+        await limiter.acquire("naver.post"),
+        await limiter.acquire("naver.post"),
+    ]
+    assert waits == [0, 0, 0, 0, 0]
+    assert "naver.post" not in limiter.get_stats()["buckets"]
+
+    # 같은 키로 한 번 더 → 1초 대기 필요 (취소하면 토큰 반환)
+    task = asyncio.create_task(limiter.acquire("openai.chat", "k1"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter._buckets[("openai.chat", _key_id("k1"))]["tokens"] > -0.5
+
+
+@pytest.fixture
+async def backend():
+    backend = MemoryBackend()
+    previous = database.set_backend(backend)
+    yield backend
+    database.set_backend(previous)
+
+
+async def test_settings_table_overrides(backend):
+    """settings 테이블의 rate_limit.<버킷> 값이 Settings 기본값을 덮어쓰는지 테스트"""
+    limiter = RateLimiter({"openai": {"per_minute": 60, "burst": 1}}, refresh_seconds=3600)
+    await backend.set_setting_value("rate_limit.openai", {"burst": 5})
+    await backend.set_setting_value("rate_limit.youtube.upload", {"per_minute": 6, "burst": 1})
+    await backend.set_setting_value("openai_model", "gpt-4o")
+
+    assert [await limiter.acquire("openai.chat") for _ in range(5)] == [0] * 5
+    assert limiter.limits == {
+        "openai": {"per_minute": 60, "burst": 5},
+        "youtube.upload": {"per_minute": 6, "burst": 1},
+    }
+
+    # 다음 재조회 전까지는 다시 읽지 않음
+    await backend.set_setting_value("rate_limit.openai", {"burst": 1})
+    calls = backend.calls
+    await limiter.acquire("openai.images")
+    assert backend.calls == calls
@@ -42,3 +42,341 @@ def test_get_scheduler_jobs(client):
     response = client.get("/api/schedules/status/jobs")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+
+@pytest.fixture
+async def schedule_backend():
+    """스케줄만 있는 메모리 백엔드 (테스트 후 스케줄러 Job 정리)"""
+    from core import database
+    from core.backends.memory import MemoryBackend
+    from services.scheduler import scheduler
+
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=3, channels_per_group=1, run_logs_per_channel=0)
+    previous = database.set_backend(backend)
+    scheduler.remove_all_jobs()
+    yield backend
+    database.set_backend(previous)
+    scheduler.remove_all_jobs()
+
+
+async def test_reconcile_registers_active_and_detects_missed_runs(schedule_backend):
+    """시작 시 동기화가 활성 스케줄만 등록하고 중단 중 놓친 실행을 감지하는지 테스트"""
+    from datetime import datetime, timedelta, timezone
+    from services.scheduler import scheduler, reconcile_schedules, register_schedule
+
+    group_id = (await schedule_backend.get_all_groups())[0]["id"]
+    for schedule in await schedule_backend.get_all_schedules():
+        await schedule_backend.delete_schedule(schedule["id"])
+
+    now = datetime.now(timezone.utc)
+    # 3시간 전 마지막 실행 이후 매시 정각 실행 → 놓친 실행 3회
+    hourly = await schedule_backend.create_schedule({
+        "target_type": "group", "target_id": group_id, "cron": "0 * * * *",
+        "last_run_at": (now - timedelta(hours=3, seconds=-1)).isoformat(),
+        "created_at": (now - timedelta(days=1)).isoformat(),
+        "updated_at": (now - timedelta(hours=3, seconds=-1)).isoformat(),
+    })
+    # 방금 수정한 스케줄은 놓친 실행 없음
+    fresh = await schedule_backend.create_schedule({
+        "target_type": "group", "target_id": group_id, "cron": "0 0 1 1 *",
+    })
+    broken = await schedule_backend.create_schedule({
+        "target_type": "group", "target_id": group_id, "cron": "잘못된 cron",
+    })
+    inactive = await schedule_backend.create_schedule({
+        "target_type": "group", "target_id": group_id, "cron": "* * * * *", "is_active": False,
+    })
+    # DB에서 비활성화된 스케줄의 Job이 남아 있으면 제거
+    register_schedule(inactive["id"], "group", group_id, "* * * * *")
+
+    report = await reconcile_schedules()
+
+    assert {job.id for job in scheduler.get_jobs()} == {hourly["id"], fresh["id"]}
+    assert report["registered"] == 2
+    assert report["removed"] == 1
+    assert report["active"] == 3
+    assert [item["schedule_id"] for item in report["failed"]] == [broken["id"]]
+    assert [item["schedule_id"] for item in report["missed"]] == [hourly["id"]]
+    assert report["missed"][0]["missed_count"] == 3
+    assert report["missed_runs"] == 3
+
+
+def test_sync_reports_missed_runs(client):
+    """동기화 후 마지막 동기화 결과를 조회할 수 있는지 테스트"""
+    assert client.post("/api/schedules/sync").status_code == 200
+
+    response = client.get("/api/schedules/status/reconcile")
+    assert response.status_code == 200
+    report = response.json()
+    assert report["registered"] == len(client.get("/api/schedules/status/jobs").json())
+    assert report["missed_runs"] == sum(item["missed_count"] for item in report["missed"])
+
+
+async def test_reconcile_applies_only_changes(schedule_backend):
+    """동기화가 바뀐 스케줄만 다시 등록하고 나머지 Job은 그대로 두는지 테스트"""
+    from services.scheduler import scheduler, reconcile_schedules
+
+    first = await reconcile_schedules()
+    assert first["added"] == first["active"] > 1
+    schedules = await schedule_backend.get_active_schedules()
+    kept, changed, deleted = schedules[0], schedules[1], schedules[-1]
+    kept_job = scheduler.get_job(kept["id"])
+
+    # 실행 기록(last_run_at)만 바뀐 스케줄은 다시 등록하지 않음
+    await schedule_backend.update_schedule(kept["id"], {"last_run_at": "2026-01-01T00:00:00+00:00"})
+    assert (await reconcile_schedules())["unchanged"] == first["active"]
+    assert scheduler.get_job(kept["id"]) is kept_job
+
+    await schedule_backend.update_schedule(changed["id"], {"cron": "*/5 * * * *"})
+    await schedule_backend.update_schedule(deleted["id"], {"is_active": False})
+    report = await reconcile_schedules()
+
+    assert (report["added"], report["rescheduled"], report["removed"]) == (0, 1, 1)
+    assert report["unchanged"] == first["active"] - 2
+    assert scheduler.get_job(kept["id"]) is kept_job
+    assert scheduler.get_job(deleted["id"]) is None
+    assert "minute='*/5'" in str(scheduler.get_job(changed["id"]).trigger)
+
+
+async def test_reconcile_does_not_retry_broken_cron_until_changed(schedule_backend, monkeypatch):
+    """잘못된 cron은 바뀌기 전까지 주기적 동기화마다 다시 등록하지 않는지 테스트"""
+    from services import scheduler as scheduler_module
+
+    schedule = (await schedule_backend.get_active_schedules())[0]
+    await schedule_backend.update_schedule(schedule["id"], {"cron": "잘못된 cron"})
+
+    calls = []
+    register = scheduler_module.register_schedule
+    monkeypatch.setattr(
+        scheduler_module, "register_schedule", lambda *args, **kwargs: calls.append(args) or register(*args, **kwargs)
+    )
+
+    await scheduler_module.reconcile_schedules()
+    registered = len(calls)
+    report = await scheduler_module.reconcile_schedules()
+    assert len(calls) == registered
+    assert [item["schedule_id"] for item in report["failed"]] == [schedule["id"]]
+
+    await schedule_backend.update_schedule(schedule["id"], {"cron": "0 9 * * *"})
+    report = await scheduler_module.reconcile_schedules()
+    assert report["added"] == 1
+    assert report["failed"] == []
+
+
+async def test_periodic_sync_picks_up_new_schedules(schedule_backend):
+    """다른 인스턴스에서 추가한 스케줄이 주기적 동기화로 등록되는지 테스트"""
+    import asyncio
+    from services.scheduler import scheduler, reconcile_schedules, start_schedule_sync, stop_schedule_sync
+
+    await reconcile_schedules()
+    group_id = (await schedule_backend.get_all_groups())[0]["id"]
+    created = await schedule_backend.create_schedule({
+        "target_type": "group", "target_id": group_id, "cron": "30 6 * * *",
+    })
+
+    start_schedule_sync(0.01)
+    try:
+        for _ in range(100):
+            if scheduler.get_job(created["id"]):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await stop_schedule_sync()
+    assert scheduler.get_job(created["id"]) is not None
+
+
+async def test_spread_shifts_same_minute_schedules(schedule_backend):
+    """분산 구간을 주면 같은 cron 시각 스케줄이 스케줄별 고정 오프셋으로 흩어지는지 테스트"""
+    import uuid
+    from datetime import datetime, timedelta, timezone
+    from services.scheduler import (
+        scheduler, register_schedule, spread_offset, get_minute_load, iter_fire_times,
+    )
+
+    schedule_ids = [str(uuid.uuid4()) for _ in range(40)]
+    for schedule_id in schedule_ids:
+        register_schedule(schedule_id, "group", "g", "0 9 * * *", spread_minutes=0)
+    assert get_minute_load(hours=24)["peak"]["jobs"] == 40
+
+    for schedule_id in schedule_ids:
+        register_schedule(schedule_id, "group", "g", "0 9 * * *", spread_minutes=30)
+    load = get_minute_load(hours=24)
+    assert load["fires"] == 40
+    assert load["peak"]["jobs"] < 10
+    assert all("09:00" <= bucket["minute"][11:] < "09:30" for bucket in load["buckets"])
+
+    # 같은 스케줄은 다시 등록해도 매일 같은 시각 (09:00 + 오프셋)
+    offset = spread_offset(schedule_ids[0], 30)
+    assert 0 <= offset < 30 * 60
+    assert offset == spread_offset(schedule_ids[0], 30)
+    now = datetime.now(timezone.utc)
+    fire_times = list(iter_fire_times(scheduler.get_job(schedule_ids[0]).trigger, now, now + timedelta(days=3)))
+    assert len(fire_times) == 3
+    assert {(t.hour, t.minute * 60 + t.second) for t in fire_times} == {(9, offset)}
+
+
+def test_schedule_load_endpoint(client):
+    """분 단위 부하 조회 API 테스트"""
+    response = client.get("/api/schedules/status/load", params={"hours": 48, "top": 5})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["window_hours"] == 48
+    assert len(data["buckets"]) <= 5
+    assert client.get("/api/schedules/status/load", params={"hours": 0}).status_code == 422
+
+
+def test_catch_up_pacer_caps_runs_per_interval():
+    """catch_up 실행이 구간마다 상한만큼만 같은 시각에 배정되는지 테스트"""
+    from datetime import datetime, timedelta, timezone
+    from services.scheduler import CatchUpPacer
+
+    now = datetime.now(timezone.utc)
+    pacer = CatchUpPacer(max_concurrency=2, interval=300)
+    offsets = [(pacer.next_run_after(now) - now).total_seconds() for _ in range(5)]
+    assert offsets == [0, 0, 300, 300, 600]
+
+    # 구간이 지나면 지금부터 다시 배정
+    later = now + timedelta(hours=1)
+    assert pacer.next_run_after(later) == later
+    assert CatchUpPacer(max_concurrency=0, interval=300).next_run_after(now) == now
+
+
+@pytest.fixture
+def misfire_settings(monkeypatch):
+    """유예 60초, catch_up 구간당 1개(600초 간격), 스케줄당 최대 3개"""
+    from core.config import settings
+    from services import scheduler as scheduler_module
+
+    monkeypatch.setattr(settings, "schedule_misfire_grace_seconds", 60)
+    monkeypatch.setattr(settings, "schedule_catch_up_max_runs", 3)
+    monkeypatch.setattr(scheduler_module, "catch_up_pacer", scheduler_module.CatchUpPacer(1, 600))
+    monkeypatch.setattr(scheduler_module, "_trigger_stats", dict.fromkeys(scheduler_module._trigger_stats, 0))
+    monkeypatch.setattr(scheduler_module, "_lateness_samples", scheduler_module.deque(maxlen=100))
+    return scheduler_module
+
+
+@pytest.mark.parametrize("policy, expected_jobs", [("skip", 0), ("coalesce", 1), ("catch_up", 1)])
+async def test_late_trigger_follows_misfire_policy(schedule_backend, misfire_settings, policy, expected_jobs):
+    """유예 시간을 넘긴 트리거를 정책대로 처리하고 지연을 기록하는지 테스트"""
+    from datetime import datetime, timedelta, timezone
+    from collections import deque
+
+    schedule = (await schedule_backend.get_active_schedules())[0]
+    planned = datetime.now(timezone.utc) - timedelta(minutes=10)
+    misfire_settings._planned_run_times[schedule["id"]] = deque([planned])
+
+    await misfire_settings.execute_schedule_job(schedule["id"], "group", schedule["target_id"], policy)
+
+    updated = await schedule_backend.get_schedule_by_id(schedule["id"])
+    assert 600 <= updated["last_lateness_seconds"] < 610
+    assert updated["last_planned_at"] is not None
+    assert (updated["last_run_at"] is not None) == (policy != "skip")
+    assert len(await schedule_backend.get_jobs()) == expected_jobs
+    assert schedule["id"] not in misfire_settings._planned_run_times
+
+    stats = misfire_settings.get_lateness_stats()
+    assert stats["triggered"] == 1
+    assert stats[{"skip": "skipped", "coalesce": "coalesced", "catch_up": "caught_up"}[policy]] == 1
+    assert stats["p95_seconds"] >= 600
+
+
+async def test_startup_catch_up_replays_recent_missed_runs(schedule_backend, misfire_settings, monkeypatch):
+    """서버 중단 중 놓친 실행을 catch_up은 최근 N개까지 나눠서, coalesce는 한 번만 실행하는지 테스트"""
+    from datetime import datetime, timedelta, timezone
+    from core.config import settings
+
+    # 마지막으로 놓친 실행이 유예 시간 안에 들어 결과가 달라지지 않도록
+    monkeypatch.setattr(settings, "schedule_misfire_grace_seconds", 0)
+
+    for schedule in await schedule_backend.get_all_schedules():
+        await schedule_backend.delete_schedule(schedule["id"])
+    group_id = (await schedule_backend.get_all_groups())[0]["id"]
+    five_hours_ago = (datetime.now(timezone.utc) - timedelta(hours=5, seconds=-1)).isoformat()
+    schedules = {}
+    for policy in ("skip", "coalesce", "catch_up"):
+        schedules[policy] = await schedule_backend.create_schedule({
+            "target_type": "group", "target_id": group_id, "cron": "0 * * * *",
+            "misfire_policy": policy, "last_run_at": five_hours_ago,
+            "created_at": five_hours_ago, "updated_at": five_hours_ago,
+        })
+
+    report = await misfire_settings.reconcile_schedules()
+
+    missed = {item["schedule_id"]: item for item in report["missed"]}
+    assert all(item["missed_count"] == 5 for item in missed.values())
+    assert {policy: missed[schedules[policy]["id"]]["enqueued"] for policy in schedules} == {
+        "skip": 0, "coalesce": 1, "catch_up": 3,
+    }
+
+    jobs = [job for job in await schedule_backend.get_jobs(limit=100) if job["schedule_id"] == schedules["catch_up"]["id"]]
+    run_after = sorted(datetime.fromisoformat(job["run_after"]) for job in jobs)
+    assert [round((t - run_after[0]).total_seconds()) for t in run_after] == [0, 600, 1200]
+    stats = misfire_settings.get_lateness_stats()
+    assert (stats["skipped"], stats["coalesced"], stats["caught_up"]) == (5 + 4 + 2, 1, 3)
+
+
+async def test_running_scheduler_passes_planned_time(schedule_backend, misfire_settings):
+    """실행 중인 스케줄러가 늦게 실행한 Job의 예정 시각으로 지연을 계산하는지 테스트"""
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+    from apscheduler.triggers.date import DateTrigger
+
+    scheduler = misfire_settings.scheduler
+    schedule = (await schedule_backend.get_active_schedules())[0]
+    planned = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+    scheduler.start()
+    try:
+        scheduler.add_job(
+            misfire_settings.execute_schedule_job,
+            trigger=DateTrigger(run_date=planned),
+            id=schedule["id"],
+            args=[schedule["id"], "group", schedule["target_id"]],
+            kwargs={"misfire_policy": "coalesce"},
+            misfire_grace_time=None,
+        )
+        for _ in range(100):
+            updated = await schedule_backend.get_schedule_by_id(schedule["id"])
+            if updated["last_lateness_seconds"] is not None:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        scheduler.shutdown(wait=False)
+
+    assert 300 <= updated["last_lateness_seconds"] < 310
+    assert misfire_settings.get_lateness_stats()["coalesced"] == 1
+    assert not misfire_settings._planned_run_times
+
+
+def test_schedule_lateness_endpoint(client):
+    """지연 메트릭 API 테스트"""
+    response = client.get("/api/schedules/status/lateness")
+    assert response.status_code == 200
+    data = response.json()
+    assert {"misfire_grace_seconds", "triggered", "skipped", "coalesced", "caught_up", "catch_up"} <= set(data)
+
+
+async def test_live_catch_up_is_capped_to_recent_runs(schedule_backend, misfire_settings):
+    """실행 중 놓친 실행 시각이 한꺼번에 넘어와도 catch_up은 최근 N개만 실행하는지 테스트"""
+    from datetime import datetime, timedelta, timezone
+    from apscheduler.events import EVENT_JOB_SUBMITTED, JobSubmissionEvent
+
+    schedule = (await schedule_backend.get_active_schedules())[0]
+    now = datetime.now(timezone.utc)
+    # 이벤트 루프 정체로 5회 놓친 뒤 APScheduler가 제출한 것처럼 (coalesce=False면 시각마다 한 번씩 호출)
+    run_times = [now - timedelta(hours=hours) for hours in range(5, 0, -1)]
+    misfire_settings._on_job_submitted(
+        JobSubmissionEvent(EVENT_JOB_SUBMITTED, schedule["id"], "default", run_times)
+    )
+    for _ in run_times:
+        await misfire_settings.execute_schedule_job(schedule["id"], "group", schedule["target_id"], "catch_up")
+
+    assert len(await schedule_backend.get_jobs()) == 3
+    stats = misfire_settings.get_lateness_stats()
+    assert (stats["skipped"], stats["caught_up"], stats["triggered"]) == (2, 3, 3)
+    assert schedule["id"] not in misfire_settings._planned_run_times
+
+    # 가장 최근 예정 시각이 마지막으로 기록됨
+    updated = await schedule_backend.get_schedule_by_id(schedule["id"])
+    assert datetime.fromisoformat(updated["last_planned_at"]) == run_times[-1]
@@ -0,0 +1,141 @@
+"""
+워커 단계 DAG 실행 (run_stages) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from workers.base import BaseWorker, RunCancelled, critical_path
+from workers.naver_blog.worker import NaverBlogWorker
+
+
+class _StageWorker(BaseWorker):
+    async def validate_config(self) -> bool:
+        return True
+
+    async def run(self):
+        return {}
+
+
+def _worker() -> _StageWorker:
+    return _StageWorker({"id": "c1", "name": "채널", "type": "youtube_shorts"})
+
+
+def _sleep_stage(seconds: float, value=None, calls: list = None):
+    async def stage(*args):
+        if calls is not None:
+            calls.append(args)
+        await asyncio.sleep(seconds)
+        return value
+    return stage
+
+
+async def test_independent_stages_overlap_and_report_critical_path():
+    """독립 단계가 동시에 실행되고, 결과 전달 순서와 임계 경로가 맞는지 테스트"""
+    worker = _worker()
+    calls = []
+    results = await worker.run_stages([
+        {"name": "idea", "func": _sleep_stage(0.02, "idea")},
+        {"name": "script", "func": _sleep_stage(0.05, "script"), "after": ["idea"]},
+        {"name": "video", "func": _sleep_stage(0.1, "video"), "after": ["script"]},
+        {"name": "thumbnail", "func": _sleep_stage(0.1, "thumb"), "after": ["idea"]},
+        {"name": "upload", "func": _sleep_stage(0.02, "id", calls), "after": ["video", "thumbnail", "idea"]},
+    ])
+
+    assert results["upload"] == "id"
+    assert calls == [("video", "thumb", "idea")]
+
+    report = worker.stage_report
+    assert report["critical_path"] == ["idea", "script", "video", "upload"]
+    assert report["critical_path_seconds"] == pytest.approx(0.19, abs=0.03)
+    # 순차 실행(0.29초)보다 짧고 임계 경로에 가까움
+    assert report["serial_seconds"] == pytest.approx(0.29, abs=0.03)
+    assert report["total_seconds"] < 0.25
+    assert report["stages"]["thumbnail"]["started"] < report["stages"]["video"]["started"]
+
+
+def test_critical_path_from_durations():
+    """단계 소요 시간으로 가장 긴 의존 경로를 계산하는지 테스트"""
+    stages = [
+        {"name": "a", "func": None},
+        {"name": "b", "func": None, "after": ["a"]},
+        {"name": "c", "func": None, "after": ["a"]},
+        {"name": "d", "func": None, "after": ["b", "c"]},
+    ]
+    assert critical_path(stages, {"a": 1, "b": 5, "c": 2, "d": 1}) == {"path": ["a", "b", "d"], "seconds": 7}
+    assert critical_path(stages, {"a": 1, "b": 1, "c": 4, "d": 1}) == {"path": ["a", "c", "d"], "seconds": 6}
+
+
+async def test_invalid_declarations():
+    """순환/없는 단계 의존은 실행 전에 ValueError로 거부되는지 테스트"""
+    worker = _worker()
+    with pytest.raises(ValueError, match="순환"):
+        await worker.run_stages([
+            {"name": "a", "func": _sleep_stage(0), "after": ["b"]},
+            {"name": "b", "func": _sleep_stage(0), "after": ["a"]},
+        ])
+    with pytest.raises(ValueError, match="없는 단계"):
+        await worker.run_stages([{"name": "a", "func": _sleep_stage(0), "after": ["x"]}])
+
+
+async def test_failure_cancels_running_stages():
+    """한 단계가 실패하면 동시에 실행 중인 단계가 취소되고 예외가 전달되는지 테스트"""
+    worker = _worker()
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def broken():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("썸네일 실패")
+
+    with pytest.raises(RuntimeError, match="썸네일 실패"):
+        await asyncio.wait_for(worker.run_stages([
+            {"name": "video", "func": slow},
+            {"name": "thumbnail", "func": broken},
+            {"name": "upload", "func": _sleep_stage(0), "after": ["video", "thumbnail"]},
+        ]), 1)
+    assert cancelled.is_set()
+    assert worker.stage_report is None
+
+
+async def test_stop_before_dependent_stage():
+    """중지 요청 후 다음 단계가 시작되지 않는지 테스트"""
+    worker = _worker()
+    started = []
+
+    async def first():
+        worker.stop()
+
+    async def second(_):
+        started.append("second")
+
+    with pytest.raises(RunCancelled):
+        await worker.run_stages([
+            {"name": "first", "func": first},
+            {"name": "second", "func": second, "after": ["first"]},
+        ])
+    assert started == []
+
+
+async def test_naver_worker_prepares_images_alongside_content():
+    """네이버 워커가 이미지 준비를 글 생성과 겹쳐 실행하고 임계 경로를 남기는지 테스트"""
+    worker = NaverBlogWorker({
+        "id": "c1",
+        "name": "블로그",
+        "type": "naver_blog",
+        "config": {"blog_id": "b", "content_category": "여행"},
+    })
+    result = await worker.run()
+
+    assert result["status"] == "published"
+    report = worker.stage_report
+    assert set(report["stages"]) == {"topic", "keywords", "content", "images", "post"}
+    assert report["critical_path"][0] == "topic"
+    assert report["critical_path"][-1] == "post"
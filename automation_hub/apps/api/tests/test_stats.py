@@ -43,3 +43,51 @@ def test_overview_stats(client):
     assert "total_channels" in data
     assert "channel_status" in data
     assert "weekly_stats" in data
+
+
+def test_log_cursor_round_trip():
+    """실행 로그 커서 인코딩/디코딩 테스트"""
+    from routers.stats import encode_log_cursor, decode_log_cursor
+
+    log = {"started_at": "2024-01-01T09:00:00.123456+00:00", "id": "11111111-1111-1111-1111-111111111111"}
+    cursor = encode_log_cursor(log)
+    assert decode_log_cursor(cursor) == (log["started_at"], log["id"])
+
+
+def test_run_logs_invalid_cursor(client):
+    """잘못된 커서는 400을 반환하는지 테스트"""
+    response = client.get("/api/stats/logs?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_skipped_and_cancelled_runs_are_not_posts(client):
+    """건너뛴/취소된 실행이 게시 수와 성공률에 포함되지 않는지 테스트"""
+    import asyncio
+    from datetime import datetime
+    from core import database
+    from core.backends.memory import MemoryBackend
+
+    backend = MemoryBackend()
+    backend.seed(platforms=1, groups_per_platform=1, channels_per_group=1, run_logs_per_channel=0)
+    channel = asyncio.run(backend.get_all_channels())[0]
+    today = datetime.now().date()
+    asyncio.run(backend.bump_run_stats_daily([
+        {"date": today.isoformat(), "channel_id": channel["id"], "group_id": channel["group_id"],
+         "status": status, "run_count": count, "total_duration_seconds": 0}
+        for status, count in (("success", 3), ("failed", 1), ("skipped", 5), ("cancelled", 2))
+    ]))
+
+    previous = database.set_backend(backend)
+    try:
+        overview = client.get("/api/stats/overview").json()
+        daily = client.get("/api/stats/daily").json()
+        groups = client.get("/api/stats/groups").json()
+        top = client.get("/api/stats/top-channels").json()
+    finally:
+        database.set_backend(previous)
+
+    assert overview["total_posts"] == 4
+    assert overview["success_rate"] == 75.0
+    assert next(day for day in daily if day["date"] == today.isoformat())["posts"] == 4
+    assert groups[0]["total_posts"] == 4 and groups[0]["success_rate"] == 75.0
+    assert top[0]["posts"] == 4
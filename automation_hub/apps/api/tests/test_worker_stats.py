@@ -0,0 +1,184 @@
+"""
+작업 워커 상태 보고 / /health 합산 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core import database
+from core.backends.memory import MemoryBackend
+from services.circuit_breaker import circuit_breaker
+from services.job_queue import JobWorker
+
+
+@pytest.fixture
+def backend():
+    """빈 메모리 백엔드"""
+    backend = MemoryBackend()
+    previous = database.set_backend(backend)
+    yield backend
+    database.set_backend(previous)
+
+
+def _circuit_stats(state: str, failures: int, trips: int, rejected: int) -> dict:
+    return {
+        "failure_threshold": 3,
+        "recovery_timeout": 60.0,
+        "circuits": {
+            "naver_blog": {
+                "state": state,
+                "failures": failures,
+                "opened_at": "2026-01-01T00:00:00" if state == "open" else None,
+                "trips": trips,
+                "rejected": rejected,
+                "last_error": "플랫폼 응답 없음" if failures else None,
+            },
+        },
+    }
+
+
+async def test_worker_heartbeat_publishes_stats(backend):
+    """워커가 heartbeat마다 자기 프로세스의 서킷 상태를 보고하는지 테스트"""
+    worker = JobWorker(
+        worker_id="host-a:1",
+        concurrency=1,
+        poll_interval=0.01,
+        heartbeat_interval=0.01,
+        stale_timeout=60,
+        retry_delay=0.01,
+    )
+    ticket = circuit_breaker.acquire("worker_stats_test")
+    circuit_breaker.record(ticket, False, "플랫폼 응답 없음")
+    try:
+        task = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.1)
+        worker.stop()
+        await task
+    finally:
+        circuit_breaker.reset("worker_stats_test")
+
+    [row] = await database.get_worker_stats(datetime.now(timezone.utc) - timedelta(minutes=1))
+    assert row["worker_id"] == "host-a:1"
+    assert row["stats"]["job_worker"]["worker_id"] == "host-a:1"
+    circuit = row["stats"]["circuit_breaker"]["circuits"]["worker_stats_test"]
+    assert circuit["failures"] == 1
+    assert circuit["last_error"] == "플랫폼 응답 없음"
+
+
+async def test_health_merges_worker_reports(backend, async_client):
+    """/health가 API 프로세스가 아니라 워커들이 보고한 서킷 상태를 합쳐 보여주는지 테스트"""
+    await database.upsert_worker_stats("host-a:1", {
+        "job_worker": {"worker_id": "host-a:1", "running": 1},
+        "circuit_breaker": _circuit_stats("closed", 1, 1, 0),
+    })
+    await database.upsert_worker_stats("host-b:2", {
+        "job_worker": {"worker_id": "host-b:2", "running": 0},
+        "circuit_breaker": _circuit_stats("open", 3, 2, 5),
+    })
+    # JOB_STALE_TIMEOUT 넘게 보고가 없는 워커는 제외
+    await database.upsert_worker_stats("host-c:3", {
+        "job_worker": {"worker_id": "host-c:3", "running": 0},
+        "circuit_breaker": _circuit_stats("open", 9, 9, 9),
+    })
+    stale_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    backend.tables["worker_stats"]["host-c:3"]["updated_at"] = stale_at.isoformat()
+
+    response = await async_client.get("/health")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert set(data["workers"]) == {"host-a:1", "host-b:2"}
+    assert data["workers"]["host-a:1"]["running"] == 1
+    circuit = data["circuit_breaker"]["circuits"]["naver_blog"]
+    assert circuit["state"] == "open"
+    assert circuit["failures"] == 3
+    assert circuit["trips"] == 3
+    assert circuit["rejected"] == 5
+    assert circuit["workers"] == {"host-a:1": "closed", "host-b:2": "open"}
+
+
+async def test_health_without_worker_reports(backend, async_client):
+    """보고한 워커가 없으면 빈 상태를 보여주는지 테스트"""
+    response = await async_client.get("/health")
+    data = response.json()
+    assert data["workers"] == {}
+    assert data["circuit_breaker"]["circuits"] == {}
+
+
+def _cpu_pool_stats(max_workers: int, busy: int, queued: int, completed: int, run_seconds: float) -> dict:
+    return {
+        "max_workers": max_workers, "started": busy > 0, "busy": busy, "queued": queued,
+        "submitted": completed + busy + queued, "completed": completed, "failed": 0,
+        "saturated": queued, "restarts": 0,
+        "queue_wait_seconds": 0.5 * completed, "max_queue_wait_seconds": float(queued),
+        "run_seconds": run_seconds,
+        "avg_queue_wait_seconds": 0.5, "avg_run_seconds": run_seconds / completed,
+    }
+
+
+async def test_health_sums_worker_cpu_pools(backend, async_client):
+    """/health의 cpu_pool이 워커들이 보고한 CPU 풀 사용 현황의 합계인지 테스트"""
+    await database.upsert_worker_stats("host-a:1", {"cpu_pool": _cpu_pool_stats(2, 2, 3, 4, 8.0)})
+    await database.upsert_worker_stats("host-b:2", {"cpu_pool": _cpu_pool_stats(4, 1, 0, 6, 30.0)})
+
+    data = (await async_client.get("/health")).json()["cpu_pool"]
+    assert data["max_workers"] == 6
+    assert data["started"] is True
+    assert (data["busy"], data["queued"], data["completed"]) == (3, 3, 10)
+    assert data["max_queue_wait_seconds"] == 3.0
+    assert data["avg_run_seconds"] == pytest.approx(3.8)
+    assert data["workers"]["host-a:1"] == {"max_workers": 2, "busy": 2, "queued": 3, "saturated": 3}
+
+
+async def test_health_sums_worker_rate_limits(backend, async_client):
+    """/health의 rate_limiter가 워커들이 보고한 버킷별 대기 통계의 합계인지 테스트"""
+    limits = {"openai": {"per_minute": 60, "burst": 5}}
+    await database.upsert_worker_stats("host-a:1", {"rate_limiter": {
+        "limits": limits,
+        "buckets": {"openai.chat": {
+            "acquired": 10, "waited": 2, "wait_seconds": 3.0, "max_wait_seconds": 2.0,
+            "avg_wait_seconds": 0.3,
+        }},
+    }})
+    await database.upsert_worker_stats("host-b:2", {"rate_limiter": {
+        "limits": limits,
+        "buckets": {"openai.chat": {
+            "acquired": 20, "waited": 1, "wait_seconds": 6.0, "max_wait_seconds": 6.0,
+            "avg_wait_seconds": 0.3,
+        }},
+    }})
+
+    data = (await async_client.get("/health")).json()["rate_limiter"]
+    assert data["limits"] == limits
+    bucket = data["buckets"]["openai.chat"]
+    assert (bucket["acquired"], bucket["waited"]) == (30, 3)
+    assert bucket["max_wait_seconds"] == 6.0
+    assert bucket["avg_wait_seconds"] == pytest.approx(0.3)
+    assert bucket["workers"]["host-b:2"] == {"acquired": 20, "waited": 1, "max_wait_seconds": 6.0}
+
+
+def _artifact_cache_stats(hits: int, misses: int, total_bytes: int) -> dict:
+    return {
+        "enabled": True, "root": "/tmp/cache", "entries": misses, "total_bytes": total_bytes,
+        "max_bytes": 1024, "hits": hits, "misses": misses, "coalesced": 0, "stored": misses,
+        "unstorable": 0, "evictions": 0, "evicted_bytes": 0, "copies": 0, "released": 0, "errors": 0,
+        "hit_rate": hits / (hits + misses),
+        "stages": {"script": {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses)}},
+    }
+
+
+async def test_health_sums_worker_artifact_caches(backend, async_client):
+    """/health의 artifact_cache가 워커들이 보고한 히트/미스 합계로 히트율을 계산하는지 테스트"""
+    await database.upsert_worker_stats("host-a:1", {"artifact_cache": _artifact_cache_stats(3, 1, 100)})
+    await database.upsert_worker_stats("host-b:2", {"artifact_cache": _artifact_cache_stats(1, 3, 300)})
+
+    data = (await async_client.get("/health")).json()["artifact_cache"]
+    assert data["enabled"] is True
+    assert (data["hits"], data["misses"], data["stored"]) == (4, 4, 4)
+    assert data["hit_rate"] == 0.5
+    assert data["stages"]["script"] == {"hits": 4, "misses": 4, "hit_rate": 0.5}
+    # 같은 디렉터리를 공유할 수 있으므로 크기는 워커별로만 표시
+    assert "total_bytes" not in data
+    assert data["workers"]["host-b:2"]["total_bytes"] == 300
@@ -0,0 +1,132 @@
+"""
+쓰기 버퍼 테스트
+"""
+
+import pytest
+
+from services import write_buffer as write_buffer_module
+from services.write_buffer import WriteBuffer
+
+
+@pytest.fixture
+def recorded_writes(monkeypatch):
+    """DB 쓰기 함수를 기록용으로 대체"""
+    writes = {"run_logs": [], "channels": [], "run_stats": []}
+
+    async def fake_upsert_run_logs(logs):
+        writes["run_logs"].append(logs)
+        return logs
+
+    async def fake_bulk_update_channel_runs(updates):
+        writes["channels"].append(updates)
+        return len(updates)
+
+    async def fake_bump_run_stats_daily(deltas):
+        writes["run_stats"].append(deltas)
+        return len(deltas)
+
+    monkeypatch.setattr(write_buffer_module, "upsert_run_logs", fake_upsert_run_logs)
+    monkeypatch.setattr(write_buffer_module, "bulk_update_channel_runs", fake_bulk_update_channel_runs)
+    monkeypatch.setattr(write_buffer_module, "bump_run_stats_daily", fake_bump_run_stats_daily)
+    return writes
+
+
+async def test_coalesces_writes_into_single_flush(recorded_writes):
+    """같은 로그/채널에 대한 연속 쓰기가 한 번의 일괄 요청으로 합쳐지는지 테스트"""
+    buffer = WriteBuffer(flush_interval=60, max_pending=100)
+
+    await buffer.add_run_log({"id": "log-1", "channel_id": "ch-1", "status": "running"})
+    await buffer.add_run_log({"id": "log-1", "channel_id": "ch-1", "status": "success"})
+    await buffer.add_run_log({"id": "log-2", "channel_id": "ch-2", "status": "running"})
+    await buffer.add_channel_update("ch-1", {"last_run_status": "success"})
+    await buffer.add_channel_update("ch-1", {"last_run_at": "2024-01-01T00:00:00"})
+    await buffer.stop()
+
+    assert len(recorded_writes["run_logs"]) == 1
+    logs = {log["id"]: log for log in recorded_writes["run_logs"][0]}
+    assert logs["log-1"]["status"] == "success"
+    assert logs["log-2"]["status"] == "running"
+
+    assert recorded_writes["channels"] == [
+        [{"id": "ch-1", "last_run_status": "success", "last_run_at": "2024-01-01T00:00:00"}]
+    ]
+    assert buffer.pending_count == 0
+
+
+async def test_run_stats_deltas_are_summed(recorded_writes):
+    """롤업 증분이 키별로 합산되고, 합이 0인 키는 반영되지 않는지 테스트"""
+    buffer = WriteBuffer(flush_interval=60, max_pending=100)
+    key = {"run_date": "2024-01-01", "channel_id": "ch-1", "group_id": "g-1"}
+
+    await buffer.add_run_stats(**key, status="running", run_count=1)
+    await buffer.add_run_stats(**key, status="running", run_count=-1)
+    await buffer.add_run_stats(**key, status="success", run_count=1, duration_seconds=10)
+    await buffer.add_run_stats(**key, status="success", run_count=1, duration_seconds=5)
+    await buffer.stop()
+
+    assert recorded_writes["run_stats"] == [[
+        {
+            "date": "2024-01-01",
+            "channel_id": "ch-1",
+            "group_id": "g-1",
+            "status": "success",
+            "run_count": 2,
+            "total_duration_seconds": 15,
+        }
+    ]]
+
+
+async def test_failed_run_stats_are_summed_with_newer_deltas(monkeypatch):
+    """실패해 이월된 롤업 증분이 그 사이 들어온 증분과 합산되는지 테스트"""
+    calls = []
+
+    async def flaky_bump(deltas):
+        calls.append(deltas)
+        if len(calls) <= 2:
+            raise RuntimeError("DB 오류")
+        return len(deltas)
+
+    monkeypatch.setattr(write_buffer_module, "bump_run_stats_daily", flaky_bump)
+    buffer = WriteBuffer(flush_interval=60, max_pending=100)
+    key = {"run_date": "2024-01-01", "channel_id": "ch-1", "group_id": "g-1", "status": "success"}
+
+    await buffer.add_run_stats(**key, run_count=1)
+    await buffer.flush()
+    await buffer.add_run_stats(**key, run_count=1)
+    await buffer.stop()
+
+    assert calls[-1][0]["run_count"] == 2
+    assert buffer.pending_count == 0
+
+
+async def test_flushes_when_max_pending_reached(recorded_writes):
+    """대기 항목이 상한에 도달하면 즉시 flush되는지 테스트"""
+    buffer = WriteBuffer(flush_interval=60, max_pending=2)
+
+    await buffer.add_run_log({"id": "log-1", "channel_id": "ch-1", "status": "running"})
+    assert recorded_writes["run_logs"] == []
+
+    await buffer.add_run_log({"id": "log-2", "channel_id": "ch-1", "status": "running"})
+    assert len(recorded_writes["run_logs"]) == 1
+    assert buffer.pending_count == 0
+
+    await buffer.stop()
+
+
+async def test_failed_rows_are_retried_then_dropped(monkeypatch):
+    """실패한 행은 다음 flush로 이월되고, 반복 실패 시 폐기되는지 테스트"""
+
+    async def failing_upsert(logs):
+        raise RuntimeError("DB 오류")
+
+    monkeypatch.setattr(write_buffer_module, "upsert_run_logs", failing_upsert)
+    buffer = WriteBuffer(flush_interval=60, max_pending=100)
+
+    await buffer.add_run_log({"id": "log-1", "channel_id": "ch-1", "status": "running"})
+    for _ in range(buffer.max_attempts - 1):
+        await buffer.flush()
+        assert buffer.pending_count == 1
+
+    await buffer.stop()
+    assert buffer.pending_count == 0
+    assert buffer.stats["dropped"] == 1
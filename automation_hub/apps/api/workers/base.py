@@ -3,10 +3,227 @@
 모든 자동화 워커의 추상 기본 클래스
 """
 
+import asyncio
+import functools
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Optional
 
+from core.config import settings
 from core.logger import setup_logger
+from services.artifact_cache import artifact_cache
+from services.checkpoint_store import checkpoint_store
+from services.process_pool import cpu_pool
+from services.rate_limiter import rate_limiter
+
+
+class RunCancelled(Exception):
+    """실행 취소 요청으로 워커가 단계 사이에서 중단됨"""
+
+
+class StageFailed(Exception):
+    """외부 호출 단계가 재시도 후에도 실패 (플랫폼 서킷 브레이커 집계 대상)"""
+
+    def __init__(self, stage: str, attempts: int, error: Exception):
+        super().__init__(f"{stage} 실패 ({attempts}회 시도): {error}")
+        self.stage = stage
+        self.attempts = attempts
+        self.error = error
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    재시도 대기 시간 (지수 백오프 + full jitter)
+
+    attempt번째 실패 후 0 ~ min(max_delay, base_delay × 2^(attempt-1)) 사이 무작위 값.
+    여러 채널이 같은 장애로 동시에 실패해도 재시도가 한꺼번에 몰리지 않습니다.
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+def retry_stage(
+    func: Optional[Callable] = None,
+    *,
+    attempts: Optional[int] = None,
+    base_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+) -> Callable:
+    """
+    외부 API 호출 단계 재시도 데코레이터 (BaseWorker 코루틴 메서드용)
+
+    실패하면 backoff_delay만큼 기다렸다 다시 호출하고, 모두 실패하면 StageFailed를 던집니다.
+    재시도 전에 중지 요청을 확인하며, RunCancelled와 ValueError(설정/입력 오류)는 재시도하지 않습니다.
+    업로드처럼 중복 실행되면 안 되는 단계는 서버에서 요청이 반영되지 않았음이 확실할 때만 예외를 던져야 합니다.
+
+    예:
+        @retry_stage
+        async def _generate_script(self, idea): ...
+
+        @retry_stage(attempts=5, base_delay=5.0)
+        async def _upload_to_youtube(self, video_path, thumbnail_path, idea): ...
+
+    Args:
+        attempts: 최대 시도 횟수 (기본: STAGE_RETRY_ATTEMPTS)
+        base_delay: 첫 재시도 최대 대기 (초, 기본: STAGE_RETRY_BASE_DELAY)
+        max_delay: 재시도 대기 상한 (초, 기본: STAGE_RETRY_MAX_DELAY)
+    """
+
+    def decorate(method: Callable) -> Callable:
+        stage = method.__name__.lstrip("_")
+
+        @functools.wraps(method)
+        async def wrapper(self: "BaseWorker", *args, **kwargs):
+            max_attempts = max(1, attempts or settings.stage_retry_attempts)
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await method(self, *args, **kwargs)
+                except (RunCancelled, ValueError):
+                    raise
+                except Exception as e:
+                    if attempt >= max_attempts:
+                        raise StageFailed(stage, attempt, e) from e
+                    delay = backoff_delay(
+                        attempt,
+                        settings.stage_retry_base_delay if base_delay is None else base_delay,
+                        settings.stage_retry_max_delay if max_delay is None else max_delay,
+                    )
+                    self.logger.warning(
+                        f"{stage} 실패, {delay:.1f}초 후 재시도 ({attempt}/{max_attempts}): {e}"
+                    )
+                    await asyncio.sleep(delay)
+                    self.check_stop()
+
+        wrapper.retry_stage = True
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def cached_stage(func: Optional[Callable] = None, *, version: str = "1") -> Callable:
+    """
+    생성 결과물 캐시 데코레이터 (BaseWorker 코루틴 메서드용)
+
+    단계 이름과 인자, version이 같으면 이전 결과를 재사용합니다 (services/artifact_cache.py).
+    캐시에서 꺼낸 파일 결과는 실행마다 만든 사본이며, 실행이 끝나면(after_run/on_error) 삭제됩니다.
+    같은 입력이면 어느 채널에서 호출해도 같은 결과를 써도 되는 생성 단계에만 적용하고,
+    채널 설정에 따라 결과가 달라지면 그 값을 인자로 받아야 합니다.
+    재시도/속도 제한을 건너뛰도록 @retry_stage 바깥에 둡니다.
+
+    예:
+        @cached_stage(version="gpt-4o-mini:v1")
+        @retry_stage
+        async def _generate_script(self, idea): ...
+
+    Args:
+        version: 모델/프롬프트 버전 (바꾸면 기존 결과를 쓰지 않음)
+    """
+
+    def decorate(method: Callable) -> Callable:
+        stage = method.__name__.lstrip("_")
+
+        @functools.wraps(method)
+        async def wrapper(self: "BaseWorker", *args):
+            value, hit = await artifact_cache.get_or_create(
+                stage, list(args), version, lambda: method(self, *args), copies=self.cache_files
+            )
+            if hit:
+                self.cache_hits.append(stage)
+                self.logger.info(f"{stage}: 캐시된 결과 사용")
+            return value
+
+        wrapper.cached_stage = True
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def cpu_bound(func: Callable) -> Callable:
+    """
+    CPU 작업 단계 표시 데코레이터
+
+    영상/이미지 합성처럼 CPU를 오래 쓰는 동기 함수를 감싸,
+    호출하면 CPU 프로세스 풀에서 실행하는 코루틴 함수로 바꿉니다.
+
+    - 모듈 최상위 함수에만 적용 (하위 프로세스가 모듈을 import해 원본 함수를 실행)
+    - 인자와 반환값은 pickle 가능해야 하며, 큰 결과물은 파일로 쓰고 경로를 반환
+
+    예:
+        @cpu_bound
+        def render_video(script: str, output_path: str) -> str: ...
+
+        video_path = await render_video(script, "/tmp/video.mp4")
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await cpu_pool.run(func, *args, **kwargs)
+
+    wrapper.cpu_bound = True
+    return wrapper
+
+
+def _stage_order(stages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    단계 선언 검증 후 의존 순서(위상 정렬)로 반환
+
+    Raises:
+        ValueError: 이름 중복, 없는 단계에 의존, 순환 의존
+    """
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for stage in stages:
+        if stage["name"] in by_name:
+            raise ValueError(f"단계 이름 중복: {stage['name']}")
+        by_name[stage["name"]] = stage
+    for stage in stages:
+        for dependency in stage.get("after", []):
+            if dependency not in by_name:
+                raise ValueError(f"없는 단계에 의존: {stage['name']} → {dependency}")
+
+    ordered: List[Dict[str, Any]] = []
+    state: Dict[str, str] = {}  # visiting | done
+
+    def visit(name: str):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"순환 의존: {name}")
+        state[name] = "visiting"
+        for dependency in by_name[name].get("after", []):
+            visit(dependency)
+        state[name] = "done"
+        ordered.append(by_name[name])
+
+    for stage in stages:
+        visit(stage["name"])
+    return ordered
+
+
+def critical_path(stages: List[Dict[str, Any]], durations: Dict[str, float]) -> Dict[str, Any]:
+    """
+    단계별 소요 시간 기준 가장 긴 의존 경로
+
+    의존 관계가 있는 단계는 겹칠 수 없으므로, 이 경로의 합이 가능한 최단 실행 시간입니다.
+
+    Returns:
+        {"path": [단계 이름, ...], "seconds": 경로 소요 시간 합}
+    """
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for stage in _stage_order(stages):
+        name = stage["name"]
+        slowest = max(stage.get("after", []), key=lambda d: finish[d], default=None)
+        previous[name] = slowest
+        finish[name] = durations.get(name, 0.0) + (finish[slowest] if slowest else 0.0)
+
+    if not finish:
+        return {"path": [], "seconds": 0.0}
+    name = max(finish, key=finish.get)
+    path = []
+    while name is not None:
+        path.append(name)
+        name = previous[name]
+    return {"path": path[::-1], "seconds": max(finish.values())}
 
 
 class BaseWorker(ABC):
@@ -33,6 +250,20 @@ class BaseWorker(ABC):
 
         self._is_running = False
         self._should_stop = False
+        # 이번 실행에서 속도 제한으로 기다린 시간 (초)
+        self.rate_limit_wait_seconds = 0.0
+        # run_stages 실행 결과 (단계별 시간, 임계 경로), 실행 로그에 함께 기록
+        self.stage_report: Optional[Dict[str, Any]] = None
+        # 단계 체크포인트 (실행기가 설정): 이번 실행 로그 ID (없으면 저장하지 않음),
+        # 이어하기 시 이전 실행에서 불러온 단계 결과 (단계 이름 → {"value", "checkpoint"})
+        self.run_log_id: Optional[str] = None
+        self.restored_stages: Dict[str, Dict[str, Any]] = {}
+        # 이번 실행에 기록한 체크포인트 (단계 이름 → 메타데이터)
+        self.checkpoints: Dict[str, Dict[str, Any]] = {}
+        # 이번 실행에서 캐시된 결과를 쓴 단계 (@cached_stage)
+        self.cache_hits: List[str] = []
+        # 캐시에서 꺼낸 파일 결과의 사본 (실행이 끝나면 삭제)
+        self.cache_files: List[str] = []
 
     @abstractmethod
     async def run(self) -> Dict[str, Any]:
@@ -55,10 +286,141 @@ class BaseWorker(ABC):
         pass
 
     def stop(self):
-        """워커 중지 요청"""
+        """워커 중지 요청 (다음 단계 경계에서 RunCancelled로 중단)"""
         self._should_stop = True
         self.logger.info(f"워커 중지 요청: {self.channel_name}")
 
+    def check_stop(self):
+        """
+        단계 경계에서 중지 요청 확인
+
+        Raises:
+            RunCancelled: stop()이 호출된 경우
+        """
+        if self._should_stop:
+            raise RunCancelled(f"실행 취소됨: {self.channel_name}")
+
+    async def run_stages(self, stages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        의존 관계에 따라 단계 실행 (서로 의존하지 않는 단계는 동시에 실행)
+
+        각 단계는 의존하는 단계가 모두 끝나면 시작하며, 의존 단계 결과를 "after" 순서대로
+        인자로 받습니다. 시작 전에 중지 요청을 확인하고, 한 단계가 실패하면 나머지를 취소한 뒤
+        그 예외를 그대로 던집니다. 끝나면 stage_report에 단계별 시간과 임계 경로를 남깁니다.
+
+        run_log_id가 있으면 끝난 단계 결과를 체크포인트로 저장하고, 이어하기 실행이면
+        (restored_stages) 이전 실행에서 끝난 단계는 실행하지 않고 저장된 결과를 씁니다.
+        의존 단계를 다시 실행하는 단계는 결과가 저장되어 있어도 다시 실행합니다.
+
+        예:
+            results = await self.run_stages([
+                {"name": "idea", "func": self._generate_content_idea},
+                {"name": "script", "func": self._generate_script, "after": ["idea"]},
+                {"name": "thumbnail", "func": self._create_thumbnail, "after": ["idea"]},
+                {"name": "upload", "func": self._upload, "after": ["script", "thumbnail"]},
+            ])
+
+        Args:
+            stages: [{"name": 단계 이름, "func": 코루틴 함수, "after": [의존 단계 이름, ...]}, ...]
+
+        Returns:
+            단계 이름 → 결과
+        """
+        ordered = _stage_order(stages)
+        run_started = time.monotonic()
+        timings: Dict[str, Dict[str, float]] = {}
+        durations: Dict[str, float] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        # 이전 실행 결과를 쓸 단계 (의존 단계도 모두 이전 결과를 쓰는 경우만)
+        restored = set()
+        for stage in ordered:
+            if stage["name"] in self.restored_stages and all(
+                dependency in restored for dependency in stage.get("after", [])
+            ):
+                restored.add(stage["name"])
+        if restored:
+            self.logger.info(f"이전 실행 결과로 건너뛰는 단계: {', '.join(sorted(restored))}")
+
+        async def run_stage(stage: Dict[str, Any]) -> Any:
+            name = stage["name"]
+            args = [await tasks[dependency] for dependency in stage.get("after", [])]
+            self.check_stop()
+            started = time.monotonic()
+
+            if name in restored:
+                durations[name] = 0.0
+                timings[name] = {
+                    "started": round(started - run_started, 3),
+                    "seconds": 0.0,
+                    "restored": True,
+                }
+                checkpoint = self.restored_stages[name]["checkpoint"]
+                if self.run_log_id:
+                    self.checkpoints[name] = await checkpoint_store.carry_over(self.run_log_id, checkpoint)
+                return self.restored_stages[name]["value"]
+
+            result = await stage["func"](*args)
+            durations[name] = time.monotonic() - started
+            timings[name] = {
+                "started": round(started - run_started, 3),
+                "seconds": round(durations[name], 3),
+            }
+            if self.run_log_id:
+                checkpoint = await checkpoint_store.save(self.run_log_id, name, result)
+                if checkpoint is not None:
+                    self.checkpoints[name] = checkpoint
+            return result
+
+        # 의존 순서로 만들어야 의존하는 태스크가 항상 먼저 존재함
+        for stage in ordered:
+            tasks[stage["name"]] = asyncio.create_task(run_stage(stage))
+
+        try:
+            done, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+            failed = next((task for task in done if task.exception() is not None), None)
+            if failed is not None:
+                raise failed.exception()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        path = critical_path(stages, durations)
+        self.stage_report = {
+            "stages": timings,
+            "total_seconds": round(time.monotonic() - run_started, 3),
+            "serial_seconds": round(sum(durations.values()), 3),
+            "critical_path": path["path"],
+            "critical_path_seconds": round(path["seconds"], 3),
+        }
+        if restored:
+            self.stage_report["restored"] = [s["name"] for s in ordered if s["name"] in restored]
+        if self.cache_hits:
+            self.stage_report["cache_hits"] = list(self.cache_hits)
+        self.logger.info(
+            f"단계 실행 완료: {self.stage_report['total_seconds']}초 "
+            f"(순차 합계 {self.stage_report['serial_seconds']}초), "
+            f"임계 경로 {' → '.join(path['path'])} ({self.stage_report['critical_path_seconds']}초)"
+        )
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def throttle(self, bucket: str, api_key: Optional[str] = None, tokens: float = 1) -> float:
+        """
+        외부 API 호출 전 속도 제한 대기
+
+        Args:
+            bucket: 버킷 이름 ("서비스.엔드포인트 분류", 예: openai.chat)
+            api_key: 호출에 쓰는 API 키 (키별로 제한)
+            tokens: 이번 호출이 쓰는 토큰 수
+
+        Returns:
+            기다린 시간 (초)
+        """
+        waited = await rate_limiter.acquire(bucket, api_key, tokens)
+        self.rate_limit_wait_seconds += waited
+        return waited
+
     def get_status(self) -> Dict[str, Any]:
         """
         워커 상태 반환
@@ -71,20 +433,30 @@ class BaseWorker(ABC):
             "channel_name": self.channel_name,
             "is_running": self._is_running,
             "should_stop": self._should_stop,
+            "rate_limit_wait_seconds": self.rate_limit_wait_seconds,
         }
 
     async def before_run(self):
         """실행 전 준비 작업 (오버라이드 가능)"""
         self._is_running = True
-        self._should_stop = False
         self.logger.info(f"워커 시작: {self.channel_name}")
 
     async def after_run(self, result: Dict[str, Any]):
         """실행 후 정리 작업 (오버라이드 가능)"""
         self._is_running = False
-        self.logger.info(f"워커 종료: {self.channel_name}")
+        await artifact_cache.release_copies(self.cache_files)
+        if self.rate_limit_wait_seconds > 0:
+            self.logger.info(
+                f"워커 종료: {self.channel_name} (속도 제한 대기 {self.rate_limit_wait_seconds:.1f}초)"
+            )
+        else:
+            self.logger.info(f"워커 종료: {self.channel_name}")
 
     async def on_error(self, error: Exception):
         """에러 발생 시 처리 (오버라이드 가능)"""
         self._is_running = False
+        await artifact_cache.release_copies(self.cache_files)
+        if isinstance(error, RunCancelled):
+            self.logger.info(f"워커 중단: {self.channel_name}")
+            return
         self.logger.error(f"워커 에러: {self.channel_name}, {error}")
@@ -4,7 +4,8 @@
 
 from typing import Dict, Any
 
-from workers.base import BaseWorker
+from core.config import settings
+from workers.base import BaseWorker, cached_stage, retry_stage
 
 
 class NaverBlogWorker(BaseWorker):
@@ -41,24 +42,23 @@ class NaverBlogWorker(BaseWorker):
                 raise ValueError("설정이 유효하지 않습니다")
 
             # TODO: 실제 자동화 로직 구현
-            # 1. 포스팅 주제 선정
-            topic = await self._select_topic()
-
-            # 2. 키워드 리서치
-            keywords = await self._research_keywords(topic)
-
-            # 3. 블로그 글 생성 (OpenAI)
-            content = await self._generate_content(topic, keywords)
-
-            # 4. 이미지 준비
-            images = await self._prepare_images(topic)
-
-            # 5. 네이버 블로그 포스팅
-            post_id = await self._post_to_naver(content, images)
+            # 이미지는 주제에만 의존하므로 키워드 리서치/글 생성과 동시에 실행
+            results = await self.run_stages([
+                # 1. 포스팅 주제 선정
+                {"name": "topic", "func": self._select_topic},
+                # 2. 키워드 리서치
+                {"name": "keywords", "func": self._research_keywords, "after": ["topic"]},
+                # 3. 블로그 글 생성 (OpenAI)
+                {"name": "content", "func": self._generate_content, "after": ["topic", "keywords"]},
+                # 4. 이미지 준비
+                {"name": "images", "func": self._prepare_images, "after": ["topic"]},
+                # 5. 네이버 블로그 포스팅
+                {"name": "post", "func": self._post_to_naver, "after": ["content", "images"]},
+            ])
 
             result = {
-                "post_id": post_id,
-                "title": content.get("title", ""),
+                "post_id": results["post"],
+                "title": results["content"].get("title", ""),
                 "status": "published",
             }
 
@@ -76,14 +76,19 @@ class NaverBlogWorker(BaseWorker):
         category = self.config.get("content_category", "일반")
         return f"{category} 관련 주제"
 
+    @cached_stage
+    @retry_stage
     async def _research_keywords(self, topic: str) -> list:
         """SEO 키워드 리서치"""
+        await self.throttle("naver.search")
         # TODO: 네이버 키워드 도구 API 활용
         self.logger.info("키워드 리서치 중...")
         return ["키워드1", "키워드2", "키워드3"]
 
+    @retry_stage
     async def _generate_content(self, topic: str, keywords: list) -> Dict[str, Any]:
         """블로그 콘텐츠 생성"""
+        await self.throttle("openai.chat", settings.openai_api_key)
         # TODO: OpenAI API를 사용한 글 생성
         self.logger.info("블로그 콘텐츠 생성 중...")
         return {
@@ -92,14 +97,19 @@ class NaverBlogWorker(BaseWorker):
             "tags": keywords,
         }
 
+    @cached_stage
+    @retry_stage
     async def _prepare_images(self, topic: str) -> list:
         """이미지 준비 (생성 또는 수집)"""
+        await self.throttle("openai.images", settings.openai_api_key)
         # TODO: 이미지 생성 또는 스톡 이미지 수집
         self.logger.info("이미지 준비 중...")
         return ["/tmp/image1.jpg"]
 
+    @retry_stage
     async def _post_to_naver(self, content: Dict[str, Any], images: list) -> str:
         """네이버 블로그 포스팅"""
+        await self.throttle("naver.post")
         # TODO: 네이버 블로그 API를 통한 포스팅
         self.logger.info("네이버 블로그 포스팅 중...")
         return "test_post_id"
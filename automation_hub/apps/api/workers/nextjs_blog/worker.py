@@ -4,7 +4,8 @@ Next.js 블로그 자동화 워커
 
 from typing import Dict, Any
 
-from workers.base import BaseWorker
+from core.config import settings
+from workers.base import BaseWorker, retry_stage
 
 
 class NextJSBlogWorker(BaseWorker):
@@ -43,15 +44,19 @@ class NextJSBlogWorker(BaseWorker):
 
             # TODO: 실제 자동화 로직 구현
             # 1. 포스팅 주제 및 키워드 선정
+            self.check_stop()
             topic_data = await self._prepare_topic()
 
             # 2. 블로그 글 생성 (OpenAI)
+            self.check_stop()
             content = await self._generate_content(topic_data)
 
             # 3. MDX 파일 생성
+            self.check_stop()
             file_path = await self._create_mdx_file(content)
 
             # 4. Git 커밋 및 푸시
+            self.check_stop()
             commit_hash = await self._git_push(file_path, content["title"])
 
             result = {
@@ -79,8 +84,10 @@ class NextJSBlogWorker(BaseWorker):
             "category": self.config.get("category", "blog"),
         }
 
+    @retry_stage
     async def _generate_content(self, topic_data: Dict[str, Any]) -> Dict[str, Any]:
         """블로그 콘텐츠 생성"""
+        await self.throttle("openai.chat", settings.openai_api_key)
         # TODO: OpenAI API를 사용한 글 생성
         self.logger.info("블로그 콘텐츠 생성 중...")
         return {
@@ -112,6 +119,7 @@ category: "{content['category']}"
         file_path = f"{self.config['content_path']}/{content['slug']}.mdx"
         return file_path
 
+    @retry_stage
     async def _git_push(self, file_path: str, title: str) -> str:
         """Git 커밋 및 푸시"""
         # TODO: Git 명령 실행
@@ -0,0 +1,23 @@
+"""
+유튜브 쇼츠 영상/썸네일 합성
+
+CPU를 오래 쓰는 합성 작업이므로 cpu_bound로 CPU 프로세스 풀에서 실행합니다.
+하위 프로세스에서 실행되므로 모듈 최상위 함수로 두고,
+결과물은 output_path에 파일로 쓴 뒤 경로만 반환합니다.
+"""
+
+from workers.base import cpu_bound
+
+
+@cpu_bound
+def render_video(script: str, output_path: str) -> str:
+    """스크립트로 영상 합성 (TTS + 이미지/영상) 후 파일 경로 반환"""
+    # TODO: TTS + 영상 합성
+    return output_path
+
+
+@cpu_bound
+def render_thumbnail(title: str, output_path: str) -> str:
+    """제목으로 썸네일 이미지 생성 후 파일 경로 반환"""
+    # TODO: 썸네일 이미지 생성
+    return output_path
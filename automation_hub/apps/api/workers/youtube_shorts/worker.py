@@ -2,9 +2,13 @@
 유튜브 쇼츠 자동화 워커
 """
 
+import os
+import tempfile
 from typing import Dict, Any
 
-from workers.base import BaseWorker
+from core.config import settings
+from workers.base import BaseWorker, cached_stage, retry_stage
+from workers.youtube_shorts.media import render_thumbnail, render_video
 
 
 class YouTubeShortsWorker(BaseWorker):
@@ -42,24 +46,27 @@ class YouTubeShortsWorker(BaseWorker):
                 raise ValueError("설정이 유효하지 않습니다")
 
             # TODO: 실제 자동화 로직 구현
-            # 1. 콘텐츠 아이디어 생성 (OpenAI)
-            content_idea = await self._generate_content_idea()
-
-            # 2. 영상 스크립트 생성
-            script = await self._generate_script(content_idea)
-
-            # 3. 영상 생성 (TTS + 이미지/영상)
-            video_path = await self._create_video(script)
-
-            # 4. 썸네일 생성
-            thumbnail_path = await self._create_thumbnail(content_idea)
-
-            # 5. 유튜브 업로드
-            video_id = await self._upload_to_youtube(video_path, thumbnail_path, content_idea)
+            # 썸네일은 아이디어에만 의존하므로 스크립트/영상 생성과 동시에 실행
+            results = await self.run_stages([
+                # 1. 콘텐츠 아이디어 생성 (OpenAI)
+                {"name": "idea", "func": self._generate_content_idea},
+                # 2. 영상 스크립트 생성
+                {"name": "script", "func": self._generate_script, "after": ["idea"]},
+                # 3. 영상 생성 (TTS + 이미지/영상)
+                {"name": "video", "func": self._create_video, "after": ["script"]},
+                # 4. 썸네일 생성
+                {"name": "thumbnail", "func": self._create_thumbnail, "after": ["idea"]},
+                # 5. 유튜브 업로드
+                {
+                    "name": "upload",
+                    "func": self._upload_to_youtube,
+                    "after": ["video", "thumbnail", "idea"],
+                },
+            ])
 
             result = {
-                "video_id": video_id,
-                "title": content_idea.get("title", ""),
+                "video_id": results["upload"],
+                "title": results["idea"].get("title", ""),
                 "status": "uploaded",
             }
 
@@ -70,8 +77,10 @@ class YouTubeShortsWorker(BaseWorker):
             await self.on_error(e)
             raise
 
+    @retry_stage
     async def _generate_content_idea(self) -> Dict[str, Any]:
         """콘텐츠 아이디어 생성"""
+        await self.throttle("openai.chat", settings.openai_api_key)
         # TODO: OpenAI API를 사용한 아이디어 생성
         self.logger.info("콘텐츠 아이디어 생성 중...")
         return {
@@ -80,28 +89,36 @@ class YouTubeShortsWorker(BaseWorker):
             "tags": ["tag1", "tag2"],
         }
 
+    @cached_stage
+    @retry_stage
     async def _generate_script(self, idea: Dict[str, Any]) -> str:
         """영상 스크립트 생성"""
+        await self.throttle("openai.chat", settings.openai_api_key)
         # TODO: OpenAI API를 사용한 스크립트 생성
         self.logger.info("스크립트 생성 중...")
         return "테스트 스크립트"
 
+    def _output_path(self, filename: str) -> str:
+        """채널별 결과물 경로 (동시 실행 시 충돌 방지)"""
+        return os.path.join(tempfile.gettempdir(), f"{self.channel_id}_{filename}")
+
     async def _create_video(self, script: str) -> str:
-        """영상 생성"""
-        # TODO: TTS + 영상 합성
+        """영상 생성 (CPU 프로세스 풀)"""
         self.logger.info("영상 생성 중...")
-        return "/tmp/video.mp4"
+        return await render_video(script, self._output_path("video.mp4"))
 
+    @cached_stage
     async def _create_thumbnail(self, idea: Dict[str, Any]) -> str:
-        """썸네일 생성"""
-        # TODO: 썸네일 이미지 생성
+        """썸네일 생성 (CPU 프로세스 풀)"""
         self.logger.info("썸네일 생성 중...")
-        return "/tmp/thumbnail.jpg"
+        return await render_thumbnail(idea.get("title", ""), self._output_path("thumbnail.jpg"))
 
+    @retry_stage
     async def _upload_to_youtube(
         self, video_path: str, thumbnail_path: str, idea: Dict[str, Any]
     ) -> str:
         """유튜브 업로드"""
+        await self.throttle("youtube.upload", settings.youtube_api_key)
         # TODO: YouTube Data API를 사용한 업로드
         self.logger.info("유튜브 업로드 중...")
         return "test_video_id"
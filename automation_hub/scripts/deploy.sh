@@ -11,6 +11,7 @@ APP_DIR=~/automation-hub
 API_DIR=$APP_DIR/apps/api
 VENV_DIR=$APP_DIR/venv
 PM2_APP_NAME="automation-hub-api"
+PM2_WORKER_NAME="automation-hub-worker"
 
 echo "=========================================="
 echo "API 서버 배포 시작"
@@ -54,12 +55,23 @@ module.exports = {
     env: {
       PATH: '$VENV_DIR/bin:' + process.env.PATH
     }
+  }, {
+    name: '$PM2_WORKER_NAME',
+    script: '$VENV_DIR/bin/python',
+    args: '-m commands.job_worker',
+    cwd: '$API_DIR',
+    interpreter: 'none',
+    kill_timeout: 600000,
+    env: {
+      PATH: '$VENV_DIR/bin:' + process.env.PATH
+    }
   }]
 };
 EOF
 
 # PM2 앱 재시작 (없으면 시작)
 pm2 delete $PM2_APP_NAME 2>/dev/null || true
+pm2 delete $PM2_WORKER_NAME 2>/dev/null || true
 pm2 start ecosystem.config.js
 
 # PM2 저장 (서버 재부팅 시 자동 시작)
@@ -75,6 +87,8 @@ echo "=========================================="
 echo ""
 echo "서버 상태 확인: pm2 status"
 echo "로그 확인: pm2 logs $PM2_APP_NAME"
+echo "워커 로그 확인: pm2 logs $PM2_WORKER_NAME"
+echo "워커 수 조정: pm2 scale $PM2_WORKER_NAME 2"
 echo "서버 재시작: pm2 restart $PM2_APP_NAME"
 echo ""
 echo "API 엔드포인트: http://$(hostname -I | awk '{print $1}'):8000"
@@ -0,0 +1,81 @@
+-- =============================================
+-- 통계 집계 함수 (RPC)
+--
+-- 통계 API(/api/stats/overview, daily, groups, top-channels)가
+-- run_logs 전체를 내려받아 Python에서 집계하지 않도록
+-- 기간별 집계를 DB에서 수행합니다.
+--
+-- 날짜 기준: started_at의 UTC 날짜
+-- 기간: p_start_date ~ p_end_date (양 끝 포함)
+-- 그룹 기준: 채널의 현재 소속 그룹 (channels.group_id)
+-- =============================================
+
+-- =============================================
+-- 1. 일별/상태별 실행 횟수
+-- =============================================
+CREATE OR REPLACE FUNCTION stats_daily_counts(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (run_date DATE, status TEXT, run_count BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT
+        (r.started_at AT TIME ZONE 'UTC')::date AS run_date,
+        r.status,
+        COUNT(*) AS run_count
+    FROM run_logs r
+    WHERE r.started_at >= (p_start_date::timestamp AT TIME ZONE 'UTC')
+      AND r.started_at < ((p_end_date + 1)::timestamp AT TIME ZONE 'UTC')
+    GROUP BY 1, 2
+    ORDER BY 1, 2;
+$$;
+
+COMMENT ON FUNCTION stats_daily_counts IS '기간 내 일별/상태별 실행 횟수';
+
+-- =============================================
+-- 2. 그룹별/상태별 실행 횟수
+-- =============================================
+CREATE OR REPLACE FUNCTION stats_group_counts(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (group_id UUID, status TEXT, run_count BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT
+        c.group_id,
+        r.status,
+        COUNT(*) AS run_count
+    FROM run_logs r
+    JOIN channels c ON c.id = r.channel_id
+    WHERE r.started_at >= (p_start_date::timestamp AT TIME ZONE 'UTC')
+      AND r.started_at < ((p_end_date + 1)::timestamp AT TIME ZONE 'UTC')
+    GROUP BY 1, 2
+    ORDER BY 1, 2;
+$$;
+
+COMMENT ON FUNCTION stats_group_counts IS '기간 내 그룹별/상태별 실행 횟수';
+
+-- =============================================
+-- 3. 채널별/상태별 실행 횟수
+-- =============================================
+CREATE OR REPLACE FUNCTION stats_channel_counts(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (channel_id UUID, group_id UUID, status TEXT, run_count BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT
+        r.channel_id,
+        c.group_id,
+        r.status,
+        COUNT(*) AS run_count
+    FROM run_logs r
+    JOIN channels c ON c.id = r.channel_id
+    WHERE r.started_at >= (p_start_date::timestamp AT TIME ZONE 'UTC')
+      AND r.started_at < ((p_end_date + 1)::timestamp AT TIME ZONE 'UTC')
+    GROUP BY 1, 2, 3
+    ORDER BY 1, 3;
+$$;
+
+COMMENT ON FUNCTION stats_channel_counts IS '기간 내 채널별/상태별 실행 횟수';
+
+-- =============================================
+-- 4. 인덱스
+-- 기간 조회 후 상태별 집계 (index-only scan 가능)
+-- =============================================
+CREATE INDEX IF NOT EXISTS idx_run_logs_started_at_channel_status
+    ON run_logs(started_at, channel_id, status);
@@ -0,0 +1,38 @@
+-- =============================================
+-- 일괄 쓰기 함수 (RPC)
+--
+-- 실행기(executor)의 쓰기 버퍼가 모아둔 채널 실행 상태 변경을
+-- 한 번의 호출로 반영합니다. (run_logs는 upsert로 일괄 처리)
+-- =============================================
+
+-- =============================================
+-- 1. 채널 실행 상태 일괄 수정
+-- p_updates: [{"id": uuid, "last_run_at": ts, "last_run_status": text, "status": text}, ...]
+-- 값이 없는(null) 필드는 기존 값 유지
+-- =============================================
+CREATE OR REPLACE FUNCTION bulk_update_channel_runs(p_updates JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE channels c
+    SET
+        last_run_at = COALESCE(u.last_run_at, c.last_run_at),
+        last_run_status = COALESCE(u.last_run_status, c.last_run_status),
+        status = COALESCE(u.status, c.status)
+    FROM jsonb_to_recordset(p_updates) AS u(
+        id UUID,
+        last_run_at TIMESTAMPTZ,
+        last_run_status TEXT,
+        status TEXT
+    )
+    WHERE c.id = u.id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+COMMENT ON FUNCTION bulk_update_channel_runs IS '채널 last_run_at/last_run_status/status 일괄 수정';
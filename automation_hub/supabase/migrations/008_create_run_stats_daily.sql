@@ -0,0 +1,150 @@
+-- =============================================
+-- 일별 실행 통계 롤업 테이블
+--
+-- run_logs를 매번 스캔하지 않도록 (날짜, 채널, 그룹, 상태)별 실행 횟수를
+-- 미리 집계해 둡니다. 실행기(executor)가 실행 시작/종료 시 증분을 반영하고,
+-- 기존 데이터는 backfill_run_stats_daily()로 채웁니다.
+--
+-- 증분 규칙 (쓰기 버퍼에서 합쳐진 뒤 반영):
+--   실행 시작: running +1
+--   실행 종료: running -1, 최종 상태(success/failed) +1 (+소요 시간)
+--
+-- 날짜 기준: started_at의 UTC 날짜 (006 통계 함수와 동일)
+-- =============================================
+
+-- =============================================
+-- 1. run_stats_daily 테이블
+-- =============================================
+CREATE TABLE IF NOT EXISTS run_stats_daily (
+    date DATE NOT NULL,
+    channel_id UUID NOT NULL REFERENCES channels(id) ON DELETE CASCADE,
+    group_id UUID NOT NULL REFERENCES groups(id) ON DELETE CASCADE,
+    status TEXT NOT NULL,
+    run_count INTEGER NOT NULL DEFAULT 0,
+    total_duration_seconds BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+
+    PRIMARY KEY (date, channel_id, group_id, status)
+);
+
+COMMENT ON TABLE run_stats_daily IS '일별 실행 통계 롤업 (날짜/채널/그룹/상태별 실행 횟수)';
+COMMENT ON COLUMN run_stats_daily.total_duration_seconds IS '완료된 실행의 소요 시간 합계 (초)';
+
+-- RLS 비활성화 (기존 테이블과 동일 정책)
+ALTER TABLE run_stats_daily DISABLE ROW LEVEL SECURITY;
+
+CREATE INDEX IF NOT EXISTS idx_run_stats_daily_group_date ON run_stats_daily(group_id, date);
+CREATE INDEX IF NOT EXISTS idx_run_stats_daily_channel_date ON run_stats_daily(channel_id, date);
+
+-- =============================================
+-- 2. 증분 반영 (RPC)
+-- p_deltas: [{"date", "channel_id", "group_id", "status", "run_count", "total_duration_seconds"}, ...]
+-- 같은 키가 한 번만 포함되어야 함 (쓰기 버퍼에서 합쳐서 전달)
+-- =============================================
+CREATE OR REPLACE FUNCTION bump_run_stats_daily(p_deltas JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    affected_count INTEGER;
+BEGIN
+    INSERT INTO run_stats_daily (date, channel_id, group_id, status, run_count, total_duration_seconds)
+    SELECT d.date, d.channel_id, d.group_id, d.status,
+           COALESCE(d.run_count, 0), COALESCE(d.total_duration_seconds, 0)
+    FROM jsonb_to_recordset(p_deltas) AS d(
+        date DATE,
+        channel_id UUID,
+        group_id UUID,
+        status TEXT,
+        run_count INTEGER,
+        total_duration_seconds BIGINT
+    )
+    ON CONFLICT (date, channel_id, group_id, status) DO UPDATE
+    SET
+        run_count = run_stats_daily.run_count + EXCLUDED.run_count,
+        total_duration_seconds = run_stats_daily.total_duration_seconds + EXCLUDED.total_duration_seconds,
+        updated_at = NOW();
+
+    GET DIAGNOSTICS affected_count = ROW_COUNT;
+    RETURN affected_count;
+END;
+$$;
+
+COMMENT ON FUNCTION bump_run_stats_daily IS '일별 실행 통계 증분 반영';
+
+-- =============================================
+-- 3. 백필 (RPC)
+-- 기간 내 롤업을 run_logs 기준으로 다시 계산
+-- 실행 중인 작업이 있는 날짜를 백필하면 해당 작업의 증분과 겹칠 수 있으므로
+-- 가급적 지난 날짜에 대해 실행
+-- =============================================
+CREATE OR REPLACE FUNCTION backfill_run_stats_daily(p_start_date DATE, p_end_date DATE)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM run_stats_daily
+    WHERE date BETWEEN p_start_date AND p_end_date;
+
+    INSERT INTO run_stats_daily (date, channel_id, group_id, status, run_count, total_duration_seconds)
+    SELECT
+        (r.started_at AT TIME ZONE 'UTC')::date,
+        r.channel_id,
+        c.group_id,
+        r.status,
+        COUNT(*),
+        COALESCE(SUM(r.duration_seconds), 0)
+    FROM run_logs r
+    JOIN channels c ON c.id = r.channel_id
+    WHERE r.started_at >= (p_start_date::timestamp AT TIME ZONE 'UTC')
+      AND r.started_at < ((p_end_date + 1)::timestamp AT TIME ZONE 'UTC')
+    GROUP BY 1, 2, 3, 4;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$;
+
+COMMENT ON FUNCTION backfill_run_stats_daily IS '기간 내 일별 실행 통계를 run_logs에서 재계산';
+
+-- =============================================
+-- 4. 통계 집계 함수가 롤업을 읽도록 변경 (006 함수 대체)
+-- 반환 형태는 동일, 조회 비용은 기록 누적량과 무관
+-- =============================================
+CREATE OR REPLACE FUNCTION stats_daily_counts(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (run_date DATE, status TEXT, run_count BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT s.date AS run_date, s.status, SUM(s.run_count)::BIGINT AS run_count
+    FROM run_stats_daily s
+    WHERE s.date BETWEEN p_start_date AND p_end_date
+    GROUP BY 1, 2
+    HAVING SUM(s.run_count) > 0
+    ORDER BY 1, 2;
+$$;
+
+CREATE OR REPLACE FUNCTION stats_group_counts(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (group_id UUID, status TEXT, run_count BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT s.group_id, s.status, SUM(s.run_count)::BIGINT AS run_count
+    FROM run_stats_daily s
+    WHERE s.date BETWEEN p_start_date AND p_end_date
+    GROUP BY 1, 2
+    HAVING SUM(s.run_count) > 0
+    ORDER BY 1, 2;
+$$;
+
+CREATE OR REPLACE FUNCTION stats_channel_counts(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (channel_id UUID, group_id UUID, status TEXT, run_count BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT s.channel_id, s.group_id, s.status, SUM(s.run_count)::BIGINT AS run_count
+    FROM run_stats_daily s
+    WHERE s.date BETWEEN p_start_date AND p_end_date
+    GROUP BY 1, 2, 3
+    HAVING SUM(s.run_count) > 0
+    ORDER BY 1, 3;
+$$;
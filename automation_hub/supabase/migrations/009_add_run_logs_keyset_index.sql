@@ -0,0 +1,14 @@
+-- =============================================
+-- 실행 로그 키셋 페이지네이션 인덱스
+--
+-- GET /api/stats/logs 와 logs/export는 (started_at, id) 내림차순으로
+-- 직전 페이지 마지막 행 다음부터 조회합니다.
+-- 정렬 키 전체를 포함한 인덱스로 페이지 위치와 무관하게 바로 시작 지점을 찾습니다.
+-- =============================================
+
+CREATE INDEX IF NOT EXISTS idx_run_logs_started_at_id
+    ON run_logs(started_at DESC, id DESC);
+
+-- 채널 필터가 있는 조회용
+CREATE INDEX IF NOT EXISTS idx_run_logs_channel_started_at_id
+    ON run_logs(channel_id, started_at DESC, id DESC);
@@ -0,0 +1,143 @@
+-- =============================================
+-- 실행 작업 큐
+--
+-- API(수동 실행)와 스케줄러는 실행을 직접 하지 않고 job_queue에 넣기만 하며,
+-- 별도 워커 프로세스(commands/job_worker.py)가 작업을 가져가 실행합니다.
+-- API 재시작과 무관하게 대기 중인 작업이 남고, 여러 호스트에서 워커를 띄울 수 있습니다.
+--
+-- 작업 수명 주기:
+--   queued → running (claim_jobs) → succeeded | failed
+--   워커가 죽어 heartbeat가 끊긴 running 작업은 requeue_stale_jobs()가
+--   max_attempts 이내면 queued로 되돌리고, 넘으면 failed로 처리
+-- =============================================
+
+-- =============================================
+-- 1. job_queue 테이블
+-- =============================================
+CREATE TABLE IF NOT EXISTS job_queue (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    job_type TEXT NOT NULL CHECK (job_type IN ('group', 'channel')),
+    target_id UUID NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    source TEXT NOT NULL DEFAULT 'manual',
+    schedule_id UUID REFERENCES schedules(id) ON DELETE SET NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_by TEXT,
+    locked_at TIMESTAMPTZ,
+    result JSONB,
+    error_message TEXT,
+    finished_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE job_queue IS '실행 작업 큐 (워커 프로세스가 가져가 실행)';
+COMMENT ON COLUMN job_queue.source IS '작업 출처: manual(API), schedule(스케줄러)';
+COMMENT ON COLUMN job_queue.run_after IS '이 시각 이후에만 실행 (재시도 대기)';
+COMMENT ON COLUMN job_queue.locked_by IS '실행 중인 워커 ID';
+COMMENT ON COLUMN job_queue.locked_at IS '워커 마지막 heartbeat 시각';
+
+-- RLS 비활성화 (기존 테이블과 동일 정책)
+ALTER TABLE job_queue DISABLE ROW LEVEL SECURITY;
+
+-- 대기 작업 조회용 (claim_jobs 정렬 순서)
+CREATE INDEX IF NOT EXISTS idx_job_queue_ready
+    ON job_queue(priority DESC, run_after, created_at)
+    WHERE status = 'queued';
+-- heartbeat / 중단 작업 확인용
+CREATE INDEX IF NOT EXISTS idx_job_queue_running
+    ON job_queue(locked_by, locked_at)
+    WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS idx_job_queue_created_at ON job_queue(created_at DESC);
+
+DROP TRIGGER IF EXISTS trigger_job_queue_updated_at ON job_queue;
+CREATE TRIGGER trigger_job_queue_updated_at
+    BEFORE UPDATE ON job_queue
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- =============================================
+-- 2. 작업 가져오기 (RPC)
+-- 실행 가능한 queued 작업을 최대 p_limit개 running으로 바꿔 반환
+-- FOR UPDATE SKIP LOCKED: 여러 워커가 동시에 호출해도 같은 작업을 가져가지 않음
+-- =============================================
+CREATE OR REPLACE FUNCTION claim_jobs(p_worker_id TEXT, p_limit INTEGER)
+RETURNS SETOF job_queue
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE job_queue j
+    SET
+        status = 'running',
+        locked_by = p_worker_id,
+        locked_at = NOW(),
+        attempts = j.attempts + 1
+    FROM (
+        SELECT id
+        FROM job_queue
+        WHERE status = 'queued' AND run_after <= NOW()
+        ORDER BY priority DESC, run_after, created_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    ) AS next_jobs
+    WHERE j.id = next_jobs.id
+    RETURNING j.*;
+END;
+$$;
+
+COMMENT ON FUNCTION claim_jobs IS '대기 작업을 워커에 할당 (FOR UPDATE SKIP LOCKED)';
+
+-- =============================================
+-- 3. 워커 heartbeat (RPC)
+-- 워커가 실행 중인 작업의 locked_at 갱신
+-- =============================================
+CREATE OR REPLACE FUNCTION heartbeat_jobs(p_worker_id TEXT)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE job_queue
+    SET locked_at = NOW()
+    WHERE locked_by = p_worker_id AND status = 'running';
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+COMMENT ON FUNCTION heartbeat_jobs IS '워커가 실행 중인 작업의 heartbeat 갱신';
+
+-- =============================================
+-- 4. 중단된 작업 복구 (RPC)
+-- heartbeat가 p_timeout_seconds 이상 끊긴 running 작업을
+-- 시도 횟수가 남았으면 queued로, 아니면 failed로 변경
+-- =============================================
+CREATE OR REPLACE FUNCTION requeue_stale_jobs(p_timeout_seconds INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE job_queue
+    SET
+        status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END,
+        finished_at = CASE WHEN attempts < max_attempts THEN NULL ELSE NOW() END,
+        error_message = '워커 응답 없음 (' || COALESCE(locked_by, '?') || ')',
+        locked_by = NULL,
+        locked_at = NULL
+    WHERE status = 'running'
+      AND locked_at < NOW() - make_interval(secs => p_timeout_seconds);
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+COMMENT ON FUNCTION requeue_stale_jobs IS 'heartbeat가 끊긴 실행 중 작업을 재대기/실패 처리';
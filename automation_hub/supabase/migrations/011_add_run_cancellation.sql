@@ -0,0 +1,68 @@
+-- =============================================
+-- 실행 취소
+--
+-- 실행 중인 채널/그룹 실행을 취소할 수 있도록 합니다.
+-- 실행은 작업 워커 프로세스(여러 호스트 가능)에서 일어나므로,
+-- API는 취소 요청을 run_cancel_requests에 기록하고 각 워커가 주기적으로 읽어
+-- 자기 프로세스에서 실행 중인 해당 실행을 중지합니다.
+--
+-- 취소 범위:
+--   run:   실행 로그 ID 하나
+--   group: 그룹의 실행 중인 채널 전체 (+ 대기 중인 그룹 작업)
+--   all:   실행 중인 전체 (+ 대기 중인 작업 전체)
+-- 요청 시각(requested_at) 이전에 시작한 실행만 취소됩니다.
+-- =============================================
+
+-- =============================================
+-- 1. 실행/작업 상태에 cancelled 추가
+-- =============================================
+ALTER TABLE run_logs DROP CONSTRAINT IF EXISTS run_logs_status_check;
+ALTER TABLE run_logs ADD CONSTRAINT run_logs_status_check
+    CHECK (status IN ('running', 'success', 'failed', 'cancelled'));
+
+ALTER TABLE job_queue DROP CONSTRAINT IF EXISTS job_queue_status_check;
+ALTER TABLE job_queue ADD CONSTRAINT job_queue_status_check
+    CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled'));
+
+-- =============================================
+-- 2. run_cancel_requests 테이블
+-- =============================================
+CREATE TABLE IF NOT EXISTS run_cancel_requests (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    scope TEXT NOT NULL CHECK (scope IN ('run', 'group', 'all')),
+    target_id UUID,
+    requested_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CHECK ((scope = 'all') = (target_id IS NULL))
+);
+
+COMMENT ON TABLE run_cancel_requests IS '실행 취소 요청 (작업 워커가 주기적으로 확인)';
+COMMENT ON COLUMN run_cancel_requests.target_id IS 'run: 실행 로그 ID, group: 그룹 ID, all: NULL';
+
+-- RLS 비활성화 (기존 테이블과 동일 정책)
+ALTER TABLE run_cancel_requests DISABLE ROW LEVEL SECURITY;
+
+CREATE INDEX IF NOT EXISTS idx_run_cancel_requests_requested_at ON run_cancel_requests(requested_at);
+
+-- =============================================
+-- 3. 대기 작업 취소 (RPC)
+-- p_group_id가 NULL이면 대기 중인 작업 전체, 아니면 해당 그룹 작업만
+-- =============================================
+CREATE OR REPLACE FUNCTION cancel_queued_jobs(p_group_id UUID DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE job_queue
+    SET status = 'cancelled', finished_at = NOW()
+    WHERE status = 'queued'
+      AND (p_group_id IS NULL OR (job_type = 'group' AND target_id = p_group_id));
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+COMMENT ON FUNCTION cancel_queued_jobs IS '대기 중인 작업 취소 (전체 또는 그룹)';
@@ -0,0 +1,79 @@
+-- =============================================
+-- 채널 중복 실행 방지 (single-flight)
+--
+-- 같은 채널이 채널 스케줄, 그룹 스케줄, 수동 실행으로 동시에 시작되지 않도록
+-- 채널별 잠금을 잡고 실행합니다 (services/channel_lock.py).
+--
+-- - postgres 백엔드: 세션 advisory lock (pg_try_advisory_lock, 이 마이그레이션 불필요)
+-- - supabase 백엔드: REST 호출은 세션을 유지할 수 없으므로 lease_locks 임대 잠금 사용
+--   (보유 프로세스가 죽어도 expires_at이 지나면 다른 프로세스가 가져감)
+--
+-- 잠금을 얻지 못해 건너뛴 실행은 run_logs에 skipped로 기록됩니다.
+-- =============================================
+
+-- =============================================
+-- 1. 실행/작업 상태에 skipped 추가
+-- =============================================
+ALTER TABLE run_logs DROP CONSTRAINT IF EXISTS run_logs_status_check;
+ALTER TABLE run_logs ADD CONSTRAINT run_logs_status_check
+    CHECK (status IN ('running', 'success', 'failed', 'cancelled', 'skipped'));
+
+ALTER TABLE job_queue DROP CONSTRAINT IF EXISTS job_queue_status_check;
+ALTER TABLE job_queue ADD CONSTRAINT job_queue_status_check
+    CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled', 'skipped'));
+
+-- =============================================
+-- 2. lease_locks 테이블 (supabase 백엔드)
+-- =============================================
+CREATE TABLE IF NOT EXISTS lease_locks (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE lease_locks IS '임대 잠금 (REST로 세션 advisory lock을 쓸 수 없는 경우)';
+COMMENT ON COLUMN lease_locks.owner IS '보유 프로세스 ID (호스트명:PID:임의값)';
+
+-- RLS 비활성화 (기존 테이블과 동일 정책)
+ALTER TABLE lease_locks DISABLE ROW LEVEL SECURITY;
+
+-- =============================================
+-- 3. 잠금 획득 / 해제 (RPC)
+-- 비어 있거나 만료되었거나 같은 보유자면 획득 (만료 시각 갱신)
+-- =============================================
+CREATE OR REPLACE FUNCTION try_lease_lock(p_key TEXT, p_owner TEXT, p_ttl_seconds INTEGER)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    INSERT INTO lease_locks (key, owner, expires_at)
+    VALUES (p_key, p_owner, NOW() + make_interval(secs => p_ttl_seconds))
+    ON CONFLICT (key) DO UPDATE
+    SET owner = EXCLUDED.owner, expires_at = EXCLUDED.expires_at, created_at = NOW()
+    WHERE lease_locks.expires_at < NOW() OR lease_locks.owner = EXCLUDED.owner;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count > 0;
+END;
+$$;
+
+COMMENT ON FUNCTION try_lease_lock IS '임대 잠금 획득 시도 (획득 여부 반환)';
+
+CREATE OR REPLACE FUNCTION release_lease_lock(p_key TEXT, p_owner TEXT)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    deleted_count INTEGER;
+BEGIN
+    DELETE FROM lease_locks WHERE key = p_key AND owner = p_owner;
+
+    GET DIAGNOSTICS deleted_count = ROW_COUNT;
+    RETURN deleted_count > 0;
+END;
+$$;
+
+COMMENT ON FUNCTION release_lease_lock IS '임대 잠금 해제 (보유자만)';
@@ -0,0 +1,51 @@
+-- =============================================
+-- 워커 단계 체크포인트 / 실행 이어하기
+--
+-- 워커 단계(run_stages) 결과를 실행 로그 ID별로 저장해 두고,
+-- 실패/취소된 실행을 다시 시작할 때 완료된 단계는 건너뛰고
+-- 첫 번째 미완료 단계부터 이어서 실행합니다.
+-- (예: 유튜브 업로드만 실패하면 아이디어/스크립트/영상 생성을 다시 하지 않음)
+--
+-- - 결과물은 작업 워커 호스트의 로컬 디렉터리(CHECKPOINT_DIR)에 저장하고,
+--   이 테이블에는 경로와 메타데이터만 기록
+-- - 이어하기 실행은 새 실행 로그로 기록되며 resumed_from에 원래 실행 로그 ID를 남김
+-- - 이어하기는 작업 큐(job_type = 'resume', target_id = 원래 실행 로그 ID)로 실행
+-- =============================================
+
+-- =============================================
+-- 1. stage_checkpoints 테이블
+-- =============================================
+CREATE TABLE IF NOT EXISTS stage_checkpoints (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    run_log_id UUID NOT NULL REFERENCES run_logs(id) ON DELETE CASCADE,
+    stage TEXT NOT NULL,
+    kind TEXT NOT NULL CHECK (kind IN ('value', 'file')),
+    artifact_path TEXT NOT NULL,
+    size_bytes BIGINT NOT NULL DEFAULT 0,
+    host TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+
+    UNIQUE (run_log_id, stage)
+);
+
+COMMENT ON TABLE stage_checkpoints IS '워커 단계 체크포인트 (실행 이어하기용)';
+COMMENT ON COLUMN stage_checkpoints.kind IS 'value: 결과값(JSON 파일), file: 결과 파일 사본';
+COMMENT ON COLUMN stage_checkpoints.artifact_path IS '결과물 로컬 경로 (host의 CHECKPOINT_DIR 아래)';
+COMMENT ON COLUMN stage_checkpoints.host IS '결과물을 저장한 호스트';
+
+-- RLS 비활성화 (기존 테이블과 동일 정책)
+ALTER TABLE stage_checkpoints DISABLE ROW LEVEL SECURITY;
+
+-- =============================================
+-- 2. 이어하기 실행의 원래 실행 로그
+-- =============================================
+ALTER TABLE run_logs ADD COLUMN IF NOT EXISTS resumed_from UUID REFERENCES run_logs(id) ON DELETE SET NULL;
+
+COMMENT ON COLUMN run_logs.resumed_from IS '이어하기 실행이면 원래 실행 로그 ID';
+
+-- =============================================
+-- 3. 작업 유형에 resume 추가 (target_id = 원래 실행 로그 ID)
+-- =============================================
+ALTER TABLE job_queue DROP CONSTRAINT IF EXISTS job_queue_job_type_check;
+ALTER TABLE job_queue ADD CONSTRAINT job_queue_job_type_check
+    CHECK (job_type IN ('group', 'channel', 'resume'));
@@ -0,0 +1,24 @@
+-- =============================================
+-- 채널별 평균 소요 시간 (스케줄 부하 예측용)
+--
+-- run_stats_daily 롤업의 완료된 실행(success/failed) 횟수와 소요 시간 합계를
+-- 채널별로 합산합니다. 평균 소요 시간 = total_duration_seconds / run_count
+-- (skipped는 소요 시간이 0, cancelled는 중간에 끊긴 실행이라 제외)
+-- =============================================
+
+CREATE OR REPLACE FUNCTION stats_channel_durations(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (channel_id UUID, run_count BIGINT, total_duration_seconds BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT s.channel_id,
+           SUM(s.run_count)::BIGINT AS run_count,
+           SUM(s.total_duration_seconds)::BIGINT AS total_duration_seconds
+    FROM run_stats_daily s
+    WHERE s.date BETWEEN p_start_date AND p_end_date
+      AND s.status IN ('success', 'failed')
+    GROUP BY 1
+    HAVING SUM(s.run_count) > 0
+    ORDER BY 1;
+$$;
+
+COMMENT ON FUNCTION stats_channel_durations IS '기간 내 채널별 완료된 실행 횟수와 소요 시간 합계';
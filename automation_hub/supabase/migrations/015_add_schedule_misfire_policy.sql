@@ -0,0 +1,26 @@
+-- =============================================
+-- 스케줄 misfire 정책 / 실행 지연 기록
+--
+-- 이벤트 루프가 막히거나 서버가 재시작되어 cron 시각에 실행하지 못한 경우(misfire)
+-- 스케줄별로 처리 방법을 정합니다. 지연이 SCHEDULE_MISFIRE_GRACE_SECONDS 이내면
+-- 정책과 관계없이 한 번 실행합니다.
+--   skip      지연된 실행은 건너뜀 (기본값, 기존 동작)
+--   coalesce  놓친 실행을 한 번으로 합쳐 실행
+--   catch_up  놓친 실행을 모두 실행 (전역 상한에 따라 나눠서 작업 큐에 추가)
+--
+-- 실행 지연(실제 트리거 시각 - 예정 시각)은 마지막 값을 남기고
+-- 분포는 API 프로세스 메트릭(GET /api/schedules/status/lateness)으로 봅니다.
+-- =============================================
+
+ALTER TABLE schedules
+    ADD COLUMN IF NOT EXISTS misfire_policy TEXT NOT NULL DEFAULT 'skip',
+    ADD COLUMN IF NOT EXISTS last_planned_at TIMESTAMPTZ,
+    ADD COLUMN IF NOT EXISTS last_lateness_seconds DOUBLE PRECISION;
+
+ALTER TABLE schedules DROP CONSTRAINT IF EXISTS schedules_misfire_policy_check;
+ALTER TABLE schedules ADD CONSTRAINT schedules_misfire_policy_check
+    CHECK (misfire_policy IN ('skip', 'coalesce', 'catch_up'));
+
+COMMENT ON COLUMN schedules.misfire_policy IS '지연된 실행 처리: skip | coalesce | catch_up';
+COMMENT ON COLUMN schedules.last_planned_at IS '마지막 트리거의 예정(cron) 시각';
+COMMENT ON COLUMN schedules.last_lateness_seconds IS '마지막 트리거의 지연 (실제 - 예정, 초)';
@@ -0,0 +1,35 @@
+-- =============================================
+-- 그룹 취소 시 그룹 채널의 대기 작업도 취소 (011 cancel_queued_jobs 대체)
+--
+-- 그룹을 취소해도 그 그룹 채널의 채널 작업(job_type = 'channel')은 대기열에 남아
+-- 취소 후에 실행되던 문제 수정. 채널 작업은 channels.group_id로 그룹을 찾습니다.
+-- =============================================
+
+CREATE OR REPLACE FUNCTION cancel_queued_jobs(p_group_id UUID DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE job_queue j
+    SET status = 'cancelled', finished_at = NOW()
+    WHERE j.status = 'queued'
+      AND (
+          p_group_id IS NULL
+          OR (j.job_type = 'group' AND j.target_id = p_group_id)
+          OR (
+              j.job_type = 'channel'
+              AND EXISTS (
+                  SELECT 1 FROM channels c
+                  WHERE c.id = j.target_id AND c.group_id = p_group_id
+              )
+          )
+      );
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+COMMENT ON FUNCTION cancel_queued_jobs IS '대기 중인 작업 취소 (전체 또는 그룹, 그룹이면 그룹 채널의 채널 작업 포함)';
@@ -0,0 +1,37 @@
+-- =============================================
+-- 그룹/채널별 실행 횟수를 채널의 현재 소속 그룹 기준으로 집계 (008 함수 대체)
+--
+-- 롤업의 group_id는 실행 시점의 그룹이므로 채널을 다른 그룹으로 옮기면
+-- 같은 채널의 행이 두 그룹에 나뉩니다. 006(run_logs JOIN channels)과 같은 결과가
+-- 나오도록 channels.group_id로 묶고, 페이지 단위 조회(range)에서 행이 중복/누락되지
+-- 않도록 모든 키 열로 정렬합니다.
+-- =============================================
+
+CREATE OR REPLACE FUNCTION stats_group_counts(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (group_id UUID, status TEXT, run_count BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT c.group_id, s.status, SUM(s.run_count)::BIGINT AS run_count
+    FROM run_stats_daily s
+    JOIN channels c ON c.id = s.channel_id
+    WHERE s.date BETWEEN p_start_date AND p_end_date
+    GROUP BY 1, 2
+    HAVING SUM(s.run_count) > 0
+    ORDER BY 1, 2;
+$$;
+
+CREATE OR REPLACE FUNCTION stats_channel_counts(p_start_date DATE, p_end_date DATE)
+RETURNS TABLE (channel_id UUID, group_id UUID, status TEXT, run_count BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT s.channel_id, c.group_id, s.status, SUM(s.run_count)::BIGINT AS run_count
+    FROM run_stats_daily s
+    JOIN channels c ON c.id = s.channel_id
+    WHERE s.date BETWEEN p_start_date AND p_end_date
+    GROUP BY 1, 2, 3
+    HAVING SUM(s.run_count) > 0
+    ORDER BY 1, 2, 3;
+$$;
+
+COMMENT ON FUNCTION stats_group_counts IS '기간 내 그룹별/상태별 실행 횟수 (채널의 현재 소속 그룹 기준)';
+COMMENT ON FUNCTION stats_channel_counts IS '기간 내 채널별/상태별 실행 횟수 (채널의 현재 소속 그룹 기준)';
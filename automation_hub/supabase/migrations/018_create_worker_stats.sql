@@ -0,0 +1,23 @@
+-- =============================================
+-- 작업 워커 상태 보고
+--
+-- 서킷 브레이커, CPU 풀, 속도 제한, 결과물 캐시 상태는 실행이 일어나는
+-- 작업 워커 프로세스(여러 호스트 가능)의 메모리에 있으므로 API 프로세스에서는 볼 수 없습니다.
+-- 각 워커가 heartbeat마다 자기 상태를 worker_id 행에 덮어쓰고,
+-- GET /health는 JOB_STALE_TIMEOUT 안에 보고한 워커의 상태를 합쳐 보여줍니다.
+-- =============================================
+
+CREATE TABLE IF NOT EXISTS worker_stats (
+    worker_id TEXT PRIMARY KEY,
+    stats JSONB NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE worker_stats IS '작업 워커가 heartbeat마다 보고하는 프로세스 상태';
+COMMENT ON COLUMN worker_stats.worker_id IS '워커 ID (호스트명:PID)';
+COMMENT ON COLUMN worker_stats.stats IS '구성 요소별 상태 ({"job_worker", "circuit_breaker", ...})';
+
+-- RLS 비활성화 (기존 테이블과 동일 정책)
+ALTER TABLE worker_stats DISABLE ROW LEVEL SECURITY;
+
+CREATE INDEX IF NOT EXISTS idx_worker_stats_updated_at ON worker_stats(updated_at);